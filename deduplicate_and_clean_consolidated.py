@@ -16,6 +16,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from scripts.analysis.pre_qualification_filters_balanced import pre_qualify_lead_balanced
+from src.exports.lead_snapshot import load_lead_records, pa, preferred_lead_path, write_lead_snapshot
 
 
 def deduplicate_and_clean():
@@ -33,9 +34,7 @@ def deduplicate_and_clean():
     print(f"Input: {input_file.name}\n")
 
     # Read all leads
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        all_leads = list(reader)
+    all_leads = load_lead_records(preferred_lead_path(input_file))
 
     print(f"Total leads in input: {len(all_leads)}")
     print()
@@ -138,6 +137,9 @@ def deduplicate_and_clean():
             writer.writeheader()
             writer.writerows(clean_leads)
 
+        if pa is not None:
+            write_lead_snapshot(clean_leads, output_file.with_suffix('.parquet'))
+
         print("="*80)
         print("SUMMARY")
         print("="*80)
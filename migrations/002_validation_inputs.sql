@@ -0,0 +1,21 @@
+-- Migration 002: Incremental Revalidation Inputs
+-- Created: 2026-10-18
+-- Purpose: Record the evidence and rule version each gate result depended on,
+--          so revalidation only re-runs gates whose inputs changed
+
+CREATE TABLE IF NOT EXISTS validation_inputs (
+    business_id INTEGER NOT NULL,
+    rule_id TEXT NOT NULL,
+    rule_hash TEXT NOT NULL,
+    inputs_hash TEXT NOT NULL,
+    observation_ids TEXT,
+    validation_version INTEGER NOT NULL,
+    passed BOOLEAN NOT NULL,
+    reason TEXT,
+    action TEXT,
+    validated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (business_id, rule_id),
+    FOREIGN KEY(business_id) REFERENCES businesses(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_validation_inputs_rule ON validation_inputs(rule_id, rule_hash);
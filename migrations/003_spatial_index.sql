@@ -0,0 +1,37 @@
+-- Migration 003: Spatial Index on Businesses
+-- Created: 2026-10-18
+-- Purpose: R*Tree over business coordinates for radius/kNN/bbox queries and
+--          proximity deduplication; triggers keep it in sync with businesses
+
+CREATE VIRTUAL TABLE IF NOT EXISTS businesses_rtree USING rtree(
+    id, min_lat, max_lat, min_lon, max_lon
+);
+
+CREATE TRIGGER IF NOT EXISTS businesses_rtree_insert
+AFTER INSERT ON businesses
+WHEN NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL
+BEGIN
+    INSERT OR REPLACE INTO businesses_rtree VALUES
+        (NEW.id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude);
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_rtree_update
+AFTER UPDATE OF latitude, longitude ON businesses
+BEGIN
+    DELETE FROM businesses_rtree WHERE id = OLD.id;
+    INSERT INTO businesses_rtree
+        SELECT NEW.id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude
+        WHERE NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_rtree_delete
+AFTER DELETE ON businesses
+BEGIN
+    DELETE FROM businesses_rtree WHERE id = OLD.id;
+END;
+
+-- Backfill existing geocoded businesses
+INSERT INTO businesses_rtree
+    SELECT id, latitude, latitude, longitude, longitude
+    FROM businesses
+    WHERE latitude IS NOT NULL AND longitude IS NOT NULL;
@@ -0,0 +1,35 @@
+-- Migration 004: Trigram Name Index on Businesses
+-- Created: 2026-10-18
+-- Purpose: FTS5 (trigram tokenizer) over normalized business names for fuzzy
+--          top-k lookup within a city/FSA; triggers keep it in sync with businesses
+CREATE VIRTUAL TABLE IF NOT EXISTS businesses_name_fts USING fts5(
+    name, city UNINDEXED, fsa UNINDEXED, tokenize = 'trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS businesses_name_fts_insert
+AFTER INSERT ON businesses
+BEGIN
+    INSERT INTO businesses_name_fts (rowid, name, city, fsa)
+    VALUES (NEW.id, NEW.normalized_name, lower(NEW.city), upper(substr(replace(NEW.postal_code, ' ', ''), 1, 3)));
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_name_fts_update
+AFTER UPDATE OF normalized_name, city, postal_code ON businesses
+BEGIN
+    DELETE FROM businesses_name_fts WHERE rowid = OLD.id;
+    INSERT INTO businesses_name_fts (rowid, name, city, fsa)
+    VALUES (NEW.id, NEW.normalized_name, lower(NEW.city), upper(substr(replace(NEW.postal_code, ' ', ''), 1, 3)));
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_name_fts_delete
+AFTER DELETE ON businesses
+BEGIN
+    DELETE FROM businesses_name_fts WHERE rowid = OLD.id;
+END;
+
+-- Backfill existing businesses
+INSERT INTO businesses_name_fts (rowid, name, city, fsa)
+    SELECT id, normalized_name, lower(city), upper(substr(replace(postal_code, ' ', ''), 1, 3))
+    FROM businesses;
+
+INSERT INTO businesses_name_fts (businesses_name_fts) VALUES ('optimize');
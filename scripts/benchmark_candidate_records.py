@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Discovery Candidate Record Benchmark
+
+Compares the per-record memory and construction time of the record types a
+discovery candidate can travel in:
+
+    legacy dataclass    the previous BusinessData (per-instance __dict__,
+                        provider payload kept as a nested dict)
+    BusinessData        the slotted record with an out-of-line payload blob
+    BusinessLead        the validated Pydantic model (eager conversion)
+
+Memory is what stays allocated (tracemalloc) while all N records are alive,
+divided by N, including the strings and provider payloads each record holds.
+
+Usage:
+    python scripts/benchmark_candidate_records.py
+    python scripts/benchmark_candidate_records.py --count 100000 --skip-lead
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.models import BusinessLead, ContactInfo, LocationInfo
+from src.sources.base_source import BusinessData
+
+
+@dataclass
+class LegacyBusinessData:
+    """The pre-slots BusinessData layout."""
+    name: str
+    source: str
+    source_url: str
+    confidence: float
+    street: Optional[str] = None
+    city: Optional[str] = None
+    province: Optional[str] = None
+    postal_code: Optional[str] = None
+    phone: Optional[str] = None
+    website: Optional[str] = None
+    email: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    industry: Optional[str] = None
+    naics_code: Optional[str] = None
+    employee_count: Optional[int] = None
+    revenue_range: Optional[str] = None
+    year_established: Optional[int] = None
+    review_count: Optional[int] = None
+    rating: Optional[float] = None
+    description: Optional[str] = None
+    raw_data: Dict[str, Any] = field(default_factory=dict)
+    fetched_at: datetime = field(default_factory=datetime.utcnow)
+
+
+def candidate_fields(i: int) -> Dict[str, Any]:
+    """Google-Places-like candidate, including its provider payload."""
+    return {
+        'name': f"Hamilton Precision {i} Inc",
+        'source': 'google_places',
+        'source_url': f"https://maps.google.com/?cid={1000000 + i}",
+        'confidence': 0.9,
+        'street': f"{i % 900 + 1} Barton St E",
+        'city': 'Hamilton',
+        'province': 'ON',
+        'postal_code': 'L8L 2W6',
+        'phone': f"(905) 555-{i % 10000:04d}",
+        'website': f"https://precision{i}.ca",
+        'latitude': 43.25 + (i % 1000) / 100000,
+        'longitude': -79.85 - (i % 1000) / 100000,
+        'industry': 'manufacturing',
+        'review_count': i % 200,
+        'rating': 4.5,
+        'raw_data': {
+            'place_id': f"ChIJ{i:012d}abcdefghij",
+            'types': ['establishment', 'point_of_interest', 'store'],
+            'business_status': 'OPERATIONAL',
+            'user_ratings_total': i % 200,
+            'geometry': {'location': {'lat': 43.25, 'lng': -79.85}},
+        },
+    }
+
+
+def build_lead(fields: Dict[str, Any]) -> BusinessLead:
+    return BusinessLead(
+        business_name=fields['name'],
+        location=LocationInfo(
+            address=fields['street'],
+            city=fields['city'],
+            province=fields['province'],
+            postal_code=fields['postal_code']
+        ),
+        contact=ContactInfo(phone=fields['phone'], website=fields['website']),
+        industry=fields['industry'],
+        review_count=fields['review_count'],
+        confidence_score=fields['confidence']
+    )
+
+
+def measure(build: Callable[[Dict[str, Any]], Any], texts: List[str]) -> Tuple[float, float]:
+    """
+    Return (construction µs per record, retained bytes per record).
+
+    Each candidate is parsed from its own JSON text (as it is from an API
+    response), so its strings and payload belong to it alone. Construction
+    time excludes parsing; memory is what the records keep once the parsed
+    inputs are dropped.
+    """
+    inputs = [json.loads(text) for text in texts]
+    gc.collect()
+    start = time.perf_counter()
+    records = [build(fields) for fields in inputs]
+    elapsed = time.perf_counter() - start
+    del records, inputs
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    inputs = [json.loads(text) for text in texts]
+    records = [build(fields) for fields in inputs]
+    del inputs
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del records
+    return elapsed * 1e6 / len(texts), retained / len(texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark discovery candidate records')
+    parser.add_argument('--count', type=int, default=100_000, help='Candidates to build')
+    parser.add_argument('--skip-lead', action='store_true', help='Skip the (slow) BusinessLead path')
+    args = parser.parse_args()
+
+    texts = [json.dumps(candidate_fields(i)) for i in range(args.count)]
+    candidates = [
+        ('legacy dataclass', lambda f: LegacyBusinessData(**f)),
+        ('BusinessData (slots)', lambda f: BusinessData(**f)),
+    ]
+    if not args.skip_lead:
+        candidates.append(('BusinessLead (pydantic)', build_lead))
+
+    print(f"Candidates: {args.count:,}")
+    print()
+    results = [(name, *measure(build, texts)) for name, build in candidates]
+
+    base_us, base_bytes = results[0][1], results[0][2]
+    print(f"{'Record':<26}{'Build µs/rec':>14}{'Bytes/rec':>12}{'Total MB':>10}{'Time x':>8}{'Mem x':>8}")
+    for name, us, nbytes in results:
+        print(
+            f"{name:<26}{us:>14.2f}{nbytes:>12,.0f}{nbytes * args.count / 2**20:>10.1f}"
+            f"{base_us / us:>8.2f}{base_bytes / nbytes:>8.2f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
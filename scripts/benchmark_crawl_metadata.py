@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Conditional Re-crawl Benchmark
+
+Serves a set of small-business sites locally (homepage + contact page each,
+ETag support, a fixed per-response latency) and runs ContactEnricher over
+them twice: a first crawl, then a revalidation pass after a share of the
+pages changed. The revalidation runs once with crawl metadata disabled (every
+page downloaded again) and once with conditional GETs through
+src/services/crawl_metadata.py. Reported: wall time, full (200) responses,
+304 responses and bytes downloaded. No network access is needed.
+
+Usage:
+    python scripts/benchmark_crawl_metadata.py
+    python scripts/benchmark_crawl_metadata.py --sites 200 --changed 0.1
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.enrichment.contact_enrichment import ContactEnricher
+from src.services.crawl_metadata import configure_crawl_cache, reset_crawl_cache
+from src.services.domain_health import configure_domain_health
+
+FILLER = "<p>Precision machining, fabrication and welding for industrial customers.</p>" * 150
+
+
+def site_pages(site: int, version: int):
+    return {
+        '/': f"<html><head><title>Shop {site}</title></head><body>{FILLER}"
+             f"<a href='/s{site}/contact'>Contact</a> Call (905) 555-{site:04d}</body></html>",
+        '/contact': f"<html><body>{FILLER}<a href='mailto:sales{version}@shop{site}.ca'>Email us</a></body></html>",
+    }
+
+
+async def start_server(args, pages, counters):
+    async def handler(request):
+        await asyncio.sleep(args.latency)
+        site, _, path = request.path[2:].partition('/')
+        body = pages[int(site)]['/' + path]
+        etag = '"%s"' % hashlib.md5(body.encode()).hexdigest()
+        if request.headers.get('If-None-Match') == etag:
+            counters['not_modified'] += 1
+            return web.Response(status=304, headers={'ETag': etag})
+        counters['full'] += 1
+        counters['bytes'] += len(body)
+        return web.Response(text=body, content_type='text/html', headers={'ETag': etag})
+
+    app = web.Application()
+    app.router.add_get("/{path:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+async def crawl(enricher, base_url, sites, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(site: int):
+        async with semaphore:
+            await enricher.enrich_business(f"Shop {site}", website=f"{base_url}/s{site}/")
+
+    await asyncio.gather(*[one(site) for site in range(sites)])
+
+
+async def run(args, conditional: bool, tmpdir: str):
+    rnd = random.Random(args.seed)
+    pages = {site: site_pages(site, 0) for site in range(args.sites)}
+    counters = {'full': 0, 'not_modified': 0, 'bytes': 0}
+    runner, port = await start_server(args, pages, counters)
+    base_url = f"http://127.0.0.1:{port}"
+
+    configure_domain_health(db_path=str(Path(tmpdir) / f"domain_health_{conditional}.db"))
+    # Interval 0: every revisit goes to the server (the conditional GET is what is measured)
+    configure_crawl_cache(db_path=str(Path(tmpdir) / f"crawl_{conditional}.db"), enabled=conditional,
+                          initial_interval_seconds=0, min_interval_seconds=0, max_interval_seconds=0)
+    enricher = ContactEnricher()
+    try:
+        await crawl(enricher, base_url, args.sites, args.concurrency)
+
+        for site in rnd.sample(range(args.sites), int(args.sites * args.changed)):
+            pages[site] = site_pages(site, 1)
+        counters.update(full=0, not_modified=0, bytes=0)
+
+        started = time.monotonic()
+        await crawl(enricher, base_url, args.sites, args.concurrency)
+        wall = time.monotonic() - started
+    finally:
+        reset_crawl_cache()
+        await runner.cleanup()
+    return {'wall': wall, **counters}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark conditional re-crawls')
+    parser.add_argument('--sites', type=int, default=100, help='Simulated websites')
+    parser.add_argument('--changed', type=float, default=0.1, help='Share of sites that changed between crawls')
+    parser.add_argument('--latency', type=float, default=0.02, help='Server response time (seconds)')
+    parser.add_argument('--concurrency', type=int, default=20, help='Sites crawled at once')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed')
+    args = parser.parse_args()
+
+    print(f"Revalidating {args.sites} sites ({args.sites * 2} pages), {args.changed:.0%} changed since the first crawl")
+    print()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = [
+            ('full re-download', asyncio.run(run(args, False, tmpdir))),
+            ('conditional GET', asyncio.run(run(args, True, tmpdir))),
+        ]
+
+    base = results[0][1]['bytes']
+    print(f"{'Revalidation':<20}{'Wall s':>9}{'200s':>7}{'304s':>7}{'KB down':>10}{'x':>7}")
+    for name, result in results:
+        ratio = base / result['bytes'] if result['bytes'] else float('inf')
+        print(f"{name:<20}{result['wall']:>9.2f}{result['full']:>7}{result['not_modified']:>7}"
+              f"{result['bytes'] / 1024:>10.0f}{ratio:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
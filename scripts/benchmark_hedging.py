@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Hedged Request Simulation
+
+Replays a batch of website fetches against simulated hosts with a heavy
+latency tail (most responses are fast, a few stall) and compares batch
+latency percentiles and request load with and without the hedging policy in
+src/services/hedging.py. No network access is needed.
+
+Usage:
+    python scripts/benchmark_hedging.py
+    python scripts/benchmark_hedging.py --requests 5000 --stall-rate 0.03 --budget 0.05
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.hedging import HedgingPolicy, HedgingSettings
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_batch(args, policy: HedgingPolicy) -> Dict[str, float]:
+    """Fetch every URL once (bounded concurrency); return latency percentiles and load."""
+    rnd = random.Random(args.seed)
+    hosts = [f"site{i}.ca" for i in range(args.hosts)]
+    sent = {'count': 0}
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async def attempt():
+        sent['count'] += 1
+        # Heavy tail: lognormal body plus occasional stalls (independent per attempt)
+        delay = rnd.lognormvariate(-3.0, 0.5) * args.time_scale
+        if rnd.random() < args.stall_rate:
+            delay += args.stall_seconds * args.time_scale
+        await asyncio.sleep(delay)
+        return delay
+
+    async def fetch(i: int):
+        url = f"https://{hosts[i % len(hosts)]}/"
+        async with semaphore:
+            started = time.monotonic()
+            await policy.run(url, attempt)
+            latencies.append(time.monotonic() - started)
+
+    started = time.monotonic()
+    await asyncio.gather(*[fetch(i) for i in range(args.requests)])
+    return {
+        'p50': percentile(latencies, 0.50),
+        'p90': percentile(latencies, 0.90),
+        'p99': percentile(latencies, 0.99),
+        'wall': time.monotonic() - started,
+        'extra': sent['count'] / args.requests - 1.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate hedged website fetches')
+    parser.add_argument('--requests', type=int, default=2000, help='Fetches in the batch')
+    parser.add_argument('--hosts', type=int, default=50, help='Distinct simulated hosts')
+    parser.add_argument('--concurrency', type=int, default=50, help='Fetches in flight')
+    parser.add_argument('--stall-rate', type=float, default=0.03, help='Fraction of attempts that stall')
+    parser.add_argument('--stall-seconds', type=float, default=1.0, help='Extra delay of a stalled attempt')
+    parser.add_argument('--budget', type=float, default=0.05, help='Hedge budget ratio')
+    parser.add_argument('--time-scale', type=float, default=1.0, help='Scale all simulated delays')
+    parser.add_argument('--percentile', type=float, default=0.9, help='Host latency percentile that triggers a hedge')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed')
+    args = parser.parse_args()
+
+    print(f"Batch: {args.requests:,} fetches over {args.hosts} hosts, "
+          f"{args.stall_rate:.0%} of attempts stall for {args.stall_seconds}s")
+    print()
+
+    baseline = asyncio.run(run_batch(args, HedgingPolicy(HedgingSettings(enabled=False))))
+    hedging = HedgingPolicy(HedgingSettings(percentile=args.percentile, budget_ratio=args.budget,
+                                            min_delay_seconds=0.0))
+    hedged = asyncio.run(run_batch(args, hedging))
+
+    print(f"{'Policy':<22}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'Wall s':>9}{'Extra req':>11}")
+    for name, result in (('no hedging', baseline), (f'hedging ({args.budget:.0%} budget)', hedged)):
+        print(f"{name:<22}{result['p50'] * 1000:>9.0f}{result['p90'] * 1000:>9.0f}{result['p99'] * 1000:>9.0f}"
+              f"{result['wall']:>9.2f}{result['extra']:>11.1%}")
+    print()
+    stats = hedging.get_stats()
+    print(f"Hedges sent: {stats['hedges_sent']}, won: {stats['hedge_wins']} "
+          f"(win rate {stats['hedge_win_rate']:.0%}), denied by budget: {stats['budget_denied']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Adaptive Concurrency Simulation
+
+Runs a mixed batch against simulated hosts through src/services/host_concurrency.py
+and compares the old fixed per-host limit (2) with the AIMD controller:
+
+    api host        fast provider API that can serve many requests at once
+    websites        small-business sites that answer 503 past a few concurrent
+                    requests and slow down as they fill up
+
+Overloaded requests are retried until they succeed. Reported: wall time,
+throughput, the share of responses that were 429/503 and the limits learned.
+No network access is needed.
+
+Usage:
+    python scripts/benchmark_host_concurrency.py
+    python scripts/benchmark_host_concurrency.py --api-requests 2000 --api-capacity 48
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.host_concurrency import ConcurrencySettings, HostConcurrency, HostLimitStore
+
+API_URL = "https://places.googleapis.com/v1/places:searchText"
+
+
+class SimulatedHost:
+    """Host with a concurrency capacity: past it, requests are refused with `status`."""
+
+    def __init__(self, capacity: int, latency: float, status: int, rnd: random.Random):
+        self.capacity = capacity
+        self.latency = latency
+        self.status = status
+        self.rnd = rnd
+        self.in_flight = 0
+
+    async def handle(self) -> int:
+        self.in_flight += 1
+        try:
+            if self.in_flight > self.capacity:
+                await asyncio.sleep(self.latency * 0.2)
+                return self.status
+            # Busier hosts answer more slowly
+            load = self.in_flight / self.capacity
+            await asyncio.sleep(self.latency * (1 + load) * self.rnd.uniform(0.8, 1.2))
+            return 200
+        finally:
+            self.in_flight -= 1
+
+
+async def run_batch(args, settings: ConcurrencySettings, store: HostLimitStore) -> Dict[str, float]:
+    rnd = random.Random(args.seed)
+    concurrency = HostConcurrency(settings, store=store)
+    api = SimulatedHost(args.api_capacity, args.api_latency, 429, rnd)
+    sites = {f"https://site{i}.ca/": SimulatedHost(args.site_capacity, args.site_latency, 503, rnd)
+             for i in range(args.sites)}
+    workload = [(API_URL, api)] * args.api_requests
+    workload += [(url, host) for url, host in sites.items() for _ in range(args.site_requests)]
+    rnd.shuffle(workload)
+
+    responses = {'total': 0, 'overload': 0}
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def fetch(url: str, host: SimulatedHost):
+        async with semaphore:
+            while True:
+                async with concurrency.slot(url) as slot:
+                    status = await host.handle()
+                    slot.observe(status)
+                responses['total'] += 1
+                if status == 200:
+                    return
+                responses['overload'] += 1
+
+    started = time.monotonic()
+    await asyncio.gather(*[fetch(url, host) for url, host in workload])
+    wall = time.monotonic() - started
+    concurrency.save()
+
+    limits = concurrency.get_stats()['limits']
+    site_limits = [limit for host, limit in limits.items() if host != 'places.googleapis.com']
+    return {
+        'wall': wall,
+        'throughput': len(workload) / wall,
+        'overload': responses['overload'] / responses['total'],
+        'api_limit': limits.get('places.googleapis.com', 0.0),
+        'site_limit': sum(site_limits) / len(site_limits) if site_limits else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate adaptive per-host concurrency')
+    parser.add_argument('--api-requests', type=int, default=1000, help='Requests to the provider API')
+    parser.add_argument('--api-capacity', type=int, default=24, help='Concurrent requests the API serves')
+    parser.add_argument('--api-latency', type=float, default=0.04, help='API response time (seconds)')
+    parser.add_argument('--sites', type=int, default=20, help='Simulated websites')
+    parser.add_argument('--site-requests', type=int, default=20, help='Requests per website')
+    parser.add_argument('--site-capacity', type=int, default=3, help='Concurrent requests a website serves')
+    parser.add_argument('--site-latency', type=float, default=0.08, help='Website response time (seconds)')
+    parser.add_argument('--concurrency', type=int, default=100, help='Requests in flight overall')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed')
+    args = parser.parse_args()
+
+    print(f"Batch: {args.api_requests:,} API requests (capacity {args.api_capacity}), "
+          f"{args.sites * args.site_requests:,} website requests over {args.sites} sites "
+          f"(capacity {args.site_capacity})")
+    print()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = HostLimitStore(str(Path(tmpdir) / "host_limits.db"))
+        rows = [
+            ('fixed (2 per host)', run_batch(args, ConcurrencySettings(enabled=False), store)),
+            ('adaptive (cold)', run_batch(args, ConcurrencySettings(), store)),
+            ('adaptive (learned)', run_batch(args, ConcurrencySettings(), store)),
+        ]
+        results = [(name, asyncio.run(batch)) for name, batch in rows]
+
+    base = results[0][1]['throughput']
+    print(f"{'Controller':<22}{'Wall s':>9}{'Req/s':>9}{'x':>7}{'429/503':>10}{'API limit':>11}{'Site limit':>12}")
+    for name, result in results:
+        print(f"{name:<22}{result['wall']:>9.2f}{result['throughput']:>9.0f}{result['throughput'] / base:>7.1f}"
+              f"{result['overload']:>10.1%}{result['api_limit']:>11.1f}{result['site_limit']:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+HTML Extraction Microbenchmark
+
+Compares the legacy scraping path (full BeautifulSoup tree + regexes over the
+raw HTML) with the single-pass extraction engine in
+src/services/html_extraction.py, per parser backend, on a corpus of saved
+pages. Reports CPU time and peak traced memory per page.
+
+Corpus sources (combine freely):
+    --pages DIR         *.html / *.htm files saved from real sites
+    --cassettes PATH    text/html responses from an HTTP cassette store
+    --synthetic N       generated pages (used when nothing else is given)
+
+Usage:
+    python scripts/benchmark_html_extraction.py --cassettes data/http_cassettes.db
+    python scripts/benchmark_html_extraction.py --pages saved_pages/ --repeat 5
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import time
+import tracemalloc
+import zlib
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from src.services.html_extraction import PARSER_BACKENDS, etree, extract_page
+
+
+def load_page_files(directory: Path) -> List[Tuple[str, str]]:
+    """Load saved pages from a directory."""
+    pages = []
+    for path in sorted(directory.rglob('*')):
+        if path.suffix.lower() in ('.html', '.htm'):
+            pages.append((str(path), path.read_text(encoding='utf-8', errors='replace')))
+    return pages
+
+
+def load_cassette_pages(store_path: Path) -> List[Tuple[str, str]]:
+    """Load recorded HTML responses from a cassette store."""
+    pages = []
+    with sqlite3.connect(store_path) as conn:
+        for url, headers_json, body in conn.execute("SELECT url, headers, body FROM cassette"):
+            headers = {k.lower(): v for k, v in json.loads(headers_json).items()}
+            if 'html' not in headers.get('content-type', ''):
+                continue
+            pages.append((url, zlib.decompress(body).decode('utf-8', errors='replace')))
+    return pages
+
+
+def synthetic_pages(count: int) -> List[Tuple[str, str]]:
+    """Generate business-site-like pages of varying size."""
+    pages = []
+    for i in range(count):
+        sections = 20 + (i % 10) * 40
+        body = ''.join(
+            f'<div class="section"><h2>Section {j}</h2>'
+            f'<p>Hamilton Manufacturing has served customers since 1985 with a team of 45 employees. '
+            f'Call (905) 555-{j % 10000:04d} or email info{j}@hamilton-mfg.ca for quotes.</p>'
+            f'<a href="/products/{j}">Product {j}</a></div>'
+            for j in range(sections)
+        )
+        html = (
+            '<html><head><title>Hamilton Manufacturing</title>'
+            '<meta name="description" content="Precision machining">'
+            f'<script>var config = {{"id": {i}}};</script><style>.x{{color:red}}</style></head>'
+            '<body><nav><a href="/about">About</a><a href="/contact-us">Contact</a></nav>'
+            f'{body}<footer><a href="mailto:sales@hamilton-mfg.ca">Email</a> '
+            '<a href="tel:+19055550100">Call</a> &copy; 2024</footer></body></html>'
+        )
+        pages.append((f'synthetic-{i}', html))
+    return pages
+
+
+def legacy_extract(html: str):
+    """The pre-engine path: full soup tree plus uncompiled regexes over raw HTML."""
+    soup = BeautifulSoup(html, 'html.parser')
+    text = soup.get_text()
+    links = soup.find_all('a', href=re.compile('/contact', re.IGNORECASE))
+    emails = set(re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', html))
+    phones = set()
+    for pattern in (r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b', r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}\b', r'\b\d{10}\b'):
+        phones.update(re.findall(pattern, html))
+    return text, links, emails, phones
+
+
+def measure(extract: Callable[[str], object], pages: List[Tuple[str, str]], repeat: int) -> Tuple[float, float]:
+    """Return (mean CPU ms per page, max peak KB per page)."""
+    peak_kb = 0.0
+    for _, html in pages:
+        tracemalloc.start()
+        extract(html)
+        peak_kb = max(peak_kb, tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+
+    start = time.process_time()
+    for _ in range(repeat):
+        for _, html in pages:
+            extract(html)
+    cpu_ms = (time.process_time() - start) * 1000 / (repeat * len(pages))
+    return cpu_ms, peak_kb
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HTML extraction')
+    parser.add_argument('--pages', type=Path, help='Directory of saved HTML pages')
+    parser.add_argument('--cassettes', type=Path, help='HTTP cassette store to read HTML responses from')
+    parser.add_argument('--synthetic', type=int, default=0, help='Number of generated pages')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions over the corpus')
+    args = parser.parse_args()
+
+    pages = []
+    if args.pages:
+        pages.extend(load_page_files(args.pages))
+    if args.cassettes:
+        pages.extend(load_cassette_pages(args.cassettes))
+    if args.synthetic or not pages:
+        pages.extend(synthetic_pages(args.synthetic or 50))
+
+    total_kb = sum(len(html.encode('utf-8')) for _, html in pages) / 1024
+    print(f"Corpus: {len(pages)} pages, {total_kb:,.0f} KB total, {total_kb / len(pages):,.1f} KB mean")
+    print()
+
+    candidates = [('legacy (bs4 + raw regex)', legacy_extract)]
+    for backend in PARSER_BACKENDS:
+        if backend == 'lxml' and etree is None:
+            continue
+        candidates.append((f'engine ({backend})', lambda html, b=backend: extract_page(html, backend=b)))
+
+    results = []
+    for name, extract in candidates:
+        cpu_ms, peak_kb = measure(extract, pages, args.repeat)
+        results.append((name, cpu_ms, peak_kb))
+
+    base_ms, base_kb = results[0][1], results[0][2]
+    print(f"{'Path':<28}{'CPU ms/page':>14}{'Peak KB/page':>15}{'CPU x':>9}{'Mem x':>9}")
+    for name, cpu_ms, peak_kb in results:
+        print(f"{name:<28}{cpu_ms:>14.2f}{peak_kb:>15.0f}{base_ms / cpu_ms:>9.1f}{base_kb / peak_kb:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
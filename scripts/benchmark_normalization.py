@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Normalization Kernel Benchmark
+
+Compares records/second for the legacy normalizers (patterns compiled and
+suffix lists looped over on every call) with the shared kernel in
+src/core/normalization.py, on a synthetic discovery stream where the same
+businesses arrive several times in slightly different formats:
+
+    legacy              per-call regex loops (the old fingerprinting helpers)
+    kernel (cold)       precompiled patterns, caches cleared before each pass
+    kernel (warm)       precompiled patterns with memoized repeats
+
+The column section compares a per-row pandas .map() with normalize_column(),
+which normalizes each distinct value once.
+
+Usage:
+    python scripts/benchmark_normalization.py
+    python scripts/benchmark_normalization.py --records 200000 --distinct 20000
+"""
+
+import argparse
+import hashlib
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+from src.core.normalization import (
+    clear_normalization_caches,
+    compute_fingerprint,
+    extract_street_number,
+    normalize_city,
+    normalize_column,
+    normalize_entity_name,
+    normalize_name,
+    normalize_phone,
+    normalize_street_name,
+    normalize_website,
+)
+
+NAME_SUFFIXES = ['Inc.', 'Inc', 'Ltd', 'Limited', 'Corp.', '']
+STREET_TYPES = [('St', 'Street'), ('Ave', 'Avenue'), ('Rd', 'Road'), ('Blvd', 'Boulevard')]
+CITIES = ['Hamilton', 'Dundas', 'Ancaster', 'Stoney Creek', 'Burlington']
+
+
+def discovery_stream(records: int, distinct: int, seed: int = 11) -> List[Dict[str, str]]:
+    """Records drawn from `distinct` businesses, each seen in varying formats."""
+    rnd = random.Random(seed)
+    stream = []
+    for _ in range(records):
+        i = rnd.randrange(distinct)
+        short, full = STREET_TYPES[i % len(STREET_TYPES)]
+        stream.append({
+            'name': f"Precision Works {i} {rnd.choice(NAME_SUFFIXES)}".strip(),
+            'street': f"{i % 900 + 1} Barton {rnd.choice([short, full, short + '.'])} {rnd.choice(['E', 'East', ''])}".strip(),
+            'city': CITIES[i % len(CITIES)],
+            'postal_code': f"L8L {i % 10}W{i % 7}",
+            'phone': rnd.choice([f"(905) 555-{i % 10000:04d}", f"905.555.{i % 10000:04d}", f"+1 905 555 {i % 10000:04d}"]),
+            'website': rnd.choice([f"https://www.works{i}.ca/", f"http://works{i}.ca/about", f"works{i}.ca"]),
+        })
+    return stream
+
+
+def legacy_entity_name(name: str) -> str:
+    name = name.lower()
+    for suffix in ['inc', 'ltd', 'limited', 'corp', 'corporation', 'llc', 'incorporated', 'co', 'company',
+                   'enterprises', 'ent', 'group', 'holding', 'holdings', 'international', 'intl']:
+        name = re.sub(r'\b' + suffix + r's?\.?\b', '', name, flags=re.IGNORECASE)
+    name = name.replace(' and ', ' ').replace(' & ', ' ')
+    name = re.sub(r'[^\w\s]', '', name)
+    return ' '.join(name.split()).strip()
+
+
+def legacy_street(street: str) -> str:
+    street = street.lower()
+    for street_type in ['street', 'st', 'avenue', 'ave', 'road', 'rd', 'drive', 'dr', 'boulevard', 'blvd', 'lane', 'ln',
+                        'court', 'ct', 'crt', 'place', 'pl', 'terrace', 'terr', 'parkway', 'pkwy', 'way']:
+        street = re.sub(r'\b' + street_type + r'\.?\b', '', street, flags=re.IGNORECASE)
+    for direction in ['east', 'west', 'north', 'south', 'e', 'w', 'n', 's']:
+        street = re.sub(r'\b' + direction + r'\.?\b', '', street, flags=re.IGNORECASE)
+    for indicator in ['unit', 'suite', 'ste', 'apt', 'apartment', '#']:
+        street = re.sub(r'\b' + indicator + r'\.?\s*\d*', '', street, flags=re.IGNORECASE)
+    street = re.sub(r'[^\w\s]', '', street)
+    street = re.sub(r'\d+', '', street)
+    return ' '.join(street.split()).strip()
+
+
+def legacy_website(url: str) -> str:
+    url = re.sub(r'^www\.', '', re.sub(r'^https?://', '', url.lower().strip())).rstrip('/')
+    match = re.match(r'^([^/]+)', url)
+    return match.group(1) if match else url
+
+
+def legacy_entity_key(record: Dict[str, str]) -> str:
+    """Entity-matching components as the fingerprinting module used to build them."""
+    number = re.match(r'^(\d+)', record['street'].strip())
+    return '|'.join([
+        legacy_entity_name(record['name']),
+        number.group(1) if number else '',
+        legacy_street(record['street']),
+        record['city'].lower().strip(),
+        re.sub(r'\D', '', record['phone'])[-10:],
+        legacy_website(record['website']),
+    ])
+
+
+def kernel_entity_key(record: Dict[str, str]) -> str:
+    return '|'.join([
+        normalize_entity_name(record['name']),
+        extract_street_number(record['street']) or '',
+        normalize_street_name(record['street']),
+        normalize_city(record['city']),
+        normalize_phone(record['phone']),
+        normalize_website(record['website']),
+    ])
+
+
+def legacy_fingerprint(business: Dict[str, str]) -> str:
+    """The previous compute_fingerprint body (uncompiled patterns, no caching)."""
+    name = re.sub(r'\b(inc|ltd|corp|incorporated|limited|corporation|llc)\b', '', business.get('name', '').lower())
+    name = re.sub(r'[^\w\s]', '', name).strip()
+    street = re.sub(r'\b(street|st|avenue|ave|road|rd|drive|dr|boulevard|blvd|lane|ln)\b', '',
+                    business.get('street', '').lower())
+    street = re.sub(r'[^\w\s\d]', '', street).strip()
+    street_match = re.match(r'^(\d+)', street)
+    postal_raw = business.get('postal_code', '') or ''
+    phone = business.get('phone', '')
+    components = [
+        name, street_match.group(1) if street_match else '', street, business.get('city', '').lower().strip(),
+        postal_raw.upper().replace(' ', '')[:3] if postal_raw else '', re.sub(r'\D', '', phone)[-10:] if phone else ''
+    ]
+    return hashlib.sha256('|'.join(c for c in components if c).encode('utf-8')).hexdigest()[:16]
+
+
+def measure(func: Callable[[Dict[str, str]], str], stream: List[Dict[str, str]], repeat: int, cold: bool) -> float:
+    """Return records/second (best of `repeat` passes)."""
+    best = float('inf')
+    for _ in range(repeat):
+        if cold:
+            clear_normalization_caches()
+        start = time.perf_counter()
+        for record in stream:
+            func(record)
+        best = min(best, time.perf_counter() - start)
+    return len(stream) / best
+
+
+def report(title: str, rows: List[tuple]):
+    base = rows[0][1]
+    print(title)
+    print(f"{'Path':<24}{'Records/s':>14}{'x':>8}")
+    for name, rate in rows:
+        print(f"{name:<24}{rate:>14,.0f}{rate / base:>8.1f}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the normalization kernel')
+    parser.add_argument('--records', type=int, default=100_000, help='Records in the discovery stream')
+    parser.add_argument('--distinct', type=int, default=10_000, help='Distinct businesses in the stream')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing passes (best is reported)')
+    args = parser.parse_args()
+
+    stream = discovery_stream(args.records, args.distinct)
+    assert all(legacy_entity_key(r) == kernel_entity_key(r) for r in stream[:1000])
+    assert all(legacy_fingerprint(r) == compute_fingerprint(r) for r in stream[:1000])
+    print(f"Stream: {args.records:,} records, {args.distinct:,} distinct businesses")
+    print()
+
+    report("Entity-matching key (name, street, city, phone, website)", [
+        ('legacy', measure(legacy_entity_key, stream, args.repeat, cold=False)),
+        ('kernel (cold)', measure(kernel_entity_key, stream, args.repeat, cold=True)),
+        ('kernel (warm)', measure(kernel_entity_key, stream, args.repeat, cold=False)),
+    ])
+    report("compute_fingerprint", [
+        ('legacy', measure(legacy_fingerprint, stream, args.repeat, cold=False)),
+        ('kernel (cold)', measure(compute_fingerprint, stream, args.repeat, cold=True)),
+        ('kernel (warm)', measure(compute_fingerprint, stream, args.repeat, cold=False)),
+    ])
+
+    names = pd.Series([r['name'] for r in stream])
+    uncached = normalize_name.__wrapped__
+    rows = []
+    for label, func in (('Series.map (per row)', lambda: names.map(uncached)),
+                        ('normalize_column', lambda: normalize_column(names, 'name'))):
+        clear_normalization_caches()
+        start = time.perf_counter()
+        func()
+        rows.append((label, len(names) / (time.perf_counter() - start)))
+    report("Name column (pandas)", rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,15 @@
 Consolidate all Phase 2 FIXED leads and remove cross-industry duplicates.
 """
 import csv
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Set
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.exports.lead_snapshot import load_lead_records, pa, preferred_lead_path, write_lead_snapshot
+
 def consolidate_leads():
     """Consolidate all fixed leads and deduplicate across industries."""
     print("="*80)
@@ -37,31 +42,29 @@ def consolidate_leads():
     for lead_file in lead_files:
         industry = lead_file.stem.replace('PHASE2_FIXED_LEADS_', '').rsplit('_', 2)[0]
 
-        with open(lead_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            leads_in_file = 0
-            dups_in_file = 0
+        leads_in_file = 0
+        dups_in_file = 0
 
-            for row in reader:
-                business_name = row['Business Name']
-                website = row.get('Website', '')
-                phone = row.get('Phone', '')
+        for row in load_lead_records(preferred_lead_path(lead_file)):
+            business_name = row['Business Name']
+            website = row.get('Website', '')
+            phone = row.get('Phone', '')
 
-                # Create unique key
-                unique_key = f"{business_name}|{website or phone}"
+            # Create unique key
+            unique_key = f"{business_name}|{website or phone}"
 
-                if unique_key in seen_businesses:
-                    duplicates_removed += 1
-                    dups_in_file += 1
-                    continue
+            if unique_key in seen_businesses:
+                duplicates_removed += 1
+                dups_in_file += 1
+                continue
 
-                seen_businesses.add(unique_key)
-                all_leads.append(row)
-                leads_in_file += 1
+            seen_businesses.add(unique_key)
+            all_leads.append(row)
+            leads_in_file += 1
 
-            leads_by_industry[industry] = leads_in_file
-            if dups_in_file > 0:
-                print(f"  ⚠️  {industry}: {dups_in_file} duplicates removed")
+        leads_by_industry[industry] = leads_in_file
+        if dups_in_file > 0:
+            print(f"  ⚠️  {industry}: {dups_in_file} duplicates removed")
 
     print()
     print(f"📊 Deduplication Results:")
@@ -81,6 +84,9 @@ def consolidate_leads():
             writer.writeheader()
             writer.writerows(all_leads)
 
+    if all_leads and pa is not None:
+        write_lead_snapshot(all_leads, consolidated_file.with_suffix('.parquet'))
+
     print(f"✅ Exported {len(all_leads)} unique leads to:")
     print(f"   {consolidated_file.name}")
     print()
@@ -173,10 +173,12 @@ async def export_qualified_leads(db_path: str, target_count: int, output_file: s
         # Export using existing CSV exporter
         print(f"\n📤 Exporting to: {output_file}")
         exporter = CSVExporter(db_path)
-        stats = await exporter.export(output_file)
+        stats = await exporter.export(output_file, snapshot_path=str(Path(output_file).with_suffix('.parquet')))
 
         print(f"\n✅ Export Complete:")
         print(f"   File: {output_file}")
+        if stats['snapshot_path']:
+            print(f"   Snapshot: {stats['snapshot_path']}")
         print(f"   Total businesses: {stats['total']}")
         print(f"   Qualified: {stats['qualified']}")
         print(f"   Excluded: {stats['excluded']}")
@@ -11,6 +11,7 @@ Usage:
     python scripts/review_queue.py approve <business_id> --reason "Legitimate manufacturing business"
     python scripts/review_queue.py reject <business_id> --reason "Funeral home - not target market"
     python scripts/review_queue.py stats
+    python scripts/review_queue.py similar "ABC Mfg" --city Hamilton
 """
 
 import sys
@@ -25,6 +26,7 @@ import structlog
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.models import LeadStatus
+from src.core.name_index import ensure_name_index, similar_names
 from src.database.connection import DatabaseManager
 from src.core.config import config
 
@@ -236,6 +238,52 @@ class ReviewQueue:
             print(f"❌ Error rejecting lead: {e}")
             sys.exit(1)
 
+    async def find_similar(
+        self,
+        name: str,
+        city: Optional[str] = None,
+        fsa: Optional[str] = None,
+        limit: int = 10
+    ):
+        """
+        List leads whose names are similar to name (possible duplicates).
+
+        Args:
+            name: Business name to look up
+            city: Only leads in this city
+            fsa: Only leads in this FSA (first 3 characters of the postal code)
+            limit: Maximum leads to display
+        """
+        try:
+            async with self.db.get_connection() as db:
+                await ensure_name_index(db, table='leads')
+                matches = await similar_names(db, name, k=limit, city=city, fsa=fsa, table='leads')
+
+            if not matches:
+                print(f"✅ No leads similar to '{name}'")
+                return
+
+            print(f"\n🔎 Leads Similar to '{name}' ({len(matches)})\n")
+            print("=" * 100)
+            print(f"{'ID':<8} {'Business Name':<40} {'City':<18} {'Status':<20} {'Score':<6}")
+            print("=" * 100)
+
+            for lead in matches:
+                business_name = lead.get('business_name') or ''
+                if len(business_name) > 40:
+                    business_name = business_name[:37] + '...'
+                city_name = (lead.get('city') or '')[:17]
+                status = (lead.get('status') or '')[:19]
+
+                print(f"{lead['id']:<8} {business_name:<40} {city_name:<18} {status:<20} {lead['name_similarity']:.2f}")
+
+            print("=" * 100 + "\n")
+
+        except Exception as e:
+            logger.error("find_similar_failed", name=name, error=str(e))
+            print(f"❌ Error finding similar leads: {e}")
+            sys.exit(1)
+
     async def get_stats(self):
         """Get review queue statistics."""
         try:
@@ -341,6 +389,13 @@ async def main():
     # Stats command
     stats_parser = subparsers.add_parser('stats', help='Show review queue statistics')
 
+    # Similar command
+    similar_parser = subparsers.add_parser('similar', help='Find leads with similar names')
+    similar_parser.add_argument('name', help='Business name to look up')
+    similar_parser.add_argument('--city', help='Only leads in this city')
+    similar_parser.add_argument('--fsa', help='Only leads in this FSA (e.g. L8N)')
+    similar_parser.add_argument('--limit', type=int, default=10, help='Maximum leads to display')
+
     args = parser.parse_args()
 
     if not args.command:
@@ -370,6 +425,8 @@ async def main():
         await queue.reject_lead(args.business_id, args.reason, args.analyst)
     elif args.command == 'stats':
         await queue.get_stats()
+    elif args.command == 'similar':
+        await queue.find_similar(args.name, city=args.city, fsa=args.fsa, limit=args.limit)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,54 @@
+"""
+Incrementally Revalidate Businesses in Database
+
+Re-runs only the gates whose evidence or rules changed since the last run
+and prints the dirty-set report.
+"""
+import argparse
+import asyncio
+import json
+
+import aiosqlite
+import structlog
+
+from src.services.incremental_revalidation import IncrementalRevalidator
+
+logger = structlog.get_logger(__name__)
+
+
+async def revalidate(db_path: str, dry_run: bool, as_json: bool):
+    """Revalidate all validated businesses in the database."""
+    db = await aiosqlite.connect(db_path)
+    db.row_factory = aiosqlite.Row
+
+    try:
+        report = await IncrementalRevalidator().revalidate(db, dry_run=dry_run)
+
+        if as_json:
+            print(json.dumps(report.to_dict(), indent=2))
+            return
+
+        print("\n" + "="*60)
+        print("INCREMENTAL REVALIDATION")
+        print("="*60)
+        print(report.summary())
+
+        if report.status_changes:
+            print("\nStatus changes:")
+            for business_id, old, new in report.status_changes[:20]:
+                print(f"   - ID {business_id}: {old} → {new}")
+
+        print("="*60)
+
+    finally:
+        await db.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Revalidate only businesses whose evidence or rules changed")
+    parser.add_argument('--db', default='data/leads_v3.db', help="Path to leads database")
+    parser.add_argument('--dry-run', action='store_true', help="Report the dirty set without re-running gates")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args()
+
+    asyncio.run(revalidate(args.db, args.dry_run, args.json))
@@ -12,6 +12,10 @@ from typing import List, Dict
 import subprocess
 import json
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.exports.lead_snapshot import load_leads, pa, preferred_lead_path, write_lead_snapshot
+
 class ValidationPipeline:
     """Multi-stage lead validation pipeline"""
 
@@ -59,7 +63,7 @@ class ValidationPipeline:
                 continue
 
             print(f"Loading: {file_path.name}...", end=' ')
-            df = pd.read_csv(file_path)
+            df = load_leads(preferred_lead_path(file_path) if file_path.suffix == '.csv' else file_path)
             df['source_file'] = file_path.stem
             all_data.append(df)
             print(f"✅ {len(df)} records")
@@ -462,6 +466,8 @@ TOP 10 LEADS:
 
         # Save output
         df.to_csv(output_file, index=False)
+        if pa is not None:
+            write_lead_snapshot(df, Path(output_file).with_suffix('.parquet'))
 
         # Generate summary
         summary = self.generate_summary(df, initial_count)
@@ -43,9 +43,14 @@ class AutomationSchedule:
     
     # Execution limits
     max_leads_per_run: int = 50
-    max_concurrent_runs: int = 1
+    max_concurrent_runs: int = 2  # Worker slots shared by all scheduled tasks
     timeout_minutes: int = 30
 
+    # Dispatch behaviour
+    jitter_seconds: int = 0  # Default random start delay per run
+    misfire_grace_seconds: int = 300  # Runs later than this count as missed
+    max_catch_up_runs: int = 3  # Cap for CatchUpPolicy.RUN_ALL
+
 
 @dataclass 
 class AlertConfig:
@@ -116,8 +121,10 @@ class AutomationConfig:
         """Validate configuration after initialization."""
         if self.environment == "production":
             # Production safety checks
-            if self.schedule.max_concurrent_runs > 1:
-                self.schedule.max_concurrent_runs = 1
+            # Overlap policies keep a task from running twice; the slot cap
+            # only bounds how many different tasks run side by side
+            if self.schedule.max_concurrent_runs > 4:
+                self.schedule.max_concurrent_runs = 4
                 
             if self.schedule.timeout_minutes > 60:
                 self.schedule.timeout_minutes = 60
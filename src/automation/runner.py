@@ -9,7 +9,7 @@ from typing import Optional
 import structlog
 
 from .config import automation_config
-from .scheduler import AutomationScheduler
+from .scheduler import AutomationScheduler, CatchUpPolicy, OverlapPolicy
 from .monitoring import MonitoringService
 from ..core.config import config
 from ..agents.orchestrator import LeadGenerationOrchestrator
@@ -55,16 +55,22 @@ class AutomatedLeadGenerator:
                     name="Automated Lead Generation Pipeline",
                     function=self._execute_pipeline,
                     schedule=self._get_schedule_expression(),
-                    enabled=True
+                    enabled=True,
+                    # Never stack pipeline runs; after downtime run once, not once per missed slot
+                    overlap_policy=OverlapPolicy.SKIP,
+                    catch_up_policy=CatchUpPolicy.RUN_ONCE
                 )
                 
-                # Add monitoring task
+                # Add monitoring task (runs in its own worker slot alongside the pipeline)
                 self.scheduler.add_task(
                     task_id="system_monitoring",
                     name="System Health Monitoring",
                     function=self._update_monitoring,
                     schedule="*/5 * * * *",  # Every 5 minutes
-                    enabled=True
+                    enabled=True,
+                    overlap_policy=OverlapPolicy.SKIP,
+                    catch_up_policy=CatchUpPolicy.SKIP,
+                    jitter_seconds=0
                 )
             
             # Start the scheduler
@@ -1,11 +1,20 @@
 """
 Production-grade task scheduler with cron support and error handling.
+
+Due times live in a min-heap; the loop sleeps until the earliest one (or until
+a task finishes or is added) and dispatches due tasks into a bounded pool of
+worker slots without awaiting them, so a long pipeline run never blocks
+monitoring or export tasks.
 """
 import asyncio
+import heapq
+import itertools
+import random
 import signal
 import sys
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Deque, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -25,6 +34,20 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class OverlapPolicy(Enum):
+    """What to do when a task comes due while its previous run is still active."""
+    SKIP = "skip"  # Drop the new run
+    QUEUE = "queue"  # Run again as soon as the current run finishes
+    CANCEL_PREVIOUS = "cancel_previous"  # Cancel the current run and start fresh
+
+
+class CatchUpPolicy(Enum):
+    """What to do with runs missed while the process was down or slots were busy."""
+    SKIP = "skip"  # Drop missed runs, wait for the next scheduled time
+    RUN_ONCE = "run_once"  # Coalesce all missed runs into one
+    RUN_ALL = "run_all"  # Replay each missed run (capped by max_catch_up_runs)
+
+
 @dataclass
 class ScheduledTask:
     """Represents a scheduled automation task."""
@@ -39,6 +62,13 @@ class ScheduledTask:
     error_count: int = 0
     last_error: Optional[str] = None
     enabled: bool = True
+    overlap_policy: OverlapPolicy = OverlapPolicy.SKIP
+    catch_up_policy: CatchUpPolicy = CatchUpPolicy.RUN_ONCE
+    jitter_seconds: float = 0.0
+    timeout_minutes: Optional[int] = None  # Falls back to config.schedule.timeout_minutes
+    queued_runs: int = 0
+    skipped_runs: int = 0
+    missed_runs: int = 0
 
 
 class AutomationScheduler:
@@ -50,7 +80,8 @@ class AutomationScheduler:
     - Graceful shutdown handling  
     - Task monitoring and logging
     - Error recovery and circuit breaker
-    - Concurrent execution limits
+    - Concurrent execution limits (worker slots)
+    - Per-task overlap, catch-up and jitter policies
     """
     
     def __init__(self, config: AutomationConfig):
@@ -61,6 +92,13 @@ class AutomationScheduler:
         self.tasks: Dict[str, ScheduledTask] = {}
         self.running_tasks: Dict[str, asyncio.Task] = {}
         self.shutdown_event = asyncio.Event()
+
+        # Dispatch state: heap of (due_at, seq, task_id), FIFO of tasks waiting for a slot
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._due_at: Dict[str, datetime] = {}
+        self._seq = itertools.count()
+        self._ready: Deque[str] = deque()
+        self._wakeup = asyncio.Event()
         
         # Execution tracking
         self.stats = {
@@ -68,7 +106,10 @@ class AutomationScheduler:
             'successful_runs': 0,
             'failed_runs': 0,
             'avg_runtime_seconds': 0.0,
-            'last_run_time': None
+            'last_run_time': None,
+            'skipped_runs': 0,
+            'missed_runs': 0,
+            'cancelled_runs': 0
         }
         
         # Setup signal handlers for graceful shutdown
@@ -91,7 +132,11 @@ class AutomationScheduler:
         name: str,
         function: Callable,
         schedule: str,
-        enabled: bool = True
+        enabled: bool = True,
+        overlap_policy: OverlapPolicy = OverlapPolicy.SKIP,
+        catch_up_policy: CatchUpPolicy = CatchUpPolicy.RUN_ONCE,
+        jitter_seconds: Optional[float] = None,
+        timeout_minutes: Optional[int] = None
     ) -> ScheduledTask:
         """
         Add a new scheduled task.
@@ -102,6 +147,10 @@ class AutomationScheduler:
             function: Async function to execute
             schedule: Cron expression or interval (e.g., "0 9 * * *" or "hourly")
             enabled: Whether the task is enabled
+            overlap_policy: Behaviour when due while the previous run is active
+            catch_up_policy: Behaviour for runs missed by more than the grace period
+            jitter_seconds: Max random start delay (default: config.schedule.jitter_seconds)
+            timeout_minutes: Per-task timeout (default: config.schedule.timeout_minutes)
             
         Returns:
             Created ScheduledTask
@@ -119,15 +168,23 @@ class AutomationScheduler:
             function=function,
             schedule=schedule,
             enabled=enabled,
-            next_run=self._calculate_next_run(schedule)
+            next_run=self._calculate_next_run(schedule),
+            overlap_policy=overlap_policy,
+            catch_up_policy=catch_up_policy,
+            jitter_seconds=(self.config.schedule.jitter_seconds
+                            if jitter_seconds is None else jitter_seconds),
+            timeout_minutes=timeout_minutes
         )
         
         self.tasks[task_id] = task
+        self._push(task)
         self.logger.info("task_added", 
                         task_id=task_id, 
                         name=name, 
                         schedule=schedule,
-                        next_run=task.next_run)
+                        next_run=task.next_run,
+                        overlap_policy=overlap_policy.value,
+                        catch_up_policy=catch_up_policy.value)
         
         return task
     
@@ -172,12 +229,13 @@ class AutomationScheduler:
         """Start the scheduler and begin processing tasks."""
         self.logger.info("scheduler_starting", 
                         task_count=len(self.tasks),
+                        worker_slots=self.config.schedule.max_concurrent_runs,
                         environment=self.config.environment)
         
         try:
             while not self.shutdown_event.is_set():
                 await self._process_pending_tasks()
-                await asyncio.sleep(60)  # Check every minute
+                await self._wait_for_next_due()
                 
         except Exception as e:
             self.logger.error("scheduler_error", error=str(e))
@@ -186,22 +244,138 @@ class AutomationScheduler:
             await self._cleanup_running_tasks()
             self.logger.info("scheduler_stopped")
     
+    def _push(self, task: ScheduledTask):
+        """Put a task's next run on the heap, applying jitter."""
+        if not task.next_run:
+            return
+        due_at = task.next_run
+        if task.jitter_seconds:
+            due_at += timedelta(seconds=random.uniform(0, task.jitter_seconds))
+        self._due_at[task.task_id] = due_at
+        heapq.heappush(self._heap, (due_at, next(self._seq), task.task_id))
+        self._wakeup.set()
+    
+    async def _wait_for_next_due(self):
+        """Sleep until the earliest due time, a finished run, or a new task."""
+        self._wakeup.clear()
+        timeout = 60.0
+        if self._heap:
+            timeout = min(timeout, max(0.0, (self._heap[0][0] - datetime.now()).total_seconds()))
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    
     async def _process_pending_tasks(self):
-        """Check and execute pending tasks."""
+        """Pop due tasks off the heap and dispatch them into free worker slots."""
         current_time = datetime.now()
         
-        for task_id, task in self.tasks.items():
+        while self._heap and self._heap[0][0] <= current_time:
+            due_at, _, task_id = heapq.heappop(self._heap)
+            task = self.tasks.get(task_id)
+            # Stale entry: task removed or rescheduled since this was pushed
+            if task is None or self._due_at.get(task_id) != due_at:
+                continue
+            del self._due_at[task_id]
             if not task.enabled:
                 continue
-                
-            if task.next_run and current_time >= task.next_run:
-                # Check concurrent execution limit
-                if len(self.running_tasks) >= self.config.schedule.max_concurrent_runs:
-                    self.logger.warning("concurrent_limit_reached", 
-                                      limit=self.config.schedule.max_concurrent_runs)
-                    continue
-                
-                await self._execute_task(task)
+            
+            runs = self._runs_due(task, current_time)
+            task.next_run = self._calculate_next_run(task.schedule, current_time)
+            self._push(task)
+            
+            if runs:
+                self._enqueue(task)
+                # Catch-up replays run back to back after the first
+                task.queued_runs += runs - 1
+        
+        self._dispatch_ready()
+    
+    def _runs_due(self, task: ScheduledTask, current_time: datetime) -> int:
+        """Number of runs to start now, applying the task's catch-up policy."""
+        lateness = (current_time - task.next_run).total_seconds()
+        if lateness <= self.config.schedule.misfire_grace_seconds:
+            return 1
+        
+        # Count scheduled times that passed without a run
+        missed = 0
+        run_time = task.next_run
+        while run_time <= current_time and missed < 1000:
+            missed += 1
+            run_time = self._calculate_next_run(task.schedule, run_time)
+        
+        if task.catch_up_policy == CatchUpPolicy.SKIP:
+            runs = 0
+        elif task.catch_up_policy == CatchUpPolicy.RUN_ALL:
+            runs = min(missed, self.config.schedule.max_catch_up_runs)
+        else:
+            runs = 1
+        
+        task.missed_runs += missed - runs
+        self.stats['missed_runs'] += missed - runs
+        self.logger.warning("task_runs_missed",
+                          task_id=task.task_id,
+                          missed=missed,
+                          running=runs,
+                          catch_up_policy=task.catch_up_policy.value,
+                          lateness_seconds=round(lateness))
+        return runs
+    
+    def _enqueue(self, task: ScheduledTask):
+        """Queue a run for a worker slot, applying the task's overlap policy."""
+        task_id = task.task_id
+        active = task_id in self.running_tasks or task_id in self._ready
+        
+        if not active:
+            self._ready.append(task_id)
+        elif task.overlap_policy == OverlapPolicy.QUEUE:
+            task.queued_runs += 1
+            self.logger.info("task_run_queued", task_id=task_id, queued_runs=task.queued_runs)
+        elif task.overlap_policy == OverlapPolicy.CANCEL_PREVIOUS:
+            running = self.running_tasks.get(task_id)
+            if running is not None:
+                running.cancel()
+                self.stats['cancelled_runs'] += 1
+                self.logger.warning("task_previous_run_cancelled", task_id=task_id)
+                self._ready.append(task_id)
+        else:
+            task.skipped_runs += 1
+            self.stats['skipped_runs'] += 1
+            self.logger.info("task_overlap_skipped", task_id=task_id)
+    
+    def _dispatch_ready(self):
+        """Start queued runs while worker slots are free."""
+        slots = self.config.schedule.max_concurrent_runs
+        
+        # Runs whose previous run is still unwinding (cancel-previous) wait their turn
+        blocked = []
+        while self._ready and len(self.running_tasks) < slots:
+            task_id = self._ready.popleft()
+            task = self.tasks.get(task_id)
+            if task is None:
+                continue
+            if task_id in self.running_tasks:
+                blocked.append(task_id)
+                continue
+            self.running_tasks[task_id] = asyncio.create_task(self._worker(task))
+        self._ready.extendleft(reversed(blocked))
+
+        if self._ready:
+            self.logger.debug("worker_slots_full",
+                            limit=slots,
+                            waiting=len(self._ready))
+    
+    async def _worker(self, task: ScheduledTask):
+        """Run a task in a worker slot and hand the slot back when done."""
+        try:
+            await self._execute_task(task)
+        finally:
+            self.running_tasks.pop(task.task_id, None)
+            if task.queued_runs and not self.shutdown_event.is_set():
+                task.queued_runs -= 1
+                self._ready.append(task.task_id)
+            self._dispatch_ready()
+            self._wakeup.set()
     
     async def _execute_task(self, task: ScheduledTask):
         """Execute a single task with error handling."""
@@ -214,28 +388,18 @@ class AutomationScheduler:
                         name=task.name,
                         run_count=task.run_count)
         
-        # Create and track the task
-        async_task = asyncio.create_task(
-            self._run_task_with_timeout(task)
-        )
-        self.running_tasks[task.task_id] = async_task
-        
-        try:
-            await async_task
-        finally:
-            # Clean up
-            if task.task_id in self.running_tasks:
-                del self.running_tasks[task.task_id]
+        await self._run_task_with_timeout(task)
     
     async def _run_task_with_timeout(self, task: ScheduledTask):
         """Run task with timeout and error handling."""
         start_time = datetime.now()
+        timeout_minutes = task.timeout_minutes or self.config.schedule.timeout_minutes
         
         try:
             # Execute with timeout
             await asyncio.wait_for(
                 task.function(),
-                timeout=self.config.schedule.timeout_minutes * 60
+                timeout=timeout_minutes * 60
             )
             
             task.status = TaskStatus.COMPLETED
@@ -258,7 +422,13 @@ class AutomationScheduler:
             
             self.logger.error("task_timeout",
                             task_id=task.task_id,
-                            timeout_minutes=self.config.schedule.timeout_minutes)
+                            timeout_minutes=timeout_minutes)
+            
+        except asyncio.CancelledError:
+            task.status = TaskStatus.CANCELLED
+            task.last_error = "Task cancelled"
+            self.logger.warning("task_cancelled", task_id=task.task_id)
+            raise
             
         except Exception as e:
             task.status = TaskStatus.FAILED
@@ -272,8 +442,7 @@ class AutomationScheduler:
                             error_count=task.error_count)
         
         finally:
-            # Schedule next run
-            task.next_run = self._calculate_next_run(task.schedule, task.last_run)
+            # Next run is scheduled at dispatch time; only record the outcome here
             self.stats['total_runs'] += 1
             self.stats['last_run_time'] = datetime.now()
     
@@ -290,6 +459,8 @@ class AutomationScheduler:
         """Gracefully shutdown the scheduler."""
         self.logger.info("scheduler_shutdown_requested")
         self.shutdown_event.set()
+        self._ready.clear()
+        self._wakeup.set()
         
         # Wait for running tasks to complete
         await self._cleanup_running_tasks()
@@ -307,7 +478,7 @@ class AutomationScheduler:
                 )
             except asyncio.TimeoutError:
                 # Force cancel remaining tasks
-                for task_id, async_task in self.running_tasks.items():
+                for task_id, async_task in list(self.running_tasks.items()):
                     async_task.cancel()
                     self.logger.warning("task_force_cancelled", task_id=task_id)
     
@@ -325,13 +496,19 @@ class AutomationScheduler:
             **self.stats,
             'active_tasks': len([t for t in self.tasks.values() if t.enabled]),
             'running_tasks': len(self.running_tasks),
+            'waiting_tasks': len(self._ready),
+            'worker_slots': self.config.schedule.max_concurrent_runs,
             'error_rate': self.stats['failed_runs'] / max(1, self.stats['total_runs'])
         }
     
     def enable_task(self, task_id: str):
         """Enable a task."""
         if task_id in self.tasks:
-            self.tasks[task_id].enabled = True
+            task = self.tasks[task_id]
+            task.enabled = True
+            # Disabled tasks drop off the heap; start again from now
+            task.next_run = self._calculate_next_run(task.schedule)
+            self._push(task)
             self.logger.info("task_enabled", task_id=task_id)
     
     def disable_task(self, task_id: str):
@@ -6,7 +6,7 @@ Task 6: Centralized Config Management with fail-fast validation.
 """
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -90,6 +90,13 @@ class AppConfig(BaseSettings):
         description="Wayback Machine API rate limit (requests/second)"
     )
 
+    RDAP_RATE_LIMIT: float = Field(
+        default=1.0,
+        ge=0.1,
+        le=10.0,
+        description="RDAP/WHOIS lookup rate limit per registry (requests/second)"
+    )
+
     # ==================== Business Criteria Thresholds ====================
     REVENUE_CONFIDENCE_THRESHOLD: float = Field(
         default=0.6,
@@ -230,6 +237,12 @@ class AppConfig(BaseSettings):
         description="Wayback Machine cache TTL (seconds)"
     )
 
+    DOMAIN_RECORD_CACHE_TTL: int = Field(
+        default=7776000,  # 90 days
+        ge=0,
+        description="Domain registration (RDAP/WHOIS) cache TTL (seconds)"
+    )
+
     # ==================== Database Settings ====================
     DATABASE_PATH: str = Field(
         default="data/leads.db",
@@ -250,6 +263,19 @@ class AppConfig(BaseSettings):
         description="Maximum database connections"
     )
 
+    # ==================== Business Type Classifier Settings ====================
+    LOCAL_CLASSIFIER_MODEL_PATH: str = Field(
+        default="data/local_classifier.json",
+        description="Local business-type model trained from QUALIFIED/EXCLUDED history"
+    )
+
+    LOCAL_CLASSIFIER_CONFIDENCE_THRESHOLD: float = Field(
+        default=0.85,
+        ge=0.5,
+        le=1.0,
+        description="Calibrated confidence below which a lead is escalated to the LLM"
+    )
+
     # ==================== HTTP Settings ====================
     HTTP_TIMEOUT: float = Field(
         default=10.0,
@@ -270,6 +296,249 @@ class AppConfig(BaseSettings):
         description="Maximum HTTP retries"
     )
 
+    HTTP_MAX_BODY_BYTES: int = Field(
+        default=2_000_000,
+        ge=10_000,
+        description="Maximum bytes read from a scraped page body; the rest is dropped"
+    )
+
+    ROBOTS_CACHE_PATH: str = Field(
+        default="data/robots_cache.db",
+        description="SQLite cache of parsed robots.txt rules per origin"
+    )
+
+    ROBOTS_CACHE_TTL_HOURS: float = Field(
+        default=24.0,
+        gt=0.0,
+        description="How long cached robots.txt rules are reused before re-fetching (hours)"
+    )
+
+    # ==================== Domain Registration Settings ====================
+    DOMAIN_RECORD_CACHE_PATH: str = Field(
+        default="data/domain_records.db",
+        description="SQLite cache of parsed RDAP/WHOIS records per domain"
+    )
+
+    WHOIS_MAX_WORKERS: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Threads reserved for blocking WHOIS fallback lookups"
+    )
+
+    # ==================== Domain Health Settings ====================
+    DOMAIN_HEALTH_ENABLED: bool = Field(
+        default=True,
+        description="Remember dead candidate websites and skip them in every enricher"
+    )
+
+    DOMAIN_HEALTH_CACHE_PATH: str = Field(
+        default="data/domain_health.db",
+        description="SQLite cache of dead hosts (NXDOMAIN, refused, TLS failure, timeout, parked)"
+    )
+
+    DOMAIN_HEALTH_TTL_HOURS: float = Field(
+        default=72.0,
+        ge=0.0,
+        description="How long NXDOMAIN and parked hosts are skipped (hours)"
+    )
+
+    DOMAIN_HEALTH_TRANSIENT_TTL_HOURS: float = Field(
+        default=6.0,
+        ge=0.0,
+        description="How long refused, TLS-failing and timed-out hosts are skipped (hours)"
+    )
+
+    DNS_PREFLIGHT_CONCURRENCY: int = Field(
+        default=50,
+        ge=1,
+        le=500,
+        description="Concurrent DNS lookups in the pre-enrichment pre-flight"
+    )
+
+    DNS_PREFLIGHT_TIMEOUT_SECONDS: float = Field(
+        default=3.0,
+        gt=0.0,
+        description="Per-host DNS timeout in the pre-flight (timeouts are not recorded)"
+    )
+
+    # ==================== Crawl Metadata Settings ====================
+    CRAWL_METADATA_ENABLED: bool = Field(
+        default=True,
+        description="Revisit scraped pages with conditional GETs and reuse extractions of unchanged pages"
+    )
+
+    CRAWL_METADATA_PATH: str = Field(
+        default="data/crawl_metadata.db",
+        description="SQLite store of per-URL ETag, Last-Modified, content hash and extracted results"
+    )
+
+    RECRAWL_INITIAL_HOURS: float = Field(
+        default=24.0,
+        ge=0.0,
+        description="Re-crawl interval for a newly scraped page (hours)"
+    )
+
+    RECRAWL_MIN_HOURS: float = Field(
+        default=6.0,
+        ge=0.0,
+        description="Shortest re-crawl interval, for pages that change on every visit (hours)"
+    )
+
+    RECRAWL_MAX_HOURS: float = Field(
+        default=720.0,
+        ge=0.0,
+        description="Longest re-crawl interval, for pages that never change (hours)"
+    )
+
+    # ==================== CSV Enrichment Settings ====================
+    CSV_ENRICHMENT_CONCURRENCY: int = Field(
+        default=8,
+        ge=1,
+        le=100,
+        description="Rows enriched concurrently by the streaming CSV runner"
+    )
+
+    CSV_ENRICHMENT_CHECKPOINT_EVERY: int = Field(
+        default=100,
+        ge=1,
+        description="Rows written between resume checkpoints"
+    )
+
+    # ==================== HTTP Cassette Settings ====================
+    HTTP_CASSETTE_MODE: str = Field(
+        default="live",
+        description="HTTP transport mode: live, record, replay"
+    )
+
+    HTTP_CASSETTE_PATH: str = Field(
+        default="data/http_cassettes.db",
+        description="SQLite cassette store for recorded HTTP responses"
+    )
+
+    HTTP_CASSETTE_ON_MISS: str = Field(
+        default="fail",
+        description="Replay behaviour for unrecorded requests: fail, passthrough"
+    )
+
+    HTTP_CASSETTE_LATENCY_MS: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Fixed simulated latency added to each replayed response (ms)"
+    )
+
+    HTTP_CASSETTE_LATENCY_SCALE: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Multiplier on the recorded latency added to each replayed response"
+    )
+
+    # ==================== Hedged Request Settings ====================
+    HEDGE_REQUESTS_ENABLED: bool = Field(
+        default=True,
+        description="Send one duplicate of a request that is slower than its host's usual latency"
+    )
+
+    HEDGE_LATENCY_PERCENTILE: float = Field(
+        default=0.9,
+        gt=0.0,
+        lt=1.0,
+        description="Host latency percentile after which a request is hedged"
+    )
+
+    HEDGE_BUDGET_RATIO: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        description="Maximum extra (hedge) requests as a fraction of all requests"
+    )
+
+    HEDGE_MIN_DELAY_SECONDS: float = Field(
+        default=0.25,
+        ge=0.0,
+        description="Never hedge a request sooner than this"
+    )
+
+    # ==================== Adaptive Concurrency Settings ====================
+    ADAPTIVE_CONCURRENCY_ENABLED: bool = Field(
+        default=True,
+        description="Adapt each host's concurrency (AIMD) instead of a fixed per-host limit"
+    )
+
+    HOST_CONCURRENCY_INITIAL: float = Field(
+        default=2.0,
+        ge=1.0,
+        description="Concurrent requests to a host before anything is learned about it"
+    )
+
+    HOST_CONCURRENCY_MAX: float = Field(
+        default=8.0,
+        ge=1.0,
+        description="Most concurrent requests to one website"
+    )
+
+    API_HOST_CONCURRENCY_MAX: float = Field(
+        default=32.0,
+        ge=1.0,
+        description="Most concurrent requests to one provider API host"
+    )
+
+    API_HOSTS: str = Field(
+        default="googleapis.com,geoapify.com,api.yelp.com",
+        description="Provider API domains (comma-separated; subdomains included)"
+    )
+
+    HOST_LIMITS_PATH: str = Field(
+        default="data/host_limits.db",
+        description="SQLite store of learned per-host concurrency limits"
+    )
+
+    HOST_LIMITS_TTL_HOURS: float = Field(
+        default=168.0,
+        ge=0.0,
+        description="Learned limits older than this are discarded (hours)"
+    )
+
+    # ==================== CPU Offload Settings ====================
+    OFFLOAD_ENABLED: bool = Field(
+        default=True,
+        description="Run CPU-bound parsing/normalization in a process pool"
+    )
+
+    OFFLOAD_MAX_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Offload worker processes (0 = one per core, minus one for the event loop)"
+    )
+
+    OFFLOAD_START_METHOD: str = Field(
+        default="spawn",
+        description="multiprocessing start method for offload workers: spawn, forkserver, fork"
+    )
+
+    # ==================== OpenStreetMap Settings ====================
+    OSM_BACKEND: str = Field(
+        default="auto",
+        description="OpenStreetMap backend: overpass, local, auto (local if the extract index exists)"
+    )
+
+    OSM_EXTRACT_DB_PATH: str = Field(
+        default="data/osm_extract.db",
+        description="SQLite index built from a local OSM extract"
+    )
+
+    OSM_DIFF_DIR: Optional[str] = Field(
+        default=None,
+        description="Directory of OsmChange replication diffs applied to the local extract"
+    )
+
+    OSM_REFRESH_INTERVAL_HOURS: float = Field(
+        default=24.0,
+        gt=0,
+        description="Apply pending diffs when the local extract is older than this"
+    )
+
     # ==================== Environment ====================
     ENVIRONMENT: str = Field(
         default="development",
@@ -286,6 +555,33 @@ class AppConfig(BaseSettings):
         description="Logging level: DEBUG, INFO, WARNING, ERROR, CRITICAL"
     )
 
+    LOG_FILE_PATH: str = Field(
+        default="logs/app.log",
+        description="Log file written by the background log writer"
+    )
+
+    LOG_FORMAT: str = Field(
+        default="console",
+        description="Log format: console (human-readable) or json"
+    )
+
+    LOG_QUEUE_SIZE: int = Field(
+        default=10000,
+        ge=100,
+        description="Max log records buffered for the background writer (excess records are dropped and counted)"
+    )
+
+    LOG_EVENT_SAMPLE_RATES: Dict[str, float] = Field(
+        default={
+            "fingerprint_computed": 5.0,
+            "rate_limit_acquired": 5.0,
+            "duplicate_blocked": 20.0,
+            "franchise_brand_excluded": 20.0,
+            "metric_recorded": 5.0,
+        },
+        description="Max events per second logged per event name (JSON object); 0 disables the event"
+    )
+
     # ==================== Validation Methods ====================
     @field_validator("REVENUE_CONFIDENCE_THRESHOLD")
     @classmethod
@@ -324,6 +620,45 @@ class AppConfig(BaseSettings):
             raise ValueError(f"ENVIRONMENT must be one of: {valid_environments}")
         return v
 
+    @field_validator("HTTP_CASSETTE_MODE")
+    @classmethod
+    def validate_cassette_mode(cls, v):
+        """Ensure cassette mode is valid."""
+        valid_modes = ["live", "record", "replay"]
+        v_lower = v.lower()
+        if v_lower not in valid_modes:
+            raise ValueError(f"HTTP_CASSETTE_MODE must be one of: {valid_modes}")
+        return v_lower
+
+    @field_validator("OFFLOAD_START_METHOD")
+    @classmethod
+    def validate_offload_start_method(cls, v):
+        """Ensure offload start method is valid."""
+        valid_methods = ["spawn", "forkserver", "fork"]
+        if v not in valid_methods:
+            raise ValueError(f"OFFLOAD_START_METHOD must be one of: {valid_methods}")
+        return v
+
+    @field_validator("HTTP_CASSETTE_ON_MISS")
+    @classmethod
+    def validate_cassette_on_miss(cls, v):
+        """Ensure cassette miss policy is valid."""
+        valid_policies = ["fail", "passthrough"]
+        v_lower = v.lower()
+        if v_lower not in valid_policies:
+            raise ValueError(f"HTTP_CASSETTE_ON_MISS must be one of: {valid_policies}")
+        return v_lower
+
+    @field_validator("OSM_BACKEND")
+    @classmethod
+    def validate_osm_backend(cls, v):
+        """Ensure OSM backend is valid."""
+        valid_backends = ["overpass", "local", "auto"]
+        v_lower = v.lower()
+        if v_lower not in valid_backends:
+            raise ValueError(f"OSM_BACKEND must be one of: {valid_backends}")
+        return v_lower
+
     @field_validator("LOG_LEVEL")
     @classmethod
     def validate_log_level(cls, v):
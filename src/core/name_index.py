@@ -0,0 +1,391 @@
+"""
+Trigram name index for fuzzy business-name lookup and cross-source grouping.
+
+Names are reduced to a matching key (lowercase, legal suffixes dropped, common
+abbreviations expanded: "ABC Mfg. Inc." -> "abc manufacturing") and compared by
+the Dice coefficient of their character trigrams.
+
+Two indexes share that scoring:
+
+- TrigramNameIndex: in-memory postings for records that are not persisted yet
+  (a discovery run being grouped across sources).
+- An SQLite FTS5 table with the trigram tokenizer per indexed table
+  (businesses_name_fts, leads_name_fts), kept in sync by triggers like the
+  R*Tree in src.core.spatial. FTS5 narrows the history to the rows sharing
+  the most rare trigrams with the query; only those are re-scored.
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# Tables with a name index, and the column holding the indexed name
+NAME_INDEXED_TABLES = {
+    'businesses': 'normalized_name',
+    'leads': 'business_name',
+}
+
+# Minimum trigram similarity for two listings to be treated as one business
+NAME_MATCH_THRESHOLD = 0.8
+
+# Candidates fetched from FTS5 before exact re-scoring
+FTS_CANDIDATE_LIMIT = 500
+
+# Trigrams in more rows than this (per city/FSA filter) are too common to
+# select candidates by
+RARE_TRIGRAM_MAX_DOCS = 500
+
+LEGAL_SUFFIXES = {
+    'inc', 'incorporated', 'ltd', 'limited', 'corp', 'corporation',
+    'llc', 'llp', 'co', 'company', 'ulc',
+}
+
+ABBREVIATIONS = {
+    'mfg': 'manufacturing',
+    'mfrs': 'manufacturers',
+    'intl': 'international',
+    'svc': 'service',
+    'svcs': 'services',
+    'bros': 'brothers',
+    'eng': 'engineering',
+    'engg': 'engineering',
+    'ind': 'industries',
+    'inds': 'industries',
+    'tech': 'technologies',
+    'assoc': 'associates',
+    'dist': 'distribution',
+    'mach': 'machine',
+    'prod': 'products',
+    'prods': 'products',
+    'cdn': 'canadian',
+    'natl': 'national',
+    'n': 'and',
+}
+
+# Abbreviated forms, so stored "abc mfg" is found from "ABC Manufacturing"
+CONTRACTIONS = {full: short for short, full in ABBREVIATIONS.items() if len(short) >= 3}
+
+
+def name_key(name: Optional[str]) -> str:
+    """Matching key for a business name ('' when nothing is left)."""
+    if not name:
+        return ''
+    text = re.sub(r"[.']", '', name.lower().replace('&', ' and '))
+    words = re.sub(r'[^\w\s]', ' ', text).split()
+    words = [ABBREVIATIONS.get(w, w) for w in words]
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+def trigrams(key: str) -> Set[str]:
+    """Character trigrams of a key, padded so word boundaries count."""
+    if not key:
+        return set()
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def name_similarity(a: Optional[str], b: Optional[str]) -> float:
+    """Dice coefficient of the trigram sets of two names (0.0-1.0)."""
+    grams_a, grams_b = trigrams(name_key(a)), trigrams(name_key(b))
+    if not grams_a or not grams_b:
+        return 0.0
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+def postal_fsa(postal_code: Optional[str]) -> Optional[str]:
+    """Forward sortation area (first three characters) of a Canadian postal code."""
+    if not postal_code:
+        return None
+    compact = postal_code.replace(' ', '').upper()
+    return compact[:3] if len(compact) >= 3 else None
+
+
+def _same_place(value: Optional[str], wanted: Optional[str]) -> bool:
+    return wanted is None or (value or '').strip().lower() == wanted.strip().lower()
+
+
+@dataclass
+class NameMatch:
+    """A candidate returned by a name index search."""
+
+    ref: Any
+    name: str
+    score: float
+    city: Optional[str] = None
+    fsa: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'ref': self.ref,
+            'name': self.name,
+            'score': round(self.score, 4),
+            'city': self.city,
+            'fsa': self.fsa,
+        }
+
+
+@dataclass
+class _Entry:
+    ref: Any
+    name: str
+    grams: Set[str]
+    city: Optional[str]
+    fsa: Optional[str]
+
+
+@dataclass
+class TrigramNameIndex:
+    """
+    In-memory trigram index over names that are not in the database yet.
+
+    Shared-trigram counts come straight from the postings, so scoring a query
+    touches only entries that share at least one trigram with it.
+    """
+
+    _entries: List[_Entry] = field(default_factory=list)
+    _postings: Dict[str, List[int]] = field(default_factory=lambda: defaultdict(list))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self,
+        ref: Any,
+        name: str,
+        city: Optional[str] = None,
+        postal_code: Optional[str] = None
+    ) -> None:
+        """Index a name under an arbitrary reference (id, group index, record)."""
+        grams = trigrams(name_key(name))
+        if not grams:
+            return
+        position = len(self._entries)
+        self._entries.append(_Entry(ref, name, grams, city, postal_fsa(postal_code)))
+        for gram in grams:
+            self._postings[gram].append(position)
+
+    def search(
+        self,
+        name: str,
+        k: int = 5,
+        city: Optional[str] = None,
+        fsa: Optional[str] = None,
+        min_score: float = 0.0
+    ) -> List[NameMatch]:
+        """
+        Top-k indexed names most similar to name.
+
+        Args:
+            name: Name to look up
+            k: Maximum matches returned
+            city: Only entries in this city (case-insensitive)
+            fsa: Only entries in this FSA (e.g. 'L8N')
+            min_score: Minimum similarity
+
+        Returns:
+            Matches, best first
+        """
+        grams = trigrams(name_key(name))
+        if not grams:
+            return []
+
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+
+        wanted_fsa = postal_fsa(fsa)
+        matches = []
+        for position, count in shared.items():
+            entry = self._entries[position]
+            if not _same_place(entry.city, city) or not _same_place(entry.fsa, wanted_fsa):
+                continue
+            score = 2 * count / (len(grams) + len(entry.grams))
+            if score >= min_score:
+                matches.append(NameMatch(entry.ref, entry.name, score, entry.city, entry.fsa))
+
+        matches.sort(key=lambda m: -m.score)
+        return matches[:k]
+
+
+def name_index_schema(table: str = 'businesses') -> str:
+    """FTS5 table and sync triggers for one of NAME_INDEXED_TABLES."""
+    column = NAME_INDEXED_TABLES[table]
+    fts = f"{table}_name_fts"
+    fsa = "upper(substr(replace({row}.postal_code, ' ', ''), 1, 3))"
+    return f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+    name, city UNINDEXED, fsa UNINDEXED, tokenize = 'trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS {fts}_insert
+AFTER INSERT ON {table}
+BEGIN
+    INSERT INTO {fts} (rowid, name, city, fsa)
+    VALUES (NEW.id, NEW.{column}, lower(NEW.city), {fsa.format(row='NEW')});
+END;
+
+CREATE TRIGGER IF NOT EXISTS {fts}_update
+AFTER UPDATE OF {column}, city, postal_code ON {table}
+BEGIN
+    DELETE FROM {fts} WHERE rowid = OLD.id;
+    INSERT INTO {fts} (rowid, name, city, fsa)
+    VALUES (NEW.id, NEW.{column}, lower(NEW.city), {fsa.format(row='NEW')});
+END;
+
+CREATE TRIGGER IF NOT EXISTS {fts}_delete
+AFTER DELETE ON {table}
+BEGIN
+    DELETE FROM {fts} WHERE rowid = OLD.id;
+END;
+"""
+
+
+async def ensure_name_index(db, table: str = 'businesses') -> None:
+    """Create the FTS5 name index and its triggers, and backfill rows that predate them."""
+    column = NAME_INDEXED_TABLES[table]
+    fts = f"{table}_name_fts"
+    await db.executescript(name_index_schema(table))
+    cursor = await db.execute(
+        f"""INSERT INTO {fts} (rowid, name, city, fsa)
+        SELECT t.id, t.{column}, lower(t.city), upper(substr(replace(t.postal_code, ' ', ''), 1, 3))
+        FROM {table} t
+        WHERE t.id NOT IN (SELECT rowid FROM {fts})"""
+    )
+    if cursor.rowcount > 0:
+        # Merge the backfill into one segment so term lookups read one b-tree
+        await db.execute(f"INSERT INTO {fts} ({fts}) VALUES ('optimize')")
+    await db.commit()
+
+
+def _query_trigrams(name: str) -> List[str]:
+    """Per-word trigrams of a name's raw, expanded and abbreviated forms."""
+    key = name_key(name)
+    forms = {re.sub(r'[^\w\s]', ' ', name.lower()), key,
+             ' '.join(CONTRACTIONS.get(w, w) for w in key.split())}
+    grams: Set[str] = set()
+    for form in forms:
+        for word in form.split():
+            grams.update(word[i:i + 3] for i in range(len(word) - 2))
+    return sorted(grams)
+
+
+async def _candidate_ids(db, fts: str, grams: List[str], where: str = '', filters: Iterable = ()) -> List[int]:
+    """
+    Rows sharing the most rare trigrams with the query, best first.
+
+    Each trigram's postings are read up to RARE_TRIGRAM_MAX_DOCS + 1 rows in a
+    single UNION ALL query; trigrams that hit the cap ("man", "ing") carry no
+    signal and are ignored, so the cost is bounded by the cap rather than by
+    the size of the history. The city/FSA condition (``where`` and its
+    ``filters``) is part of every postings read, so rarity and the candidate
+    cap apply within the requested area. Returns [] when every trigram is
+    common.
+    """
+    cap = RARE_TRIGRAM_MAX_DOCS + 1
+    filters = list(filters)
+    sub = f"SELECT * FROM (SELECT ?, rowid FROM {fts} WHERE {fts} MATCH ?{where} LIMIT {cap})"
+    params: list = []
+    for position, gram in enumerate(grams):
+        params.extend([position, f'"{gram}"', *filters])
+    cursor = await db.execute(' UNION ALL '.join([sub] * len(grams)), params)
+
+    postings: Dict[int, List[int]] = defaultdict(list)
+    for position, rowid in await cursor.fetchall():
+        postings[position].append(rowid)
+
+    shared: Dict[int, int] = defaultdict(int)
+    for rowids in postings.values():
+        if len(rowids) < cap:
+            for rowid in rowids:
+                shared[rowid] += 1
+    return sorted(shared, key=lambda rowid: -shared[rowid])
+
+
+async def similar_names(
+    db,
+    name: str,
+    k: int = 5,
+    city: Optional[str] = None,
+    fsa: Optional[str] = None,
+    min_score: float = 0.0,
+    table: str = 'businesses',
+    statuses: Optional[Iterable[str]] = None,
+    exclude_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Rows of an indexed table whose names are most similar to name.
+
+    Args:
+        db: Database connection (ensure_name_index must have run)
+        name: Name to look up
+        k: Maximum rows returned
+        city: Only rows in this city (case-insensitive)
+        fsa: Only rows in this FSA (e.g. 'L8N')
+        min_score: Minimum similarity
+        table: One of NAME_INDEXED_TABLES
+        statuses: Optional status filter
+        exclude_id: Row to leave out (the record being looked up)
+
+    Returns:
+        Rows as dicts with a ``name_similarity`` key, best first
+    """
+    grams = _query_trigrams(name)
+    if not grams:
+        return []
+
+    fts = f"{table}_name_fts"
+    where = ''
+    filters: list = []
+    if city:
+        where += " AND city = ?"
+        filters.append(city.strip().lower())
+    if fsa:
+        where += " AND fsa = ?"
+        filters.append(postal_fsa(fsa))
+
+    candidates = (await _candidate_ids(db, fts, grams, where, filters))[:FTS_CANDIDATE_LIMIT]
+    if candidates:
+        cursor = await db.execute(
+            f"SELECT rowid, name FROM {fts} WHERE rowid IN ({','.join('?' * len(candidates))})",
+            candidates
+        )
+    else:
+        # Every trigram is common: let bm25 rank the whole filtered history
+        cursor = await db.execute(
+            f"SELECT rowid, name FROM {fts} WHERE {fts} MATCH ?{where} ORDER BY rank LIMIT {FTS_CANDIDATE_LIMIT}",
+            [' OR '.join(f'"{g}"' for g in grams)] + filters
+        )
+
+    query_grams = trigrams(name_key(name))
+    scored = []
+    for rowid, candidate in await cursor.fetchall():
+        if rowid == exclude_id:
+            continue
+        other = trigrams(name_key(candidate))
+        if not other:
+            continue
+        score = 2 * len(query_grams & other) / (len(query_grams) + len(other))
+        if score >= min_score:
+            scored.append((score, rowid))
+    if not scored:
+        return []
+
+    scores = dict((rowid, score) for score, rowid in scored)
+    query = f"SELECT * FROM {table} WHERE id IN ({','.join('?' * len(scores))})"
+    params = list(scores)
+    if statuses:
+        statuses = list(statuses)
+        query += f" AND status IN ({','.join('?' * len(statuses))})"
+        params.extend(statuses)
+
+    cursor = await db.execute(query, params)
+    columns = [c[0] for c in cursor.description]
+    rows = [dict(zip(columns, row)) for row in await cursor.fetchall()]
+    for row in rows:
+        row['name_similarity'] = scores[row['id']]
+    rows.sort(key=lambda r: -r['name_similarity'])
+    return rows[:k]
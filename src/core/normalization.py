@@ -1,12 +1,129 @@
 """
 Entity resolution and fingerprinting for de-duplication.
 PRIORITY: P0 - Critical for preventing duplicate leads.
+
+This is the single normalization kernel: name, street, address, phone,
+postal code, website and city normalizers used by fingerprinting, dedup,
+cross-source validation and the gates. Patterns are compiled once at import,
+string normalizers are memoized in bounded LRU caches, and normalize_batch /
+normalize_column normalize whole columns (lists, pandas, pyarrow) at once.
 """
 
 import hashlib
 import re
-from typing import Dict, Optional, Tuple
-
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.offload import cpu_task
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas is a core dependency
+    np = None
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+# Entries kept per memoized normalizer. Discovery runs see the same names,
+# streets and cities over and over (every source, dedup, fingerprinting and
+# the gates), so a bounded cache turns repeat normalization into a lookup.
+NORMALIZE_CACHE_SIZE = 65536
+
+_CACHES: Dict[str, Callable] = {}
+
+
+def memoized(func: Callable) -> Callable:
+    """Bounded LRU memoization for a single-argument normalizer."""
+    cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(func)
+    _CACHES[f"{func.__module__}.{func.__qualname__}"] = cached
+    return cached
+
+
+def normalization_cache_info() -> Dict[str, Dict[str, int]]:
+    """Hits, misses and size of every normalizer cache."""
+    return {name: cached.cache_info()._asdict() for name, cached in _CACHES.items()}
+
+
+def clear_normalization_caches():
+    """Drop every memoized normalization result."""
+    for cached in _CACHES.values():
+        cached.cache_clear()
+
+
+# ==================== Patterns ====================
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_NON_DIGITS = re.compile(r'\D')
+_LEADING_NUMBER = re.compile(r'^(\d+)')
+_DIGIT_RUNS = re.compile(r'\d+')
+_PROTOCOL = re.compile(r'^https?://')
+_WWW = re.compile(r'^www\.')
+_DOMAIN = re.compile(r'^([^/]+)')
+
+# compute_fingerprint (stored fingerprints depend on these exact rules)
+_FINGERPRINT_NAME_SUFFIXES = re.compile(r'\b(inc|ltd|corp|incorporated|limited|corporation|llc)\b')
+_FINGERPRINT_STREET_TYPES = re.compile(r'\b(street|st|avenue|ave|road|rd|drive|dr|boulevard|blvd|lane|ln)\b')
+_FINGERPRINT_STREET_PUNCTUATION = re.compile(r'[^\w\s\d]')
+
+# normalize_name
+_NAME_SUFFIXES = re.compile(r'\b(inc|ltd|corp|incorporated|limited|corporation|llc|co)\b\.?')
+
+# normalize_entity_name / normalize_street_name (cross-source entity matching)
+ENTITY_NAME_SUFFIXES = (
+    'inc', 'ltd', 'limited', 'corp', 'corporation', 'llc',
+    'incorporated', 'co', 'company', 'enterprises', 'ent',
+    'group', 'holding', 'holdings', 'international', 'intl'
+)
+STREET_TYPES = (
+    'street', 'st', 'avenue', 'ave', 'road', 'rd', 'drive', 'dr',
+    'boulevard', 'blvd', 'lane', 'ln', 'court', 'ct', 'crt',
+    'place', 'pl', 'terrace', 'terr', 'parkway', 'pkwy', 'way'
+)
+STREET_DIRECTIONS = ('east', 'west', 'north', 'south', 'e', 'w', 'n', 's')
+UNIT_INDICATORS = ('unit', 'suite', 'ste', 'apt', 'apartment', '#')
+
+_ENTITY_NAME_SUFFIXES = re.compile(
+    r'\b(?:' + '|'.join(ENTITY_NAME_SUFFIXES) + r')s?\.?\b', re.IGNORECASE
+)
+_STREET_TYPES = re.compile(r'\b(?:' + '|'.join(STREET_TYPES) + r')\.?\b', re.IGNORECASE)
+_STREET_DIRECTIONS = re.compile(r'\b(?:' + '|'.join(STREET_DIRECTIONS) + r')\.?\b', re.IGNORECASE)
+# Applied one after another: a unit pattern has no closing word boundary, so
+# removing one indicator can expose the next
+_UNIT_INDICATORS = tuple(
+    re.compile(r'\b' + re.escape(indicator) + r'\.?\s*\d*', re.IGNORECASE)
+    for indicator in UNIT_INDICATORS
+)
+
+# normalize_address
+ADDRESS_ABBREVIATIONS = {
+    'st': 'street',
+    'ave': 'avenue',
+    'rd': 'road',
+    'dr': 'drive',
+    'blvd': 'boulevard',
+    'ln': 'lane',
+    'ct': 'court',
+    'pl': 'place',
+    'pkwy': 'parkway',
+    'apt': 'apartment',
+    'ste': 'suite',
+    'unit': 'unit',
+}
+# Applied in order: an expansion consumes its trailing '.', which changes the
+# word boundaries the next abbreviation sees
+_ADDRESS_ABBREVIATIONS = tuple(
+    (re.compile(r'\b' + abbrev + r'\b\.?', re.IGNORECASE), full)
+    for abbrev, full in ADDRESS_ABBREVIATIONS.items()
+)
+
+
+# ==================== Fingerprints ====================
 
 def compute_fingerprint(business: Dict) -> str:
     """
@@ -20,19 +137,8 @@ def compute_fingerprint(business: Dict) -> str:
 
     Returns: SHA256 hash (first 16 chars for readability)
     """
-    # Normalize name
-    name = business.get('name', '').lower()
-    name = re.sub(r'\b(inc|ltd|corp|incorporated|limited|corporation|llc)\b', '', name)
-    name = re.sub(r'[^\w\s]', '', name).strip()
-
-    # Normalize street
-    street = business.get('street', '').lower()
-    street = re.sub(r'\b(street|st|avenue|ave|road|rd|drive|dr|boulevard|blvd|lane|ln)\b', '', street)
-    street = re.sub(r'[^\w\s\d]', '', street).strip()
-
-    # Extract street number
-    street_match = re.match(r'^(\d+)', street)
-    street_num = street_match.group(1) if street_match else ''
+    name = _fingerprint_name(business.get('name', ''))
+    street_num, street = _fingerprint_street(business.get('street', ''))
 
     # City + postal prefix
     city = business.get('city', '').lower().strip()
@@ -41,7 +147,7 @@ def compute_fingerprint(business: Dict) -> str:
 
     # Phone digits only
     phone = business.get('phone', '')
-    phone_digits = re.sub(r'\D', '', phone)[-10:] if phone else ''  # Last 10 digits
+    phone_digits = _NON_DIGITS.sub('', phone)[-10:] if phone else ''  # Last 10 digits
 
     # Combine components
     components = [name, street_num, street, city, postal, phone_digits]
@@ -52,6 +158,42 @@ def compute_fingerprint(business: Dict) -> str:
     return hash_obj.hexdigest()[:16]
 
 
+@cpu_task("compute_fingerprints", min_offload_size=1000)
+def compute_fingerprints(businesses: List[Dict]) -> List[Optional[str]]:
+    """
+    Fingerprint a batch of businesses (offload entry point).
+
+    Pipelines fingerprint everything a discovery run returned in one call
+    instead of one record at a time on the event loop. Records that cannot be
+    fingerprinted come back as None so one bad record does not fail the batch.
+    """
+    fingerprints = []
+    for business in businesses:
+        try:
+            fingerprints.append(compute_fingerprint(business))
+        except Exception:
+            fingerprints.append(None)
+    return fingerprints
+
+
+@memoized
+def _fingerprint_name(name: str) -> str:
+    name = _FINGERPRINT_NAME_SUFFIXES.sub('', name.lower())
+    return _PUNCTUATION.sub('', name).strip()
+
+
+@memoized
+def _fingerprint_street(street: str) -> Tuple[str, str]:
+    """(street number, normalized street) as compute_fingerprint uses them."""
+    street = _FINGERPRINT_STREET_TYPES.sub('', street.lower())
+    street = _FINGERPRINT_STREET_PUNCTUATION.sub('', street).strip()
+    street_match = _LEADING_NUMBER.match(street)
+    return (street_match.group(1) if street_match else ''), street
+
+
+# ==================== Field Normalizers ====================
+
+@memoized
 def normalize_name(name: str) -> str:
     """Normalize business name for comparison."""
     if not name:
@@ -59,13 +201,61 @@ def normalize_name(name: str) -> str:
 
     name = name.lower()
     # Remove common suffixes
-    name = re.sub(r'\b(inc|ltd|corp|incorporated|limited|corporation|llc|co)\b\.?', '', name)
+    name = _NAME_SUFFIXES.sub('', name)
     # Remove punctuation
-    name = re.sub(r'[^\w\s]', '', name)
+    name = _PUNCTUATION.sub('', name)
     # Normalize whitespace
     return ' '.join(name.split())
 
 
+@memoized
+def normalize_entity_name(name: str) -> str:
+    """
+    Normalize business name for cross-source entity matching.
+
+    Strips a wider set of suffixes than normalize_name (Company, Group,
+    Holdings, International, plurals) as well as '&' / 'and' between words.
+
+    Examples:
+        >>> normalize_entity_name("ABC Manufacturing Inc.")
+        'abc manufacturing'
+        >>> normalize_entity_name("ABC Mfg. Ltd")
+        'abc mfg'
+    """
+    if not name:
+        return ""
+
+    name = _ENTITY_NAME_SUFFIXES.sub('', name.lower())
+    name = name.replace(' and ', ' ').replace(' & ', ' ')
+    name = _PUNCTUATION.sub('', name)
+    return ' '.join(name.split())
+
+
+@memoized
+def normalize_street_name(street: str) -> str:
+    """
+    Normalize street name (without number, type, direction or unit).
+
+    Examples:
+        >>> normalize_street_name("123 Main St E")
+        'main'
+        >>> normalize_street_name("123 Main Street East Unit 5")
+        'main'
+    """
+    if not street:
+        return ""
+
+    street = _STREET_TYPES.sub('', street.lower())
+    street = _STREET_DIRECTIONS.sub('', street)
+    for pattern in _UNIT_INDICATORS:
+        street = pattern.sub('', street)
+
+    # Street numbers are extracted separately
+    street = _PUNCTUATION.sub('', street)
+    street = _DIGIT_RUNS.sub('', street)
+    return ' '.join(street.split())
+
+
 def normalize_address(address: str) -> Dict[str, str]:
     """
     Parse and normalize address into components.
@@ -74,36 +264,22 @@ def normalize_address(address: str) -> Dict[str, str]:
     if not address:
         return {'normalized': '', 'original': ''}
 
-    normalized = address.lower().strip()
-
-    # Expand common abbreviations
-    abbreviations = {
-        r'\bst\b\.?': 'street',
-        r'\bave\b\.?': 'avenue',
-        r'\brd\b\.?': 'road',
-        r'\bdr\b\.?': 'drive',
-        r'\bblvd\b\.?': 'boulevard',
-        r'\bln\b\.?': 'lane',
-        r'\bct\b\.?': 'court',
-        r'\bpl\b\.?': 'place',
-        r'\bpkwy\b\.?': 'parkway',
-        r'\bapt\b\.?': 'apartment',
-        r'\bste\b\.?': 'suite',
-        r'\bunit\b\.?': 'unit',
+    return {
+        'normalized': _normalize_address_text(address),
+        'original': address
     }
 
-    for abbrev, full in abbreviations.items():
-        normalized = re.sub(abbrev, full, normalized, flags=re.IGNORECASE)
 
+@memoized
+def _normalize_address_text(address: str) -> str:
+    normalized = address.lower().strip()
+    # Expand common abbreviations
+    for pattern, full in _ADDRESS_ABBREVIATIONS:
+        normalized = pattern.sub(full, normalized)
     # Remove punctuation except spaces
-    normalized = re.sub(r'[^\w\s]', '', normalized)
+    normalized = _PUNCTUATION.sub('', normalized)
     # Normalize whitespace
-    normalized = ' '.join(normalized.split())
-
-    return {
-        'normalized': normalized,
-        'original': address
-    }
+    return ' '.join(normalized.split())
 
 
 def normalize_phone(phone: str) -> str:
@@ -114,11 +290,8 @@ def normalize_phone(phone: str) -> str:
     if not phone:
         return ''
 
-    # Extract digits only
-    digits = re.sub(r'\D', '', phone)
-
-    # Return last 10 digits (strip country code if present)
-    return digits[-10:] if len(digits) >= 10 else digits
+    # Extract digits only; keep the last 10 (strip country code if present)
+    return _NON_DIGITS.sub('', phone)[-10:]
 
 
 def normalize_postal_code(postal: str) -> str:
@@ -129,15 +302,10 @@ def normalize_postal_code(postal: str) -> str:
     if not postal:
         return ''
 
-    postal = postal.upper().replace(' ', '').strip()
-
-    # Validate format (Canadian: A1A1A1)
-    if re.match(r'^[A-Z]\d[A-Z]\d[A-Z]\d$', postal):
-        return postal
-
-    return postal
+    return postal.upper().replace(' ', '').strip()
 
 
+@memoized
 def normalize_website(url: str) -> str:
     """
     Normalize website URL for comparison.
@@ -147,17 +315,37 @@ def normalize_website(url: str) -> str:
         return ''
 
     url = url.lower().strip()
+    url = _PROTOCOL.sub('', url)
+    url = _WWW.sub('', url).rstrip('/')
+    # Domain only (remove path)
+    domain_match = _DOMAIN.match(url)
+    return domain_match.group(1) if domain_match else url
 
-    # Remove protocol
-    url = re.sub(r'^https?://', '', url)
-    # Remove www
-    url = re.sub(r'^www\.', '', url)
-    # Remove trailing slash
-    url = url.rstrip('/')
-    # Extract domain only (remove path)
-    domain_match = re.match(r'^([^/]+)', url)
 
-    return domain_match.group(1) if domain_match else url
+def normalize_city(city: str) -> str:
+    """Lowercase, trimmed city name."""
+    return city.lower().strip() if city else ''
+
+
+def extract_street_number(address: str) -> Optional[str]:
+    """Extract street number from address."""
+    if not address:
+        return None
+
+    match = _LEADING_NUMBER.match(address.strip())
+    return match.group(1) if match else None
+
+
+NORMALIZERS: Dict[str, Callable[[str], str]] = {
+    'name': normalize_name,
+    'entity_name': normalize_entity_name,
+    'street': normalize_street_name,
+    'address': lambda value: normalize_address(value)['normalized'],
+    'phone': normalize_phone,
+    'postal_code': normalize_postal_code,
+    'website': normalize_website,
+    'city': normalize_city,
+}
 
 
 def normalize_value(value: str, field: str) -> str:
@@ -174,19 +362,58 @@ def normalize_value(value: str, field: str) -> str:
     if not value:
         return ''
 
-    if field == 'phone':
-        return normalize_phone(value)
-    elif field == 'postal_code':
-        return normalize_postal_code(value)
-    elif field == 'address':
-        return normalize_address(value)['normalized']
-    elif field == 'website':
-        return normalize_website(value)
-    elif field == 'name':
-        return normalize_name(value)
-    else:
-        # Generic normalization
-        return value.strip().lower()
+    normalizer = NORMALIZERS.get(field)
+    if normalizer:
+        return normalizer(value)
+    # Generic normalization
+    return value.strip().lower()
+
+
+# ==================== Batch API ====================
+
+def normalize_batch(values: Iterable[Any], field: str) -> List[str]:
+    """
+    Normalize a sequence of values of one field type.
+
+    Missing values (None, NaN) normalize to ''. Each distinct value is
+    normalized once per batch.
+    """
+    results: Dict[Any, str] = {}
+    normalized = []
+    for value in values:
+        if value not in results:
+            results[value] = '' if _is_missing(value) else normalize_value(str(value), field)
+        normalized.append(results[value])
+    return normalized
+
+
+def normalize_column(column: Any, field: str) -> Any:
+    """
+    Normalize a pandas Series or pyarrow (Chunked)Array column.
+
+    Only the column's distinct values go through the normalizer; the results
+    are broadcast back by position, so a 1M-row column with 20k distinct
+    names costs 20k normalizations. Returns the same kind of column that was
+    passed in (Series keeps its index); missing values become ''. Any other
+    iterable is handled by normalize_batch.
+    """
+    if pd is not None and isinstance(column, pd.Series):
+        codes, uniques = pd.factorize(column, use_na_sentinel=True)
+        # Missing values are coded -1, which picks the trailing ''
+        lookup = np.array(normalize_batch(list(uniques), field) + [''], dtype=object)
+        return pd.Series(lookup[codes], index=column.index, name=column.name, dtype=object)
+
+    if pa is not None and isinstance(column, (pa.Array, pa.ChunkedArray)):
+        uniques = pc.unique(column)
+        lookup = pa.array(normalize_batch(uniques.to_pylist(), field), type=pa.string())
+        positions = pc.index_in(column, value_set=uniques)
+        return pc.fill_null(pc.take(lookup, positions), '')
+
+    return normalize_batch(column, field)
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value != value  # NaN is the only value unequal to itself
 
 
 def compare_addresses(addr1: str, addr2: str) -> Tuple[bool, float]:
@@ -206,8 +433,8 @@ def compare_addresses(addr1: str, addr2: str) -> Tuple[bool, float]:
         return True, 1.0
 
     # Extract street number for both
-    num1 = re.match(r'^(\d+)', norm1)
-    num2 = re.match(r'^(\d+)', norm2)
+    num1 = _LEADING_NUMBER.match(norm1)
+    num2 = _LEADING_NUMBER.match(norm2)
 
     # If street numbers don't match, likely different addresses
     if num1 and num2 and num1.group(1) != num2.group(1):
@@ -229,12 +456,3 @@ def compare_addresses(addr1: str, addr2: str) -> Tuple[bool, float]:
     is_match = jaccard_similarity > 0.7
 
     return is_match, jaccard_similarity
-
-
-def extract_street_number(address: str) -> Optional[str]:
-    """Extract street number from address."""
-    if not address:
-        return None
-
-    match = re.match(r'^(\d+)', address.strip())
-    return match.group(1) if match else None
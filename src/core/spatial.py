@@ -0,0 +1,232 @@
+"""
+Spatial index on businesses for radius, nearest-neighbour and bbox queries.
+
+An SQLite R*Tree (businesses_rtree) mirrors businesses.latitude/longitude and is
+kept in sync by triggers, so proximity lookups touch only the candidates inside
+a bounding box instead of scanning the table. Exact distances are then computed
+with the haversine formula used by the geo gate.
+"""
+
+import math
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.core.normalization import normalize_name, normalize_phone, normalize_website
+from src.gates.geo_gate import haversine_distance
+
+SPATIAL_INDEX_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS businesses_rtree USING rtree(
+    id, min_lat, max_lat, min_lon, max_lon
+);
+
+CREATE TRIGGER IF NOT EXISTS businesses_rtree_insert
+AFTER INSERT ON businesses
+WHEN NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL
+BEGIN
+    INSERT OR REPLACE INTO businesses_rtree VALUES
+        (NEW.id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude);
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_rtree_update
+AFTER UPDATE OF latitude, longitude ON businesses
+BEGIN
+    DELETE FROM businesses_rtree WHERE id = OLD.id;
+    INSERT INTO businesses_rtree
+        SELECT NEW.id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude
+        WHERE NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_rtree_delete
+AFTER DELETE ON businesses
+BEGIN
+    DELETE FROM businesses_rtree WHERE id = OLD.id;
+END;
+"""
+
+# Two listings within this distance are candidates for the same business
+PROXIMITY_DUPLICATE_RADIUS_M = 50.0
+
+# Normalized-name similarity that, together with location, marks a duplicate
+NAME_SIMILARITY_THRESHOLD = 0.6
+
+DEFAULT_CATCHMENT_RADII_KM = (5.0, 10.0, 20.0)
+
+Bounds = Tuple[float, float, float, float]
+
+
+def radius_to_bbox(latitude: float, longitude: float, radius_meters: float) -> Bounds:
+    """Bounding box (south, west, north, east) around a point."""
+    dlat = radius_meters / 111_320
+    dlon = radius_meters / (111_320 * max(math.cos(math.radians(latitude)), 0.01))
+    return (latitude - dlat, longitude - dlon, latitude + dlat, longitude + dlon)
+
+
+async def ensure_spatial_index(db) -> None:
+    """Create the R*Tree and its triggers, and backfill rows that predate them."""
+    await db.executescript(SPATIAL_INDEX_SCHEMA)
+    await db.execute(
+        """INSERT INTO businesses_rtree
+        SELECT b.id, b.latitude, b.latitude, b.longitude, b.longitude
+        FROM businesses b
+        WHERE b.latitude IS NOT NULL AND b.longitude IS NOT NULL
+          AND b.id NOT IN (SELECT id FROM businesses_rtree)"""
+    )
+    await db.commit()
+
+
+async def businesses_in_bbox(
+    db,
+    bbox: Bounds,
+    statuses: Optional[Sequence[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Businesses whose coordinates fall inside a bounding box.
+
+    Args:
+        db: Database connection
+        bbox: (south, west, north, east)
+        statuses: Optional status filter
+
+    Returns:
+        Business rows as dicts
+    """
+    south, west, north, east = bbox
+    query = """SELECT b.* FROM businesses_rtree r
+        JOIN businesses b ON b.id = r.id
+        WHERE r.min_lat >= ? AND r.max_lat <= ? AND r.min_lon >= ? AND r.max_lon <= ?"""
+    params: list = [south, north, west, east]
+    if statuses:
+        query += f" AND b.status IN ({','.join('?' * len(statuses))})"
+        params.extend(statuses)
+
+    cursor = await db.execute(query, params)
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in await cursor.fetchall()]
+
+
+async def businesses_within_radius(
+    db,
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+    statuses: Optional[Sequence[str]] = None,
+    exclude_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Businesses within radius_km of a point, nearest first.
+
+    Each row carries a ``distance_from_point_km`` key.
+    """
+    candidates = await businesses_in_bbox(
+        db, radius_to_bbox(latitude, longitude, radius_km * 1000), statuses
+    )
+    results = []
+    for row in candidates:
+        if row['id'] == exclude_id:
+            continue
+        distance = haversine_distance(latitude, longitude, row['latitude'], row['longitude'])
+        if distance <= radius_km:
+            row['distance_from_point_km'] = distance
+            results.append(row)
+
+    results.sort(key=lambda r: r['distance_from_point_km'])
+    return results
+
+
+async def nearest_businesses(
+    db,
+    latitude: float,
+    longitude: float,
+    k: int = 5,
+    max_radius_km: float = 50.0,
+    statuses: Optional[Sequence[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    The k nearest businesses to a point, searching outward up to max_radius_km.
+
+    The search radius doubles until k results are found inside it, so dense
+    areas resolve from a small box.
+    """
+    radius_km = min(1.0, max_radius_km)
+    while True:
+        results = await businesses_within_radius(db, latitude, longitude, radius_km, statuses)
+        if len(results) >= k or radius_km >= max_radius_km:
+            return results[:k]
+        radius_km = min(radius_km * 2, max_radius_km)
+
+
+def _name_similarity(a: str, b: str) -> float:
+    a, b = normalize_name(a or ''), normalize_name(b or '')
+    if not a or not b:
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+async def find_proximity_duplicate(
+    db,
+    latitude: Optional[float],
+    longitude: Optional[float],
+    name: str,
+    phone: Optional[str] = None,
+    website: Optional[str] = None,
+    radius_m: float = PROXIMITY_DUPLICATE_RADIUS_M
+) -> Optional[Dict[str, Any]]:
+    """
+    Find an existing business at the same location that fingerprinting missed.
+
+    A nearby business is a duplicate when it also shares the phone number or
+    website domain, or its normalized name is similar enough (renames,
+    suffix changes, typos).
+
+    Returns:
+        The matching business row with ``match_reason``, or None
+    """
+    if latitude is None or longitude is None:
+        return None
+
+    phone = normalize_phone(phone or '')
+    domain = normalize_website(website or '')
+
+    nearby = await businesses_within_radius(db, latitude, longitude, radius_m / 1000)
+    for row in nearby:
+        if phone and normalize_phone(row.get('phone') or '') == phone:
+            row['match_reason'] = 'phone'
+        elif domain and normalize_website(row.get('website') or '') == domain:
+            row['match_reason'] = 'website'
+        elif _name_similarity(name, row.get('original_name')) >= NAME_SIMILARITY_THRESHOLD:
+            row['match_reason'] = 'name'
+        else:
+            continue
+        return row
+
+    return None
+
+
+async def catchment_report(
+    db,
+    latitude: float,
+    longitude: float,
+    radii_km: Sequence[float] = DEFAULT_CATCHMENT_RADII_KM
+) -> Dict[str, Any]:
+    """
+    Business counts by status within each radius of a point.
+
+    Returns:
+        {'center': (lat, lon), 'rings': [{'radius_km', 'total', 'by_status'}, ...]}
+    """
+    radii = sorted(radii_km)
+    businesses = await businesses_within_radius(db, latitude, longitude, radii[-1]) if radii else []
+
+    rings = []
+    for radius in radii:
+        by_status: Dict[str, int] = {}
+        for row in businesses:
+            if row['distance_from_point_km'] <= radius:
+                by_status[row['status']] = by_status.get(row['status'], 0) + 1
+        rings.append({
+            'radius_km': radius,
+            'total': sum(by_status.values()),
+            'by_status': by_status
+        })
+
+    return {'center': (latitude, longitude), 'rings': rings}
@@ -12,14 +12,30 @@ Methods:
 import asyncio
 import aiohttp
 import re
-from typing import List, Dict, Optional, Set
+from typing import Iterable, List, Dict, Optional, Set
 from datetime import datetime
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 import structlog
 
+from ..services.html_extraction import (
+    ExtractedPage,
+    extract_page,
+    extract_page_async,
+    read_body_bytes_capped,
+)
+from ..services.crawl_metadata import get_crawl_cache
+from ..services.domain_health import get_domain_health
+from ..services.http_transport import create_client_session
+
 logger = structlog.get_logger(__name__)
 
+# Placeholder addresses that show up in templates and form hints
+PLACEHOLDER_EMAIL_MARKERS = ('example.com', 'domain.com', 'email.com', 'test.com', 'placeholder')
+ASSET_SUFFIXES = ('.png', '.jpg', '.gif', '.svg')
+
+# Crawl-metadata key for the contacts extracted from a page
+CRAWL_KEY = 'contacts'
+
 
 class ContactEnricher:
     """
@@ -36,11 +52,13 @@ class ContactEnricher:
         self.timeout = aiohttp.ClientTimeout(total=15, connect=5)
         self.logger = logger
 
-        # Common contact page URL patterns
+        # Common contact page URL patterns, in order of preference
         self.contact_page_patterns = [
-            '/contact', '/contact-us', '/contactus', '/about/contact',
-            '/about', '/about-us', '/aboutus',
-            '/company', '/company/contact'
+            re.compile(pattern, re.IGNORECASE) for pattern in (
+                '/contact', '/contact-us', '/contactus', '/about/contact',
+                '/about', '/about-us', '/aboutus',
+                '/company', '/company/contact'
+            )
         ]
 
     async def enrich_business(
@@ -84,6 +102,11 @@ class ContactEnricher:
         # Clean website URL
         website = self._clean_url(website)
 
+        dead = get_domain_health().check(website)
+        if dead is not None:
+            self.logger.debug("dead_website_skipped", business=business_name, website=website, kind=dead.kind)
+            return self._finalize_enrichment(enrichment)
+
         try:
             # 1. Find and scrape contact page
             contact_info = await self._scrape_contact_page(website)
@@ -132,37 +155,28 @@ class ContactEnricher:
         }
 
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with create_client_session(timeout=self.timeout) as session:
                 # Try homepage first
                 try:
-                    async with session.get(
-                        website,
-                        headers={'User-Agent': 'Mozilla/5.0 (Business Research Bot)'},
-                        ssl=False
-                    ) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            soup = BeautifulSoup(html, 'html.parser')
-
-                            # Extract contact info from homepage
-                            homepage_emails = self._extract_emails(html)
-                            homepage_phones = self._extract_phones(html)
-
-                            info['emails'].update(homepage_emails)
-                            info['phones'].update(homepage_phones)
-
-                            # Find contact page link
-                            contact_url = self._find_contact_page_link(soup, website)
-
-                            # If contact page found, scrape it
-                            if contact_url and contact_url != website:
-                                contact_info = await self._scrape_page(session, contact_url)
-                                info['emails'].update(contact_info['emails'])
-                                info['phones'].update(contact_info['phones'])
-                                info['contact_page_url'] = contact_url
+                    homepage = await self._page_contacts(
+                        session, website, {'User-Agent': 'Mozilla/5.0 (Business Research Bot)'}
+                    )
+                    if homepage:
+                        # Extract contact info from homepage
+                        info['emails'].update(homepage['emails'])
+                        info['phones'].update(homepage['phones'])
+
+                        # If contact page found, scrape it
+                        contact_url = homepage['contact_page_url']
+                        if contact_url and contact_url != website:
+                            contact_info = await self._scrape_page(session, contact_url)
+                            info['emails'].update(contact_info['emails'])
+                            info['phones'].update(contact_info['phones'])
+                            info['contact_page_url'] = contact_url
 
                 except Exception as e:
                     self.logger.debug("homepage_scrape_failed", website=website, error=str(e))
+                    get_domain_health().record_failure(website, e)
 
         except Exception as e:
             self.logger.error("contact_scrape_failed", website=website, error=str(e))
@@ -174,46 +188,72 @@ class ContactEnricher:
         info = {'emails': set(), 'phones': set()}
 
         try:
-            async with session.get(
-                url,
-                headers={'User-Agent': 'Mozilla/5.0'},
-                ssl=False
-            ) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    info['emails'] = self._extract_emails(html)
-                    info['phones'] = self._extract_phones(html)
+            contacts = await self._page_contacts(session, url, {'User-Agent': 'Mozilla/5.0'})
+            if contacts:
+                info['emails'] = set(contacts['emails'])
+                info['phones'] = set(contacts['phones'])
         except Exception as e:
             self.logger.debug("page_scrape_failed", url=url, error=str(e))
 
         return info
 
-    def _find_contact_page_link(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
-        """Find contact page link in HTML."""
+    async def _page_contacts(self, session: aiohttp.ClientSession, url: str, headers: Dict) -> Optional[Dict]:
+        """
+        Emails, phones and contact page link of one page (None unless it answers 200).
+
+        Previously scraped pages are revisited with a conditional GET; if the
+        page is unchanged (304 or same content) the last extraction is reused,
+        and within its re-crawl interval the page is not requested at all.
+        """
+        crawl_cache = get_crawl_cache()
+        contacts = crawl_cache.lookup(url, CRAWL_KEY)
+        if contacts is not None:
+            return contacts
+
+        async with session.get(
+            url,
+            headers={**headers, **crawl_cache.request_headers(url, CRAWL_KEY)},
+            ssl=False
+        ) as response:
+            body, encoding = b'', None
+            if response.status == 200:
+                body, encoding, _ = await read_body_bytes_capped(response)
+            contacts = crawl_cache.revisit(url, CRAWL_KEY, response.status, response.headers, body)
+            if contacts is not None or response.status != 200:
+                return contacts
+
+        page = await extract_page_async(body, encoding, base_url=url)
+        contacts = {
+            'emails': sorted(self._filter_emails(page.emails)),
+            'phones': sorted(page.phones),
+            'contact_page_url': self._find_contact_page_link(page),
+        }
+        crawl_cache.store_extraction(url, CRAWL_KEY, contacts)
+        return contacts
+
+    def _find_contact_page_link(self, page: ExtractedPage) -> Optional[str]:
+        """Find contact page link in an extracted page."""
         for pattern in self.contact_page_patterns:
-            # Try exact match
-            links = soup.find_all('a', href=re.compile(pattern, re.IGNORECASE))
+            links = page.find_links(pattern)
             if links:
-                href = links[0].get('href')
-                return urljoin(base_url, href)
+                return links[0].url
 
         return None
 
     def _extract_emails(self, html: str) -> Set[str]:
         """Extract email addresses from HTML."""
-        # Email regex pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = set(re.findall(email_pattern, html))
+        return self._filter_emails(extract_page(html).emails)
 
-        # Filter out common false positives
+    def _filter_emails(self, emails: Iterable[str]) -> Set[str]:
+        """Filter out common false positives."""
         filtered = set()
         for email in emails:
             email_lower = email.lower()
             # Skip example/placeholder emails
-            if any(skip in email_lower for skip in ['example.com', 'domain.com', 'email.com', 'test.com', 'placeholder']):
+            if any(skip in email_lower for skip in PLACEHOLDER_EMAIL_MARKERS):
                 continue
             # Skip image/asset emails
-            if email_lower.endswith(('.png', '.jpg', '.gif', '.svg')):
+            if email_lower.endswith(ASSET_SUFFIXES):
                 continue
 
             filtered.add(email)
@@ -222,28 +262,7 @@ class ContactEnricher:
 
     def _extract_phones(self, html: str) -> Set[str]:
         """Extract phone numbers from HTML."""
-        # North American phone patterns
-        patterns = [
-            r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # 123-456-7890, 123.456.7890
-            r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}\b',    # (123) 456-7890
-            r'\b\d{10}\b',                          # 1234567890
-        ]
-
-        phones = set()
-        for pattern in patterns:
-            matches = re.findall(pattern, html)
-            phones.update(matches)
-
-        # Normalize phone numbers
-        normalized = set()
-        for phone in phones:
-            # Remove formatting
-            digits = re.sub(r'\D', '', phone)
-            # Keep only if 10 or 11 digits
-            if len(digits) in [10, 11]:
-                normalized.add(phone)
-
-        return normalized
+        return extract_page(html).phones
 
     def _generate_email_patterns(self, domain: str) -> Set[str]:
         """
@@ -0,0 +1,289 @@
+"""
+Streaming CSV enrichment runner shared by the CSV enrichers.
+
+Input rows are read lazily and handed to an enrichment function by a bounded
+pool of workers. Results are written as soon as every earlier row is done, so
+the output keeps input order without holding the file in memory. The number
+of rows written (and the output size at that point) is checkpointed next to
+the output; rerunning the same command resumes after the last checkpoint.
+
+Usage:
+    runner = CsvEnrichmentRunner(enrich_row, output_columns=['Founded Year'], provider='linkedin')
+    result = await runner.run('data/in.csv', 'data/out.csv')
+"""
+
+import asyncio
+import csv
+import inspect
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Union
+
+import structlog
+
+from ..services.domain_health import get_domain_health
+from ..utils.rate_limiter import TokenBucketLimiter, get_limiter
+
+logger = structlog.get_logger(__name__)
+
+Row = Dict[str, Any]
+RowEnricher = Callable[[Row], Union[Optional[Row], Awaitable[Optional[Row]]]]
+
+CHECKPOINT_SUFFIX = '.checkpoint.json'
+
+
+@dataclass
+class CsvRunResult:
+    """Outcome of one runner invocation."""
+
+    input_path: str
+    output_path: str
+    rows_written: int
+    rows_enriched: int
+    rows_failed: int
+    resumed_from: int
+    elapsed_seconds: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class CsvEnrichmentRunner:
+    """
+    Enrich a CSV row by row with bounded concurrency and ordered, checkpointed output.
+
+    The enrichment function receives each row as a dict and returns the
+    enriched row (or None after updating it in place). It may be a coroutine
+    function or a plain function. A row whose enrichment raises is logged and
+    written unchanged, so one bad row does not stop the run.
+    """
+
+    def __init__(
+        self,
+        enrich_row: RowEnricher,
+        output_columns: Sequence[str] = (),
+        concurrency: Optional[int] = None,
+        provider: Optional[str] = None,
+        rate_limiter: Optional[TokenBucketLimiter] = None,
+        checkpoint_every: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        preflight_column: Optional[str] = None
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            enrich_row: Called once per input row
+            output_columns: Columns the enricher adds (appended to the input header)
+            concurrency: Rows enriched at once (default CSV_ENRICHMENT_CONCURRENCY)
+            provider: Name of a registered rate limiter shared by every run
+                against the same provider (e.g. 'linkedin')
+            rate_limiter: Explicit limiter, takes precedence over provider
+            checkpoint_every: Rows written between checkpoints
+            max_pending: Rows read ahead of the oldest unfinished row (bounds
+                memory when one row is slow); defaults to 4x concurrency
+            preflight_column: Website column to DNS pre-flight before enriching,
+                so rows with dead hosts are skipped by the enricher
+        """
+        settings = _settings_from_config()
+        self.enrich_row = enrich_row
+        self.output_columns = list(output_columns)
+        self.concurrency = max(1, concurrency or settings['concurrency'])
+        self.rate_limiter = rate_limiter or (get_limiter(provider) if provider else None)
+        self.provider = provider
+        self.checkpoint_every = max(1, checkpoint_every or settings['checkpoint_every'])
+        self.max_pending = max(self.concurrency, max_pending or self.concurrency * 4)
+        self.preflight_column = preflight_column
+        self.logger = logger
+
+    async def run(self, input_path: str, output_path: str, resume: bool = True) -> CsvRunResult:
+        """
+        Enrich input_path into output_path.
+
+        Args:
+            input_path: Input CSV (read as a stream)
+            output_path: Output CSV (written incrementally, in input order)
+            resume: Continue from an existing checkpoint instead of starting over
+
+        Returns:
+            CsvRunResult for this invocation
+        """
+        started = time.monotonic()
+        checkpoint_path = Path(output_path + CHECKPOINT_SUFFIX)
+        checkpoint = self._load_checkpoint(checkpoint_path, input_path, output_path) if resume else None
+        resumed_from = checkpoint['rows_written'] if checkpoint else 0
+        counts = {'enriched': 0, 'failed': 0}
+
+        if self.preflight_column:
+            await self._preflight(input_path, resumed_from)
+
+        with open(input_path, 'r', newline='', encoding='utf-8') as infile:
+            reader = csv.DictReader(infile)
+            input_columns = reader.fieldnames or []
+            fieldnames = input_columns + [c for c in self.output_columns if c not in input_columns]
+
+            if checkpoint:
+                # Drop anything written after the last checkpoint (it is redone)
+                with open(output_path, 'r+b') as partial:
+                    partial.truncate(checkpoint['output_bytes'])
+                outfile = open(output_path, 'a', newline='', encoding='utf-8')
+                writer = csv.DictWriter(outfile, fieldnames=fieldnames, restval='', extrasaction='ignore')
+            else:
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                outfile = open(output_path, 'w', newline='', encoding='utf-8')
+                writer = csv.DictWriter(outfile, fieldnames=fieldnames, restval='', extrasaction='ignore')
+                writer.writeheader()
+
+            state = {'next': resumed_from, 'written': resumed_from, 'since_checkpoint': 0}
+            finished: Dict[int, Row] = {}
+            window = asyncio.Semaphore(self.max_pending)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
+
+            def flush_ready():
+                while state['next'] in finished:
+                    writer.writerow(finished.pop(state['next']))
+                    state['next'] += 1
+                    state['written'] += 1
+                    state['since_checkpoint'] += 1
+                    window.release()
+                if state['since_checkpoint'] >= self.checkpoint_every:
+                    self._save_checkpoint(checkpoint_path, input_path, outfile, state['written'])
+                    state['since_checkpoint'] = 0
+                    self.logger.info(
+                        "csv_enrichment_progress",
+                        output=output_path,
+                        rows_written=state['written'],
+                        rows_per_second=round((state['written'] - resumed_from) / max(time.monotonic() - started, 1e-6), 2)
+                    )
+
+            async def worker():
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    index, row = item
+                    finished[index] = await self._enrich(index, row, counts)
+                    flush_ready()
+
+            async def produce():
+                for index, row in enumerate(reader):
+                    if index < resumed_from:
+                        continue
+                    await window.acquire()
+                    await queue.put((index, row))
+                for _ in range(self.concurrency):
+                    await queue.put(None)
+
+            tasks = [asyncio.create_task(produce())]
+            tasks += [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+            try:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    task.result()
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                # Keep what is already in order on disk for the next run
+                self._save_checkpoint(checkpoint_path, input_path, outfile, state['written'])
+                outfile.close()
+                raise
+
+            outfile.close()
+
+        checkpoint_path.unlink(missing_ok=True)
+        result = CsvRunResult(
+            input_path=input_path,
+            output_path=output_path,
+            rows_written=state['written'],
+            rows_enriched=counts['enriched'],
+            rows_failed=counts['failed'],
+            resumed_from=resumed_from,
+            elapsed_seconds=round(time.monotonic() - started, 3)
+        )
+        self.logger.info("csv_enrichment_complete", **result.to_dict())
+        return result
+
+    async def _enrich(self, index: int, row: Row, counts: Dict[str, int]) -> Row:
+        original = dict(row)
+        try:
+            if self.rate_limiter:
+                await self.rate_limiter.wait()
+            result = self.enrich_row(row)
+            if inspect.isawaitable(result):
+                result = await result
+            counts['enriched'] += 1
+            return row if result is None else result
+        except Exception as e:
+            counts['failed'] += 1
+            self.logger.warning("csv_row_enrichment_failed", row=index + 1, provider=self.provider, error=str(e))
+            return original
+
+    async def _preflight(self, input_path: str, resumed_from: int):
+        """Resolve the remaining rows' website hosts up front (one streaming pass over the column)."""
+        with open(input_path, 'r', newline='', encoding='utf-8') as infile:
+            websites = [
+                row.get(self.preflight_column) or ''
+                for index, row in enumerate(csv.DictReader(infile))
+                if index >= resumed_from
+            ]
+        await get_domain_health().preflight(websites)
+
+    def _load_checkpoint(self, checkpoint_path: Path, input_path: str, output_path: str) -> Optional[Dict]:
+        if not checkpoint_path.exists():
+            return None
+        try:
+            checkpoint = json.loads(checkpoint_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        output_size = os.path.getsize(output_path) if os.path.exists(output_path) else -1
+        if (checkpoint.get('input_path') != os.path.abspath(input_path)
+                or output_size < checkpoint.get('output_bytes', 0)):
+            self.logger.warning("csv_checkpoint_ignored", checkpoint=str(checkpoint_path))
+            return None
+
+        self.logger.info("csv_enrichment_resuming", output=output_path, rows_written=checkpoint['rows_written'])
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint_path: Path, input_path: str, outfile, rows_written: int):
+        outfile.flush()
+        os.fsync(outfile.fileno())
+        checkpoint = {
+            'input_path': os.path.abspath(input_path),
+            'rows_written': rows_written,
+            'output_bytes': os.fstat(outfile.fileno()).st_size,
+            'saved_at': time.time()
+        }
+        tmp_path = checkpoint_path.with_name(checkpoint_path.name + '.tmp')
+        tmp_path.write_text(json.dumps(checkpoint))
+        os.replace(tmp_path, checkpoint_path)
+
+
+async def enrich_csv(
+    input_path: str,
+    output_path: str,
+    enrich_row: RowEnricher,
+    output_columns: Sequence[str] = (),
+    **runner_options
+) -> CsvRunResult:
+    """Convenience wrapper: build a CsvEnrichmentRunner and run it once."""
+    runner = CsvEnrichmentRunner(enrich_row, output_columns=output_columns, **runner_options)
+    return await runner.run(input_path, output_path)
+
+
+def _settings_from_config() -> Dict:
+    try:
+        from ..core.config import config
+        return {
+            'concurrency': config.CSV_ENRICHMENT_CONCURRENCY,
+            'checkpoint_every': config.CSV_ENRICHMENT_CHECKPOINT_EVERY,
+        }
+    except Exception:
+        return {
+            'concurrency': 8,
+            'checkpoint_every': 100,
+        }
@@ -1,26 +1,35 @@
 """
-Domain Age Checker - Get website age via WHOIS
+Domain Age Checker - Get website age via RDAP/WHOIS
 
 Fetches domain registration date to determine years in business.
-Uses python-whois library for WHOIS lookups.
+Lookups go through the shared DomainRegistrationService, so a domain already
+resolved for owner lookup (or on a previous run) is not queried again.
 """
 import asyncio
-import whois
-from datetime import datetime
 from typing import Optional, Dict
 import structlog
 from urllib.parse import urlparse
 
+from ..services.domain_registration import (
+    DomainRecord,
+    DomainRegistrationService,
+    get_domain_registration_service,
+)
+from .csv_runner import CsvEnrichmentRunner
+
 logger = structlog.get_logger(__name__)
 
+AGE_COLUMNS = ['Years in Business', 'Founded Year', 'Age Source', 'Age Confidence']
+
 
 class DomainAgeChecker:
     """
-    Check domain age using WHOIS lookups.
+    Check domain age using registration records.
     """
 
-    def __init__(self):
+    def __init__(self, registry: Optional[DomainRegistrationService] = None):
         self.logger = logger
+        self.registry = registry or get_domain_registration_service()
 
     def extract_domain(self, url: str) -> Optional[str]:
         """Extract clean domain from URL."""
@@ -45,7 +54,7 @@ class DomainAgeChecker:
 
     async def get_domain_age(self, website: str) -> Optional[Dict]:
         """
-        Get domain age from WHOIS.
+        Get domain age from the domain's registration record.
 
         Args:
             website: Website URL
@@ -58,115 +67,86 @@ class DomainAgeChecker:
             if not domain:
                 return None
 
-            # WHOIS lookup (blocking, run in executor)
-            loop = asyncio.get_event_loop()
-            whois_data = await loop.run_in_executor(None, whois.whois, domain)
+            record = await self.registry.lookup(domain)
+            return self._age_from_record(record)
 
-            if not whois_data:
-                return None
+        except Exception as e:
+            self.logger.debug("domain_age_lookup_failed", website=website, error=str(e)[:100])
+            return None
 
-            # Extract creation date
-            creation_date = whois_data.creation_date
+    async def close(self):
+        """Release the registration service's HTTP session (reopened on the next lookup)."""
+        await self.registry.close()
 
-            if not creation_date:
-                return None
+    def _age_from_record(self, record: DomainRecord) -> Optional[Dict]:
+        """Build the domain age result from a registration record."""
+        if record.creation_date is None:
+            return None
 
-            # Handle list of dates (sometimes WHOIS returns multiple)
-            if isinstance(creation_date, list):
-                creation_date = creation_date[0]
-
-            # Calculate years (handle timezone-aware dates)
-            if isinstance(creation_date, datetime):
-                # Remove timezone info for comparison
-                if creation_date.tzinfo:
-                    creation_date = creation_date.replace(tzinfo=None)
-                years_old = (datetime.now() - creation_date).days / 365.25
-
-                self.logger.info(
-                    "domain_age_found",
-                    domain=domain,
-                    creation_date=creation_date.isoformat(),
-                    years_old=round(years_old, 1)
-                )
-
-                return {
-                    'creation_date': creation_date.isoformat(),
-                    'years_old': round(years_old, 1),
-                    'year_founded': creation_date.year,
-                    'confidence': 0.85,  # WHOIS is reliable
-                    'source': 'whois'
-                }
+        years_old = record.years_old()
 
-            return None
+        self.logger.info(
+            "domain_age_found",
+            domain=record.domain,
+            creation_date=record.creation_date.isoformat(),
+            years_old=round(years_old, 1)
+        )
 
-        except Exception as e:
-            self.logger.debug("domain_age_lookup_failed", website=website, error=str(e)[:100])
-            return None
+        return {
+            'creation_date': record.creation_date.isoformat(),
+            'years_old': round(years_old, 1),
+            'year_founded': record.creation_date.year,
+            'confidence': 0.85,  # Registry data is reliable
+            'source': record.source
+        }
 
-    async def enrich_csv_with_domain_age(self, input_csv: str, output_csv: str):
+    async def enrich_csv_with_domain_age(self, input_csv: str, output_csv: str, concurrency: Optional[int] = None):
         """
         Add domain age to CSV file.
 
+        Rows stream through the shared CSV runner; the registration service
+        dedupes domains and rate limits per registry, so rows can be looked up
+        concurrently. Output keeps input order and resumes from a checkpoint.
+
         Args:
             input_csv: Input CSV path
             output_csv: Output CSV path with domain age
+            concurrency: Rows looked up at once (default CSV_ENRICHMENT_CONCURRENCY)
         """
-        import csv
-
-        with open(input_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        enriched = []
+        summary = {'successful': 0}
 
-        for i, row in enumerate(rows, 1):
-            website = row.get('Website', '')
-            business_name = row.get('Business Name', '')
-
-            self.logger.info(
-                "checking_domain_age",
-                index=i,
-                total=len(rows),
-                business=business_name,
-                website=website
-            )
-
-            # Get domain age
-            age_data = await self.get_domain_age(website)
+        async def enrich_row(row: Dict) -> Dict:
+            record = await self.registry.lookup(row.get('Website', ''))
+            age_data = self._age_from_record(record)
 
             if age_data:
                 row['Years in Business'] = age_data['years_old']
                 row['Founded Year'] = age_data['year_founded']
                 row['Age Source'] = age_data['source']
                 row['Age Confidence'] = f"{int(age_data['confidence'] * 100)}%"
-            elif 'Years in Business' not in row or row.get('Years in Business', '').startswith('UNKNOWN'):
+                summary['successful'] += 1
+            elif 'Years in Business' not in row:
                 # Keep existing values or mark as UNKNOWN
-                if 'Years in Business' not in row:
-                    row['Years in Business'] = 'UNKNOWN - WHOIS failed'
-                    row['Founded Year'] = 'UNKNOWN'
-                    row['Age Source'] = 'whois_failed'
-                    row['Age Confidence'] = '0%'
-
-            enriched.append(row)
-
-            # Rate limiting
-            await asyncio.sleep(0.5)
-
-        # Write output
-        if enriched:
-            fieldnames = list(enriched[0].keys())
-            with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(enriched)
-
-            self.logger.info("domain_age_enrichment_complete", output=output_csv, total=len(enriched))
-
-            # Summary
-            print("\n=== DOMAIN AGE SUMMARY ===")
-            successful = sum(1 for r in enriched if isinstance(r.get('Years in Business'), (int, float)) or (isinstance(r.get('Years in Business'), str) and r.get('Years in Business').replace('.', '').isdigit()))
-            print(f"Successfully enriched: {successful}/{len(enriched)}")
-            print(f"Failed/Unknown: {len(enriched) - successful}/{len(enriched)}")
+                row['Years in Business'] = 'UNKNOWN - WHOIS failed'
+                row['Founded Year'] = 'UNKNOWN'
+                row['Age Source'] = 'whois_failed'
+                row['Age Confidence'] = '0%'
+            return row
+
+        runner = CsvEnrichmentRunner(enrich_row, output_columns=AGE_COLUMNS, concurrency=concurrency)
+        try:
+            result = await runner.run(input_csv, output_csv)
+        finally:
+            await self.close()
+
+        self.logger.info("domain_age_enrichment_complete", output=output_csv, total=result.rows_written)
+
+        # Summary (this invocation; a resumed run counts only the rows it did)
+        processed = result.rows_written - result.resumed_from
+        print("\n=== DOMAIN AGE SUMMARY ===")
+        print(f"Successfully enriched: {summary['successful']}/{processed}")
+        print(f"Failed/Unknown: {processed - summary['successful']}/{processed}")
+        return result
 
 
 async def add_domain_age():
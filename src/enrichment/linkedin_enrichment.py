@@ -16,8 +16,18 @@ import aiohttp
 from bs4 import BeautifulSoup
 import structlog
 
+from ..services.http_transport import create_client_session
+from .csv_runner import CsvEnrichmentRunner
+
 logger = structlog.get_logger(__name__)
 
+LINKEDIN_COLUMNS = [
+    'Employee Count (LinkedIn)',
+    'Employee Range (LinkedIn)',
+    'Year Founded (LinkedIn)',
+    'Industry (LinkedIn)',
+]
+
 
 class LinkedInEnricher:
     """
@@ -64,7 +74,7 @@ class LinkedInEnricher:
             # Google search for LinkedIn URL
             search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
 
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 async with session.get(search_url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status != 200:
                         self.logger.warning("google_search_failed", status=response.status, company=company_name)
@@ -102,7 +112,7 @@ class LinkedInEnricher:
             Dict with employee_count, year_founded, industry, etc.
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 async with session.get(linkedin_url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
                     if response.status != 200:
                         self.logger.warning("linkedin_scrape_failed", status=response.status, url=linkedin_url)
@@ -226,29 +236,23 @@ class LinkedInEnricher:
             self.logger.error("linkedin_enrichment_failed", error=str(e), company=company_name)
             return None
 
-    async def enrich_from_csv(self, csv_path: str, output_path: str):
+    async def enrich_from_csv(self, csv_path: str, output_path: str, concurrency: int = 2):
         """
         Enrich businesses from CSV file with LinkedIn data.
 
+        Rows stream through the shared CSV runner: output is written in input
+        order as rows finish, an interrupted run resumes from its checkpoint,
+        and lookups share the 'linkedin' rate limit.
+
         Args:
             csv_path: Path to input CSV with Business Name, Website columns
             output_path: Path to output CSV with enriched data
+            concurrency: Businesses looked up at once
         """
-        import csv
-
-        with open(csv_path, 'r') as infile:
-            reader = csv.DictReader(infile)
-            rows = list(reader)
-
-        enriched_rows = []
-
-        for i, row in enumerate(rows, 1):
+        async def enrich_row(row: Dict) -> Dict:
             company_name = row.get('Business Name', '')
             website = row.get('Website', '')
 
-            self.logger.info(f"enriching_business", index=i, total=len(rows), company=company_name)
-
-            # Enrich with LinkedIn
             enrichment = await self.enrich_business(company_name, website)
 
             if enrichment:
@@ -261,20 +265,18 @@ class LinkedInEnricher:
                 row['Employee Range (LinkedIn)'] = 'UNKNOWN - LinkedIn not found'
                 row['Year Founded (LinkedIn)'] = 'UNKNOWN - LinkedIn not found'
                 row['Industry (LinkedIn)'] = 'UNKNOWN - LinkedIn not found'
-
-            enriched_rows.append(row)
-
-            # Rate limiting (be respectful to LinkedIn)
-            await asyncio.sleep(2)
-
-        # Write output CSV
-        fieldnames = list(enriched_rows[0].keys())
-        with open(output_path, 'w', newline='') as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(enriched_rows)
-
-        self.logger.info("enrichment_complete", output_path=output_path, total=len(enriched_rows))
+            return row
+
+        runner = CsvEnrichmentRunner(
+            enrich_row,
+            output_columns=LINKEDIN_COLUMNS,
+            concurrency=concurrency,
+            provider='linkedin'
+        )
+        result = await runner.run(csv_path, output_path)
+
+        self.logger.info("enrichment_complete", output_path=output_path, total=result.rows_written)
+        return result
 
 
 async def enrich_google_places_leads():
@@ -12,11 +12,13 @@ import asyncio
 import re
 from typing import Optional, Dict, List, Tuple
 import aiohttp
-from bs4 import BeautifulSoup
-import whois
-from urllib.parse import urlparse
 import structlog
 
+from ..services.domain_health import get_domain_health
+from ..services.domain_registration import DomainRegistrationService, get_domain_registration_service
+from ..services.html_extraction import extract_page_async, read_body_bytes_capped
+from ..services.http_transport import create_client_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -30,8 +32,9 @@ class OwnerLookupService:
     - Pattern matching for owner names in content
     """
 
-    def __init__(self):
+    def __init__(self, registry: Optional[DomainRegistrationService] = None):
         self.logger = logger
+        self.registry = registry or get_domain_registration_service()
         self.stats = {
             'attempted': 0,
             'found_via_website': 0,
@@ -56,10 +59,12 @@ class OwnerLookupService:
         # Name pattern regex
         # Matches patterns like "Founded by John Smith" or "President: Jane Doe"
         self.name_patterns = [
-            r'(?:founded by|owner|president|ceo|director|principal|managed by)[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+)[,\s]+(?:founder|owner|president|ceo|director|principal)',
-            r'contact[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'(?:mr\.|ms\.|mrs\.)\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+            re.compile(pattern, re.IGNORECASE) for pattern in (
+                r'(?:founded by|owner|president|ceo|director|principal|managed by)[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+                r'([A-Z][a-z]+\s+[A-Z][a-z]+)[,\s]+(?:founder|owner|president|ceo|director|principal)',
+                r'contact[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+                r'(?:mr\.|ms\.|mrs\.)\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+            )
         ]
 
     async def lookup_owner(
@@ -147,8 +152,14 @@ class OwnerLookupService:
             'details': []
         }
 
+        domain_health = get_domain_health()
+        dead = domain_health.check(website)
+        if dead is not None:
+            result['details'].append(f"Website skipped: host known dead ({dead.kind})")
+            return result
+
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 # Try homepage first
                 names = await self._scrape_page_for_names(session, website, timeout)
                 if names:
@@ -158,8 +169,10 @@ class OwnerLookupService:
                     result['details'].append(f"Found on homepage")
                     return result
 
-                # Try common pages
+                # Try common pages (stop once the host turns out to be dead)
                 for pattern in self.page_patterns:
+                    if domain_health.is_dead(website):
+                        break
                     page_url = website.rstrip('/') + pattern
                     names = await self._scrape_page_for_names(session, page_url, timeout)
                     if names:
@@ -201,20 +214,16 @@ class OwnerLookupService:
                 if response.status != 200:
                     return []
 
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Remove script and style elements
-                for script in soup(["script", "style", "nav", "footer", "header"]):
-                    script.decompose()
+                body, encoding, _ = await read_body_bytes_capped(response)
 
-                # Get visible text
-                text = soup.get_text()
+                # Get visible text, skipping navigation chrome
+                page = await extract_page_async(body, encoding, skip_tags=("nav", "footer", "header"))
+                text = page.text
 
                 # Search for name patterns
                 names = []
                 for pattern in self.name_patterns:
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
+                    matches = pattern.finditer(text)
                     for match in matches:
                         name = match.group(1).strip()
                         if self._is_valid_name(name):
@@ -223,11 +232,13 @@ class OwnerLookupService:
                 # Deduplicate and return
                 return list(dict.fromkeys(names))  # Preserve order, remove dupes
 
-        except asyncio.TimeoutError:
+        except asyncio.TimeoutError as e:
             self.logger.debug("page_scrape_timeout", url=url)
+            get_domain_health().record_failure(url, e)
             return []
         except Exception as e:
             self.logger.debug("page_scrape_failed", url=url, error=str(e))
+            get_domain_health().record_failure(url, e)
             return []
 
     def _is_valid_name(self, name: str) -> bool:
@@ -281,30 +292,20 @@ class OwnerLookupService:
         }
 
         try:
-            # Extract domain from URL
-            parsed = urlparse(website)
-            domain = parsed.netloc or parsed.path
-            domain = domain.replace('www.', '')
-
-            # Async WHOIS lookup (run in executor to not block)
-            loop = asyncio.get_event_loop()
-            whois_data = await loop.run_in_executor(
-                None,
-                lambda: whois.whois(domain)
-            )
+            # Shared registration record (also used for domain age)
+            record = await self.registry.lookup(website)
+
+            # Registrant name (RDAP or WHOIS)
+            name = record.registrant
+            if name and self._is_valid_name(name):
+                result['name'] = name
+                result['source'] = 'whois'
+                result['confidence'] = 'low'  # WHOIS often inaccurate
+                result['details'].append(f"Found via {record.source.upper()} (may be registrar)")
+                return result
 
-            # Extract name from WHOIS
-            if whois_data and hasattr(whois_data, 'name'):
-                name = whois_data.name
-                if isinstance(name, list):
-                    name = name[0] if name else None
-
-                if name and self._is_valid_name(name):
-                    result['name'] = name
-                    result['source'] = 'whois'
-                    result['confidence'] = 'low'  # WHOIS often inaccurate
-                    result['details'].append("Found via WHOIS (may be registrar)")
-                    return result
+            if record.error:
+                result['details'].append(f"WHOIS failed: {record.error}")
 
         except Exception as e:
             self.logger.debug("whois_lookup_failed",
@@ -330,6 +331,9 @@ class OwnerLookupService:
             List of owner lookup results
         """
         semaphore = asyncio.Semaphore(max_concurrent)
+        await get_domain_health().preflight(
+            self._clean_url(b['website']) for b in businesses if b.get('website')
+        )
 
         async def lookup_with_semaphore(business):
             async with semaphore:
@@ -355,6 +359,10 @@ class OwnerLookupService:
 
         return valid_results
 
+    async def close(self):
+        """Release the registration service's HTTP session (reopened on the next lookup)."""
+        await self.registry.close()
+
     def print_stats(self):
         """Print lookup statistics."""
         print(f"\n{'='*60}")
@@ -473,7 +481,10 @@ async def lookup_owners_for_leads(leads: List[Dict]) -> List[Dict]:
     print(f"\n🔍 Starting owner lookup for {len(leads)} businesses...")
     print(f"   This may take a few minutes...\n")
 
-    results = await service.lookup_batch(leads, max_concurrent=3)
+    try:
+        results = await service.lookup_batch(leads, max_concurrent=3)
+    finally:
+        await service.close()
 
     # Merge results back into leads
     enriched_leads = []
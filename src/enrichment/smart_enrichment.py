@@ -17,9 +17,17 @@ from datetime import datetime
 import structlog
 
 from ..core.config import INDUSTRY_BENCHMARKS
+from .csv_runner import CsvEnrichmentRunner
 
 logger = structlog.get_logger(__name__)
 
+SMART_COLUMNS = [
+    'Employee Range', 'Employee Count Source', 'Employee Confidence',
+    'Years in Business', 'Founded Year', 'Age Source', 'Age Confidence',
+    'Revenue Range', 'Revenue Estimate', 'Revenue Midpoint', 'Revenue Source',
+    'Revenue Confidence', 'Revenue Margin %',
+]
+
 
 class SmartEnricher:
     """
@@ -278,12 +286,7 @@ class SmartEnricher:
         """
         import csv
 
-        # Load original data
-        with open(csv_input_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            businesses = list(reader)
-
-        # Load scraped data if available
+        # Load scraped data if available (a lookup table, not the input)
         scraped_data = {}
         if scraped_csv_path:
             try:
@@ -295,9 +298,9 @@ class SmartEnricher:
             except:
                 self.logger.warning("scraped_csv_not_found", path=scraped_csv_path)
 
-        enriched = []
+        sources: Dict[str, int] = {}
 
-        for biz in businesses:
+        def enrich_row(biz: Dict) -> Dict:
             name = biz.get('Business Name', '')
             industry = biz.get('Industry', '')
             city = biz.get('City', '')
@@ -371,35 +374,29 @@ class SmartEnricher:
             biz['Revenue Confidence'] = f"{int(revenue['confidence'] * 100)}%"
             biz['Revenue Margin %'] = revenue['factors_used']['margin_percentage']  # NEW: Show margin
 
-            enriched.append(biz)
+            source = biz.get('Employee Count Source', 'unknown')
+            sources[source] = sources.get(source, 0) + 1
+            return biz
 
-        # Write output
-        if enriched:
-            fieldnames = list(enriched[0].keys())
-            with open(csv_output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(enriched)
+        # Stream rows through the shared CSV runner (ordered output, resumable)
+        runner = CsvEnrichmentRunner(enrich_row, output_columns=SMART_COLUMNS, concurrency=1)
+        result = await runner.run(csv_input_path, csv_output_path)
 
-            self.logger.info(
-                "smart_enrichment_complete",
-                output_path=csv_output_path,
-                total=len(enriched)
-            )
+        self.logger.info(
+            "smart_enrichment_complete",
+            output_path=csv_output_path,
+            total=result.rows_written
+        )
 
-            # Print summary
-            print("\n=== SMART ENRICHMENT SUMMARY ===")
-            print(f"Total businesses: {len(enriched)}")
+        # Print summary
+        print("\n=== SMART ENRICHMENT SUMMARY ===")
+        print(f"Total businesses: {result.rows_written}")
 
-            # Count by source
-            sources = {}
-            for biz in enriched:
-                source = biz.get('Employee Count Source', 'unknown')
-                sources[source] = sources.get(source, 0) + 1
+        print("\nEmployee Count Sources:")
+        for source, count in sources.items():
+            print(f"  {source}: {count}")
 
-            print("\nEmployee Count Sources:")
-            for source, count in sources.items():
-                print(f"  {source}: {count}")
+        return result
 
 
 async def enrich_google_places():
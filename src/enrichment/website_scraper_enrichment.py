@@ -13,11 +13,58 @@ import re
 from typing import Optional, Dict, Tuple
 from datetime import datetime
 import aiohttp
-from bs4 import BeautifulSoup
 import structlog
 
+from ..services.crawl_metadata import get_crawl_cache
+from ..services.domain_health import get_domain_health
+from ..services.html_extraction import ExtractedPage, extract_page_async, read_body_capped
+from ..services.http_transport import create_client_session
+from .csv_runner import CsvEnrichmentRunner
+
 logger = structlog.get_logger(__name__)
 
+SCRAPED_COLUMNS = [
+    'Employee Count (Scraped)',
+    'Employee Range (Scraped)',
+    'Year Founded (Scraped)',
+    'Years in Business',
+]
+
+EMPLOYEE_COUNT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        # Exact count
+        r'(?:we have|team of|company of|staff of|with)\s+([\d,]+)\s+(?:employees|staff|people|team members)',
+        r'([\d,]+)\s+(?:employees|staff|people|team members)',
+        # Range
+        r'([\d,]+)\s*(?:-|to)\s*([\d,]+)\s+(?:employees|staff|people)',
+        # "Over X" pattern
+        r'(?:over|more than)\s+([\d,]+)\s+(?:employees|staff|people)',
+        # Company size
+        r'company size[:\s]*([\d,]+)\s*(?:-\s*([\d,]+))?',
+    )
+]
+
+YEAR_FOUNDED_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(?:founded|established|est\.|since)[:\s]*(\d{4})',
+        r'serving (?:customers|clients) since (\d{4})',
+        r'in business since (\d{4})',
+        r'©\s*(\d{4})',  # Copyright year (less reliable)
+    )
+]
+
+# Common About page patterns
+ABOUT_HREF_KEYWORDS = [
+    'about', 'about-us', 'about_us', 'aboutus',
+    'company', 'our-company', 'our-story',
+    'team', 'our-team', 'meet-the-team',
+    'who-we-are', 'contact', 'contact-us'
+]
+ABOUT_TEXT_KEYWORDS = ['about', 'team', 'company', 'our story']
+
+# Crawl-metadata key for the firmographics extracted from a page
+CRAWL_KEY = 'firmographics'
+
 
 class WebsiteScraperEnricher:
     """
@@ -41,17 +88,62 @@ class WebsiteScraperEnricher:
     async def fetch_page(self, url: str) -> Optional[str]:
         """Fetch page HTML with timeout and error handling."""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 async with session.get(url, headers=self.headers, timeout=aiohttp.ClientTimeout(total=15), ssl=False) as response:
                     if response.status == 200:
-                        return await response.text()
+                        html, _ = await read_body_capped(response)
+                        return html
                     else:
                         self.logger.debug("page_fetch_failed", url=url, status=response.status)
                         return None
         except Exception as e:
             self.logger.debug("page_fetch_error", url=url, error=str(e)[:100])
+            get_domain_health().record_failure(url, e)
             return None
 
+    async def scrape_page_facts(self, url: str) -> Optional[Dict]:
+        """
+        Employee data, founding year and About page links of one page.
+
+        Previously scraped pages are revisited with a conditional GET; if the
+        page is unchanged (304 or same content) the last extraction is reused,
+        and within its re-crawl interval the page is not requested at all.
+
+        Returns:
+            Dict with employee_data, year_founded and about_pages, or None if the fetch failed
+        """
+        crawl_cache = get_crawl_cache()
+        facts = crawl_cache.lookup(url, CRAWL_KEY)
+        if facts is not None:
+            return facts
+
+        try:
+            async with create_client_session() as session:
+                headers = {**self.headers, **crawl_cache.request_headers(url, CRAWL_KEY)}
+                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15), ssl=False) as response:
+                    html = ''
+                    if response.status == 200:
+                        html, _ = await read_body_capped(response)
+                    facts = crawl_cache.revisit(url, CRAWL_KEY, response.status, response.headers, html)
+                    if facts is not None:
+                        return facts
+                    if response.status != 200:
+                        self.logger.debug("page_fetch_failed", url=url, status=response.status)
+                        return None
+        except Exception as e:
+            self.logger.debug("page_fetch_error", url=url, error=str(e)[:100])
+            get_domain_health().record_failure(url, e)
+            return None
+
+        page = await extract_page_async(html, base_url=url)
+        facts = {
+            'employee_data': self.extract_employee_count(page.text),
+            'year_founded': self.extract_year_founded(page.text),
+            'about_pages': await self.find_about_pages(url, page),
+        }
+        crawl_cache.store_extraction(url, CRAWL_KEY, facts)
+        return facts
+
     def extract_employee_count(self, text: str) -> Optional[Dict]:
         """
         Extract employee count or range from text.
@@ -62,20 +154,8 @@ class WebsiteScraperEnricher:
         - "10-30 employees" → range 10-30
         - "over 100 staff" → >100
         """
-        patterns = [
-            # Exact count
-            r'(?:we have|team of|company of|staff of|with)\s+([\d,]+)\s+(?:employees|staff|people|team members)',
-            r'([\d,]+)\s+(?:employees|staff|people|team members)',
-            # Range
-            r'([\d,]+)\s*(?:-|to)\s*([\d,]+)\s+(?:employees|staff|people)',
-            # "Over X" pattern
-            r'(?:over|more than)\s+([\d,]+)\s+(?:employees|staff|people)',
-            # Company size
-            r'company size[:\s]*([\d,]+)\s*(?:-\s*([\d,]+))?',
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in EMPLOYEE_COUNT_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 try:
                     if match.group(2):  # Range match
@@ -110,18 +190,11 @@ class WebsiteScraperEnricher:
         - "Since 1980"
         - "Est. 1999"
         """
-        patterns = [
-            r'(?:founded|established|est\.|since)[:\s]*(\d{4})',
-            r'serving (?:customers|clients) since (\d{4})',
-            r'in business since (\d{4})',
-            r'©\s*(\d{4})',  # Copyright year (less reliable)
-        ]
-
         current_year = datetime.now().year
         found_years = []
 
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in YEAR_FOUNDED_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 try:
                     year = int(match.group(1))
@@ -137,43 +210,28 @@ class WebsiteScraperEnricher:
 
         return None
 
-    async def find_about_pages(self, base_url: str, homepage_html: str) -> list:
+    async def find_about_pages(self, base_url: str, homepage: ExtractedPage) -> list:
         """
         Find About Us, Team, Company Info pages.
 
         Args:
             base_url: Website base URL
-            homepage_html: Homepage HTML content
+            homepage: Extracted homepage
 
         Returns:
             List of candidate URLs to scrape
         """
-        soup = BeautifulSoup(homepage_html, 'html.parser')
         candidate_urls = []
 
-        # Common About page patterns
-        about_keywords = [
-            'about', 'about-us', 'about_us', 'aboutus',
-            'company', 'our-company', 'our-story',
-            'team', 'our-team', 'meet-the-team',
-            'who-we-are', 'contact', 'contact-us'
-        ]
-
         # Find links matching about patterns
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            link_text = link.get_text().lower().strip()
+        for link in homepage.links:
+            href = link.href.lower()
+            link_text = link.text.lower()
 
             # Check if link or text matches about keywords
-            if any(keyword in href for keyword in about_keywords) or \
-               any(keyword in link_text for keyword in ['about', 'team', 'company', 'our story']):
-                # Build full URL
-                if href.startswith('http'):
-                    full_url = href
-                elif href.startswith('/'):
-                    full_url = base_url.rstrip('/') + href
-                else:
-                    full_url = base_url.rstrip('/') + '/' + href
+            if any(keyword in href for keyword in ABOUT_HREF_KEYWORDS) or \
+               any(keyword in link_text for keyword in ABOUT_TEXT_KEYWORDS):
+                full_url = link.url if link.url.startswith('http') else base_url.rstrip('/') + '/' + link.href
 
                 if full_url not in candidate_urls:
                     candidate_urls.append(full_url)
@@ -196,9 +254,14 @@ class WebsiteScraperEnricher:
             if not website.startswith('http'):
                 website = f"https://{website}"
 
+            dead = get_domain_health().check(website)
+            if dead is not None:
+                self.logger.debug("dead_website_skipped", website=website, kind=dead.kind)
+                return None
+
             # Fetch homepage
-            homepage_html = await self.fetch_page(website)
-            if not homepage_html:
+            homepage = await self.scrape_page_facts(website)
+            if not homepage:
                 return None
 
             # Extract from homepage first
@@ -211,36 +274,33 @@ class WebsiteScraperEnricher:
             }
 
             # Try homepage
-            employee_data = self.extract_employee_count(homepage_html)
-            if employee_data:
-                result.update(employee_data)
+            if homepage['employee_data']:
+                result.update(homepage['employee_data'])
 
-            year_founded = self.extract_year_founded(homepage_html)
-            if year_founded:
-                result['year_founded'] = year_founded
-                result['years_in_business'] = datetime.now().year - year_founded
+            if homepage['year_founded']:
+                result['year_founded'] = homepage['year_founded']
+                result['years_in_business'] = datetime.now().year - homepage['year_founded']
 
             # If employee count not found, try About pages
             if not result.get('employee_count') and not result.get('employee_range'):
-                about_pages = await self.find_about_pages(website, homepage_html)
-
-                for about_url in about_pages:
-                    about_html = await self.fetch_page(about_url)
-                    if about_html:
-                        employee_data = self.extract_employee_count(about_html)
-                        if employee_data:
-                            result.update(employee_data)
+                for about_url in homepage['about_pages']:
+                    if get_domain_health().is_dead(website):
+                        break
+                    fetched = not get_crawl_cache().is_fresh(about_url, CRAWL_KEY)
+                    about = await self.scrape_page_facts(about_url)
+                    if about:
+                        if about['employee_data']:
+                            result.update(about['employee_data'])
                             break  # Found it, stop searching
 
                         # Also check for year founded
-                        if not result['year_founded']:
-                            year_founded = self.extract_year_founded(about_html)
-                            if year_founded:
-                                result['year_founded'] = year_founded
-                                result['years_in_business'] = datetime.now().year - year_founded
+                        if not result['year_founded'] and about['year_founded']:
+                            result['year_founded'] = about['year_founded']
+                            result['years_in_business'] = datetime.now().year - about['year_founded']
 
                     # Rate limit
-                    await asyncio.sleep(0.5)
+                    if fetched:
+                        await asyncio.sleep(0.5)
 
             self.logger.info(
                 "website_scrape_complete",
@@ -256,25 +316,21 @@ class WebsiteScraperEnricher:
             self.logger.error("website_scrape_error", website=website, error=str(e))
             return None
 
-    async def enrich_from_csv(self, csv_path: str, output_path: str):
+    async def enrich_from_csv(self, csv_path: str, output_path: str, concurrency: Optional[int] = None):
         """
         Enrich businesses from CSV with website-scraped data.
 
+        Rows stream through the shared CSV runner. Each row is a different
+        site, so rows are scraped concurrently (per-site pacing stays inside
+        scrape_website); output keeps input order and resumes from a checkpoint.
+
         Args:
             csv_path: Input CSV path with Website column
             output_path: Output CSV path with enriched data
+            concurrency: Websites scraped at once (default CSV_ENRICHMENT_CONCURRENCY)
         """
-        import csv
-
-        with open(csv_path, 'r', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            rows = list(reader)
-
-        enriched_rows = []
-
-        for i, row in enumerate(rows, 1):
-            website = row.get('Website', '').strip()
-            company_name = row.get('Business Name', '')
+        async def enrich_row(row: Dict) -> Dict:
+            website = (row.get('Website') or '').strip()
 
             # Skip if no website or marked as UNKNOWN
             if not website or 'UNKNOWN' in website:
@@ -282,18 +338,8 @@ class WebsiteScraperEnricher:
                 row['Employee Range (Scraped)'] = 'UNKNOWN - no website'
                 row['Year Founded (Scraped)'] = 'UNKNOWN - no website'
                 row['Years in Business'] = 'UNKNOWN - no website'
-                enriched_rows.append(row)
-                continue
-
-            self.logger.info(
-                "enriching_business",
-                index=i,
-                total=len(rows),
-                company=company_name,
-                website=website
-            )
+                return row
 
-            # Scrape website
             enrichment = await self.scrape_website(website)
 
             if enrichment:
@@ -311,21 +357,14 @@ class WebsiteScraperEnricher:
                 row['Employee Range (Scraped)'] = 'UNKNOWN - scrape failed'
                 row['Year Founded (Scraped)'] = 'UNKNOWN - scrape failed'
                 row['Years in Business'] = 'UNKNOWN - scrape failed'
+            return row
 
-            enriched_rows.append(row)
-
-            # Rate limiting
-            await asyncio.sleep(1)
-
-        # Write output
-        if enriched_rows:
-            fieldnames = list(enriched_rows[0].keys())
-            with open(output_path, 'w', newline='', encoding='utf-8') as outfile:
-                writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(enriched_rows)
+        runner = CsvEnrichmentRunner(enrich_row, output_columns=SCRAPED_COLUMNS, concurrency=concurrency,
+                                     preflight_column='Website')
+        result = await runner.run(csv_path, output_path)
 
-            self.logger.info("enrichment_complete", output_path=output_path, total=len(enriched_rows))
+        self.logger.info("enrichment_complete", output_path=output_path, total=result.rows_written)
+        return result
 
 
 async def enrich_google_places_leads():
@@ -7,7 +7,7 @@ This module enforces the StandardLeadOutput schema for ALL exports.
 import csv
 from datetime import datetime
 from collections import defaultdict
-from typing import List
+from typing import List, Optional
 import aiosqlite
 
 from ..core.output_schema import (
@@ -17,6 +17,7 @@ from ..core.output_schema import (
     calculate_sde_from_revenue,
     format_currency_cad
 )
+from .lead_snapshot import pa, write_lead_snapshot
 
 
 class CSVExporter:
@@ -52,7 +53,12 @@ class CSVExporter:
             'phones': obs_dict.get('phone', [])
         }
 
-    async def export(self, output_path: str, status_filter: str = None) -> dict:
+    async def export(
+        self,
+        output_path: str,
+        status_filter: str = None,
+        snapshot_path: Optional[str] = None
+    ) -> dict:
         """
         Export businesses to CSV using STANDARDIZED format.
 
@@ -62,6 +68,7 @@ class CSVExporter:
         Args:
             output_path: Path to output CSV file
             status_filter: Optional status filter (e.g., 'QUALIFIED')
+            snapshot_path: Optional Parquet/Arrow snapshot written with the same rows
 
         Returns:
             dict with export statistics
@@ -84,6 +91,7 @@ class CSVExporter:
                 """)
 
             businesses = await cursor.fetchall()
+            rows = []
 
             # Write CSV using STANDARDIZED headers (NEVER change these)
             with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
@@ -156,7 +164,14 @@ class CSVExporter:
                         data_sources=data_sources
                     )
 
-                    writer.writerow(standard_output.to_dict())
+                    row = standard_output.to_dict()
+                    writer.writerow(row)
+                    rows.append(row)
+
+            if snapshot_path and pa is not None:
+                write_lead_snapshot(rows, snapshot_path)
+            else:
+                snapshot_path = None
 
             # Calculate statistics
             status_counts = defaultdict(int)
@@ -168,7 +183,8 @@ class CSVExporter:
                 'qualified': status_counts.get('QUALIFIED', 0),
                 'excluded': status_counts.get('EXCLUDED', 0),
                 'review_required': status_counts.get('REVIEW_REQUIRED', 0),
-                'output_path': output_path
+                'output_path': output_path,
+                'snapshot_path': snapshot_path
             }
 
         finally:
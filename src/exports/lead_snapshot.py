@@ -0,0 +1,289 @@
+"""
+Columnar lead snapshots (Parquet / Arrow IPC) alongside the CSV exports.
+
+CSV stays the human-facing output. Snapshots are for the analysis,
+consolidation and revalidation scripts that repeatedly reload large lead
+files: the schema is explicit (derived from STANDARD_CSV_HEADERS and
+StandardLeadOutput), so nothing is re-inferred on load, and reads support
+column projection and predicate pushdown.
+
+Requires pyarrow (optional dependency):
+    pip install pyarrow
+
+Usage:
+    write_lead_snapshot(rows, "data/outputs/leads.parquet")
+    df = load_leads(
+        "data/outputs/leads.parquet",
+        columns=["Business Name", "Phone Number"],
+        filters=[("Status", "=", "QUALIFIED")]
+    )
+"""
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import structlog
+
+from ..core.output_schema import STANDARD_CSV_HEADERS, StandardLeadOutput
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+logger = structlog.get_logger(__name__)
+
+
+PARQUET_SUFFIXES = {'.parquet', '.pq'}
+ARROW_SUFFIXES = {'.arrow', '.feather', '.ipc'}
+
+# Columns with few distinct values are dictionary-encoded (categoricals in pandas)
+DICTIONARY_COLUMNS = {
+    'City',
+    'Province',
+    'Industry',
+    'Estimated Employees (Range)',
+    'Status',
+    'Data Sources',
+}
+
+# (column, op, value) triples, as accepted by pyarrow / pandas read_parquet
+Filter = Tuple[str, str, Any]
+
+# StandardLeadOutput fields map 1:1, in order, onto the locked CSV headers
+SNAPSHOT_FIELD_MAP: Dict[str, str] = dict(
+    zip(StandardLeadOutput.model_fields.keys(), STANDARD_CSV_HEADERS)
+)
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is required for lead snapshots: pip install pyarrow")
+
+
+def lead_snapshot_schema():
+    """
+    Arrow schema for standard lead snapshots.
+
+    Every StandardLeadOutput field is a string; low-cardinality columns are
+    dictionary-encoded.
+    """
+    _require_pyarrow()
+
+    fields = []
+    for field_name, header in SNAPSHOT_FIELD_MAP.items():
+        if header in DICTIONARY_COLUMNS:
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        else:
+            arrow_type = pa.string()
+        description = StandardLeadOutput.model_fields[field_name].description or ''
+        fields.append(pa.field(
+            header,
+            arrow_type,
+            nullable=True,
+            metadata={'field': field_name, 'description': description}
+        ))
+    return pa.schema(fields, metadata={'schema': 'standard_lead_output'})
+
+
+def _is_standard(columns: Sequence[str]) -> bool:
+    return list(columns) == STANDARD_CSV_HEADERS
+
+
+def _to_table(data: Union[pd.DataFrame, Iterable[Dict[str, Any]]]):
+    """Convert rows / DataFrame to an Arrow table, using the standard schema when it applies."""
+    if not isinstance(data, pd.DataFrame):
+        rows = [row.to_dict() if isinstance(row, StandardLeadOutput) else row for row in data]
+        data = pd.DataFrame(rows, columns=STANDARD_CSV_HEADERS if not rows else None)
+
+    if _is_standard(data.columns):
+        frame = data.astype('string')
+        return pa.Table.from_pandas(frame, schema=lead_snapshot_schema(), preserve_index=False)
+
+    # Non-standard lead files: keep numeric columns typed, store everything else as strings
+    frame = data.copy()
+    for column in frame.columns:
+        if frame[column].dtype == object:
+            frame[column] = frame[column].astype('string')
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def write_lead_snapshot(
+    data: Union[pd.DataFrame, Iterable[Dict[str, Any]]],
+    path: Union[str, Path],
+    compression: str = 'zstd'
+) -> int:
+    """
+    Write leads to a Parquet (.parquet) or Arrow IPC (.arrow/.feather) snapshot.
+
+    Args:
+        data: DataFrame, dicts keyed by STANDARD_CSV_HEADERS, or StandardLeadOutput rows
+        path: Output path; the suffix selects the format
+        compression: Codec for both formats (zstd, lz4, snappy, ...)
+
+    Returns:
+        Number of rows written
+    """
+    _require_pyarrow()
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = _to_table(data)
+
+    if path.suffix in ARROW_SUFFIXES:
+        feather.write_feather(table, str(path), compression=compression if compression != 'snappy' else 'lz4')
+    else:
+        pq.write_table(table, str(path), compression=compression)
+
+    logger.info("lead_snapshot_written", path=str(path), rows=table.num_rows, columns=table.num_columns)
+    return table.num_rows
+
+
+def _filters_to_expression(filters: Sequence[Filter]):
+    """Translate (column, op, value) triples into a pyarrow dataset expression."""
+    expression = None
+    for column, op, value in filters:
+        field = ds.field(column)
+        if op in ('=', '=='):
+            clause = field == value
+        elif op == '!=':
+            clause = field != value
+        elif op == '<':
+            clause = field < value
+        elif op == '<=':
+            clause = field <= value
+        elif op == '>':
+            clause = field > value
+        elif op == '>=':
+            clause = field >= value
+        elif op == 'in':
+            clause = field.isin(list(value))
+        elif op == 'not in':
+            clause = ~field.isin(list(value))
+        else:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        expression = clause if expression is None else expression & clause
+    return expression
+
+
+def read_lead_snapshot(
+    path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[Filter]] = None
+) -> pd.DataFrame:
+    """
+    Read a snapshot with column projection and predicate pushdown.
+
+    Only the requested columns are decoded, and Parquet row groups whose
+    statistics exclude the filter are skipped entirely.
+    """
+    _require_pyarrow()
+
+    path = Path(path)
+    file_format = 'ipc' if path.suffix in ARROW_SUFFIXES else 'parquet'
+    dataset = ds.dataset(str(path), format=file_format)
+    expression = _filters_to_expression(filters) if filters else None
+    table = dataset.to_table(columns=columns, filter=expression)
+    return table.to_pandas()
+
+
+def _apply_filters(df: pd.DataFrame, filters: Sequence[Filter]) -> pd.DataFrame:
+    """Apply (column, op, value) filters to a DataFrame (CSV fallback)."""
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        series = df[column]
+        if op in ('=', '=='):
+            mask &= series == value
+        elif op == '!=':
+            mask &= series != value
+        elif op == '<':
+            mask &= series < value
+        elif op == '<=':
+            mask &= series <= value
+        elif op == '>':
+            mask &= series > value
+        elif op == '>=':
+            mask &= series >= value
+        elif op == 'in':
+            mask &= series.isin(list(value))
+        elif op == 'not in':
+            mask &= ~series.isin(list(value))
+        else:
+            raise ValueError(f"Unsupported filter operator: {op}")
+    return df[mask.fillna(False)].reset_index(drop=True)
+
+
+def load_leads(
+    path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[Filter]] = None
+) -> pd.DataFrame:
+    """
+    Load a lead file, preferring the columnar path.
+
+    Snapshots (.parquet/.arrow/.feather) are read with projection and
+    pushdown. CSV files are read with ``usecols`` as strings, without type
+    inference ('' for empty cells, as csv.DictReader returns).
+    """
+    path = Path(path)
+
+    if path.suffix in PARQUET_SUFFIXES | ARROW_SUFFIXES:
+        return read_lead_snapshot(path, columns=columns, filters=filters)
+
+    read_columns = columns
+    if columns and filters:
+        read_columns = list(dict.fromkeys(list(columns) + [f[0] for f in filters]))
+
+    # Every CSV value stays the string csv.DictReader would give (no numeric
+    # inference: phones and employee counts must not turn into floats)
+    df = pd.read_csv(path, usecols=read_columns, dtype=str, keep_default_na=False)
+
+    if filters:
+        df = _apply_filters(df, filters)
+    if columns:
+        df = df[columns]
+    return df
+
+
+def load_lead_records(
+    path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[Filter]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Load leads as a list of dicts (csv.DictReader-compatible: missing values are '').
+    """
+    df = load_leads(path, columns=columns, filters=filters).astype(object)
+    return df.where(df.notna(), '').to_dict('records')
+
+
+def preferred_lead_path(csv_path: Union[str, Path]) -> Path:
+    """
+    Return the snapshot written next to a CSV if it exists and is readable, else the CSV.
+    """
+    csv_path = Path(csv_path)
+    snapshot = snapshot_path_for(csv_path)
+    if pa is not None and snapshot.exists() and snapshot.stat().st_mtime >= csv_path.stat().st_mtime:
+        return snapshot
+    return csv_path
+
+
+def csv_to_snapshot(csv_path: Union[str, Path], snapshot_path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Convert an existing lead CSV into a Parquet snapshot next to it.
+
+    Returns:
+        Path of the written snapshot
+    """
+    csv_path = Path(csv_path)
+    snapshot_path = Path(snapshot_path) if snapshot_path else csv_path.with_suffix('.parquet')
+    write_lead_snapshot(load_leads(csv_path), snapshot_path)
+    return snapshot_path
+
+
+def snapshot_path_for(csv_path: Union[str, Path]) -> Path:
+    """Default snapshot path written next to a CSV export."""
+    return Path(csv_path).with_suffix('.parquet')
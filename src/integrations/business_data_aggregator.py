@@ -9,6 +9,8 @@ import aiohttp
 import structlog
 
 from ..core.models import DataSource
+from ..core.name_index import NAME_MATCH_THRESHOLD, TrigramNameIndex, name_key
+from ..core.normalization import compare_addresses, normalize_phone, normalize_website
 from ..core.exceptions import DataSourceError
 from ..sources.openstreetmap import OpenStreetMapSearcher
 from ..sources.duckduckgo_businesses import DuckDuckGoBusinessSearcher
@@ -17,6 +19,7 @@ from ..sources.hamilton_chamber import HamiltonChamberSearcher
 from ..sources.canadian_importers import CanadianImportersSearcher
 from ..services.source_validator import SourceCrossValidator
 from ..utils.fingerprinting import compute_business_fingerprint, businesses_are_duplicates
+from ..services.http_transport import create_client_session
 
 
 class BusinessDataAggregator:
@@ -48,7 +51,7 @@ class BusinessDataAggregator:
     async def __aenter__(self):
         if self.session is None:
             timeout = aiohttp.ClientTimeout(total=60, connect=15)
-            self.session = aiohttp.ClientSession(
+            self.session = create_client_session(
                 timeout=timeout,
                 headers={
                     'User-Agent': 'Business Research Bot (Educational Purpose)',
@@ -382,6 +385,19 @@ class BusinessDataAggregator:
 
         return businesses[:max_results]
 
+    @staticmethod
+    def _listings_corroborate(first: Dict[str, Any], second: Dict[str, Any]) -> bool:
+        """True when two listings share a phone number, street address or website domain."""
+        phone = normalize_phone(first.get('phone') or '')
+        if len(phone) == 10 and phone == normalize_phone(second.get('phone') or ''):
+            return True
+
+        if compare_addresses(first.get('address') or '', second.get('address') or '')[0]:
+            return True
+
+        website = normalize_website(first.get('website') or '')
+        return bool(website) and website == normalize_website(second.get('website') or '')
+
     async def _cross_validate_businesses(
         self,
         businesses: List[Dict[str, Any]],
@@ -390,7 +406,7 @@ class BusinessDataAggregator:
         """
         Cross-validate businesses from multiple sources.
 
-        Groups businesses by normalized name and validates consistency.
+        Groups businesses by similar name (trigram index) and validates consistency.
         Merges consensus data from multiple sources.
 
         Args:
@@ -403,32 +419,34 @@ class BusinessDataAggregator:
         if not businesses:
             return []
 
-        # Helper function to normalize business names for grouping
-        def normalize_business_name(name: str) -> str:
-            """Normalize business name for grouping."""
-            if not name:
-                return ""
-            normalized = name.lower().strip()
-            # Remove common suffixes
-            for suffix in ['ltd', 'limited', 'inc', 'incorporated', 'corp', 'corporation', 'llc', 'co']:
-                normalized = normalized.replace(f' {suffix}', '').replace(f'.{suffix}', '')
-            # Remove punctuation
-            normalized = normalized.replace('.', '').replace(',', '').replace('&', 'and')
-            # Remove extra spaces
-            normalized = ' '.join(normalized.split())
-            return normalized
-
-        # Group businesses by normalized name
-        business_groups = {}
+        # Group listings of the same business across sources. Names match
+        # fuzzily ("ABC Mfg" / "ABC Manufacturing Inc."), and only within the
+        # same city when both listings have one. A fuzzy (not identical) name
+        # key also needs a shared phone, address or website domain, so "Joe
+        # Smith Welding" and "John Smith Welding" stay apart.
+        name_index = TrigramNameIndex()
+        business_groups: List[List[Dict[str, Any]]] = []
         for biz in businesses:
             name = biz.get('business_name', '')
             if not name:
                 continue
 
-            normalized_name = normalize_business_name(name)
-            if normalized_name not in business_groups:
-                business_groups[normalized_name] = []
-            business_groups[normalized_name].append(biz)
+            city = (biz.get('city') or '').strip().lower()
+            key = name_key(name)
+            group_id = None
+            for match in name_index.search(name, k=5, min_score=NAME_MATCH_THRESHOLD):
+                if city and match.city and match.city != city:
+                    continue
+                group = business_groups[match.ref]
+                if name_key(match.name) == key or any(self._listings_corroborate(biz, other) for other in group):
+                    group_id = match.ref
+                    break
+
+            if group_id is None:
+                group_id = len(business_groups)
+                business_groups.append([])
+                name_index.add(group_id, name, city=city or None, postal_code=biz.get('postal_code'))
+            business_groups[group_id].append(biz)
 
         # Validate each group
         validated_businesses = []
@@ -436,7 +454,7 @@ class BusinessDataAggregator:
         single_source_count = 0
         excluded_count = 0
 
-        for normalized_name, group in business_groups.items():
+        for group in business_groups:
             if len(group) > 1:
                 # Multiple sources - cross-validate
                 multi_source_count += 1
@@ -12,6 +12,7 @@ import structlog
 
 from ..core.models import DataSource
 from ..core.exceptions import DataSourceError
+from ..services.http_transport import create_client_session
 
 
 class YellowPagesClient:
@@ -54,7 +55,7 @@ class YellowPagesClient:
     async def __aenter__(self):
         if self.session is None:
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            self.session = aiohttp.ClientSession(
+            self.session = create_client_session(
                 timeout=timeout,
                 headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
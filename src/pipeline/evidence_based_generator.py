@@ -15,7 +15,9 @@ import structlog
 
 from src.integrations.business_data_aggregator import BusinessDataAggregator
 from src.core.normalization import compute_fingerprint, normalize_name, normalize_address, normalize_phone
+from src.utils.offload import run_cpu_task
 from src.core.evidence import Observation, create_observation
+from src.core.spatial import ensure_spatial_index, find_proximity_duplicate
 from src.services.new_validation_service import ValidationService
 from src.sources.places import PlacesService
 from src.core.config import config
@@ -38,6 +40,7 @@ class EvidenceBasedLeadGenerator:
     def __init__(self, db_path: str = 'data/leads_v2.db'):
         self.db_path = db_path
         self.validator = ValidationService()
+        self._spatial_index_ready = False
         self.places_service = PlacesService(
             google_api_key=getattr(config, 'google_api_key', None),
             yelp_api_key=getattr(config, 'yelp_api_key', None)
@@ -50,6 +53,7 @@ class EvidenceBasedLeadGenerator:
             'excluded': 0,
             'review_required': 0,
             'duplicates_blocked': 0,
+            'proximity_duplicates_blocked': 0,
             'category_blocked': 0,
             'geo_blocked': 0,
             'corroboration_blocked': 0
@@ -62,14 +66,18 @@ class EvidenceBasedLeadGenerator:
         await db.execute("PRAGMA foreign_keys = ON")
         return db
 
-    async def discover_and_persist(self, business_data: Dict) -> Optional[int]:
+    async def discover_and_persist(self, business_data: Dict, fingerprint: Optional[str] = None) -> Optional[int]:
         """
         Step 1: Discover business and persist immediately.
 
+        Args:
+            business_data: Normalized business dict
+            fingerprint: Precomputed fingerprint (from a batch), computed here if omitted
+
         Returns: business_id if new, None if duplicate
         """
         # Compute fingerprint
-        fingerprint = compute_fingerprint(business_data)
+        fingerprint = fingerprint or compute_fingerprint(business_data)
 
         db = await self.get_db()
         try:
@@ -88,6 +96,28 @@ class EvidenceBasedLeadGenerator:
                           new_name=business_data.get('name'))
                 return None
 
+            # Same location under a different name/address (only when the source has coordinates)
+            if business_data.get('latitude') is not None and business_data.get('longitude') is not None:
+                if not self._spatial_index_ready:
+                    await ensure_spatial_index(db)
+                    self._spatial_index_ready = True
+                nearby = await find_proximity_duplicate(
+                    db,
+                    business_data['latitude'],
+                    business_data['longitude'],
+                    business_data.get('name', ''),
+                    phone=business_data.get('phone'),
+                    website=business_data.get('website')
+                )
+                if nearby:
+                    self.stats['proximity_duplicates_blocked'] += 1
+                    logger.info("proximity_duplicate_blocked",
+                              existing_id=nearby['id'],
+                              existing_name=nearby['original_name'],
+                              new_name=business_data.get('name'),
+                              match_reason=nearby['match_reason'])
+                    return None
+
             # Insert new business
             cursor = await db.execute(
                 """INSERT INTO businesses
@@ -298,22 +328,27 @@ class EvidenceBasedLeadGenerator:
 
             print(f"📊 Discovered {len(businesses)} raw businesses\n")
 
-            for idx, biz in enumerate(businesses, 1):
+            records = [
+                {
+                    'name': biz.get('business_name', ''),
+                    'street': biz.get('address', ''),
+                    'city': biz.get('city', 'Hamilton'),
+                    'postal_code': biz.get('postal_code'),
+                    'phone': biz.get('phone'),
+                    'website': biz.get('website'),
+                    'latitude': biz.get('latitude'),
+                    'longitude': biz.get('longitude')
+                }
+                for biz in businesses
+            ]
+            # Fingerprint the whole batch at once (in the offload pool for large runs)
+            fingerprints = await run_cpu_task("compute_fingerprints", records)
+
+            for idx, (business_data, fingerprint) in enumerate(zip(records, fingerprints), 1):
                 business_id = None  # Initialize to avoid UnboundLocalError
                 try:
                     # Step 1: Discover & Persist
-                    business_data = {
-                        'name': biz.get('business_name', ''),
-                        'street': biz.get('address', ''),
-                        'city': biz.get('city', 'Hamilton'),
-                        'postal_code': biz.get('postal_code'),
-                        'phone': biz.get('phone'),
-                        'website': biz.get('website'),
-                        'latitude': biz.get('latitude'),
-                        'longitude': biz.get('longitude')
-                    }
-
-                    business_id = await self.discover_and_persist(business_data)
+                    business_id = await self.discover_and_persist(business_data, fingerprint=fingerprint)
 
                     if business_id is None:
                         # Duplicate
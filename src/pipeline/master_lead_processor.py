@@ -11,6 +11,9 @@ from typing import Dict, Tuple, Optional
 from pathlib import Path
 import logging
 
+from ..core.normalization import normalize_column
+from ..exports.lead_snapshot import load_leads
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -139,9 +142,11 @@ class MasterLeadProcessor:
         return df
 
     def _load_data(self, file_path: str) -> pd.DataFrame:
-        """Load CSV or XLSX file and normalize column names."""
+        """Load CSV, XLSX or Parquet/Arrow snapshot and normalize column names."""
         if file_path.endswith('.xlsx'):
             df = pd.read_excel(file_path)
+        elif file_path.endswith(('.parquet', '.arrow', '.feather')):
+            df = load_leads(file_path)
         else:
             df = pd.read_csv(file_path)
 
@@ -189,9 +194,10 @@ class MasterLeadProcessor:
         cols_removed = initial_cols - len(df.columns)
         self.stats['duplicate_columns_removed'] = cols_removed
 
-        # Remove duplicate rows (based on business name + address)
+        # Remove duplicate rows (based on normalized business name + address)
         if 'business_name' in df.columns and 'address' in df.columns:
-            df = df.drop_duplicates(subset=['business_name', 'address'], keep='first')
+            keys = normalize_column(df['business_name'], 'name') + '|' + normalize_column(df['address'], 'address')
+            df = df[~keys.duplicated(keep='first')]
         else:
             df = df.drop_duplicates()
 
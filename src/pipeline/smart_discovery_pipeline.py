@@ -23,7 +23,11 @@ from src.sources.multi_source_aggregator import MultiSourceAggregator
 from src.enrichment.contact_enrichment import ContactEnricher
 from src.enrichment.smart_enrichment import SmartEnricher
 from src.core.normalization import compute_fingerprint, normalize_name, normalize_phone
+from src.utils.offload import get_offload_stats, run_cpu_task
 from src.core.evidence import Observation, create_observation
+from src.core.spatial import ensure_spatial_index, find_proximity_duplicate
+from src.services.crawl_metadata import get_crawl_cache
+from src.services.domain_health import get_domain_health
 from src.services.new_validation_service import ValidationService
 from src.core.config import config
 from src.exports import CSVExporter, ReportGenerator
@@ -51,10 +55,12 @@ class SmartDiscoveryPipeline:
         self.enricher = ContactEnricher()
         self.smart_enricher = SmartEnricher()  # NEW: Multi-factor revenue estimation
         self.validator = ValidationService()
+        self._spatial_index_ready = False
 
         self.stats = {
             'discovered': 0,
             'duplicates_blocked': 0,
+            'proximity_duplicates_blocked': 0,
             'enriched': 0,
             'geocoded': 0,
             'qualified': 0,
@@ -164,21 +170,26 @@ class SmartDiscoveryPipeline:
         await db.execute("PRAGMA foreign_keys = ON")
         return db
 
-    async def discover_and_persist(self, business_data) -> Optional[int]:
+    @staticmethod
+    def _fingerprint_fields(business_data) -> Dict:
+        return {
+            'name': business_data.name,
+            'street': business_data.street or '',
+            'city': business_data.city or ''
+        }
+
+    async def discover_and_persist(self, business_data, fingerprint: Optional[str] = None) -> Optional[int]:
         """
         Discover business and persist with source tracking.
 
         Args:
             business_data: BusinessData object from source
+            fingerprint: Precomputed fingerprint (from a batch), computed here if omitted
 
         Returns: business_id if new, None if duplicate
         """
         # Compute fingerprint
-        fingerprint = compute_fingerprint({
-            'name': business_data.name,
-            'street': business_data.street or '',
-            'city': business_data.city or ''
-        })
+        fingerprint = fingerprint or compute_fingerprint(self._fingerprint_fields(business_data))
 
         db = await self.get_db()
         try:
@@ -199,6 +210,30 @@ class SmartDiscoveryPipeline:
                 )
                 return None
 
+            # Same location under a different name/address (renames, relisted businesses)
+            if not self._spatial_index_ready:
+                await ensure_spatial_index(db)
+                self._spatial_index_ready = True
+            nearby = await find_proximity_duplicate(
+                db,
+                business_data.latitude,
+                business_data.longitude,
+                business_data.name,
+                phone=business_data.phone,
+                website=business_data.website
+            )
+            if nearby:
+                self.stats['proximity_duplicates_blocked'] += 1
+                logger.debug(
+                    "proximity_duplicate_blocked",
+                    existing_id=nearby['id'],
+                    existing_name=nearby['original_name'],
+                    new_name=business_data.name,
+                    distance_m=round(nearby['distance_from_point_km'] * 1000, 1),
+                    match_reason=nearby['match_reason']
+                )
+                return None
+
             # Insert new business
             cursor = await db.execute(
                 """INSERT INTO businesses
@@ -550,14 +585,25 @@ class SmartDiscoveryPipeline:
 
         print(f"\n✅ Discovered {len(businesses)} businesses from {len(set(b.source for b in businesses))} sources\n")
 
+        # DNS pre-flight: hosts that no longer exist are skipped by every enricher
+        domain_health = get_domain_health()
+        dead = await domain_health.preflight(biz.website for biz in businesses if biz.website)
+        if dead:
+            print(f"   Skipping {len(dead)} websites that no longer resolve or are known dead\n")
+
+        # Fingerprint the whole batch at once (in the offload pool for large runs)
+        fingerprints = await run_cpu_task(
+            "compute_fingerprints", [self._fingerprint_fields(biz) for biz in businesses]
+        )
+
         # Step 2-5: Process each business
-        for idx, biz in enumerate(businesses, 1):
+        for idx, (biz, fingerprint) in enumerate(zip(businesses, fingerprints), 1):
             try:
                 if show:
                     print(f"[{idx}/{len(businesses)}] Processing: {biz.name} (from {biz.source})")
 
                 # Step 2: Persist (with deduplication)
-                business_id = await self.discover_and_persist(biz)
+                business_id = await self.discover_and_persist(biz, fingerprint=fingerprint)
 
                 if business_id is None:
                     if show:
@@ -597,6 +643,8 @@ class SmartDiscoveryPipeline:
                 continue
 
         # Final report
+        domain_health.record_metrics()
+        get_crawl_cache().record_metrics()
         self.print_stats()
         self.aggregator.print_source_performance()
 
@@ -617,10 +665,12 @@ class SmartDiscoveryPipeline:
         # Export CSV
         csv_path = f"data/leads_{timestamp}.csv"
         csv_exporter = CSVExporter(self.db_path)
-        csv_stats = await csv_exporter.export(csv_path)
+        csv_stats = await csv_exporter.export(csv_path, snapshot_path=f"data/leads_{timestamp}.parquet")
 
         print(f"\n✅ CSV Export Complete:")
         print(f"   File: {csv_path}")
+        if csv_stats['snapshot_path']:
+            print(f"   Snapshot: {csv_stats['snapshot_path']}")
         print(f"   Total: {csv_stats['total']} businesses")
         print(f"   Qualified: {csv_stats['qualified']}")
         print(f"   Excluded: {csv_stats['excluded']}")
@@ -664,6 +714,10 @@ class SmartDiscoveryPipeline:
         print(f"\n📦 SOURCE BREAKDOWN:")
         for source, count in sorted(self.stats['source_breakdown'].items(), key=lambda x: x[1], reverse=True):
             print(f"   {source:<25} {count:>5} businesses")
+        offload = get_offload_stats()
+        print(f"\n⚙️  CPU OFFLOAD ({offload['workers']} workers):")
+        print(f"   Off event loop:    {offload['offloaded_seconds']:.2f}s ({offload['offloaded_share']:.0%})")
+        print(f"   Inline:            {offload['inline_seconds']:.2f}s")
         print(f"{'='*80}")
 
         if self.stats['discovered'] > 0:
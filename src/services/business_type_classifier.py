@@ -2,10 +2,14 @@
 Business Type Classifier Service - Multi-Source Business Type Verification
 Uses website scraping, Yellow Pages, Google, LinkedIn, Chamber of Commerce, and LLM analysis
 to accurately determine business type and filter out unwanted categories.
+
+A local classifier trained on our QUALIFIED/EXCLUDED history runs before the
+LLM; only leads it can't classify confidently are escalated.
 """
 import asyncio
 import aiohttp
 import re
+from collections import deque
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 import json
@@ -13,6 +17,11 @@ import json
 import structlog
 
 from ..core.models import BusinessLead
+from .http_transport import create_client_session
+from .local_classifier import LocalBusinessClassifier, LocalPrediction, business_categories, load_local_classifier
+
+# Recent local-tier latencies kept for percentile stats
+LATENCY_WINDOW = 1000
 
 
 class BusinessTypeClassifier:
@@ -21,9 +30,21 @@ class BusinessTypeClassifier:
     Determines actual business operations to filter convenience stores, retail chains, etc.
     """
 
-    def __init__(self):
+    def __init__(self, local_classifier: Optional[LocalBusinessClassifier] = None,
+                 local_confidence_threshold: Optional[float] = None):
         self.logger = structlog.get_logger(__name__)
 
+        # Offline tier in front of the LLM (None until a model has been trained)
+        self.local_classifier = local_classifier if local_classifier is not None else load_local_classifier()
+        self.local_confidence_threshold = local_confidence_threshold
+        if self.local_confidence_threshold is None:
+            try:
+                from ..core.config import config
+                self.local_confidence_threshold = config.LOCAL_CLASSIFIER_CONFIDENCE_THRESHOLD
+            except Exception:
+                self.local_confidence_threshold = 0.85
+        self._local_latencies_us = deque(maxlen=LATENCY_WINDOW)
+
         # Business types to EXCLUDE (not suitable for acquisition)
         self.excluded_business_types = {
             'convenience_store',
@@ -124,6 +145,9 @@ class BusinessTypeClassifier:
             'excluded_by_google': 0,
             'excluded_by_llm': 0,
             'excluded_by_keywords': 0,
+            'excluded_by_local_model': 0,
+            'decided_locally': 0,
+            'escalated_to_llm': 0,
             'approved': 0
         }
 
@@ -146,6 +170,7 @@ class BusinessTypeClassifier:
             'google_info': {},
             'linkedin_info': {},
             'chamber_info': {},
+            'local_classification': {},
             'llm_classification': {},
             'keyword_matches': []
         }
@@ -190,7 +215,29 @@ class BusinessTypeClassifier:
         chamber_result = await self._check_hamilton_chamber(lead)
         evidence['chamber_info'] = chamber_result
 
-        # 7. LLM-based final classification (analyzes all evidence)
+        # 7. Local classifier: confident answers never reach the LLM
+        local_result = self._local_classify(lead, evidence)
+        if local_result is not None:
+            evidence['local_classification'] = local_result.to_dict()
+
+            if local_result.confidence >= self.local_confidence_threshold:
+                self.classification_stats['decided_locally'] += 1
+
+                if not local_result.is_suitable:
+                    self.classification_stats['excluded_by_local_model'] += 1
+                    return False, self._local_exclusion_reason(local_result), evidence
+
+                self.classification_stats['approved'] += 1
+                self.logger.info(
+                    "business_type_approved",
+                    business_name=lead.business_name,
+                    confidence=round(local_result.confidence, 3),
+                    tier="local"
+                )
+                return True, "Business type suitable for acquisition", evidence
+
+        # 8. LLM-based final classification (ambiguous leads only)
+        self.classification_stats['escalated_to_llm'] += 1
         llm_result = await self._llm_classify_business(lead, evidence)
         evidence['llm_classification'] = llm_result
 
@@ -265,7 +312,7 @@ class BusinessTypeClassifier:
                 website = f"https://{website}"
 
             timeout = aiohttp.ClientTimeout(total=15)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with create_client_session(timeout=timeout) as session:
                 async with session.get(website, allow_redirects=True) as response:
                     if response.status != 200:
                         result['reason'] = f'Website returned status {response.status}'
@@ -486,6 +533,27 @@ class BusinessTypeClassifier:
 
         return result
 
+    def _local_classify(self, lead: BusinessLead, evidence: Dict[str, Any]) -> Optional[LocalPrediction]:
+        """Run the local classifier tier (None if no model is available)."""
+        if self.local_classifier is None:
+            return None
+
+        try:
+            prediction = self.local_classifier.predict(lead.business_name, business_categories(lead.industry))
+        except Exception as e:
+            self.logger.warning("local_classification_error", business_name=lead.business_name, error=str(e))
+            return None
+
+        self._local_latencies_us.append(prediction.latency_us)
+        return prediction
+
+    @staticmethod
+    def _local_exclusion_reason(prediction: LocalPrediction) -> str:
+        if prediction.method == 'neighbour':
+            return (f"Matches previously excluded business '{prediction.neighbour}' "
+                    f"(similarity {prediction.neighbour_similarity:.2f})")
+        return f"Local classifier predicts excluded business type (confidence {prediction.confidence:.2f})"
+
     async def _llm_classify_business(self, lead: BusinessLead, evidence: Dict[str, Any]) -> Dict[str, Any]:
         """
         Use local LLM to analyze all gathered evidence and make final classification.
@@ -589,6 +657,27 @@ class BusinessTypeClassifier:
 
         return result
 
-    def get_classification_stats(self) -> Dict[str, int]:
-        """Get classification statistics."""
-        return self.classification_stats.copy()
+    def get_classification_stats(self) -> Dict[str, Any]:
+        """Get classification statistics, including LLM escalation rate and local-tier latency."""
+        stats: Dict[str, Any] = self.classification_stats.copy()
+
+        reached_tier = stats['decided_locally'] + stats['escalated_to_llm']
+        stats['escalation_rate'] = round(stats['escalated_to_llm'] / reached_tier, 4) if reached_tier else 0.0
+
+        latencies = sorted(self._local_latencies_us)
+        if latencies:
+            stats['local_latency_us_avg'] = round(sum(latencies) / len(latencies), 1)
+            stats['local_latency_us_p95'] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1)
+
+        return stats
+
+    def record_tier_metrics(self):
+        """Publish escalation rate and local-tier latency to the metrics store."""
+        from ..utils.metrics import track_pipeline_metric
+
+        stats = self.get_classification_stats()
+        track_pipeline_metric("classifier_escalation_rate", stats['escalation_rate'])
+        track_pipeline_metric("classifier_decided_locally", stats['decided_locally'])
+        track_pipeline_metric("classifier_escalated_to_llm", stats['escalated_to_llm'])
+        if 'local_latency_us_p95' in stats:
+            track_pipeline_metric("classifier_local_latency_us_p95", stats['local_latency_us_p95'])
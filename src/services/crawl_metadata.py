@@ -0,0 +1,378 @@
+"""
+Crawl metadata: conditional GETs and delta re-crawls of scraped pages.
+
+Re-enriching or revalidating a lead used to download every page again from
+scratch. This store remembers, per URL, the ETag and Last-Modified validators,
+a content hash, the last fetch time and what each consumer extracted from the
+page (emails, phones, founding year, name-match score...). Revisits send
+If-None-Match / If-Modified-Since; when the server answers 304, or the body
+hashes the same, the previous extraction is reused instead of re-parsing.
+
+Each URL also gets a re-crawl interval that adapts to how often the page
+actually changes: it doubles every time a revisit finds the page unchanged and
+halves when it changed (between RECRAWL_MIN_HOURS and RECRAWL_MAX_HOURS).
+Fetches sooner than half an interval after the last one do not move it. Within
+the interval scrapers reuse the extraction without any request; the website
+validator always revalidates, since it reports whether the site is up.
+
+Example:
+    >>> cache = get_crawl_cache()
+    >>> facts = cache.lookup(url, 'contacts')           # fresh: no request at all
+    >>> if facts is None:
+    ...     headers = cache.request_headers(url, 'contacts')
+    ...     status, response_headers, body = ...          # GET with those headers
+    ...     facts = cache.revisit(url, 'contacts', status, response_headers, body)
+    ...     if facts is None and status == 200:
+    ...         facts = extract(body)
+    ...         cache.store_extraction(url, 'contacts', facts)
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Set, Union
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class CrawlRecord:
+    """What is known about one URL from previous fetches."""
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    fetched_at: float = 0.0
+    changed_at: float = 0.0
+    checks: int = 0
+    changes: int = 0
+    interval_seconds: float = 0.0
+    next_crawl_at: float = 0.0
+    # consumer key -> JSON-serializable extraction from this version of the page
+    extracted: Dict[str, Any] = field(default_factory=dict)
+
+
+def content_hash(body: Union[str, bytes]) -> str:
+    """Stable hash of a response body."""
+    if isinstance(body, str):
+        body = body.encode('utf-8', errors='replace')
+    return hashlib.sha256(body).hexdigest()
+
+
+def _header(headers: Optional[Mapping], name: str) -> Optional[str]:
+    value = headers.get(name) if headers is not None else None
+    return value if isinstance(value, str) and value else None
+
+
+class CrawlMetadataStore:
+    """SQLite store of crawl records (the file is created on first write)."""
+
+    def __init__(self, db_path: str = "data/crawl_metadata.db"):
+        """
+        Initialize crawl metadata store.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Schema:
+            - url: TEXT PRIMARY KEY
+            - etag, last_modified: TEXT (validators for conditional GETs)
+            - content_hash: TEXT (sha256 of the last body)
+            - interval_seconds, next_crawl_at: REAL (adaptive re-crawl schedule)
+            - extracted: TEXT (JSON, per-consumer extraction)
+        """
+        self.db_path = Path(db_path)
+
+    def _init_db(self):
+        """Initialize database schema."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_metadata (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_hash TEXT,
+                    fetched_at REAL NOT NULL,
+                    changed_at REAL NOT NULL,
+                    checks INTEGER NOT NULL,
+                    changes INTEGER NOT NULL,
+                    interval_seconds REAL NOT NULL,
+                    next_crawl_at REAL NOT NULL,
+                    extracted TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def get(self, url: str) -> Optional[CrawlRecord]:
+        """Get the stored record for a URL."""
+        if not self.db_path.exists():
+            return None
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, content_hash, fetched_at, changed_at, checks, changes, "
+                "interval_seconds, next_crawl_at, extracted FROM crawl_metadata WHERE url = ?",
+                (url,)
+            ).fetchone()
+        if not row:
+            return None
+        try:
+            extracted = json.loads(row[9])
+        except ValueError:
+            extracted = {}
+        return CrawlRecord(url, *row[:9], extracted=extracted)
+
+    def put(self, record: CrawlRecord):
+        """Store (or replace) a URL's record."""
+        self._init_db()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO crawl_metadata (url, etag, last_modified, content_hash, fetched_at, "
+                "changed_at, checks, changes, interval_seconds, next_crawl_at, extracted) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (record.url, record.etag, record.last_modified, record.content_hash, record.fetched_at,
+                 record.changed_at, record.checks, record.changes, record.interval_seconds,
+                 record.next_crawl_at, json.dumps(record.extracted))
+            )
+            conn.commit()
+
+
+class CrawlCache:
+    """
+    Conditional-GET validators, change detection and extraction reuse, per URL.
+
+    Args:
+        store: Disk store (default: CRAWL_METADATA_PATH from config)
+        initial_interval_seconds: Re-crawl interval of a newly seen page (default: RECRAWL_INITIAL_HOURS)
+        min_interval_seconds: Floor for pages that keep changing (default: RECRAWL_MIN_HOURS)
+        max_interval_seconds: Ceiling for pages that never change (default: RECRAWL_MAX_HOURS)
+        enabled: With False nothing is reused, every page is fetched in full
+    """
+
+    def __init__(self, store: Optional[CrawlMetadataStore] = None,
+                 initial_interval_seconds: Optional[float] = None,
+                 min_interval_seconds: Optional[float] = None,
+                 max_interval_seconds: Optional[float] = None,
+                 enabled: Optional[bool] = None):
+        settings = _settings_from_config()
+        self.store = store or CrawlMetadataStore(settings['db_path'])
+        self.min_interval_seconds = (settings['min_interval_seconds'] if min_interval_seconds is None
+                                     else min_interval_seconds)
+        self.max_interval_seconds = max(self.min_interval_seconds, settings['max_interval_seconds']
+                                        if max_interval_seconds is None else max_interval_seconds)
+        initial = settings['initial_interval_seconds'] if initial_interval_seconds is None else initial_interval_seconds
+        self.initial_interval_seconds = min(max(initial, self.min_interval_seconds), self.max_interval_seconds)
+        self.enabled = settings['enabled'] if enabled is None else enabled
+
+        self._memory: Dict[str, Optional[CrawlRecord]] = {}
+        # URLs whose latest fetch found the page unchanged
+        self._unchanged: Set[str] = set()
+
+        self.stats = {
+            'fetches': 0,
+            'conditional_requests': 0,
+            'not_modified': 0,
+            'unchanged_by_hash': 0,
+            'changed': 0,
+            'fresh_skips': 0,
+            'reused': 0,
+        }
+
+    def _record(self, url: str) -> Optional[CrawlRecord]:
+        if url not in self._memory:
+            self._memory[url] = self.store.get(url)
+        return self._memory[url]
+
+    def is_fresh(self, url: str, key: str) -> bool:
+        """True if the URL is within its re-crawl interval and the consumer has an extraction."""
+        record = self._record(url) if self.enabled else None
+        return record is not None and key in record.extracted and time.time() < record.next_crawl_at
+
+    def lookup(self, url: str, key: str) -> Optional[Any]:
+        """The stored extraction if the URL is within its re-crawl interval (no request needed)."""
+        if not self.is_fresh(url, key):
+            return None
+        record = self._memory[url]
+        self.stats['fresh_skips'] += 1
+        logger.debug("crawl_fresh_skip", url=url, key=key,
+                     recrawl_in_hours=round((record.next_crawl_at - time.time()) / 3600, 1))
+        return record.extracted[key]
+
+    def request_headers(self, url: str, key: Optional[str] = None) -> Dict[str, str]:
+        """
+        If-None-Match / If-Modified-Since for a revisit.
+
+        With a key, the headers are only sent if that consumer has an
+        extraction to fall back on (a 304 carries no body).
+        """
+        record = self._record(url) if self.enabled else None
+        if record is None or (key is not None and key not in record.extracted):
+            return {}
+        headers = {}
+        if record.etag:
+            headers['If-None-Match'] = record.etag
+        if record.last_modified:
+            headers['If-Modified-Since'] = record.last_modified
+        if headers:
+            self.stats['conditional_requests'] += 1
+        return headers
+
+    def observe(self, url: str, status: int, headers: Optional[Mapping] = None,
+                body: Union[str, bytes, None] = None) -> bool:
+        """
+        Record a fetch of a URL and, on a real revisit, adapt its re-crawl interval.
+
+        Only 200 and 304 responses count. A changed page drops the stored
+        extractions (they describe the old version).
+
+        Returns:
+            True if the page is unchanged since the previous fetch
+        """
+        if not self.enabled or status not in (200, 304):
+            return False
+
+        now = time.time()
+        record = self._record(url)
+        if status == 304:
+            if record is None:
+                return False
+            unchanged = True
+            self.stats['not_modified'] += 1
+        else:
+            new_hash = content_hash(body or b'')
+            unchanged = record is not None and record.content_hash == new_hash
+            if unchanged:
+                self.stats['unchanged_by_hash'] += 1
+
+        self.stats['fetches'] += 1
+        if record is None:
+            record = self._memory[url] = CrawlRecord(url, changed_at=now,
+                                                     interval_seconds=self.initial_interval_seconds)
+        else:
+            # Only a fetch at least half an interval after the last one says
+            # anything about the change rate; quicker refetches (another
+            # consumer, a retry) just refresh the validators
+            revisit = now - record.fetched_at >= record.interval_seconds / 2
+            if unchanged:
+                if revisit:
+                    record.interval_seconds = min(record.interval_seconds * 2, self.max_interval_seconds)
+            else:
+                if revisit:
+                    record.interval_seconds = max(record.interval_seconds / 2, self.min_interval_seconds)
+                record.changes += 1
+                record.changed_at = now
+                record.extracted = {}
+                self.stats['changed'] += 1
+
+        if status == 200:
+            record.content_hash = new_hash
+            record.etag = _header(headers, 'ETag')
+            record.last_modified = _header(headers, 'Last-Modified')
+        else:
+            record.etag = _header(headers, 'ETag') or record.etag
+            record.last_modified = _header(headers, 'Last-Modified') or record.last_modified
+        record.fetched_at = now
+        record.checks += 1
+        record.next_crawl_at = now + record.interval_seconds
+
+        if unchanged:
+            self._unchanged.add(url)
+        else:
+            self._unchanged.discard(url)
+        self.store.put(record)
+        return unchanged
+
+    def reuse(self, url: str, key: str) -> Optional[Any]:
+        """The stored extraction if the latest fetch found the page unchanged."""
+        record = self._record(url) if self.enabled else None
+        if record is None or url not in self._unchanged or key not in record.extracted:
+            return None
+        self.stats['reused'] += 1
+        return record.extracted[key]
+
+    def revisit(self, url: str, key: str, status: int, headers: Optional[Mapping] = None,
+                body: Union[str, bytes, None] = None) -> Optional[Any]:
+        """observe() then reuse(): the previous extraction, or None if the page must be extracted."""
+        self.observe(url, status, headers, body)
+        return self.reuse(url, key)
+
+    def store_extraction(self, url: str, key: str, value: Any):
+        """Remember what a consumer extracted from the version of the page just fetched."""
+        record = self._record(url) if self.enabled else None
+        if record is None:
+            return
+        record.extracted[key] = value
+        self.store.put(record)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Fetch counts and the share of fetches that found the page unchanged."""
+        unchanged = self.stats['not_modified'] + self.stats['unchanged_by_hash']
+        return {
+            **self.stats,
+            'unchanged_rate': unchanged / self.stats['fetches'] if self.stats['fetches'] else 0.0,
+        }
+
+    def record_metrics(self):
+        """Publish revisit counts to the metrics store."""
+        from ..utils.metrics import track_pipeline_metric
+
+        track_pipeline_metric("crawl_not_modified", self.stats['not_modified'])
+        track_pipeline_metric("crawl_unchanged_by_hash", self.stats['unchanged_by_hash'])
+        track_pipeline_metric("crawl_changed", self.stats['changed'])
+        track_pipeline_metric("crawl_fresh_skips", self.stats['fresh_skips'])
+        track_pipeline_metric("crawl_extractions_reused", self.stats['reused'])
+
+
+def _settings_from_config() -> Dict:
+    try:
+        from ..core.config import config
+        return {
+            'enabled': config.CRAWL_METADATA_ENABLED,
+            'db_path': config.CRAWL_METADATA_PATH,
+            'initial_interval_seconds': config.RECRAWL_INITIAL_HOURS * 3600,
+            'min_interval_seconds': config.RECRAWL_MIN_HOURS * 3600,
+            'max_interval_seconds': config.RECRAWL_MAX_HOURS * 3600,
+        }
+    except Exception:
+        return {
+            'enabled': True,
+            'db_path': "data/crawl_metadata.db",
+            'initial_interval_seconds': 24 * 3600,
+            'min_interval_seconds': 6 * 3600,
+            'max_interval_seconds': 720 * 3600,
+        }
+
+
+_cache: Optional[CrawlCache] = None
+
+
+def get_crawl_cache() -> CrawlCache:
+    """Get the process-wide crawl cache, shared by every scraper."""
+    global _cache
+    if _cache is None:
+        _cache = CrawlCache()
+    return _cache
+
+
+def configure_crawl_cache(db_path: Optional[str] = None, **overrides) -> CrawlCache:
+    """
+    Replace the shared crawl cache (e.g. a different store or intervals).
+
+    Example:
+        >>> configure_crawl_cache(db_path="/tmp/crawl_metadata.db", initial_interval_seconds=0)
+    """
+    global _cache
+    store = CrawlMetadataStore(db_path) if db_path else None
+    _cache = CrawlCache(store=store, **overrides)
+    return _cache
+
+
+def reset_crawl_cache():
+    """Drop the shared crawl cache (tests, config changes)."""
+    global _cache
+    _cache = None
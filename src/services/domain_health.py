@@ -0,0 +1,411 @@
+"""
+Domain-health registry: negative cache of dead candidate websites.
+
+Directory listings go stale: many candidate websites no longer resolve,
+refuse connections, fail TLS, time out or show a parking page. Each enricher
+used to find that out on its own, every run, usually by waiting out a full
+timeout. This registry remembers those outcomes per host in SQLite with a TTL
+(long for NXDOMAIN and parked domains, short for the transient failures), so
+every consumer skips the host until the TTL runs out.
+
+A DNS pre-flight resolves a batch's hosts concurrently before enrichment
+starts and records the ones that do not exist, so even the first consumer in
+a run never waits on them.
+
+Example:
+    >>> health = get_domain_health()
+    >>> await health.preflight([b.website for b in businesses])
+    >>> if health.is_dead(website):
+    ...     return None
+    >>> try:
+    ...     ...  # fetch
+    ... except Exception as e:
+    ...     health.record_failure(website, e)
+"""
+
+import asyncio
+import socket
+import sqlite3
+import ssl
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+import requests
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Failure kinds recorded in the registry
+NXDOMAIN = 'nxdomain'
+REFUSED = 'refused'
+TLS_ERROR = 'tls_error'
+TIMEOUT = 'timeout'
+PARKED = 'parked'
+
+# Kinds that can clear up on their own get the shorter, transient TTL
+TRANSIENT_KINDS = frozenset({REFUSED, TLS_ERROR, TIMEOUT})
+
+# getaddrinfo codes meaning "no such host" (EAI_AGAIN and friends are not)
+_NXDOMAIN_CODES = frozenset(
+    code for code in (getattr(socket, 'EAI_NONAME', None), getattr(socket, 'EAI_NODATA', None)) if code is not None
+)
+
+
+@dataclass
+class DomainHealthRecord:
+    """A host known to be dead, and why."""
+    host: str
+    kind: str
+    error: Optional[str] = None
+    checked_at: float = 0.0
+    expires_at: float = 0.0
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) >= self.expires_at
+
+
+def host_of(website: str) -> Optional[str]:
+    """Lower-case host name of a URL or bare domain (no port, no trailing dot)."""
+    if not website or 'UNKNOWN' in website:
+        return None
+    if '://' not in website:
+        website = f"https://{website.strip()}"
+    try:
+        host = urlparse(website).hostname
+    except ValueError:
+        return None
+    return host.strip('.').lower() if host else None
+
+
+def _causes(error: BaseException):
+    """The error and everything it wraps (cause/context, os_error, reason, args)."""
+    seen = set()
+    stack = [error]
+    while stack:
+        exc = stack.pop()
+        if exc is None or id(exc) in seen:
+            continue
+        seen.add(id(exc))
+        yield exc
+        stack.extend([exc.__cause__, exc.__context__, getattr(exc, 'os_error', None), getattr(exc, 'reason', None)])
+        stack.extend(arg for arg in getattr(exc, 'args', ()) if isinstance(arg, BaseException))
+
+
+def classify_failure(error: BaseException) -> Optional[str]:
+    """
+    Failure kind for a fetch error from aiohttp or requests (None = not a dead-host signal).
+
+    Example:
+        >>> classify_failure(socket.gaierror(socket.EAI_NONAME, "Name or service not known"))
+        'nxdomain'
+    """
+    causes = list(_causes(error))
+    for exc in causes:
+        if isinstance(exc, socket.gaierror):
+            return NXDOMAIN if exc.errno in _NXDOMAIN_CODES else None
+    for exc in causes:
+        if isinstance(exc, (ssl.SSLError, aiohttp.ClientSSLError, requests.exceptions.SSLError)):
+            return TLS_ERROR
+    for exc in causes:
+        if isinstance(exc, ConnectionRefusedError):
+            return REFUSED
+    for exc in causes:
+        if isinstance(exc, (asyncio.TimeoutError, socket.timeout, requests.Timeout)):
+            return TIMEOUT
+    return None
+
+
+class DomainHealthStore:
+    """SQLite store of dead-host records (the file is created on first write)."""
+
+    def __init__(self, db_path: str = "data/domain_health.db"):
+        """
+        Initialize domain health store.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Schema:
+            - host: TEXT PRIMARY KEY
+            - kind: TEXT (nxdomain, refused, tls_error, timeout, parked)
+            - expires_at: REAL (unix time the host may be tried again)
+        """
+        self.db_path = Path(db_path)
+
+    def _init_db(self):
+        """Initialize database schema."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS domain_health (
+                    host TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    error TEXT,
+                    checked_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def get(self, host: str) -> Optional[DomainHealthRecord]:
+        """Get the stored record for a host, expired or not."""
+        if not self.db_path.exists():
+            return None
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT kind, error, checked_at, expires_at FROM domain_health WHERE host = ?",
+                (host,)
+            ).fetchone()
+        return DomainHealthRecord(host, *row) if row else None
+
+    def put(self, record: DomainHealthRecord):
+        """Store (or replace) a host's record."""
+        self._init_db()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO domain_health (host, kind, error, checked_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (record.host, record.kind, record.error, record.checked_at, record.expires_at)
+            )
+            conn.commit()
+
+    def delete(self, host: str):
+        """Forget a host (it answered again)."""
+        if not self.db_path.exists():
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM domain_health WHERE host = ?", (host,))
+            conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired records. Returns the number removed."""
+        if not self.db_path.exists():
+            return 0
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("DELETE FROM domain_health WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+            return cursor.rowcount
+
+
+class DomainHealthRegistry:
+    """
+    Dead-host lookups and recording, shared by every website consumer.
+
+    Args:
+        store: Disk cache (default: DOMAIN_HEALTH_CACHE_PATH from config)
+        ttl_seconds: Lifetime of NXDOMAIN and parked records (default: DOMAIN_HEALTH_TTL_HOURS)
+        transient_ttl_seconds: Lifetime of refused/TLS/timeout records
+            (default: DOMAIN_HEALTH_TRANSIENT_TTL_HOURS)
+        enabled: With False nothing is skipped or recorded
+    """
+
+    def __init__(self, store: Optional[DomainHealthStore] = None, ttl_seconds: Optional[float] = None,
+                 transient_ttl_seconds: Optional[float] = None, enabled: Optional[bool] = None):
+        settings = _settings_from_config()
+        self.store = store or DomainHealthStore(settings['db_path'])
+        self.ttl_seconds = settings['ttl_seconds'] if ttl_seconds is None else ttl_seconds
+        self.transient_ttl_seconds = (settings['transient_ttl_seconds'] if transient_ttl_seconds is None
+                                      else transient_ttl_seconds)
+        self.enabled = settings['enabled'] if enabled is None else enabled
+        self.preflight_concurrency = settings['preflight_concurrency']
+        self.preflight_timeout = settings['preflight_timeout']
+
+        # host -> dead record, or None once the host is known not to be dead
+        self._memory: Dict[str, Optional[DomainHealthRecord]] = {}
+
+        self.stats = {
+            'checks': 0,
+            'skipped': 0,
+            'recorded': 0,
+            'recovered': 0,
+            'preflight_checked': 0,
+            'preflight_dead': 0,
+        }
+        self.skipped_by_kind: Dict[str, int] = {}
+        self.recorded_by_kind: Dict[str, int] = {}
+
+    def check(self, website: str) -> Optional[DomainHealthRecord]:
+        """The unexpired dead record for the website's host, or None if it may be fetched."""
+        host = host_of(website)
+        if not self.enabled or host is None:
+            return None
+
+        self.stats['checks'] += 1
+        if host in self._memory:
+            record = self._memory[host]
+        else:
+            record = self._memory[host] = self.store.get(host)
+
+        if record is None or record.is_expired():
+            self._memory[host] = None
+            return None
+
+        self.stats['skipped'] += 1
+        self.skipped_by_kind[record.kind] = self.skipped_by_kind.get(record.kind, 0) + 1
+        logger.debug("dead_host_skipped", host=host, kind=record.kind)
+        return record
+
+    def is_dead(self, website: str) -> bool:
+        """True if the website's host is known dead (counts as a skip)."""
+        return self.check(website) is not None
+
+    def record(self, website: str, kind: str, error: Optional[str] = None) -> Optional[DomainHealthRecord]:
+        """Remember that a host is dead."""
+        host = host_of(website)
+        if not self.enabled or host is None:
+            return None
+
+        now = time.time()
+        ttl = self.transient_ttl_seconds if kind in TRANSIENT_KINDS else self.ttl_seconds
+        record = DomainHealthRecord(host, kind, (error or '')[:200] or None, now, now + ttl)
+        self._memory[host] = record
+        self.store.put(record)
+        self.stats['recorded'] += 1
+        self.recorded_by_kind[kind] = self.recorded_by_kind.get(kind, 0) + 1
+        logger.info("dead_host_recorded", host=host, kind=kind, ttl_hours=round(ttl / 3600, 1))
+        return record
+
+    def record_failure(self, website: str, error: BaseException) -> Optional[str]:
+        """Record a fetch error if it marks the host dead. Returns the kind recorded."""
+        kind = classify_failure(error)
+        if kind is not None:
+            self.record(website, kind, str(error) or type(error).__name__)
+        return kind
+
+    def record_parked(self, website: str):
+        self.record(website, PARKED)
+
+    def record_ok(self, website: str):
+        """The host answered; drop any record that is still in memory."""
+        host = host_of(website)
+        if not self.enabled or host is None:
+            return
+        if self._memory.get(host) is not None:
+            self.store.delete(host)
+            self.stats['recovered'] += 1
+        self._memory[host] = None
+
+    async def preflight(self, websites: Iterable[str], concurrency: Optional[int] = None,
+                        timeout: Optional[float] = None) -> Dict[str, DomainHealthRecord]:
+        """
+        Resolve every distinct host concurrently and record the ones that do not exist.
+
+        Hosts already known dead are not resolved again. DNS timeouts and
+        temporary resolver failures are not recorded.
+
+        Returns:
+            Dead records for the batch, keyed by host (newly found and cached)
+        """
+        if not self.enabled:
+            return {}
+
+        hosts = {host for host in map(host_of, websites) if host}
+        dead: Dict[str, DomainHealthRecord] = {}
+        pending = []
+        for host in hosts:
+            record = self._lookup(host)
+            if record is not None:
+                dead[host] = record
+            else:
+                pending.append(host)
+
+        semaphore = asyncio.Semaphore(concurrency or self.preflight_concurrency)
+        timeout = timeout or self.preflight_timeout
+        loop = asyncio.get_running_loop()
+
+        async def resolve(host: str):
+            async with semaphore:
+                try:
+                    await asyncio.wait_for(loop.getaddrinfo(host, None, type=socket.SOCK_STREAM), timeout)
+                except Exception as e:
+                    if classify_failure(e) == NXDOMAIN:
+                        dead[host] = self.record(host, NXDOMAIN, str(e))
+                        self.stats['preflight_dead'] += 1
+                else:
+                    self._memory[host] = None
+
+        started = time.monotonic()
+        await asyncio.gather(*[resolve(host) for host in pending])
+        self.stats['preflight_checked'] += len(pending)
+        logger.info("dns_preflight_complete", hosts=len(hosts), resolved=len(pending), dead=len(dead),
+                    seconds=round(time.monotonic() - started, 2))
+        return dead
+
+    def _lookup(self, host: str) -> Optional[DomainHealthRecord]:
+        """Unexpired dead record for a host without counting a skip."""
+        record = self._memory[host] if host in self._memory else self.store.get(host)
+        if record is None or record.is_expired():
+            return None
+        self._memory[host] = record
+        return record
+
+    def get_stats(self) -> Dict[str, object]:
+        """Skip and record counts (overall and per kind)."""
+        return {**self.stats, 'skipped_by_kind': dict(self.skipped_by_kind),
+                'recorded_by_kind': dict(self.recorded_by_kind)}
+
+    def record_metrics(self):
+        """Publish skip and record counts to the metrics store."""
+        from ..utils.metrics import track_pipeline_metric
+
+        track_pipeline_metric("domain_health_skipped", self.stats['skipped'])
+        track_pipeline_metric("domain_health_recorded", self.stats['recorded'])
+        track_pipeline_metric("dns_preflight_dead", self.stats['preflight_dead'])
+        for kind, count in self.skipped_by_kind.items():
+            track_pipeline_metric("domain_health_skipped_by_kind", count, tags={'kind': kind})
+
+
+def _settings_from_config() -> Dict:
+    try:
+        from ..core.config import config
+        return {
+            'enabled': config.DOMAIN_HEALTH_ENABLED,
+            'db_path': config.DOMAIN_HEALTH_CACHE_PATH,
+            'ttl_seconds': config.DOMAIN_HEALTH_TTL_HOURS * 3600,
+            'transient_ttl_seconds': config.DOMAIN_HEALTH_TRANSIENT_TTL_HOURS * 3600,
+            'preflight_concurrency': config.DNS_PREFLIGHT_CONCURRENCY,
+            'preflight_timeout': config.DNS_PREFLIGHT_TIMEOUT_SECONDS,
+        }
+    except Exception:
+        return {
+            'enabled': True,
+            'db_path': "data/domain_health.db",
+            'ttl_seconds': 72 * 3600,
+            'transient_ttl_seconds': 6 * 3600,
+            'preflight_concurrency': 50,
+            'preflight_timeout': 3.0,
+        }
+
+
+_registry: Optional[DomainHealthRegistry] = None
+
+
+def get_domain_health() -> DomainHealthRegistry:
+    """Get the process-wide registry, so every consumer skips the same dead hosts."""
+    global _registry
+    if _registry is None:
+        _registry = DomainHealthRegistry()
+    return _registry
+
+
+def configure_domain_health(db_path: Optional[str] = None, **overrides) -> DomainHealthRegistry:
+    """
+    Replace the shared registry (e.g. a different store or TTLs).
+
+    Example:
+        >>> configure_domain_health(db_path="/tmp/domain_health.db", transient_ttl_seconds=600)
+    """
+    global _registry
+    store = DomainHealthStore(db_path) if db_path else None
+    _registry = DomainHealthRegistry(store=store, **overrides)
+    return _registry
+
+
+def reset_domain_health():
+    """Drop the shared registry (tests, config changes)."""
+    global _registry
+    _registry = None
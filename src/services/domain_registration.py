@@ -0,0 +1,527 @@
+"""
+Shared domain-registration lookups (RDAP with WHOIS fallback).
+
+Domain age and owner lookup both need the same registration record. This
+service fetches it once per domain and keeps the parsed creation date,
+registrant and registrar in SQLite with a long TTL, so later runs never repeat
+the round trip.
+
+RDAP is queried over HTTP through the shared aiohttp transport (rdap.org
+redirects to the authoritative registry). WHOIS is only used when RDAP has no
+answer and the optional ``python-whois`` package is installed; those blocking
+calls run on a small dedicated thread pool, not the loop's default executor.
+Lookups are rate limited per registry (TLD), and concurrent lookups of the same
+domain share one request.
+
+Example:
+    >>> service = get_domain_registration_service()
+    >>> record = await service.lookup("https://www.stolkmachine.ca/about")
+    >>> record.creation_date, record.registrant
+"""
+
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+import structlog
+
+from ..utils.rate_limiter import TokenBucketLimiter
+from .http_transport import create_client_session
+
+try:
+    import whois
+except ImportError:
+    whois = None
+
+logger = structlog.get_logger(__name__)
+
+# Empty answers (404, no registration data) are retried after a day instead of
+# the full TTL; transport failures are not cached at all
+NEGATIVE_TTL_SECONDS = 86400
+
+# Public suffixes with registrations one level below them
+SECOND_LEVEL_SUFFIXES = {
+    'co.uk', 'org.uk', 'com.au', 'co.nz',
+    'ab.ca', 'bc.ca', 'mb.ca', 'nb.ca', 'nl.ca', 'ns.ca', 'on.ca', 'pe.ca', 'qc.ca', 'sk.ca',
+}
+
+
+def registrable_domain(website: str) -> Optional[str]:
+    """
+    Reduce a URL or host name to the registered domain.
+
+    Example:
+        >>> registrable_domain("https://shop.www.example.on.ca:8443/x")
+        'example.on.ca'
+    """
+    if not website or 'UNKNOWN' in website:
+        return None
+
+    if '://' not in website:
+        website = f"https://{website}"
+
+    host = (urlparse(website).hostname or '').strip('.').lower()
+    labels = [label for label in host.split('.') if label]
+    if len(labels) < 2:
+        return None
+
+    keep = 3 if '.'.join(labels[-2:]) in SECOND_LEVEL_SUFFIXES and len(labels) >= 3 else 2
+    return '.'.join(labels[-keep:])
+
+
+@dataclass
+class DomainRecord:
+    """Parsed registration data for one domain."""
+    domain: str
+    creation_date: Optional[datetime] = None
+    registrant: Optional[str] = None
+    registrar: Optional[str] = None
+    source: Optional[str] = None  # 'rdap' or 'whois'
+    error: Optional[str] = None
+    looked_up_at: float = 0.0
+    expires_at: float = 0.0
+
+    @property
+    def found(self) -> bool:
+        return self.source is not None
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) >= self.expires_at
+
+    def years_old(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Domain age in years, or None without a creation date."""
+        if self.creation_date is None:
+            return None
+        return ((now or datetime.now()) - self.creation_date).days / 365.25
+
+
+def _naive(value: datetime) -> datetime:
+    """Drop timezone info (dates are compared against naive local now)."""
+    return value.replace(tzinfo=None) if value.tzinfo else value
+
+
+def _parse_rdap_date(value: str) -> Optional[datetime]:
+    try:
+        return _naive(datetime.fromisoformat(value.replace('Z', '+00:00')))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _vcard_name(entity: Dict) -> Optional[str]:
+    """Full name (fn) from an RDAP entity's jCard."""
+    vcard = entity.get('vcardArray')
+    if not isinstance(vcard, list) or len(vcard) < 2:
+        return None
+    for prop in vcard[1]:
+        if len(prop) >= 4 and prop[0] == 'fn' and isinstance(prop[3], str) and prop[3].strip():
+            return prop[3].strip()
+    return None
+
+
+def parse_rdap(data: Dict) -> Tuple[Optional[datetime], Optional[str], Optional[str]]:
+    """
+    Extract (creation date, registrant, registrar) from an RDAP domain response.
+
+    Entities may be nested (e.g. the registrar's abuse contact), so they are
+    walked recursively; the first name found for each role wins.
+    """
+    creation_date = None
+    for event in data.get('events', []):
+        if event.get('eventAction') == 'registration':
+            creation_date = _parse_rdap_date(event.get('eventDate'))
+            break
+
+    names: Dict[str, str] = {}
+    pending = list(data.get('entities', []))
+    while pending:
+        entity = pending.pop(0)
+        name = _vcard_name(entity)
+        for role in entity.get('roles', []):
+            if name and role not in names:
+                names[role] = name
+        pending.extend(entity.get('entities', []))
+
+    return creation_date, names.get('registrant'), names.get('registrar')
+
+
+def _parse_whois(data) -> Tuple[Optional[datetime], Optional[str], Optional[str]]:
+    """Extract (creation date, registrant, registrar) from a python-whois result."""
+    def first(value):
+        # Registries sometimes return several values; the earliest date wins
+        if isinstance(value, list):
+            values = [v for v in value if v]
+            if values and all(isinstance(v, datetime) for v in values):
+                return min(values)
+            return values[0] if values else None
+        return value
+
+    creation_date = first(getattr(data, 'creation_date', None))
+    if not isinstance(creation_date, datetime):
+        creation_date = None
+
+    registrant = first(getattr(data, 'name', None)) or first(getattr(data, 'org', None))
+    registrar = first(getattr(data, 'registrar', None))
+    return (
+        _naive(creation_date) if creation_date else None,
+        registrant if isinstance(registrant, str) else None,
+        registrar if isinstance(registrar, str) else None,
+    )
+
+
+class DomainRecordStore:
+    """SQLite store of parsed registration records, keyed by domain."""
+
+    def __init__(self, db_path: str = "data/domain_records.db"):
+        """
+        Initialize domain record store.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Schema:
+            - domain: TEXT PRIMARY KEY (registered domain)
+            - creation_date: TEXT (ISO date, NULL if unknown)
+            - expires_at: REAL (unix time the record should be refreshed)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS domain_records (
+                    domain TEXT PRIMARY KEY,
+                    creation_date TEXT,
+                    registrant TEXT,
+                    registrar TEXT,
+                    source TEXT,
+                    error TEXT,
+                    looked_up_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def get(self, domain: str) -> Optional[DomainRecord]:
+        """Get the stored record for a domain, expired or not."""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT creation_date, registrant, registrar, source, error, looked_up_at, expires_at "
+                "FROM domain_records WHERE domain = ?",
+                (domain,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        creation_date, registrant, registrar, source, error, looked_up_at, expires_at = row
+        return DomainRecord(
+            domain=domain,
+            creation_date=datetime.fromisoformat(creation_date) if creation_date else None,
+            registrant=registrant,
+            registrar=registrar,
+            source=source,
+            error=error,
+            looked_up_at=looked_up_at,
+            expires_at=expires_at
+        )
+
+    def put(self, record: DomainRecord):
+        """Store (or replace) a domain's record."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO domain_records "
+                "(domain, creation_date, registrant, registrar, source, error, looked_up_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.domain,
+                    record.creation_date.isoformat() if record.creation_date else None,
+                    record.registrant,
+                    record.registrar,
+                    record.source,
+                    record.error,
+                    record.looked_up_at,
+                    record.expires_at
+                )
+            )
+            conn.commit()
+
+
+class DomainRegistrationService:
+    """
+    One registration lookup per domain, shared by all enrichers.
+
+    Args:
+        store: Disk cache (default: DOMAIN_RECORD_CACHE_PATH from config)
+        ttl_seconds: Lifetime of a found record (default: DOMAIN_RECORD_CACHE_TTL)
+        rate_per_registry: Lookups per second per TLD registry (default: RDAP_RATE_LIMIT)
+        whois_workers: Threads for the blocking WHOIS fallback (default: WHOIS_MAX_WORKERS)
+        use_whois: Fall back to WHOIS when RDAP has no answer (needs python-whois)
+    """
+
+    RDAP_BOOTSTRAP_URL = "https://rdap.org/domain/"
+
+    def __init__(self, store: Optional[DomainRecordStore] = None, ttl_seconds: Optional[float] = None,
+                 rate_per_registry: Optional[float] = None, whois_workers: Optional[int] = None,
+                 use_whois: bool = True, timeout: float = 15.0):
+        settings = _settings_from_config()
+        self.store = store or DomainRecordStore(settings['db_path'])
+        self.ttl_seconds = settings['ttl_seconds'] if ttl_seconds is None else ttl_seconds
+        self.rate_per_registry = rate_per_registry or settings['rate_per_registry']
+        self.whois_workers = whois_workers or settings['whois_workers']
+        self.use_whois = use_whois and whois is not None
+        self.timeout = timeout
+
+        self._memory: Dict[str, DomainRecord] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._limiters: Dict[str, TokenBucketLimiter] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
+
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'shared': 0,
+            'rdap_lookups': 0,
+            'whois_lookups': 0,
+            'not_found': 0,
+            'errors': 0
+        }
+
+    async def lookup(self, website: str) -> DomainRecord:
+        """
+        Get the registration record for a URL or domain.
+
+        Never raises: failures come back as a record with ``error`` set.
+        """
+        domain = registrable_domain(website)
+        if not domain:
+            return DomainRecord(domain=website or '', error='invalid domain')
+
+        record = self._memory.get(domain)
+        if record is not None and not record.is_expired():
+            self.stats['memory_hits'] += 1
+            return record
+
+        pending = self._inflight.get(domain)
+        if pending is not None:
+            self.stats['shared'] += 1
+            return await asyncio.shield(pending)
+
+        task = asyncio.ensure_future(self._resolve(domain))
+        self._inflight[domain] = task
+        task.add_done_callback(lambda _: self._inflight.pop(domain, None))
+        return await asyncio.shield(task)
+
+    async def lookup_batch(self, websites: List[str], max_concurrent: int = 10) -> List[DomainRecord]:
+        """
+        Look up many websites; results are in input order.
+
+        Duplicate domains are fetched once and the per-registry limiter spaces
+        the requests, so a large batch is safe to submit at once.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def bounded(website: str) -> DomainRecord:
+            async with semaphore:
+                return await self.lookup(website)
+
+        return list(await asyncio.gather(*(bounded(website) for website in websites)))
+
+    async def _resolve(self, domain: str) -> DomainRecord:
+        record = self.store.get(domain)
+        if record is not None and not record.is_expired():
+            self.stats['disk_hits'] += 1
+            self._memory[domain] = record
+            return record
+
+        await self._get_limiter(domain).wait()
+
+        now = time.time()
+        record = DomainRecord(domain=domain, looked_up_at=now)
+        errors = []
+        answered = False  # A registry replied, even if with nothing
+
+        try:
+            creation_date, registrant, registrar = await self._lookup_rdap(domain)
+            answered = True
+            if creation_date or registrant or registrar:
+                record.creation_date, record.registrant, record.registrar = creation_date, registrant, registrar
+                record.source = 'rdap'
+        except Exception as e:
+            errors.append(f"rdap: {str(e)[:100]}")
+
+        if record.creation_date is None and self.use_whois:
+            try:
+                creation_date, registrant, registrar = await self._lookup_whois(domain)
+                answered = True
+                if creation_date or registrant:
+                    record.creation_date = creation_date or record.creation_date
+                    record.registrant = record.registrant or registrant
+                    record.registrar = record.registrar or registrar
+                    record.source = 'whois'
+            except Exception as e:
+                errors.append(f"whois: {str(e)[:100]}")
+
+        if record.found:
+            record.expires_at = now + self.ttl_seconds
+            logger.info("domain_record_found",
+                       domain=domain,
+                       source=record.source,
+                       creation_date=record.creation_date.isoformat() if record.creation_date else None)
+        elif answered:
+            self.stats['not_found'] += 1
+            record.error = '; '.join(errors) or 'no registration data'
+            record.expires_at = now + min(NEGATIVE_TTL_SECONDS, self.ttl_seconds)
+            logger.debug("domain_record_not_found", domain=domain, error=record.error)
+        else:
+            # Transport failure: report it, but let the next lookup try again
+            self.stats['errors'] += 1
+            record.error = '; '.join(errors)
+            record.expires_at = now
+            logger.debug("domain_record_lookup_failed", domain=domain, error=record.error)
+            return record
+
+        self.store.put(record)
+        self._memory[domain] = record
+        return record
+
+    async def _lookup_rdap(self, domain: str) -> Tuple[Optional[datetime], Optional[str], Optional[str]]:
+        self.stats['rdap_lookups'] += 1
+        session = self._get_session()
+        async with session.get(f"{self.RDAP_BOOTSTRAP_URL}{domain}") as response:
+            if response.status == 404:
+                return None, None, None
+            if response.status != 200:
+                raise ValueError(f"RDAP returned status {response.status}")
+            data = await response.json(content_type=None)
+        return parse_rdap(data)
+
+    async def _lookup_whois(self, domain: str) -> Tuple[Optional[datetime], Optional[str], Optional[str]]:
+        self.stats['whois_lookups'] += 1
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.whois_workers, thread_name_prefix="whois")
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(self._executor, whois.whois, domain)
+        return _parse_whois(data) if data else (None, None, None)
+
+    def _get_limiter(self, domain: str) -> TokenBucketLimiter:
+        """Per-registry limiter; the TLD identifies the registry."""
+        registry = domain.rsplit('.', 1)[-1]
+        if registry not in self._limiters:
+            self._limiters[registry] = TokenBucketLimiter(rate_per_second=self.rate_per_registry, burst_size=1)
+        return self._limiters[registry]
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Session bound to the running loop (recreated if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            _discard_session(self._session, self._session_loop)
+            self._session = None
+        if self._session is None or self._session.closed:
+            self._session = create_client_session(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'Accept': 'application/rdap+json'}
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session and stop the WHOIS threads (both are reopened on the next lookup)."""
+        if self._session is not None and not self._session.closed:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            else:
+                _discard_session(self._session, self._session_loop)
+        self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get lookup statistics."""
+        return {**self.stats, 'domains': len(self._memory)}
+
+
+_closing: set = set()
+
+
+def _discard_session(session, loop):
+    """
+    Close a session from code that cannot await it on its own loop.
+
+    The close runs on the loop that opened the session: awaited directly when
+    that loop is idle and nothing else is running, otherwise scheduled on it.
+    A session whose loop is already closed cannot be closed cleanly and is
+    only detached.
+    """
+    if session is None or session.closed:
+        return
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    try:
+        if loop is None or loop.is_closed():
+            session.detach()
+        elif loop is running:
+            task = loop.create_task(session.close())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+        elif running is None and not loop.is_running():
+            loop.run_until_complete(session.close())
+        else:
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+    except Exception as e:
+        logger.debug("domain_registration_session_close_failed", error=str(e)[:100])
+
+
+def _settings_from_config() -> Dict:
+    try:
+        from ..core.config import config
+        return {
+            'db_path': config.DOMAIN_RECORD_CACHE_PATH,
+            'ttl_seconds': config.DOMAIN_RECORD_CACHE_TTL,
+            'rate_per_registry': config.RDAP_RATE_LIMIT,
+            'whois_workers': config.WHOIS_MAX_WORKERS,
+        }
+    except Exception:
+        return {
+            'db_path': "data/domain_records.db",
+            'ttl_seconds': 7776000,
+            'rate_per_registry': 1.0,
+            'whois_workers': 4,
+        }
+
+
+_service: Optional[DomainRegistrationService] = None
+
+
+def get_domain_registration_service() -> DomainRegistrationService:
+    """Get the process-wide service, so every enricher shares one cache."""
+    global _service
+    if _service is None:
+        _service = DomainRegistrationService()
+    return _service
+
+
+def reset_domain_registration_service():
+    """Drop the shared service (tests, config changes)."""
+    global _service
+    if _service is not None:
+        _discard_session(_service._session, _service._session_loop)
+        if _service._executor is not None:
+            _service._executor.shutdown(wait=False)
+    _service = None
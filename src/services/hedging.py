@@ -0,0 +1,298 @@
+"""
+Hedged requests for tail-latency control on the shared HTTP layer.
+
+A request that has not answered by its host's observed latency percentile
+(p90 by default) gets one duplicate attempt, a "hedge". The first attempt to
+succeed wins and the other is cancelled. Hedges are paid for from a global
+budget that earns HEDGE_BUDGET_RATIO hedges per request, so target sites see
+at most that fraction of extra requests however slow they are.
+
+Usage:
+    policy = get_hedging_policy()
+    status, body, final_url = await policy.run(url, lambda: fetch(url))
+    policy.get_stats()   # hedge rate and win rate
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+from urllib.parse import urlparse
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar('T')
+
+# Latency samples kept per host and across all hosts
+HOST_LATENCY_WINDOW = 32
+GLOBAL_LATENCY_WINDOW = 256
+
+# Samples needed before a host's own percentile is trusted (the global
+# percentile stands in until then)
+MIN_LATENCY_SAMPLES = 5
+
+# Unspent hedges the budget can bank for a burst of slow hosts
+MAX_BANKED_HEDGES = 10.0
+
+
+@dataclass
+class HedgingSettings:
+    """Hedging policy settings."""
+
+    enabled: bool = True
+    percentile: float = 0.9
+    budget_ratio: float = 0.05
+    min_delay_seconds: float = 0.25
+
+
+class LatencyTracker:
+    """Recent response latencies per host, with percentile lookup."""
+
+    def __init__(self, host_window: int = HOST_LATENCY_WINDOW, global_window: int = GLOBAL_LATENCY_WINDOW):
+        self.host_window = host_window
+        self.hosts: Dict[str, Deque[float]] = {}
+        self.all_hosts: Deque[float] = deque(maxlen=global_window)
+
+    def record(self, host: str, seconds: float):
+        samples = self.hosts.get(host)
+        if samples is None:
+            samples = self.hosts[host] = deque(maxlen=self.host_window)
+        samples.append(seconds)
+        self.all_hosts.append(seconds)
+
+    def percentile(self, host: str, q: float, min_samples: int = MIN_LATENCY_SAMPLES) -> Optional[float]:
+        """Latency percentile for a host (all hosts until it has enough samples)."""
+        samples = self.hosts.get(host)
+        if not samples or len(samples) < min_samples:
+            samples = self.all_hosts
+        if len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class HedgeBudget:
+    """
+    Token budget: every request earns `ratio` hedges, every hedge spends one.
+
+    A request that is due a hedge while the budget is empty queues for the
+    next token. Tokens go to the longest-waiting request first; requests that
+    finish on their own leave the queue, so a scarce budget ends up spent on
+    the stalled requests rather than on the mildly slow ones.
+    """
+
+    def __init__(self, ratio: float, max_banked: float = MAX_BANKED_HEDGES):
+        self.ratio = ratio
+        self.max_banked = max_banked
+        self.tokens = 0.0
+        self.waiters: Deque[asyncio.Future] = deque()
+
+    def earn(self):
+        self.tokens = min(self.max_banked, self.tokens + self.ratio)
+        while self.waiters and self._affordable():
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.tokens -= 1.0
+                waiter.set_result(True)
+
+    def refund(self):
+        self.tokens = min(self.max_banked, self.tokens + 1.0)
+
+    async def acquire(self):
+        """Wait for a hedge token (cancel to give up the place in the queue)."""
+        if self._affordable() and not self.waiters:
+            self.tokens -= 1.0
+            return
+        waiter = asyncio.get_event_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as the caller gave up
+                self.refund()
+            raise
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+
+    def _affordable(self) -> bool:
+        # Tolerate float drift (20 x 0.05 sums to just under 1.0)
+        return self.tokens >= 1.0 - 1e-9
+
+
+class HedgingPolicy:
+    """
+    Run request attempts with at most one hedge each.
+
+    An attempt is a zero-argument coroutine function that performs the whole
+    request, including reading the body, so a cancelled attempt releases its
+    connection. Once a request passes its hedge delay it waits for a budget
+    token (see HedgeBudget) until either a token arrives or it completes.
+    If the first attempt to finish failed, the other is still awaited; the
+    error is raised only when every attempt failed.
+    """
+
+    def __init__(self, settings: Optional[HedgingSettings] = None):
+        self.settings = settings or HedgingSettings()
+        self.latency = LatencyTracker()
+        self.budget = HedgeBudget(self.settings.budget_ratio)
+        self.logger = logger
+        self.stats = {
+            'requests': 0,
+            'hedges_sent': 0,
+            'hedge_wins': 0,
+            'primary_wins': 0,
+            'budget_denied': 0,  # due a hedge, but finished before a token was free
+        }
+
+    def hedge_delay(self, host: str) -> Optional[float]:
+        """Seconds to wait before hedging a request to host (None = never)."""
+        if not self.settings.enabled:
+            return None
+        observed = self.latency.percentile(host, self.settings.percentile)
+        if observed is None:
+            return None
+        return max(self.settings.min_delay_seconds, observed)
+
+    async def run(self, url: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run attempt(), hedging it once if it is slower than the host's percentile.
+
+        Args:
+            url: Request URL (its host keys the latency history)
+            attempt: Performs one complete request
+
+        Returns:
+            The first successful attempt's result
+        """
+        host = urlparse(url).netloc or url
+        self.stats['requests'] += 1
+        self.budget.earn()
+
+        started: Dict[asyncio.Future, float] = {}
+        tasks: List[asyncio.Future] = []
+
+        def launch():
+            task = asyncio.ensure_future(attempt())
+            task.add_done_callback(_consume_result)
+            started[task] = time.monotonic()
+            tasks.append(task)
+
+        launch()
+        try:
+            delay = self.hedge_delay(host)
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    if await self._hedge_granted(tasks[0]):
+                        self.stats['hedges_sent'] += 1
+                        self.logger.debug("request_hedged", host=host, delay=round(delay, 3))
+                        launch()
+                    else:
+                        self.stats['budget_denied'] += 1
+
+            winner = await _first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        self.latency.record(host, time.monotonic() - started[winner])
+        if len(tasks) > 1:
+            self.stats['hedge_wins' if winner is tasks[1] else 'primary_wins'] += 1
+        return winner.result()
+
+    async def _hedge_granted(self, primary: asyncio.Future) -> bool:
+        """Wait for a hedge token unless the primary attempt finishes first."""
+        grant = asyncio.ensure_future(self.budget.acquire())
+        try:
+            await asyncio.wait([primary, grant], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not grant.done():
+                grant.cancel()
+                await asyncio.wait([grant])
+        if grant.cancelled():
+            return False
+        if primary.done():
+            self.budget.refund()
+            return False
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hedge counts plus extra-request rate and hedge win rate."""
+        stats = dict(self.stats)
+        stats['hedge_rate'] = round(stats['hedges_sent'] / stats['requests'], 4) if stats['requests'] else 0.0
+        stats['hedge_win_rate'] = round(stats['hedge_wins'] / stats['hedges_sent'], 4) if stats['hedges_sent'] else 0.0
+        return stats
+
+
+async def _first_success(tasks: List[asyncio.Future]) -> asyncio.Future:
+    """First task (in launch order on ties) to finish without error."""
+    pending = set(tasks)
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in (t for t in tasks if t in done):
+            if task.cancelled():
+                continue
+            if task.exception() is None:
+                return task
+            error = error or task.exception()
+    raise error if error else asyncio.CancelledError()
+
+
+def _consume_result(task: asyncio.Future):
+    """Mark a losing attempt's outcome as retrieved (no 'never retrieved' warnings)."""
+    if not task.cancelled():
+        task.exception()
+
+
+# ==================== Shared Policy ====================
+
+_policy: Optional[HedgingPolicy] = None
+
+
+def _settings_from_config() -> HedgingSettings:
+    try:
+        from ..core.config import config
+        return HedgingSettings(
+            enabled=config.HEDGE_REQUESTS_ENABLED,
+            percentile=config.HEDGE_LATENCY_PERCENTILE,
+            budget_ratio=config.HEDGE_BUDGET_RATIO,
+            min_delay_seconds=config.HEDGE_MIN_DELAY_SECONDS
+        )
+    except Exception:
+        return HedgingSettings()
+
+
+def get_hedging_policy() -> HedgingPolicy:
+    """Get the process-wide hedging policy (latency history and budget are shared)."""
+    global _policy
+    if _policy is None:
+        _policy = HedgingPolicy(_settings_from_config())
+    return _policy
+
+
+def configure_hedging(**overrides) -> HedgingPolicy:
+    """
+    Replace the shared policy with overridden settings.
+
+    Example:
+        >>> configure_hedging(budget_ratio=0.02, percentile=0.95)
+    """
+    global _policy
+    settings = HedgingSettings(**{**_settings_from_config().__dict__, **overrides})
+    _policy = HedgingPolicy(settings)
+    logger.info("hedging_configured", **settings.__dict__)
+    return _policy
+
+
+def reset_hedging():
+    """Drop the shared policy; it is rebuilt from config on next use."""
+    global _policy
+    _policy = None
@@ -0,0 +1,414 @@
+"""
+Adaptive per-host concurrency (AIMD) for the shared HTTP layer.
+
+Each host gets its own concurrency limit instead of a fixed limit_per_host.
+The limit grows additively (about +1 per limit's worth of healthy responses)
+while latency stays near the host's baseline, holds while latency or error
+rates degrade, and is cut multiplicatively on 429/503, timeouts and
+Retry-After (which also pauses the host). Learned limits are saved to SQLite
+so the next run starts where this one left off.
+
+Provider APIs (Places, Geoapify, ...) may climb to a higher ceiling than
+small-business websites. Websites are the hosts that need politeness: when a
+Retry-After pause ends their queued requests resume with random jitter
+instead of all at once.
+
+Usage:
+    concurrency = get_host_concurrency()
+    async with concurrency.slot(url) as slot:
+        async with session.get(url) as response:
+            slot.observe(response.status, response.headers.get('Retry-After'))
+    concurrency.save()
+"""
+
+import asyncio
+import random
+import sqlite3
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Statuses that mean "slow down"
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+# Longest Retry-After pause honoured (some servers send hours)
+MAX_RETRY_AFTER_SECONDS = 120.0
+
+# Queued requests to a polite host resume spread over this many seconds
+RESUME_JITTER_SECONDS = 1.0
+
+# Baseline latency creeps toward slower samples at this rate (it drops at once)
+BASELINE_DRIFT = 0.01
+
+# Latencies below this are never treated as degraded
+LATENCY_SLACK_SECONDS = 0.05
+
+
+@dataclass
+class ConcurrencySettings:
+    """Adaptive concurrency settings."""
+
+    enabled: bool = True
+    initial_limit: float = 2.0
+    min_limit: float = 1.0
+    max_limit: float = 8.0
+    api_max_limit: float = 32.0
+    api_hosts: Tuple[str, ...] = ('googleapis.com', 'geoapify.com', 'api.yelp.com')
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 2.0
+    store_path: str = "data/host_limits.db"
+    store_ttl_seconds: float = 7 * 24 * 3600
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header (delta-seconds or HTTP-date) as seconds from now."""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class HostLimit:
+    """
+    AIMD concurrency limit for one host.
+
+    Requests past the limit queue FIFO. Overload signals from requests that
+    started before the last decrease are ignored, so one burst of 503s cuts
+    the limit once rather than once per response.
+    """
+
+    def __init__(self, host: str, limit: float, min_limit: float, max_limit: float,
+                 decrease_factor: float = 0.5, latency_tolerance: float = 2.0,
+                 polite: bool = True, adaptive: bool = True, baseline_latency: Optional[float] = None):
+        self.host = host
+        self.limit = limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.polite = polite
+        self.adaptive = adaptive
+        self.baseline_latency = baseline_latency
+        self.in_flight = 0
+        self.generation = 0
+        self.paused_until = 0.0
+        self.dirty = False
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def capacity(self) -> int:
+        return max(1, int(self.limit))
+
+    async def acquire(self) -> int:
+        """Wait for a slot (and any Retry-After pause); returns the request's generation."""
+        await self._take_slot()
+        try:
+            while self.paused_until > time.monotonic():
+                delay = self.paused_until - time.monotonic()
+                if self.polite:
+                    delay += random.uniform(0, RESUME_JITTER_SECONDS)
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.release()
+            raise
+        return self.generation
+
+    async def _take_slot(self):
+        if self.in_flight < self.capacity and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Handed a slot just as the caller gave up
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self, latency: float):
+        """Healthy response: grow the limit unless latency has degraded."""
+        degraded = self._degraded(latency)
+        if self.baseline_latency is None or latency < self.baseline_latency:
+            self.baseline_latency = latency
+        else:
+            self.baseline_latency += BASELINE_DRIFT * (latency - self.baseline_latency)
+
+        # Only grow a limit that is actually in use
+        if self.adaptive and not degraded and self.in_flight >= self.capacity and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self.dirty = True
+            self._wake()
+
+    def on_overload(self, generation: int, retry_after: Optional[float] = None) -> bool:
+        """429/503/timeout: cut the limit (once per generation). Returns True if cut."""
+        if retry_after:
+            pause = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+            self.paused_until = max(self.paused_until, time.monotonic() + pause)
+        if not self.adaptive or generation < self.generation:
+            return False
+        self.generation += 1
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        self.dirty = True
+        return True
+
+    def _degraded(self, latency: float) -> bool:
+        if self.baseline_latency is None:
+            return False
+        return latency > max(self.baseline_latency * self.latency_tolerance, LATENCY_SLACK_SECONDS)
+
+    def _wake(self):
+        while self._waiters and self.in_flight < self.capacity:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(True)
+
+
+class ConcurrencySlot:
+    """One request's slot; report the response with observe()."""
+
+    def __init__(self, host_limit: HostLimit, generation: int):
+        self.host_limit = host_limit
+        self.generation = generation
+        self.started = time.monotonic()
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+    def observe(self, status: int, retry_after: Optional[str] = None):
+        self.status = status
+        self.retry_after = parse_retry_after(retry_after)
+
+
+class HostLimitStore:
+    """SQLite store of learned per-host limits (the file is created on first save)."""
+
+    def __init__(self, db_path: str = "data/host_limits.db"):
+        """
+        Initialize host limit store.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Schema:
+            - host: TEXT PRIMARY KEY
+            - concurrency_limit: REAL
+            - baseline_latency: REAL (seconds, NULL until measured)
+            - updated_at: REAL (unix time)
+        """
+        self.db_path = Path(db_path)
+
+    def _init_db(self):
+        """Initialize database schema."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS host_limits (
+                    host TEXT PRIMARY KEY,
+                    concurrency_limit REAL NOT NULL,
+                    baseline_latency REAL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def get(self, host: str, max_age_seconds: float) -> Optional[Tuple[float, Optional[float]]]:
+        """(limit, baseline latency) for a host, if learned within max_age_seconds."""
+        if not self.db_path.exists():
+            return None
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT concurrency_limit, baseline_latency FROM host_limits WHERE host = ? AND updated_at > ?",
+                (host, time.time() - max_age_seconds)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def put_many(self, rows: Dict[str, Tuple[float, Optional[float]]]):
+        """Store (or replace) limits for several hosts."""
+        now = time.time()
+        self._init_db()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO host_limits (host, concurrency_limit, baseline_latency, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(host, limit, baseline, now) for host, (limit, baseline) in rows.items()]
+            )
+            conn.commit()
+
+
+class HostConcurrency:
+    """
+    Per-host AIMD limits, loaded from and saved to a HostLimitStore.
+
+    With adaptation disabled every host keeps the initial limit (the old
+    fixed limit_per_host behaviour).
+    """
+
+    def __init__(self, settings: Optional[ConcurrencySettings] = None, store: Optional[HostLimitStore] = None):
+        self.settings = settings or ConcurrencySettings()
+        self.store = store or HostLimitStore(self.settings.store_path)
+        self.hosts: Dict[str, HostLimit] = {}
+        self.logger = logger
+        self.stats = {
+            'requests': 0,
+            'increases': 0,
+            'decreases': 0,
+            'retry_after_pauses': 0,
+            'restored_hosts': 0,
+        }
+
+    def is_api_host(self, host: str) -> bool:
+        host = host.split(':', 1)[0].lower()
+        return any(host == suffix or host.endswith('.' + suffix) for suffix in self.settings.api_hosts)
+
+    def host_limit(self, host: str) -> HostLimit:
+        """The host's limiter, restored from the store on first use."""
+        host_limit = self.hosts.get(host)
+        if host_limit is not None:
+            return host_limit
+
+        settings = self.settings
+        api = self.is_api_host(host)
+        max_limit = settings.api_max_limit if api else settings.max_limit
+        limit, baseline = settings.initial_limit, None
+        if settings.enabled:
+            learned = self.store.get(host, settings.store_ttl_seconds)
+            if learned is not None:
+                limit, baseline = learned
+                self.stats['restored_hosts'] += 1
+        host_limit = self.hosts[host] = HostLimit(
+            host,
+            limit=min(max_limit, max(settings.min_limit, limit)),
+            min_limit=settings.min_limit,
+            max_limit=max_limit,
+            decrease_factor=settings.decrease_factor,
+            latency_tolerance=settings.latency_tolerance,
+            polite=not api,
+            adaptive=settings.enabled,
+            baseline_latency=baseline
+        )
+        return host_limit
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[ConcurrencySlot]:
+        """
+        Hold one of the host's concurrency slots for a request.
+
+        A timeout inside the block counts as overload; a cancelled request
+        (e.g. a losing hedge) only frees its slot.
+        """
+        host = urlparse(url).netloc or url
+        host_limit = self.host_limit(host)
+        slot = ConcurrencySlot(host_limit, await host_limit.acquire())
+        self.stats['requests'] += 1
+        try:
+            yield slot
+        except asyncio.TimeoutError:
+            self._overload(slot, reason='timeout')
+            raise
+        else:
+            # Other 5xx (and errors raised above) neither grow nor cut the limit
+            if slot.status in OVERLOAD_STATUSES or slot.retry_after:
+                self._overload(slot, reason=slot.status)
+            elif slot.status is None or slot.status < 500:
+                before = host_limit.limit
+                host_limit.on_success(time.monotonic() - slot.started)
+                if host_limit.limit > before:
+                    self.stats['increases'] += 1
+        finally:
+            host_limit.release()
+
+    def _overload(self, slot: ConcurrencySlot, reason):
+        host_limit = slot.host_limit
+        if slot.retry_after:
+            self.stats['retry_after_pauses'] += 1
+        if host_limit.on_overload(slot.generation, slot.retry_after):
+            self.stats['decreases'] += 1
+            self.logger.info("host_concurrency_decreased", host=host_limit.host,
+                             limit=round(host_limit.limit, 2), reason=reason, retry_after=slot.retry_after)
+
+    def save(self) -> int:
+        """Persist limits that changed since the last save. Returns hosts written."""
+        dirty = {host: (h.limit, h.baseline_latency) for host, h in self.hosts.items() if h.dirty}
+        if dirty:
+            self.store.put_many(dirty)
+            for host in dirty:
+                self.hosts[host].dirty = False
+        return len(dirty)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Limit changes plus the current limit per host."""
+        return {**self.stats, 'limits': {host: round(h.limit, 2) for host, h in self.hosts.items()}}
+
+
+# ==================== Shared Controller ====================
+
+_controller: Optional[HostConcurrency] = None
+
+
+def _settings_from_config() -> ConcurrencySettings:
+    try:
+        from ..core.config import config
+        return ConcurrencySettings(
+            enabled=config.ADAPTIVE_CONCURRENCY_ENABLED,
+            initial_limit=config.HOST_CONCURRENCY_INITIAL,
+            max_limit=config.HOST_CONCURRENCY_MAX,
+            api_max_limit=config.API_HOST_CONCURRENCY_MAX,
+            api_hosts=tuple(h.strip().lower() for h in config.API_HOSTS.split(',') if h.strip()),
+            store_path=config.HOST_LIMITS_PATH,
+            store_ttl_seconds=config.HOST_LIMITS_TTL_HOURS * 3600
+        )
+    except Exception:
+        return ConcurrencySettings()
+
+
+def get_host_concurrency() -> HostConcurrency:
+    """Get the process-wide controller (limits are shared by all clients)."""
+    global _controller
+    if _controller is None:
+        _controller = HostConcurrency(_settings_from_config())
+    return _controller
+
+
+def configure_host_concurrency(**overrides) -> HostConcurrency:
+    """
+    Replace the shared controller with overridden settings.
+
+    Example:
+        >>> configure_host_concurrency(max_limit=4, store_path="/tmp/host_limits.db")
+    """
+    global _controller
+    settings = ConcurrencySettings(**{**_settings_from_config().__dict__, **overrides})
+    _controller = HostConcurrency(settings)
+    logger.info("host_concurrency_configured", enabled=settings.enabled, max_limit=settings.max_limit,
+                api_max_limit=settings.api_max_limit)
+    return _controller
+
+
+def reset_host_concurrency():
+    """Drop the shared controller; it is rebuilt from config on next use."""
+    global _controller
+    _controller = None
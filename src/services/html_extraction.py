@@ -0,0 +1,381 @@
+"""
+Bounded HTML extraction for scrapers and validators.
+
+Response bodies are streamed up to a byte cap (HTTP_MAX_BODY_BYTES) instead of
+being read whole, then parsed in a single event-driven pass without building a
+document tree: lxml's parser-target interface when lxml is installed, the
+standard library ``HTMLParser`` otherwise. The one pass collects visible text,
+the title, links, ``mailto:``/``tel:`` hrefs and meta tags; emails and phones
+are matched with precompiled patterns over the visible text only.
+
+Async callers use ``extract_page_async()``, which parses large pages in the
+CPU offload pool (src/utils/offload.py) so parsing never stalls the event loop.
+
+Example:
+    >>> async with session.get(url) as response:
+    ...     body, encoding, truncated = await read_body_bytes_capped(response)
+    >>> page = await extract_page_async(body, encoding, base_url=url)
+    >>> page.emails, page.phones, page.find_links(re.compile('/contact'))
+"""
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Tuple, Union
+from urllib.parse import unquote, urljoin
+
+import aiohttp
+import structlog
+
+from ..core.normalization import normalize_phone
+from ..utils.offload import cpu_task, run_cpu_task
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+logger = structlog.get_logger(__name__)
+
+
+DEFAULT_MAX_BODY_BYTES = 2_000_000
+READ_CHUNK_BYTES = 64 * 1024
+
+# Pages smaller than this parse faster inline than the round trip to a worker
+MIN_OFFLOAD_BYTES = 32 * 1024
+
+PARSER_BACKENDS = ("lxml", "html.parser")
+DEFAULT_BACKEND = "lxml" if etree is not None else "html.parser"
+
+# Elements whose content is never visible text
+INVISIBLE_TAGS = frozenset({"script", "style", "noscript", "template"})
+
+# Elements that break the text flow; text inside inline elements (b, span, a...)
+# joins its neighbours without a space, as in "<b>Ham</b>ilton"
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "body", "br", "caption", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "head", "header", "hr", "html", "li", "main", "nav", "ol", "option", "p", "pre", "section",
+    "table", "tbody", "td", "tfoot", "th", "thead", "title", "tr", "ul",
+})
+
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+
+# North American formats: 123-456-7890, 123.456.7890, (123) 456-7890, 1234567890
+PHONE_RE = re.compile(r"\(\d{3}\)\s?\d{3}[-.\s]?\d{4}\b|\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b")
+
+NON_DIGIT_RE = re.compile(r"\D")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class PageLink:
+    """An anchor found on the page."""
+    href: str
+    url: str
+    text: str
+
+
+@dataclass
+class ExtractedPage:
+    """Everything the scrapers and validators read from one page."""
+    text: str = ""
+    title: str = ""
+    links: List[PageLink] = field(default_factory=list)
+    emails: Set[str] = field(default_factory=set)
+    phones: Set[str] = field(default_factory=set)
+    meta: Dict[str, str] = field(default_factory=dict)
+    tag_counts: Counter = field(default_factory=Counter)
+
+    def find_links(self, pattern: Pattern, match_text: bool = False) -> List[PageLink]:
+        """Links whose href (and optionally anchor text) matches a compiled pattern."""
+        return [
+            link for link in self.links
+            if pattern.search(link.href) or (match_text and pattern.search(link.text))
+        ]
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Compact picklable form (returned by offload workers)."""
+        return {
+            'text': self.text,
+            'title': self.title,
+            'links': [(link.href, link.url, link.text) for link in self.links],
+            'emails': sorted(self.emails),
+            'phones': sorted(self.phones),
+            'meta': self.meta,
+            'tag_counts': dict(self.tag_counts),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> 'ExtractedPage':
+        """Rebuild a page from to_payload() output."""
+        return cls(
+            text=payload['text'],
+            title=payload['title'],
+            links=[PageLink(href, url, text) for href, url, text in payload['links']],
+            emails=set(payload['emails']),
+            phones=set(payload['phones']),
+            meta=payload['meta'],
+            tag_counts=Counter(payload['tag_counts']),
+        )
+
+
+def get_max_body_bytes() -> int:
+    """Configured body cap (falls back to the default outside the app config)."""
+    try:
+        from ..core.config import config
+        return config.HTTP_MAX_BODY_BYTES
+    except Exception:
+        return DEFAULT_MAX_BODY_BYTES
+
+
+async def read_body_bytes_capped(response, max_bytes: Optional[int] = None) -> Tuple[bytes, str, bool]:
+    """
+    Read a response body, stopping after ``max_bytes``.
+
+    Live aiohttp responses are streamed chunk by chunk so oversized pages are
+    never fully downloaded. Responses already held in memory (replayed
+    cassettes) are read and cut to the same cap.
+
+    Returns:
+        (raw body, encoding to decode it with, whether the body was truncated)
+    """
+    max_bytes = max_bytes or get_max_body_bytes()
+    encoding = getattr(response, "charset", None) or "utf-8"
+    stream = getattr(response, "content", None)
+
+    if not isinstance(stream, aiohttp.StreamReader):
+        body = (await response.text()).encode("utf-8")
+        return body[:max_bytes], "utf-8", len(body) > max_bytes
+
+    chunks = []
+    size = 0
+    truncated = False
+    async for chunk in stream.iter_chunked(READ_CHUNK_BYTES):
+        remaining = max_bytes - size
+        if len(chunk) >= remaining:
+            chunks.append(chunk[:remaining])
+            truncated = len(chunk) > remaining or not stream.at_eof()
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+
+    if truncated:
+        logger.debug("response_body_truncated", url=str(getattr(response, "url", "")), max_bytes=max_bytes)
+
+    return b"".join(chunks), encoding, truncated
+
+
+def decode_body(body: bytes, encoding: str = "utf-8") -> str:
+    """Decode a body, replacing bad bytes and falling back to UTF-8 for unknown charsets."""
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+async def read_body_capped(response, max_bytes: Optional[int] = None) -> Tuple[str, bool]:
+    """
+    Read and decode a response body, stopping after ``max_bytes``.
+
+    Returns:
+        (decoded text, whether the body was truncated)
+    """
+    body, encoding, truncated = await read_body_bytes_capped(response, max_bytes)
+    return decode_body(body, encoding), truncated
+
+
+class _PageCollector:
+    """Parser target that turns start/end/data events into an ExtractedPage."""
+
+    def __init__(self, base_url: Optional[str], skip_tags: Iterable[str]):
+        self.base_url = base_url
+        self.skip_tags = INVISIBLE_TAGS.union(skip_tags)
+        self.page = ExtractedPage()
+        self._text: List[str] = []
+        self._title: List[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+        self._link: Optional[Tuple[str, List[str]]] = None
+        self._hrefs: List[str] = []
+
+    def start(self, tag, attrib):
+        tag = tag.lower()
+        self.page.tag_counts[tag] += 1
+        if tag in BLOCK_TAGS:
+            self._text.append(" ")
+
+        if tag in self.skip_tags:
+            self._skip_depth += 1
+        elif tag == "a":
+            href = (attrib.get("href") or "").strip()
+            if href:
+                self._close_link()
+                self._link = (href, [])
+                self._hrefs.append(href)
+        elif tag == "meta":
+            key = attrib.get("name") or attrib.get("property") or attrib.get("http-equiv")
+            if key and attrib.get("content") is not None:
+                self.page.meta[key.lower()] = attrib["content"]
+        elif tag == "title":
+            self._in_title = True
+
+    def end(self, tag):
+        tag = tag.lower()
+        if tag in BLOCK_TAGS:
+            self._text.append(" ")
+
+        if tag in self.skip_tags:
+            if self._skip_depth:
+                self._skip_depth -= 1
+        elif tag == "a":
+            self._close_link()
+        elif tag == "title":
+            self._in_title = False
+
+    def data(self, data):
+        # Whitespace-only chunks are kept: they separate words across inline tags
+        if self._skip_depth:
+            return
+        if self._in_title:
+            self._title.append(data)
+        self._text.append(data)
+        if self._link is not None:
+            self._link[1].append(data)
+
+    def close(self) -> ExtractedPage:
+        self._close_link()
+        page = self.page
+        page.text = WHITESPACE_RE.sub(" ", "".join(self._text)).strip()
+        page.title = WHITESPACE_RE.sub(" ", "".join(self._title)).strip()
+
+        page.emails.update(EMAIL_RE.findall(page.text))
+        page.phones.update(
+            phone for phone in PHONE_RE.findall(page.text)
+            if len(NON_DIGIT_RE.sub("", phone)) in (10, 11)
+        )
+        seen_numbers = {normalize_phone(phone) for phone in page.phones}
+        for href in self._hrefs:
+            scheme, _, target = href.partition(":")
+            scheme = scheme.lower()
+            if scheme == "mailto":
+                address = unquote(target.split("?", 1)[0]).strip()
+                if EMAIL_RE.fullmatch(address):
+                    page.emails.add(address)
+            elif scheme == "tel":
+                # tel: numbers are usually the visible number in E.164 form; keep one copy
+                number = unquote(target).strip()
+                if len(NON_DIGIT_RE.sub("", number)) in (10, 11):
+                    digits = normalize_phone(number)
+                    if digits not in seen_numbers:
+                        seen_numbers.add(digits)
+                        page.phones.add(digits)
+        return page
+
+    def _close_link(self):
+        if self._link is None:
+            return
+        href, text = self._link
+        url = urljoin(self.base_url, href) if self.base_url else href
+        self.page.links.append(PageLink(
+            href=href,
+            url=url,
+            text=WHITESPACE_RE.sub(" ", "".join(text)).strip()
+        ))
+        self._link = None
+
+
+class _StdlibParser(HTMLParser):
+    """Feeds ``html.parser`` events into a _PageCollector."""
+
+    def __init__(self, target: _PageCollector):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag, attrs):
+        self.target.start(tag, {name: value or "" for name, value in attrs})
+
+    def handle_endtag(self, tag):
+        self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+
+def _parse(html: str, collector: _PageCollector, backend: str) -> ExtractedPage:
+    if backend == "lxml":
+        parser = etree.HTMLParser(target=collector, recover=True)
+        parser.feed(html)
+        return parser.close()
+
+    parser = _StdlibParser(collector)
+    parser.feed(html)
+    parser.close()
+    return collector.close()
+
+
+def extract_page(
+    html: str,
+    base_url: Optional[str] = None,
+    skip_tags: Iterable[str] = (),
+    backend: Optional[str] = None
+) -> ExtractedPage:
+    """
+    Extract text, links, contacts and meta tags from HTML in one pass.
+
+    Args:
+        html: Page HTML (usually from read_body_capped)
+        base_url: Used to resolve links to absolute URLs
+        skip_tags: Extra elements whose text is ignored (e.g. nav, footer)
+        backend: "lxml" or "html.parser" (defaults to lxml when installed)
+
+    Returns:
+        ExtractedPage
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Parser backend must be one of: {PARSER_BACKENDS}")
+    if backend == "lxml" and etree is None:
+        backend = "html.parser"
+
+    if not html or not html.strip():
+        return ExtractedPage()
+
+    try:
+        return _parse(html, _PageCollector(base_url, skip_tags), backend)
+    except Exception as e:
+        if backend == "html.parser":
+            raise
+        logger.debug("lxml_extraction_failed", error=str(e))
+        return _parse(html, _PageCollector(base_url, skip_tags), "html.parser")
+
+
+@cpu_task("extract_page", min_offload_size=MIN_OFFLOAD_BYTES)
+def extract_page_payload(
+    body: Union[bytes, str],
+    encoding: str = "utf-8",
+    base_url: Optional[str] = None,
+    skip_tags: Tuple[str, ...] = ()
+) -> Dict[str, Any]:
+    """Offload entry point: raw body in, compact page payload out."""
+    html = decode_body(body, encoding) if isinstance(body, bytes) else body
+    return extract_page(html, base_url=base_url, skip_tags=skip_tags).to_payload()
+
+
+async def extract_page_async(
+    body: Union[bytes, str],
+    encoding: str = "utf-8",
+    base_url: Optional[str] = None,
+    skip_tags: Iterable[str] = ()
+) -> ExtractedPage:
+    """
+    extract_page() for async callers; large pages are parsed in the offload pool.
+
+    Args:
+        body: Raw body (from read_body_bytes_capped) or already-decoded HTML
+        encoding: Charset of a raw body
+        base_url: Used to resolve links to absolute URLs
+        skip_tags: Extra elements whose text is ignored
+    """
+    payload = await run_cpu_task("extract_page", body, encoding, base_url, tuple(skip_tags))
+    return ExtractedPage.from_payload(payload)
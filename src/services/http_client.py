@@ -6,15 +6,19 @@ import random
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Set
-from urllib.parse import urljoin, urlparse
-from urllib.robotparser import RobotFileParser
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlparse
 
 import aiohttp
 import structlog
 
 from ..core.config import HttpConfig
 from ..core.exceptions import HttpClientError, RateLimitError, CircuitBreakerOpenError
+from ..utils.rate_limiter import TokenBucketLimiter
+from .hedging import get_hedging_policy
+from .host_concurrency import get_host_concurrency
+from .http_transport import create_client_session
+from .robots import RobotsPolicy
 
 
 class CircuitBreakerState(Enum):
@@ -119,7 +123,10 @@ class HttpClient:
         self.session: Optional[aiohttp.ClientSession] = None
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         self.rate_limiter = RateLimiter(config.requests_per_minute)
-        self.robots_cache: Dict[str, bool] = {}
+        self.robots = RobotsPolicy(user_agent=config.user_agent)
+        self.host_limiters: Dict[str, TokenBucketLimiter] = {}
+        self.hedging = get_hedging_policy()
+        self.concurrency = get_host_concurrency()
         self.logger = structlog.get_logger(__name__)
         
         # Request statistics
@@ -139,6 +146,7 @@ class HttpClient:
         """Async context manager exit."""
         if self.session:
             await self.session.close()
+        self.concurrency.save()
     
     async def _create_session(self):
         """Create aiohttp session with proper configuration."""
@@ -147,15 +155,16 @@ class HttpClient:
             connect=self.config.connection_timeout
         )
         
+        # Per-host concurrency is adaptive (see host_concurrency)
         connector = aiohttp.TCPConnector(
             limit=self.config.concurrent_requests,
-            limit_per_host=2,
+            limit_per_host=0,
             ttl_dns_cache=300,
             use_dns_cache=True,
             keepalive_timeout=30
         )
         
-        self.session = aiohttp.ClientSession(
+        self.session = create_client_session(
             timeout=timeout,
             connector=connector,
             headers={'User-Agent': self.config.user_agent},
@@ -172,73 +181,33 @@ class HttpClient:
         return self.circuit_breakers[domain]
     
     async def _check_robots_txt(self, url: str) -> bool:
-        """Check if URL is allowed by robots.txt."""
+        """Check if URL is allowed by robots.txt (rules cached per origin)."""
         if not self.config.respect_robots_txt:
             return True
         
-        parsed = urlparse(url)
-        domain = f"{parsed.scheme}://{parsed.netloc}"
+        allowed = await self.robots.can_fetch(self.session, url)
+        if not allowed:
+            self.logger.info("robots_txt_disallowed", 
+                           url=url, 
+                           user_agent=self.config.user_agent)
         
-        # Check cache first
-        if domain in self.robots_cache:
-            return self.robots_cache[domain]
+        return allowed
+    
+    async def _wait_for_crawl_delay(self, url: str, domain: str):
+        """Space requests to a host by its robots.txt Crawl-delay."""
+        if not self.config.respect_robots_txt:
+            return
         
-        try:
-            robots_url = urljoin(domain, '/robots.txt')
-            
-            # Use a separate session for robots.txt to avoid infinite recursion
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.get(robots_url) as response:
-                    if response.status == 200:
-                        robots_content = await response.text()
-                        
-                        # Parse robots.txt
-                        allowed = self._parse_robots_txt(robots_content, parsed.path, self.config.user_agent)
-                        self.robots_cache[domain] = allowed
-                        
-                        if not allowed:
-                            self.logger.info("robots_txt_disallowed", 
-                                           url=url, 
-                                           user_agent=self.config.user_agent)
-                        
-                        return allowed
+        delay = await self.robots.crawl_delay(self.session, url)
+        if not delay:
+            return
         
-        except Exception as e:
-            self.logger.warning("robots_txt_check_failed", domain=domain, error=str(e))
+        limiter = self.host_limiters.get(domain)
+        if limiter is None or limiter.rate_per_second != 1.0 / delay:
+            limiter = TokenBucketLimiter(rate_per_second=1.0 / delay, burst_size=1)
+            self.host_limiters[domain] = limiter
         
-        # Default to allowed if robots.txt is unavailable
-        self.robots_cache[domain] = True
-        return True
-    
-    def _parse_robots_txt(self, content: str, path: str, user_agent: str) -> bool:
-        """Parse robots.txt content to check if path is allowed."""
-        try:
-            rp = RobotFileParser()
-            rp.set_url("http://example.com/robots.txt")  # Dummy URL
-            rp.feed(content)
-            return rp.can_fetch(user_agent, path)
-        except Exception:
-            # Fallback to simple parsing
-            user_agent_section = False
-            
-            for line in content.split('\n'):
-                line = line.strip().lower()
-                
-                if line.startswith('user-agent:'):
-                    ua = line.split(':', 1)[1].strip()
-                    user_agent_section = ua == '*' or user_agent.lower() in ua
-                
-                elif user_agent_section and line.startswith('disallow:'):
-                    disallow_path = line.split(':', 1)[1].strip()
-                    if disallow_path == '/' or path.startswith(disallow_path):
-                        return False
-            
-            return True
-    
-    async def _add_request_jitter(self):
-        """Add random jitter to prevent thundering herd."""
-        jitter = 0.1 + (random.random() * 0.5)  # 0.1-0.6 seconds
-        await asyncio.sleep(jitter)
+        await limiter.wait()
     
     async def get(self, url: str, **kwargs) -> Optional[aiohttp.ClientResponse]:
         """Make a GET request with full resilience patterns."""
@@ -258,28 +227,34 @@ class HttpClient:
             self.logger.info("request_blocked_by_robots", url=url)
             return None
         
-        # Rate limiting
-        await self.rate_limiter.wait_for_token()
+        # Request-rate politeness is for websites; provider APIs are paced by
+        # their adaptive concurrency limit (and their own quota limiters)
+        if not self.concurrency.is_api_host(domain):
+            await self.rate_limiter.wait_for_token()
+            await self._wait_for_crawl_delay(url, domain)
         
-        # Add jitter
-        await self._add_request_jitter()
+        async def send():
+            async with self.concurrency.slot(url) as slot:
+                self.stats['requests_made'] += 1
+                async with self.session.get(url, **kwargs) as response:
+                    slot.observe(response.status, response.headers.get('Retry-After'))
+                    return response
         
-        # Make request with retries
+        # Make request with retries; a slow attempt is hedged instead of
+        # waiting out the timeout (retries back off with jitter)
         last_exception = None
         
         for attempt in range(self.config.max_retries + 1):
             try:
-                self.stats['requests_made'] += 1
+                response = await self.hedging.run(url, send)
+                circuit_breaker.record_success()
                 
-                async with self.session.get(url, **kwargs) as response:
-                    circuit_breaker.record_success()
-                    
-                    self.logger.info("http_request_success", 
-                                   url=url,
-                                   status=response.status,
-                                   attempt=attempt + 1)
-                    
-                    return response
+                self.logger.info("http_request_success", 
+                               url=url,
+                               status=response.status,
+                               attempt=attempt + 1)
+                
+                return response
                     
             except Exception as e:
                 last_exception = e
@@ -300,6 +275,7 @@ class HttpClient:
         # All retries failed
         raise HttpClientError(f"Request failed after {self.config.max_retries + 1} attempts: {last_exception}")
     
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> Dict[str, Any]:
         """Get client statistics."""
-        return self.stats.copy()
\ No newline at end of file
+        return {**self.stats, 'robots': self.robots.get_stats(), 'hedging': self.hedging.get_stats(),
+                'concurrency': self.concurrency.get_stats()}
\ No newline at end of file
@@ -0,0 +1,514 @@
+"""
+Pluggable HTTP transport with record/replay cassettes.
+
+Every source and enricher creates its aiohttp sessions through
+``create_client_session()``. With the transport in ``live`` mode (the default)
+that is a plain ``aiohttp.ClientSession``. In ``record`` or ``replay`` mode it is
+a ``CassetteSession`` that stores responses in a local SQLite cassette store
+(zlib-compressed bodies, keyed by a normalized request) and serves them back
+with optional simulated latency.
+
+Modes:
+- live: real network calls, nothing recorded
+- record: real network calls, every response is written to the cassette store
+- replay: responses come from the cassette store; misses either raise
+  ``CassetteMissError`` (on_miss="fail") or go to the network and are recorded
+  (on_miss="passthrough")
+
+Configured from the HTTP_CASSETTE_* settings, or programmatically:
+    >>> configure_transport(mode="replay", store_path="data/cassettes.db")
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+import structlog
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from ..core.exceptions import HttpClientError
+
+logger = structlog.get_logger(__name__)
+
+
+TRANSPORT_MODES = ("live", "record", "replay")
+MISS_POLICIES = ("fail", "passthrough")
+
+# Query/body parameters stripped from cassette keys so recordings never hold
+# credentials and survive key rotation.
+SECRET_PARAMS = {"apikey", "api_key", "key", "token", "access_token", "client_secret"}
+
+# Request headers that change the response and therefore belong in the key.
+KEYED_HEADERS = {"x-goog-fieldmask", "accept", "accept-language"}
+
+
+class CassetteMissError(HttpClientError):
+    """Raised in replay mode when a request has no recorded response."""
+    pass
+
+
+@dataclass
+class TransportSettings:
+    """Active transport configuration."""
+    mode: str = "live"
+    store_path: str = "data/http_cassettes.db"
+    on_miss: str = "fail"
+    latency_ms: float = 0.0
+    latency_scale: float = 0.0
+
+    def __post_init__(self):
+        if self.mode not in TRANSPORT_MODES:
+            raise ValueError(f"Transport mode must be one of: {TRANSPORT_MODES}")
+        if self.on_miss not in MISS_POLICIES:
+            raise ValueError(f"Cassette miss policy must be one of: {MISS_POLICIES}")
+
+
+@dataclass
+class RecordedResponse:
+    """A response as stored in the cassette."""
+    status: int
+    reason: str
+    url: str
+    headers: Dict[str, str]
+    body: bytes
+    elapsed_ms: float
+
+
+def normalize_request(
+    method: str,
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+    data: Any = None,
+    json_body: Any = None,
+    headers: Optional[Mapping[str, str]] = None
+) -> str:
+    """
+    Build the canonical form of a request used for cassette keys.
+
+    Lowercases scheme and host, drops fragments, merges ``params`` into the
+    query string, sorts query and body parameters, and removes credentials.
+
+    Example:
+        >>> normalize_request("get", "HTTPS://Example.com/a?b=2&a=1&apiKey=x")
+        'GET https://example.com/a?a=1&b=2'
+    """
+    parts = urlsplit(url)
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in SECRET_PARAMS
+    ]
+    if params:
+        query.extend(
+            (str(k), str(v)) for k, v in dict(params).items()
+            if str(k).lower() not in SECRET_PARAMS
+        )
+    path = parts.path or "/"
+    canonical_url = urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ""
+    ))
+
+    canonical = f"{method.upper()} {canonical_url}"
+
+    if json_body is not None:
+        canonical += " json=" + json.dumps(json_body, sort_keys=True, separators=(",", ":"))
+    elif isinstance(data, Mapping):
+        form = sorted((str(k), str(v)) for k, v in data.items() if str(k).lower() not in SECRET_PARAMS)
+        canonical += " form=" + urlencode(form)
+    elif isinstance(data, (bytes, str)):
+        raw = data.encode() if isinstance(data, str) else data
+        canonical += " body=" + hashlib.sha256(raw).hexdigest()
+
+    if headers:
+        keyed = sorted(
+            (k.lower(), str(v)) for k, v in headers.items() if k.lower() in KEYED_HEADERS
+        )
+        if keyed:
+            canonical += " headers=" + urlencode(keyed)
+
+    return canonical
+
+
+def cassette_key(canonical_request: str) -> str:
+    """Hash a normalized request into a cassette key."""
+    return hashlib.sha256(canonical_request.encode()).hexdigest()
+
+
+class CassetteStore:
+    """SQLite-backed store of recorded HTTP responses."""
+
+    def __init__(self, db_path: str = "data/http_cassettes.db"):
+        """
+        Initialize cassette store.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Schema:
+            - key: TEXT PRIMARY KEY (sha256 of normalized request)
+            - request: TEXT (normalized request, for inspection)
+            - body: BLOB (zlib-compressed response body)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "recorded": 0,
+            "bytes_raw": 0,
+            "bytes_stored": 0
+        }
+
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cassette (
+                    key TEXT PRIMARY KEY,
+                    request TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    reason TEXT,
+                    url TEXT NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    elapsed_ms REAL NOT NULL,
+                    recorded_at INTEGER NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def get(self, key: str) -> Optional[RecordedResponse]:
+        """Get a recorded response, or None if the request was never recorded."""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT status, reason, url, headers, body, elapsed_ms FROM cassette WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        status, reason, url, headers_json, body, elapsed_ms = row
+        return RecordedResponse(
+            status=status,
+            reason=reason or "",
+            url=url,
+            headers=json.loads(headers_json),
+            body=zlib.decompress(body),
+            elapsed_ms=elapsed_ms
+        )
+
+    def put(self, key: str, request: str, response: RecordedResponse):
+        """Record (or overwrite) the response for a request."""
+        compressed = zlib.compress(response.body, 6)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO cassette
+                (key, request, status, reason, url, headers, body, elapsed_ms, recorded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key, request, response.status, response.reason, response.url,
+                    json.dumps(response.headers), compressed, response.elapsed_ms,
+                    int(time.time())
+                )
+            )
+            conn.commit()
+
+        self.stats["recorded"] += 1
+        self.stats["bytes_raw"] += len(response.body)
+        self.stats["bytes_stored"] += len(compressed)
+        logger.debug("cassette_recorded", request=request, status=response.status)
+
+    def count(self) -> int:
+        """Number of recorded responses."""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM cassette").fetchone()[0]
+
+    def clear(self):
+        """Delete all recordings."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM cassette")
+            conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics including compression ratio."""
+        stats = dict(self.stats)
+        stats["compression_ratio"] = (
+            stats["bytes_stored"] / stats["bytes_raw"] if stats["bytes_raw"] else 0.0
+        )
+        stats["total_entries"] = self.count()
+        return stats
+
+
+class CassetteResponse:
+    """
+    Replayed response exposing the parts of ``aiohttp.ClientResponse`` the
+    sources and enrichers use (status, headers, url, text/json/read).
+    """
+
+    def __init__(self, recorded: RecordedResponse, method: str = "GET",
+                 request_url: Optional[str] = None,
+                 request_headers: Optional[Mapping[str, str]] = None):
+        self.status = recorded.status
+        self.reason = recorded.reason
+        self.method = method
+        self.url = URL(recorded.url)
+        self.headers = CIMultiDictProxy(CIMultiDict(recorded.headers))
+        self.request_info = aiohttp.RequestInfo(
+            url=URL(request_url) if request_url else self.url,
+            method=method,
+            headers=CIMultiDictProxy(CIMultiDict(request_headers or {})),
+            real_url=self.url
+        )
+        self._body = recorded.body
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "application/octet-stream").split(";")[0].strip()
+
+    @property
+    def charset(self) -> Optional[str]:
+        for part in self.headers.get("Content-Type", "").split(";")[1:]:
+            name, _, value = part.strip().partition("=")
+            if name.lower() == "charset":
+                return value.strip('"') or None
+        return None
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: Optional[str] = None, errors: str = "strict") -> str:
+        return self._body.decode(encoding or self.charset or "utf-8", errors)
+
+    async def json(self, *, encoding: Optional[str] = None, loads=json.loads,
+                   content_type: Optional[str] = "application/json") -> Any:
+        if not self._body.strip():
+            return None
+        return loads(self._body.decode(encoding or self.charset or "utf-8"))
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise aiohttp.ClientResponseError(
+                request_info=self.request_info,
+                history=(),
+                status=self.status,
+                message=self.reason,
+                headers=self.headers
+            )
+
+    def release(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class _CassetteRequest:
+    """Awaitable / async-context-manager wrapper, like aiohttp's request context."""
+
+    def __init__(self, coro):
+        self._coro = coro
+        self._response: Optional[CassetteResponse] = None
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self) -> CassetteResponse:
+        self._response = await self._coro
+        return self._response
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._response is not None:
+            self._response.release()
+
+
+class CassetteSession:
+    """
+    Drop-in replacement for ``aiohttp.ClientSession`` that records or replays.
+
+    The underlying live session is only created when a request actually has to
+    go to the network, so pure replay runs never open a connection.
+    """
+
+    def __init__(
+        self,
+        settings: TransportSettings,
+        store: Optional[CassetteStore] = None,
+        **session_kwargs
+    ):
+        self.settings = settings
+        self.store = store or CassetteStore(settings.store_path)
+        self._session_kwargs = session_kwargs
+        self._live: Optional[aiohttp.ClientSession] = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _live_session(self) -> aiohttp.ClientSession:
+        if self._live is None:
+            self._live = aiohttp.ClientSession(**self._session_kwargs)
+        return self._live
+
+    def request(self, method: str, url: str, **kwargs) -> _CassetteRequest:
+        return _CassetteRequest(self._request(method, str(url), **kwargs))
+
+    def get(self, url: str, **kwargs) -> _CassetteRequest:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> _CassetteRequest:
+        return self.request("POST", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> _CassetteRequest:
+        return self.request("HEAD", url, **kwargs)
+
+    async def _request(self, method: str, url: str, **kwargs) -> CassetteResponse:
+        canonical = normalize_request(
+            method,
+            url,
+            params=kwargs.get("params"),
+            data=kwargs.get("data"),
+            json_body=kwargs.get("json"),
+            headers=kwargs.get("headers")
+        )
+        key = cassette_key(canonical)
+
+        if self.settings.mode == "replay":
+            recorded = self.store.get(key)
+            if recorded is not None:
+                delay = self.settings.latency_ms + recorded.elapsed_ms * self.settings.latency_scale
+                if delay > 0:
+                    await asyncio.sleep(delay / 1000)
+                logger.debug("cassette_replayed", request=canonical, status=recorded.status)
+                return CassetteResponse(recorded, method, url, kwargs.get("headers"))
+
+            if self.settings.on_miss == "fail":
+                logger.warning("cassette_miss", request=canonical)
+                raise CassetteMissError(f"No cassette recording for {canonical}")
+
+            logger.info("cassette_miss_passthrough", request=canonical)
+
+        recorded = await self._fetch_live(method, url, **kwargs)
+        self.store.put(key, canonical, recorded)
+        return CassetteResponse(recorded, method, url, kwargs.get("headers"))
+
+    async def _fetch_live(self, method: str, url: str, **kwargs) -> RecordedResponse:
+        start = time.perf_counter()
+        async with self._live_session().request(method, url, **kwargs) as response:
+            body = await response.read()
+            return RecordedResponse(
+                status=response.status,
+                reason=response.reason or "",
+                url=str(response.url),
+                headers={k: v for k, v in response.headers.items()},
+                body=body,
+                elapsed_ms=(time.perf_counter() - start) * 1000
+            )
+
+    async def close(self):
+        self._closed = True
+        if self._live is not None:
+            await self._live.close()
+        elif self._session_kwargs.get("connector") is not None:
+            await self._session_kwargs["connector"].close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+# ==================== Transport Configuration ====================
+_settings: Optional[TransportSettings] = None
+_stores: Dict[str, CassetteStore] = {}
+
+
+def _settings_from_config() -> TransportSettings:
+    from ..core.config import config
+
+    return TransportSettings(
+        mode=config.HTTP_CASSETTE_MODE,
+        store_path=config.HTTP_CASSETTE_PATH,
+        on_miss=config.HTTP_CASSETTE_ON_MISS,
+        latency_ms=config.HTTP_CASSETTE_LATENCY_MS,
+        latency_scale=config.HTTP_CASSETTE_LATENCY_SCALE
+    )
+
+
+def get_transport_settings() -> TransportSettings:
+    """Get the active transport settings (loaded from config on first use)."""
+    global _settings
+    if _settings is None:
+        _settings = _settings_from_config()
+    return _settings
+
+
+def configure_transport(**overrides) -> TransportSettings:
+    """
+    Override transport settings for this process.
+
+    Example:
+        >>> configure_transport(mode="replay", on_miss="passthrough", latency_ms=20)
+    """
+    global _settings
+    current = get_transport_settings()
+    _settings = TransportSettings(**{**current.__dict__, **overrides})
+    logger.info("http_transport_configured", **_settings.__dict__)
+    return _settings
+
+
+def reset_transport():
+    """Drop overrides and cached stores; settings reload from config on next use."""
+    global _settings
+    _settings = None
+    _stores.clear()
+
+
+def get_cassette_store(path: Optional[str] = None) -> CassetteStore:
+    """Get the shared cassette store for a path (defaults to the configured one)."""
+    path = path or get_transport_settings().store_path
+    if path not in _stores:
+        _stores[path] = CassetteStore(path)
+    return _stores[path]
+
+
+def create_client_session(**session_kwargs):
+    """
+    Create an HTTP session honouring the configured transport mode.
+
+    Accepts the same keyword arguments as ``aiohttp.ClientSession``.
+
+    Returns:
+        aiohttp.ClientSession in live mode, CassetteSession otherwise
+    """
+    settings = get_transport_settings()
+    if settings.mode == "live":
+        return aiohttp.ClientSession(**session_kwargs)
+    return CassetteSession(settings, store=get_cassette_store(settings.store_path), **session_kwargs)
@@ -0,0 +1,490 @@
+"""
+Incremental revalidation driven by evidence and validation version.
+
+Every gate result is stored with a hash of the inputs it was computed from
+(business columns, observation ids/values, place types) and a hash of the rule
+itself (gate source + the config it reads). On revalidation only gates whose
+inputs or rule changed are re-run; everything else reuses the stored result.
+Whenever the rule hashes change, a new row is added to validation_versions
+with the config snapshot, so exports can be traced to the rules they passed.
+
+Gate outcomes are combined with the same short-circuit semantics as
+ValidationService.validate_business().
+
+Usage:
+    revalidator = IncrementalRevalidator(service)
+    report = await revalidator.revalidate(db)
+    print(report.summary())
+"""
+import hashlib
+import inspect
+import json
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from ..core.evidence import Observation
+from ..core.rules import (
+    CATEGORY_BLACKLIST,
+    GEO_CONFIG,
+    NAME_BLACKLIST_PATTERNS,
+    REVIEW_REQUIRED_CATEGORIES,
+    TARGET_WHITELIST,
+)
+from .new_validation_service import ValidationService
+
+logger = structlog.get_logger(__name__)
+
+
+VALIDATION_INPUTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS validation_inputs (
+    business_id INTEGER NOT NULL,
+    rule_id TEXT NOT NULL,
+    rule_hash TEXT NOT NULL,
+    inputs_hash TEXT NOT NULL,
+    observation_ids TEXT,
+    validation_version INTEGER NOT NULL,
+    passed BOOLEAN NOT NULL,
+    reason TEXT,
+    action TEXT,
+    validated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (business_id, rule_id),
+    FOREIGN KEY(business_id) REFERENCES businesses(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_validation_inputs_rule ON validation_inputs(rule_id, rule_hash);
+"""
+
+# Statuses produced by validation; other statuses haven't reached the gates yet
+VALIDATED_STATUSES = ('QUALIFIED', 'EXCLUDED', 'REVIEW_REQUIRED')
+
+# Dirty reasons
+DIRTY_NEW = 'new'
+DIRTY_INPUTS = 'inputs_changed'
+DIRTY_RULE = 'rule_changed'
+
+
+@dataclass(frozen=True)
+class GateSpec:
+    """Declaration of a gate and the inputs it depends on."""
+    rule_id: str
+    method: str  # ValidationService method name
+    business_fields: Tuple[str, ...] = ()
+    observation_fields: Tuple[str, ...] = ()
+    uses_place_types: bool = False
+    rule_config: Any = None
+    # action -> final status for failures that stop validation
+    terminal: Dict[Optional[str], str] = field(default_factory=dict)
+
+
+_REVIEW_OR_EXCLUDE = {'REVIEW_REQUIRED': 'REVIEW_REQUIRED', 'AUTO_EXCLUDE': 'EXCLUDED'}
+
+# Order and stop semantics mirror ValidationService.validate_business()
+GATE_SPECS: List[GateSpec] = [
+    GateSpec(
+        'category_gate', 'category_gate',
+        business_fields=('name', 'industry'),
+        uses_place_types=True,
+        rule_config={
+            'whitelist': sorted(TARGET_WHITELIST),
+            'blacklist': sorted(CATEGORY_BLACKLIST),
+            'name_patterns': NAME_BLACKLIST_PATTERNS,
+            'review': REVIEW_REQUIRED_CATEGORIES,
+        },
+        terminal=_REVIEW_OR_EXCLUDE
+    ),
+    GateSpec(
+        'geo_gate', 'geo_gate',
+        business_fields=('latitude', 'longitude', 'city'),
+        rule_config=GEO_CONFIG,
+        terminal={'AUTO_EXCLUDE': 'EXCLUDED'}
+    ),
+    *[
+        GateSpec(
+            f'corroboration_{obs_field}', 'corroboration_gate',
+            observation_fields=(obs_field,),
+            rule_config={'field': obs_field},
+            terminal={'REVIEW_REQUIRED': 'REVIEW_REQUIRED'}
+        )
+        for obs_field in ('address', 'phone', 'postal_code')
+    ],
+    GateSpec(
+        'employee_gate', 'employee_gate',
+        business_fields=('employee_count',),
+        terminal=_REVIEW_OR_EXCLUDE
+    ),
+    GateSpec(
+        'website_gate', 'website_gate',
+        business_fields=('website_ok', 'website_age_years'),
+        terminal=_REVIEW_OR_EXCLUDE
+    ),
+    GateSpec(
+        'revenue_gate', 'revenue_gate',
+        business_fields=('revenue_estimate', 'employee_count'),
+        observation_fields=('revenue_midpoint', 'revenue_estimate'),
+        terminal={None: 'EXCLUDED', 'REVIEW_REQUIRED': 'EXCLUDED', 'AUTO_EXCLUDE': 'EXCLUDED'}
+    ),
+]
+
+
+def _digest(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+def rule_hash(service: ValidationService, spec: GateSpec) -> str:
+    """
+    Hash of a gate's implementation and configuration.
+
+    Covers the gate method source (including its default thresholds) and
+    the rule config it reads, so editing either marks the gate dirty.
+    """
+    method = getattr(type(service), spec.method)
+    try:
+        source = inspect.getsource(method)
+    except (OSError, TypeError):
+        source = method.__qualname__
+    return _digest({'rule_id': spec.rule_id, 'source': source, 'config': spec.rule_config})
+
+
+@dataclass
+class GateResult:
+    """Stored or freshly computed gate outcome."""
+    passed: bool
+    reason: str
+    action: Optional[str]
+
+
+@dataclass
+class DirtySetReport:
+    """What an incremental revalidation had to recompute and what it reused."""
+    validation_version: int
+    dry_run: bool = False
+    businesses_total: int = 0
+    businesses_dirty: int = 0
+    businesses_skipped_override: int = 0
+    gates_rerun: int = 0
+    gates_reused: int = 0
+    gates_not_reached: int = 0
+    dirty_by_rule: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    status_changes: List[Tuple[int, str, str]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def gates_total(self) -> int:
+        return self.gates_rerun + self.gates_reused
+
+    @property
+    def work_skipped_pct(self) -> float:
+        """Share of evaluated gates served from stored results."""
+        if self.gates_total == 0:
+            return 0.0
+        return self.gates_reused / self.gates_total * 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'validation_version': self.validation_version,
+            'dry_run': self.dry_run,
+            'businesses_total': self.businesses_total,
+            'businesses_dirty': self.businesses_dirty,
+            'businesses_skipped_override': self.businesses_skipped_override,
+            'gates_rerun': self.gates_rerun,
+            'gates_reused': self.gates_reused,
+            'gates_not_reached': self.gates_not_reached,
+            'work_skipped_pct': round(self.work_skipped_pct, 1),
+            'dirty_by_rule': {rule: dict(reasons) for rule, reasons in self.dirty_by_rule.items()},
+            'status_changes': len(self.status_changes),
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+        }
+
+    def summary(self) -> str:
+        lines = [
+            f"Validation version: {self.validation_version}{' (dry run)' if self.dry_run else ''}",
+            f"Businesses: {self.businesses_total} total, {self.businesses_dirty} dirty, "
+            f"{self.businesses_skipped_override} manual overrides skipped",
+            f"Gates: {self.gates_rerun} re-run, {self.gates_reused} reused "
+            f"({self.work_skipped_pct:.1f}% skipped), {self.gates_not_reached} not reached",
+            f"Status changes: {len(self.status_changes)}",
+        ]
+        for rule_id, reasons in sorted(self.dirty_by_rule.items()):
+            detail = ', '.join(f"{reason}={count}" for reason, count in sorted(reasons.items()))
+            lines.append(f"  {rule_id:<28} {detail}")
+        lines.append(f"Elapsed: {self.elapsed_seconds:.2f}s")
+        return '\n'.join(lines)
+
+
+class IncrementalRevalidator:
+    """
+    Re-runs only the gates whose evidence or rules changed since the last run.
+    """
+
+    def __init__(self, service: Optional[ValidationService] = None, specs: Optional[Sequence[GateSpec]] = None):
+        self.service = service or ValidationService()
+        self.specs = list(GATE_SPECS if specs is None else specs)
+        self.rule_hashes = {spec.rule_id: rule_hash(self.service, spec) for spec in self.specs}
+        self.logger = logger
+
+    async def ensure_schema(self, db):
+        """Create the validation_inputs table if missing."""
+        await db.executescript(VALIDATION_INPUTS_SCHEMA)
+        await db.commit()
+
+    async def ensure_validation_version(self, db, dry_run: bool = False) -> int:
+        """
+        Return the validation version for the current rule hashes.
+
+        A new validation_versions row is recorded when any rule hash differs
+        from the latest snapshot.
+        """
+        cursor = await db.execute(
+            "SELECT version, config_snapshot FROM validation_versions ORDER BY version DESC LIMIT 1"
+        )
+        row = await cursor.fetchone()
+        latest_version = row[0] if row else 0
+        latest_hashes = {}
+        if row and row[1]:
+            try:
+                latest_hashes = json.loads(row[1]).get('rule_hashes', {})
+            except (ValueError, AttributeError):
+                latest_hashes = {}
+
+        if latest_hashes == self.rule_hashes:
+            return latest_version
+
+        version = latest_version + 1
+        if dry_run:
+            return version
+
+        changed = sorted(r for r, h in self.rule_hashes.items() if latest_hashes.get(r) != h)
+        await db.execute(
+            "INSERT INTO validation_versions (version, description, config_snapshot) VALUES (?, ?, ?)",
+            (
+                version,
+                f"Rule inputs changed: {', '.join(changed)}",
+                json.dumps({'rule_hashes': self.rule_hashes}, sort_keys=True)
+            )
+        )
+        await db.commit()
+        self.logger.info("validation_version_created", version=version, changed_rules=changed)
+        return version
+
+    async def _load_businesses(self, db, business_ids: Optional[Sequence[int]], statuses: Sequence[str]) -> List[dict]:
+        if business_ids is not None:
+            placeholders = ','.join('?' * len(business_ids))
+            cursor = await db.execute(f"SELECT * FROM businesses WHERE id IN ({placeholders})", tuple(business_ids))
+        else:
+            placeholders = ','.join('?' * len(statuses))
+            cursor = await db.execute(f"SELECT * FROM businesses WHERE status IN ({placeholders})", tuple(statuses))
+        columns = [d[0] for d in cursor.description]
+        return [dict(zip(columns, row)) for row in await cursor.fetchall()]
+
+    async def _load_observations(self, db, business_ids: Sequence[int]) -> Dict[int, List[dict]]:
+        """Load all observations for the batch in one query, grouped by business."""
+        grouped: Dict[int, List[dict]] = defaultdict(list)
+        if not business_ids:
+            return grouped
+        placeholders = ','.join('?' * len(business_ids))
+        cursor = await db.execute(
+            f"""SELECT id, business_id, source_url, field, value, confidence
+                FROM observations WHERE business_id IN ({placeholders})
+                ORDER BY business_id, id""",
+            tuple(business_ids)
+        )
+        for row in await cursor.fetchall():
+            grouped[row[1]].append({
+                'id': row[0], 'business_id': row[1], 'source_url': row[2],
+                'field': row[3], 'value': row[4], 'confidence': row[5]
+            })
+        return grouped
+
+    async def _load_stored(self, db, business_ids: Sequence[int]) -> Dict[Tuple[int, str], dict]:
+        if not business_ids:
+            return {}
+        placeholders = ','.join('?' * len(business_ids))
+        cursor = await db.execute(
+            f"""SELECT business_id, rule_id, rule_hash, inputs_hash, passed, reason, action
+                FROM validation_inputs WHERE business_id IN ({placeholders})""",
+            tuple(business_ids)
+        )
+        return {
+            (row[0], row[1]): {
+                'rule_hash': row[2], 'inputs_hash': row[3],
+                'result': GateResult(bool(row[4]), row[5], row[6])
+            }
+            for row in await cursor.fetchall()
+        }
+
+    @staticmethod
+    def _place_types(observations: List[dict]) -> List[str]:
+        for obs in observations:
+            if obs['field'] == 'place_types':
+                return obs['value'].split(',') if obs['value'] else []
+        return []
+
+    def gate_inputs(self, spec: GateSpec, business: dict, observations: List[dict]) -> Tuple[str, List[int]]:
+        """
+        Hash of the inputs a gate reads for one business.
+
+        Returns:
+            (inputs_hash, observation_ids)
+        """
+        field_obs = [o for o in observations if o['field'] in spec.observation_fields]
+        payload = {
+            'business': {name: business.get(name) for name in spec.business_fields},
+            'observations': [(o['id'], o['field'], o['value'], o['confidence']) for o in field_obs],
+        }
+        if spec.uses_place_types:
+            payload['place_types'] = self._place_types(observations)
+        return _digest(payload), [o['id'] for o in field_obs]
+
+    def classify(self, spec: GateSpec, stored: Optional[dict], inputs_hash: str) -> Optional[str]:
+        """Dirty reason for a gate, or None if its stored result is reusable."""
+        if stored is None:
+            return DIRTY_NEW
+        if stored['rule_hash'] != self.rule_hashes[spec.rule_id]:
+            return DIRTY_RULE
+        if stored['inputs_hash'] != inputs_hash:
+            return DIRTY_INPUTS
+        return None
+
+    async def _run_gate(self, db, spec: GateSpec, business: dict, observations: List[dict]) -> GateResult:
+        method = getattr(self.service, spec.method)
+        if spec.method == 'category_gate':
+            passed, reason, action = method(business, self._place_types(observations))
+        elif spec.method == 'corroboration_gate':
+            obs_objects = [
+                Observation(
+                    business_id=o['business_id'], source_url=o['source_url'], field=o['field'],
+                    value=o['value'], confidence=o['confidence']
+                )
+                for o in observations if o['field'] in spec.observation_fields
+            ]
+            passed, reason, action = method(obs_objects, spec.observation_fields[0])
+        elif spec.method == 'revenue_gate':
+            passed, reason, action = await method(db, business, business['id'])
+        else:
+            passed, reason, action = method(business)
+        return GateResult(passed, reason, action)
+
+    async def revalidate(
+        self,
+        db,
+        business_ids: Optional[Sequence[int]] = None,
+        statuses: Sequence[str] = VALIDATED_STATUSES,
+        dry_run: bool = False,
+        batch_size: int = 500
+    ) -> DirtySetReport:
+        """
+        Revalidate businesses, re-running only dirty gates.
+
+        Args:
+            db: aiosqlite connection with row_factory = aiosqlite.Row
+            business_ids: Specific businesses (default: all with a validated status)
+            statuses: Statuses to revalidate when business_ids is not given
+            dry_run: Report the dirty set without re-running gates or writing
+            batch_size: Businesses loaded and committed per batch
+
+        Returns:
+            DirtySetReport
+        """
+        start = time.perf_counter()
+        await self.ensure_schema(db)
+        version = await self.ensure_validation_version(db, dry_run=dry_run)
+        report = DirtySetReport(validation_version=version, dry_run=dry_run)
+
+        businesses = await self._load_businesses(db, business_ids, statuses)
+        report.businesses_total = len(businesses)
+
+        for offset in range(0, len(businesses), batch_size):
+            batch = businesses[offset:offset + batch_size]
+            ids = [b['id'] for b in batch]
+            observations = await self._load_observations(db, ids)
+            stored = await self._load_stored(db, ids)
+            input_rows = []
+
+            for business in batch:
+                if business.get('manual_override'):
+                    report.businesses_skipped_override += 1
+                    continue
+                await self._revalidate_one(
+                    db, business, observations.get(business['id'], []), stored, version,
+                    report, input_rows, dry_run
+                )
+
+            if not dry_run and input_rows:
+                await db.executemany(
+                    """INSERT OR REPLACE INTO validation_inputs
+                    (business_id, rule_id, rule_hash, inputs_hash, observation_ids,
+                     validation_version, passed, reason, action, validated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    input_rows
+                )
+                await db.executemany(
+                    """INSERT INTO validations (business_id, rule_id, passed, reason, evidence_ids, validated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)""",
+                    [(r[0], r[1], r[6], r[7], r[4], r[9]) for r in input_rows]
+                )
+                await db.commit()
+
+        report.elapsed_seconds = time.perf_counter() - start
+        self.logger.info("incremental_revalidation_complete", **report.to_dict())
+        return report
+
+    async def _revalidate_one(self, db, business, observations, stored, version, report, input_rows, dry_run):
+        business_id = business['id']
+        status = 'QUALIFIED'
+        deciding = None
+        dirty = False
+        stopped = False
+
+        for index, spec in enumerate(self.specs):
+            if stopped:
+                report.gates_not_reached += len(self.specs) - index
+                break
+
+            inputs_hash, observation_ids = self.gate_inputs(spec, business, observations)
+            previous = stored.get((business_id, spec.rule_id))
+            reason = self.classify(spec, previous, inputs_hash)
+
+            if reason is None:
+                result = previous['result']
+                report.gates_reused += 1
+            else:
+                dirty = True
+                report.dirty_by_rule[spec.rule_id][reason] += 1
+                if dry_run:
+                    # Outcome unknown without running; assume the gate passes
+                    report.gates_rerun += 1
+                    continue
+                result = await self._run_gate(db, spec, business, observations)
+                report.gates_rerun += 1
+                input_rows.append((
+                    business_id, spec.rule_id, self.rule_hashes[spec.rule_id], inputs_hash,
+                    json.dumps(observation_ids), version, result.passed, result.reason,
+                    result.action, datetime.utcnow().isoformat()
+                ))
+
+            if not result.passed and result.action in spec.terminal:
+                status = spec.terminal[result.action]
+                deciding = (spec.rule_id, result.reason)
+                stopped = True
+
+        if dirty:
+            report.businesses_dirty += 1
+        if dry_run or not dirty or status == business['status']:
+            return
+
+        report.status_changes.append((business_id, business['status'], status))
+        await db.execute(
+            "UPDATE businesses SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (status, business_id)
+        )
+        if status == 'EXCLUDED':
+            rule_id, reason = deciding
+            await db.execute(
+                "INSERT INTO exclusions (business_id, rule_id, reason, excluded_at) VALUES (?, ?, ?, ?)",
+                (business_id, rule_id, reason, datetime.utcnow().isoformat())
+            )
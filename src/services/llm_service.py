@@ -16,7 +16,6 @@ import json
 import time
 from typing import Optional, Dict
 import structlog
-from openai import AsyncOpenAI, OpenAIError
 from pydantic import ValidationError
 
 from ..core.config import config
@@ -68,6 +67,8 @@ class LLMExtractionService:
             logger.warning("openai_api_key_not_configured")
             self.client = None
         else:
+            # Imported here so modules that never call the LLM don't pay for openai at startup
+            from openai import AsyncOpenAI
             self.client = AsyncOpenAI(api_key=self.api_key)
 
         # Metrics tracking
@@ -175,6 +176,8 @@ class LLMExtractionService:
         Returns:
             Response dict or None
         """
+        from openai import OpenAIError
+
         # Get rate limiter for OpenAI
         limiter = get_limiter("openai")
 
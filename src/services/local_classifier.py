@@ -0,0 +1,469 @@
+"""
+Local business-type classifier (offline tier in front of the LLM).
+
+Trained on our own history from the evidence tables (business name +
+industry), it answers most classifications locally and leaves only the
+ambiguous ones for the LLM. Businesses the category gate excluded are the
+negatives; QUALIFIED and EXPORTED businesses are the positives.
+
+Two parts:
+- Logistic regression over hashed word/bigram/char-trigram features of the
+  name and categories, with Platt scaling fitted on out-of-fold scores so the
+  confidence it reports is calibrated.
+- A nearest-neighbour index over known businesses; a near-identical name with
+  a recorded outcome is answered directly from history.
+
+Pure Python and dependency-free; a prediction is a few dict lookups.
+
+Usage:
+    python -m src.services.local_classifier train --db data/leads.db
+    python -m src.services.local_classifier predict "Stoney Creek Esso"
+
+    >>> classifier = LocalBusinessClassifier.load("data/local_classifier.json")
+    >>> prediction = classifier.predict("Hamilton Metal Fabrication", business_categories("manufacturing"))
+    >>> prediction.label, prediction.confidence
+    ('QUALIFIED', 0.94)
+"""
+
+import json
+import math
+import random
+import re
+import sqlite3
+import time
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+LABEL_QUALIFIED = 'QUALIFIED'
+LABEL_EXCLUDED = 'EXCLUDED'
+LABELS = (LABEL_QUALIFIED, LABEL_EXCLUDED)
+
+# Statuses counted as QUALIFIED when reading history (exported leads qualified first)
+QUALIFIED_STATUSES = (LABEL_QUALIFIED, 'EXPORTED')
+
+# Only exclusions by this rule are business-type negatives; other rules
+# (distance, revenue, duplicates...) say nothing about the business type
+CATEGORY_GATE_RULE = 'category_gate'
+
+DEFAULT_BUCKETS = 2 ** 18
+MODEL_VERSION = 2
+
+# Nearest neighbour at or above this cosine similarity decides on its own
+NEIGHBOUR_MATCH_SIMILARITY = 0.92
+
+# Name tokens shared by more than this share of known businesses ("hamilton",
+# "inc") are not used to find neighbour candidates
+MAX_TOKEN_DOC_SHARE = 0.05
+
+# Rarest name tokens a neighbour candidate must share
+CANDIDATE_TOKENS = 2
+
+TOKEN_RE = re.compile(r"[a-z0-9&']+")
+
+
+def _bucket(gram: str, n_buckets: int) -> int:
+    # crc32 rather than hash(): stable across processes, so saved models stay valid
+    return zlib.crc32(gram.encode('utf-8')) % n_buckets
+
+
+def _name_tokens(name: str) -> List[str]:
+    return TOKEN_RE.findall((name or '').lower())
+
+
+def business_categories(industry: Optional[str]) -> List[str]:
+    """
+    Category inputs of a business, built the same way for training and prediction.
+
+    Only the industry is used: stored history has Google place types while
+    live leads carry Yellow Pages categories, and features from one
+    vocabulary never fire on the other.
+    """
+    return [industry] if industry and industry.strip() else []
+
+
+def extract_features(name: str, categories: Sequence[str] = (),
+                     n_buckets: int = DEFAULT_BUCKETS) -> Dict[int, float]:
+    """
+    Hashed, L2-normalized n-gram features of a business.
+
+    Word unigrams/bigrams and character trigrams of the name, plus one feature
+    per category (see business_categories()).
+    """
+    tokens = _name_tokens(name)
+    grams = [f"w:{t}" for t in tokens]
+    grams += [f"b:{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    padded = f" {' '.join(tokens)} "
+    grams += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+    grams += [f"t:{c.strip().lower()}" for c in categories if c and c.strip()]
+
+    counts: Dict[int, float] = defaultdict(float)
+    for gram in grams:
+        counts[_bucket(gram, n_buckets)] += 1.0
+
+    norm = math.sqrt(sum(v * v for v in counts.values())) or 1.0
+    return {k: v / norm for k, v in counts.items()}
+
+
+def _sigmoid(z: float) -> float:
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
+
+
+def _dot(weights: Dict[int, float], features: Dict[int, float]) -> float:
+    return sum(weights.get(k, 0.0) * v for k, v in features.items())
+
+
+def train_logistic(X: List[Dict[int, float]], y: List[int], epochs: int = 25, learning_rate: float = 0.5,
+                   l2: float = 1e-4, seed: int = 13) -> Tuple[Dict[int, float], float]:
+    """
+    Class-balanced logistic regression by SGD over sparse features.
+
+    Returns:
+        (weights, bias); y is 1 for EXCLUDED
+    """
+    positives = sum(y)
+    negatives = len(y) - positives
+    class_weight = {
+        1: len(y) / (2.0 * positives) if positives else 1.0,
+        0: len(y) / (2.0 * negatives) if negatives else 1.0,
+    }
+
+    weights: Dict[int, float] = {}
+    bias = 0.0
+    order = list(range(len(X)))
+    rng = random.Random(seed)
+
+    for epoch in range(epochs):
+        rng.shuffle(order)
+        rate = learning_rate / (1.0 + epoch * 0.2)
+        for i in order:
+            features = X[i]
+            gradient = (_sigmoid(bias + _dot(weights, features)) - y[i]) * class_weight[y[i]]
+            for k, v in features.items():
+                w = weights.get(k, 0.0)
+                weights[k] = w - rate * (gradient * v + l2 * w)
+            bias -= rate * gradient
+
+    return weights, bias
+
+
+def fit_platt(scores: List[float], y: List[int], iterations: int = 200) -> Tuple[float, float]:
+    """
+    Fit Platt scaling p = sigmoid(a * score + b) on held-out scores.
+
+    Uses Platt's smoothed targets so a small, separable history doesn't
+    produce 0/1 confidences.
+    """
+    positives = sum(y)
+    negatives = len(y) - positives
+    if not positives or not negatives:
+        return 1.0, 0.0
+
+    hi = (positives + 1.0) / (positives + 2.0)
+    lo = 1.0 / (negatives + 2.0)
+    targets = [hi if label else lo for label in y]
+
+    a, b = 1.0, 0.0
+    for _ in range(iterations):
+        # Newton step on the two parameters
+        g_a = g_b = h_aa = h_ab = h_bb = 0.0
+        for s, t in zip(scores, targets):
+            p = _sigmoid(a * s + b)
+            d = p - t
+            w = max(p * (1.0 - p), 1e-12)
+            g_a += d * s
+            g_b += d
+            h_aa += w * s * s
+            h_ab += w * s
+            h_bb += w
+        h_aa += 1e-6
+        h_bb += 1e-6
+        det = h_aa * h_bb - h_ab * h_ab
+        if abs(det) < 1e-12:
+            break
+        step_a = (h_bb * g_a - h_ab * g_b) / det
+        step_b = (h_aa * g_b - h_ab * g_a) / det
+        a -= step_a
+        b -= step_b
+        if abs(step_a) < 1e-7 and abs(step_b) < 1e-7:
+            break
+
+    return a, b
+
+
+@dataclass
+class LabelledBusiness:
+    """One training example from the evidence tables."""
+    name: str
+    label: str
+    categories: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LocalPrediction:
+    """Result of the local tier."""
+    label: str
+    confidence: float  # calibrated probability of the predicted label
+    probability_excluded: float
+    method: str  # 'neighbour' or 'model'
+    neighbour: Optional[str] = None
+    neighbour_similarity: float = 0.0
+    latency_us: float = 0.0
+
+    @property
+    def is_suitable(self) -> bool:
+        return self.label == LABEL_QUALIFIED
+
+    def to_dict(self) -> Dict:
+        return {
+            'label': self.label,
+            'confidence': round(self.confidence, 4),
+            'probability_excluded': round(self.probability_excluded, 4),
+            'method': self.method,
+            'neighbour': self.neighbour,
+            'neighbour_similarity': round(self.neighbour_similarity, 4),
+            'latency_us': round(self.latency_us, 1),
+        }
+
+
+class NeighbourIndex:
+    """Inverted index over known businesses for cosine nearest-neighbour lookup."""
+
+    def __init__(self, n_buckets: int = DEFAULT_BUCKETS):
+        self.n_buckets = n_buckets
+        self.examples: List[LabelledBusiness] = []
+        self._features: List[Dict[int, float]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._max_postings = 0
+
+    def build(self, examples: Sequence[LabelledBusiness]):
+        self.examples = list(examples)
+        self._features = [extract_features(e.name, e.categories, self.n_buckets) for e in self.examples]
+        self._postings = defaultdict(list)
+        for i, example in enumerate(self.examples):
+            for token in set(_name_tokens(example.name)):
+                self._postings[token].append(i)
+        self._max_postings = max(20, int(len(self.examples) * MAX_TOKEN_DOC_SHARE))
+
+    def nearest(self, name: str, features: Dict[int, float]) -> Tuple[Optional[LabelledBusiness], float]:
+        """Most similar known business (by cosine over the same features) and its similarity."""
+        # A near-duplicate contains the name's rarest words, so only businesses
+        # listed under all of them are compared
+        postings = sorted(
+            (posting for posting in (self._postings.get(t) for t in set(_name_tokens(name)))
+             if posting and len(posting) <= self._max_postings),
+            key=len
+        )[:CANDIDATE_TOKENS]
+        candidates = set(postings[0]).intersection(*postings[1:]) if postings else set()
+
+        best, best_similarity = None, 0.0
+        for i in candidates:
+            other = self._features[i]
+            similarity = sum(v * other.get(k, 0.0) for k, v in features.items())
+            if similarity > best_similarity:
+                best, best_similarity = self.examples[i], similarity
+        return best, best_similarity
+
+
+class LocalBusinessClassifier:
+    """
+    Calibrated offline classifier for QUALIFIED vs EXCLUDED.
+
+    Args:
+        n_buckets: Hashed feature space size
+    """
+
+    def __init__(self, n_buckets: int = DEFAULT_BUCKETS):
+        self.n_buckets = n_buckets
+        self.weights: Dict[int, float] = {}
+        self.bias = 0.0
+        self.platt = (1.0, 0.0)
+        self.index = NeighbourIndex(n_buckets)
+        self.training_info: Dict = {}
+
+    @property
+    def is_trained(self) -> bool:
+        return bool(self.weights)
+
+    def fit(self, examples: Sequence[LabelledBusiness], folds: int = 3) -> Dict:
+        """
+        Train on labelled history.
+
+        Out-of-fold scores from ``folds``-fold cross-validation are used to
+        fit the calibration and to report held-out accuracy.
+        """
+        examples = [e for e in examples if e.label in LABELS and e.name]
+        if len({e.label for e in examples}) < 2:
+            raise ValueError("Training needs both QUALIFIED and EXCLUDED examples")
+
+        X = [extract_features(e.name, e.categories, self.n_buckets) for e in examples]
+        y = [1 if e.label == LABEL_EXCLUDED else 0 for e in examples]
+
+        folds = max(2, min(folds, len(examples) // 10)) if len(examples) >= 20 else 0
+        if folds:
+            oof_scores = [0.0] * len(X)
+            fold_of = [i % folds for i in range(len(X))]
+            random.Random(7).shuffle(fold_of)
+            for fold in range(folds):
+                train_idx = [i for i in range(len(X)) if fold_of[i] != fold]
+                weights, bias = train_logistic([X[i] for i in train_idx], [y[i] for i in train_idx])
+                for i in range(len(X)):
+                    if fold_of[i] == fold:
+                        oof_scores[i] = bias + _dot(weights, X[i])
+            self.platt = fit_platt(oof_scores, y)
+            correct = sum(1 for s, label in zip(oof_scores, y) if (s >= 0) == bool(label))
+            held_out_accuracy = correct / len(y)
+        else:
+            held_out_accuracy = None
+
+        self.weights, self.bias = train_logistic(X, y)
+        if not folds:
+            self.platt = fit_platt([self.bias + _dot(self.weights, x) for x in X], y)
+        self.index.build(examples)
+
+        self.training_info = {
+            'examples': len(examples),
+            'excluded': sum(y),
+            'qualified': len(y) - sum(y),
+            'folds': folds,
+            'held_out_accuracy': round(held_out_accuracy, 4) if held_out_accuracy is not None else None,
+            'trained_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        logger.info("local_classifier_trained", **self.training_info)
+        return self.training_info
+
+    def predict(self, name: str, categories: Sequence[str] = ()) -> LocalPrediction:
+        """Classify one business; confidence is the calibrated probability of the returned label."""
+        start = time.perf_counter()
+        features = extract_features(name, categories, self.n_buckets)
+
+        neighbour, similarity = self.index.nearest(name, features)
+        if neighbour is not None and similarity >= NEIGHBOUR_MATCH_SIMILARITY:
+            p_excluded = similarity if neighbour.label == LABEL_EXCLUDED else 1.0 - similarity
+            method = 'neighbour'
+        else:
+            a, b = self.platt
+            p_excluded = _sigmoid(a * (self.bias + _dot(self.weights, features)) + b)
+            method = 'model'
+
+        label = LABEL_EXCLUDED if p_excluded >= 0.5 else LABEL_QUALIFIED
+        return LocalPrediction(
+            label=label,
+            confidence=max(p_excluded, 1.0 - p_excluded),
+            probability_excluded=p_excluded,
+            method=method,
+            neighbour=neighbour.name if neighbour else None,
+            neighbour_similarity=similarity,
+            latency_us=(time.perf_counter() - start) * 1e6
+        )
+
+    def save(self, path: str):
+        """Write the model (weights, calibration, known businesses) as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'version': MODEL_VERSION,
+            'n_buckets': self.n_buckets,
+            'weights': {str(k): round(v, 6) for k, v in self.weights.items() if abs(v) > 1e-6},
+            'bias': self.bias,
+            'platt': list(self.platt),
+            'examples': [[e.name, e.label, e.categories] for e in self.index.examples],
+            'training_info': self.training_info,
+        }
+        path.write_text(json.dumps(payload), encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: str) -> 'LocalBusinessClassifier':
+        """Load a model written by save()."""
+        payload = json.loads(Path(path).read_text(encoding='utf-8'))
+        if payload.get('version') != MODEL_VERSION:
+            raise ValueError(f"Unsupported local classifier model version: {payload.get('version')}")
+
+        classifier = cls(n_buckets=payload['n_buckets'])
+        classifier.weights = {int(k): v for k, v in payload['weights'].items()}
+        classifier.bias = payload['bias']
+        classifier.platt = tuple(payload['platt'])
+        classifier.training_info = payload.get('training_info', {})
+        classifier.index.build([
+            LabelledBusiness(name=name, label=label, categories=categories)
+            for name, label, categories in payload['examples']
+        ])
+        return classifier
+
+
+def load_labelled_history(db_path: str) -> List[LabelledBusiness]:
+    """
+    Read labelled businesses from the evidence tables.
+
+    QUALIFIED and EXPORTED businesses are QUALIFIED; EXCLUDED businesses are
+    EXCLUDED only when the category gate excluded them.
+    """
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        businesses = conn.execute(f"""
+            SELECT * FROM businesses b
+            WHERE b.status IN ({', '.join('?' * len(QUALIFIED_STATUSES))})
+               OR (b.status = ? AND EXISTS (
+                   SELECT 1 FROM exclusions e WHERE e.business_id = b.id AND e.rule_id = ?
+               ))
+        """, (*QUALIFIED_STATUSES, LABEL_EXCLUDED, CATEGORY_GATE_RULE)).fetchall()
+
+    examples = []
+    for row in businesses:
+        row = dict(row)
+        examples.append(LabelledBusiness(
+            name=row.get('original_name') or row['normalized_name'],
+            label=LABEL_EXCLUDED if row['status'] == LABEL_EXCLUDED else LABEL_QUALIFIED,
+            categories=business_categories(row.get('industry'))
+        ))
+    return examples
+
+
+def load_local_classifier(path: Optional[str] = None) -> Optional[LocalBusinessClassifier]:
+    """Load the configured model, or None if it hasn't been trained yet."""
+    if path is None:
+        try:
+            from ..core.config import config
+            path = config.LOCAL_CLASSIFIER_MODEL_PATH
+        except Exception:
+            path = "data/local_classifier.json"
+
+    if not Path(path).exists():
+        return None
+
+    try:
+        return LocalBusinessClassifier.load(path)
+    except Exception as e:
+        logger.warning("local_classifier_load_failed", path=path, error=str(e))
+        return None
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local business-type classifier")
+    parser.add_argument('--model', default='data/local_classifier.json', help="Model file path")
+    sub = parser.add_subparsers(dest='command', required=True)
+    train_cmd = sub.add_parser('train', help="Train from qualified/category-excluded history")
+    train_cmd.add_argument('--db', default='data/leads.db', help="Evidence database path")
+    predict_cmd = sub.add_parser('predict', help="Classify a business name")
+    predict_cmd.add_argument('name')
+    predict_cmd.add_argument('--industry')
+    args = parser.parse_args()
+
+    if args.command == 'train':
+        model = LocalBusinessClassifier()
+        print(json.dumps(model.fit(load_labelled_history(args.db)), indent=2))
+        model.save(args.model)
+    else:
+        model = LocalBusinessClassifier.load(args.model)
+        print(json.dumps(model.predict(args.name, business_categories(args.industry)).to_dict(), indent=2))
@@ -0,0 +1,373 @@
+"""
+Per-domain robots.txt rules with an on-disk cache.
+
+Each origin's robots.txt is fetched once through the caller's session, parsed
+into user-agent groups and stored in SQLite with a TTL, so restarts and other
+workers reuse it instead of re-fetching. Path checks are answered from rules
+compiled once per origin: plain prefixes use ``str.startswith``, patterns with
+``*`` / ``$`` become regexes, and the longest matching rule wins (ties go to
+Allow), as in RFC 9309.
+
+Crawl-delay is kept with the rules so the HTTP client can space requests per
+host.
+
+Example:
+    >>> policy = RobotsPolicy(user_agent="Hamilton Business Research Bot 2.0")
+    >>> if await policy.can_fetch(session, "https://example.ca/contact"):
+    ...     delay = await policy.crawl_delay(session, "https://example.ca/contact")
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import structlog
+
+from .html_extraction import read_body_capped
+
+logger = structlog.get_logger(__name__)
+
+# Larger files are truncated (RFC 9309 requires parsing at least 500 KiB)
+ROBOTS_MAX_BYTES = 512_000
+
+# Failed fetches are retried sooner than the regular TTL
+ERROR_TTL_SECONDS = 3600
+
+# Crawl-delay values above this are clamped (some sites publish hours)
+MAX_CRAWL_DELAY = 60.0
+
+
+@dataclass
+class RobotsGroup:
+    """Rules that apply to one or more user-agent tokens."""
+    agents: List[str]
+    rules: List[Tuple[bool, str]] = field(default_factory=list)  # (allow, pattern)
+    crawl_delay: Optional[float] = None
+
+
+def parse_robots_txt(content: str) -> List[RobotsGroup]:
+    """
+    Parse robots.txt into user-agent groups.
+
+    Consecutive User-agent lines share the rules that follow them; unknown
+    directives (Sitemap, Host, ...) are ignored.
+    """
+    groups: List[RobotsGroup] = []
+    current: Optional[RobotsGroup] = None
+    in_rules = False
+
+    for raw_line in content.splitlines():
+        line = raw_line.split('#', 1)[0].strip()
+        if ':' not in line:
+            continue
+
+        key, value = line.split(':', 1)
+        key = key.strip().lower()
+        value = value.strip()
+
+        if key == 'user-agent':
+            if current is None or in_rules:
+                current = RobotsGroup(agents=[])
+                groups.append(current)
+                in_rules = False
+            current.agents.append(value.lower())
+        elif current is None:
+            continue
+        elif key in ('allow', 'disallow'):
+            in_rules = True
+            if value:  # "Disallow:" with no path allows everything
+                current.rules.append((key == 'allow', value))
+        elif key == 'crawl-delay':
+            in_rules = True
+            try:
+                current.crawl_delay = float(value)
+            except ValueError:
+                pass
+
+    return groups
+
+
+def _compile_pattern(pattern: str):
+    """Compile a rule path to a matcher function taking the request path."""
+    if '*' not in pattern and not pattern.endswith('$'):
+        return lambda path: path.startswith(pattern)
+
+    anchored = pattern.endswith('$')
+    body = pattern[:-1] if anchored else pattern
+    regex = re.compile('.*'.join(re.escape(part) for part in body.split('*')) + ('$' if anchored else ''))
+    return lambda path: regex.match(path) is not None
+
+
+class RobotsMatcher:
+    """Compiled rules for one user agent on one origin."""
+
+    def __init__(self, rules: List[Tuple[bool, str]] = (), crawl_delay: Optional[float] = None):
+        # Longest rules first, Allow before Disallow at equal length
+        ordered = sorted(rules, key=lambda rule: (len(rule[1]), rule[0]), reverse=True)
+        self._rules = [(allow, _compile_pattern(pattern)) for allow, pattern in ordered]
+        self.crawl_delay = min(crawl_delay, MAX_CRAWL_DELAY) if crawl_delay else None
+
+    def allowed(self, path: str) -> bool:
+        """Check a path (with query string) against the rules."""
+        if not path:
+            path = '/'
+        if path == '/robots.txt':
+            return True
+
+        for allow, matches in self._rules:
+            if matches(path):
+                return allow
+        return True
+
+
+def select_group_rules(groups: List[RobotsGroup], user_agent: str) -> RobotsMatcher:
+    """
+    Build the matcher for our user agent.
+
+    Groups whose token appears in our user agent win, the most specific
+    (longest) token first; otherwise the ``*`` group applies. Groups naming the
+    same token are merged.
+    """
+    ua = user_agent.split('/')[0].lower()
+    best_token = None
+
+    for group in groups:
+        for agent in group.agents:
+            token = agent.split('/')[0]
+            if token != '*' and token and token in ua and (best_token is None or len(token) > len(best_token)):
+                best_token = token
+
+    selected = best_token or '*'
+    rules: List[Tuple[bool, str]] = []
+    crawl_delay = None
+    for group in groups:
+        if any(agent.split('/')[0] == selected for agent in group.agents):
+            rules.extend(group.rules)
+            if group.crawl_delay is not None:
+                crawl_delay = group.crawl_delay
+
+    return RobotsMatcher(rules, crawl_delay)
+
+
+@dataclass
+class RobotsRecord:
+    """Parsed robots.txt of one origin, as stored in the cache."""
+    origin: str
+    status: int  # HTTP status, or 0 if the fetch failed
+    groups: List[RobotsGroup]
+    fetched_at: float
+    expires_at: float
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) >= self.expires_at
+
+    def groups_json(self) -> str:
+        return json.dumps([
+            {'agents': g.agents, 'rules': g.rules, 'crawl_delay': g.crawl_delay}
+            for g in self.groups
+        ])
+
+    @staticmethod
+    def groups_from_json(data: str) -> List[RobotsGroup]:
+        return [
+            RobotsGroup(
+                agents=g['agents'],
+                rules=[(bool(allow), pattern) for allow, pattern in g['rules']],
+                crawl_delay=g['crawl_delay']
+            )
+            for g in json.loads(data)
+        ]
+
+
+class RobotsCacheStore:
+    """SQLite store of parsed robots.txt rules, keyed by origin."""
+
+    def __init__(self, db_path: str = "data/robots_cache.db"):
+        """
+        Initialize robots cache.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Schema:
+            - origin: TEXT PRIMARY KEY (scheme://host[:port])
+            - rules_json: TEXT (JSON list of user-agent groups)
+            - expires_at: REAL (unix time)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS robots (
+                    origin TEXT PRIMARY KEY,
+                    status INTEGER NOT NULL,
+                    rules_json TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def get(self, origin: str) -> Optional[RobotsRecord]:
+        """Get the stored record for an origin, expired or not."""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT status, rules_json, fetched_at, expires_at FROM robots WHERE origin = ?",
+                (origin,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, groups, fetched_at, expires_at = row
+        return RobotsRecord(
+            origin=origin,
+            status=status,
+            groups=RobotsRecord.groups_from_json(groups),
+            fetched_at=fetched_at,
+            expires_at=expires_at
+        )
+
+    def put(self, record: RobotsRecord):
+        """Store (or replace) an origin's record."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO robots (origin, status, rules_json, fetched_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (record.origin, record.status, record.groups_json(), record.fetched_at, record.expires_at)
+            )
+            conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired records. Returns the number removed."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("DELETE FROM robots WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+            return cursor.rowcount
+
+
+def _origin(url: str) -> Tuple[str, str]:
+    """Split a URL into (origin, path with query)."""
+    parsed = urlparse(url)
+    path = parsed.path or '/'
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    return f"{parsed.scheme}://{parsed.netloc}".lower(), path
+
+
+class RobotsPolicy:
+    """
+    robots.txt decisions for one user agent, backed by memory and disk caches.
+
+    Args:
+        user_agent: User-Agent the rules are selected for
+        store: Disk cache (default: ROBOTS_CACHE_PATH from config)
+        ttl_seconds: How long fetched rules stay valid (default: ROBOTS_CACHE_TTL_HOURS)
+    """
+
+    def __init__(self, user_agent: str, store: Optional[RobotsCacheStore] = None,
+                 ttl_seconds: Optional[float] = None):
+        self.user_agent = user_agent
+        if store is None or ttl_seconds is None:
+            default_path, default_ttl = _settings_from_config()
+            store = store or RobotsCacheStore(default_path)
+            ttl_seconds = default_ttl if ttl_seconds is None else ttl_seconds
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self._matchers: Dict[str, Tuple[RobotsMatcher, float]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'fetched': 0,
+            'fetch_errors': 0,
+            'disallowed': 0
+        }
+
+    async def get_matcher(self, session, url: str) -> RobotsMatcher:
+        """Get compiled rules for the URL's origin, fetching robots.txt at most once per TTL."""
+        origin, _ = _origin(url)
+
+        cached = self._matchers.get(origin)
+        if cached and cached[1] > time.time():
+            self.stats['memory_hits'] += 1
+            return cached[0]
+
+        lock = self._locks.setdefault(origin, asyncio.Lock())
+        async with lock:
+            # Another task may have loaded it while we waited
+            cached = self._matchers.get(origin)
+            if cached and cached[1] > time.time():
+                self.stats['memory_hits'] += 1
+                return cached[0]
+
+            record = self.store.get(origin)
+            if record is not None and not record.is_expired():
+                self.stats['disk_hits'] += 1
+            else:
+                record = await self._fetch(session, origin)
+                self.store.put(record)
+
+            matcher = select_group_rules(record.groups, self.user_agent)
+            self._matchers[origin] = (matcher, record.expires_at)
+            return matcher
+
+    async def _fetch(self, session, origin: str) -> RobotsRecord:
+        """Fetch and parse an origin's robots.txt."""
+        now = time.time()
+        robots_url = f"{origin}/robots.txt"
+
+        try:
+            async with session.get(robots_url) as response:
+                status = response.status
+                if 200 <= status < 300:
+                    content, truncated = await read_body_capped(response, ROBOTS_MAX_BYTES)
+                    groups = parse_robots_txt(content)
+                    if truncated:
+                        logger.warning("robots_txt_truncated", origin=origin, max_bytes=ROBOTS_MAX_BYTES)
+                else:
+                    # 4xx: no robots.txt, everything allowed
+                    groups = []
+        except Exception as e:
+            self.stats['fetch_errors'] += 1
+            logger.warning("robots_txt_check_failed", domain=origin, error=str(e))
+            return RobotsRecord(origin, 0, [], now, now + min(ERROR_TTL_SECONDS, self.ttl_seconds))
+
+        self.stats['fetched'] += 1
+        ttl = self.ttl_seconds if status < 500 else min(ERROR_TTL_SECONDS, self.ttl_seconds)
+        logger.debug("robots_txt_fetched", origin=origin, status=status, groups=len(groups))
+        return RobotsRecord(origin, status, groups, now, now + ttl)
+
+    async def can_fetch(self, session, url: str) -> bool:
+        """Check whether the URL may be fetched."""
+        matcher = await self.get_matcher(session, url)
+        allowed = matcher.allowed(_origin(url)[1])
+        if not allowed:
+            self.stats['disallowed'] += 1
+        return allowed
+
+    async def crawl_delay(self, session, url: str) -> Optional[float]:
+        """Crawl-delay (seconds) for the URL's host, or None."""
+        return (await self.get_matcher(session, url)).crawl_delay
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        return {**self.stats, 'origins': len(self._matchers)}
+
+
+def _settings_from_config() -> Tuple[str, float]:
+    try:
+        from ..core.config import config
+        return config.ROBOTS_CACHE_PATH, config.ROBOTS_CACHE_TTL_HOURS * 3600
+    except Exception:
+        return "data/robots_cache.db", 24 * 3600
@@ -9,6 +9,8 @@ import asyncio
 from typing import List, Dict, Optional, Tuple
 import structlog
 
+from ..core.name_index import NAME_MATCH_THRESHOLD, name_similarity
+from ..core.normalization import normalize_phone, normalize_website
 from ..utils.address_normalizer import addresses_match, normalize_address
 
 logger = structlog.get_logger(__name__)
@@ -131,15 +133,13 @@ class SourceCrossValidator:
             issues.append("No business name found in any source")
             return issues
 
-        # Normalize names for comparison
-        normalized_names = [self._normalize_name(n) for n in names]
-        expected_normalized = self._normalize_name(expected_name)
-
-        # Check if all names are similar
+        # Check if all names are similar (trigram similarity of the matching keys,
+        # so "ABC Mfg Ltd" and "ABC Manufacturing Inc." agree)
         mismatches = []
-        for i, norm_name in enumerate(normalized_names):
-            if norm_name != expected_normalized:
-                mismatches.append(f"Source {i+1}: {names[i]}")
+        for i, name in enumerate(names):
+            score = name_similarity(name, expected_name)
+            if score < NAME_MATCH_THRESHOLD:
+                mismatches.append(f"Source {i+1}: {name} (similarity {score:.2f})")
 
         if mismatches:
             issues.append(f"Business name mismatch across sources: {', '.join(mismatches)}")
@@ -219,7 +219,7 @@ class SourceCrossValidator:
     ) -> Tuple[List[str], Optional[str]]:
         """Validate phone number consistency."""
         issues = []
-        phones = [self._normalize_phone(b.get('phone', '')) for b in businesses if b.get('phone')]
+        phones = [normalize_phone(b.get('phone', '')) for b in businesses if b.get('phone')]
 
         if not phones:
             return [], None
@@ -241,7 +241,7 @@ class SourceCrossValidator:
     ) -> Tuple[List[str], Optional[str]]:
         """Validate website consistency."""
         issues = []
-        websites = [self._normalize_website(b.get('website', '')) for b in businesses if b.get('website')]
+        websites = [normalize_website(b.get('website', '')) for b in businesses if b.get('website')]
 
         if not websites:
             return [], None
@@ -314,59 +314,6 @@ class SourceCrossValidator:
 
         return max(0.0, min(1.0, score))
 
-    def _normalize_name(self, name: str) -> str:
-        """Normalize business name for comparison."""
-        if not name:
-            return ""
-
-        normalized = name.lower().strip()
-
-        # Remove common suffixes
-        suffixes = ['ltd', 'limited', 'inc', 'incorporated', 'corp', 'corporation', 'llc', 'co']
-        for suffix in suffixes:
-            normalized = normalized.replace(f' {suffix}', '').replace(f'.{suffix}', '')
-
-        # Remove punctuation
-        normalized = normalized.replace('.', '').replace(',', '').replace('&', 'and')
-
-        # Remove extra spaces
-        normalized = ' '.join(normalized.split())
-
-        return normalized
-
-    def _normalize_phone(self, phone: str) -> str:
-        """Normalize phone number for comparison."""
-        if not phone:
-            return ""
-
-        # Keep only digits
-        import re
-        digits = re.sub(r'\D', '', phone)
-
-        # Remove country code if present
-        if len(digits) == 11 and digits.startswith('1'):
-            digits = digits[1:]
-
-        return digits
-
-    def _normalize_website(self, website: str) -> str:
-        """Normalize website URL for comparison."""
-        if not website:
-            return ""
-
-        normalized = website.lower().strip()
-
-        # Remove protocol
-        normalized = normalized.replace('https://', '').replace('http://', '')
-
-        # Remove www
-        normalized = normalized.replace('www.', '')
-
-        # Remove trailing slash
-        normalized = normalized.rstrip('/')
-
-        return normalized
-
     async def _llm_validate_conflicts(
         self,
         businesses: List[Dict],
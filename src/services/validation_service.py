@@ -14,6 +14,7 @@ from ..core.models import BusinessLead
 from ..core.exceptions import ValidationError
 from .noc_classification_service import NOCClassificationService
 from .business_type_classifier import BusinessTypeClassifier
+from .http_transport import create_client_session
 try:
     from .website_validation_service import WebsiteValidationService
     WEBSITE_VALIDATION_AVAILABLE = True
@@ -221,7 +222,7 @@ class BusinessValidationService:
         
         try:
             timeout = aiohttp.ClientTimeout(total=15)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with create_client_session(timeout=timeout) as session:
                 async with session.get(website, allow_redirects=True) as response:
                     if response.status != 200:
                         self.logger.warning(
@@ -498,7 +499,7 @@ class BusinessValidationService:
         
         try:
             timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with create_client_session(timeout=timeout) as session:
                 async with session.head(website, allow_redirects=True) as response:
                     # Accept any HTTP status that indicates the site exists
                     if 200 <= response.status < 600:
@@ -14,6 +14,7 @@ import structlog
 import requests
 
 from ..utils.rate_limiter import get_limiter
+from .domain_health import PARKED, get_domain_health
 
 logger = structlog.get_logger(__name__)
 
@@ -209,6 +210,12 @@ class WaybackService:
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
 
+            # Known-dead hosts are not fetched again; a parked verdict is reused
+            domain_health = get_domain_health()
+            dead = domain_health.check(url)
+            if dead is not None:
+                return dead.kind == PARKED
+
             # Rate limit check (wayback limiter also covers parked domain checks)
             limiter = get_limiter("wayback")
             if not limiter.acquire():
@@ -252,6 +259,7 @@ class WaybackService:
                     self.logger.info("parked_domain_detected",
                                    url=url,
                                    indicator=indicator)
+                    domain_health.record_parked(url)
                     return True
 
             # Check if redirected to domain marketplace
@@ -269,6 +277,7 @@ class WaybackService:
                     self.logger.info("parked_domain_redirect",
                                    url=url,
                                    marketplace=marketplace)
+                    domain_health.record_parked(url)
                     return True
 
             return False
@@ -277,6 +286,7 @@ class WaybackService:
             self.logger.error("parked_domain_check_failed",
                             url=url,
                             error=str(e))
+            get_domain_health().record_failure(url, e)
             # If we can't check, assume not parked (don't block on errors)
             return False
 
@@ -13,12 +13,17 @@ from urllib.parse import urlparse
 
 import aiohttp
 import certifi
-from bs4 import BeautifulSoup
 from difflib import SequenceMatcher
 
 from src.core.exceptions import ValidationError
 from src.utils.logging_config import get_logger
 from src.services.wayback_service import check_website_age_gate
+from src.services.html_extraction import ExtractedPage, extract_page_async, read_body_capped
+from src.services.crawl_metadata import CrawlCache, get_crawl_cache
+from src.services.domain_health import PARKED, TIMEOUT, DomainHealthRegistry, classify_failure, get_domain_health
+from src.services.hedging import HedgingPolicy, get_hedging_policy
+from src.services.host_concurrency import HostConcurrency, get_host_concurrency
+from src.services.http_transport import create_client_session
 
 logger = get_logger(__name__)
 
@@ -105,12 +110,20 @@ class WebsiteValidationService:
         timeout: float = 10.0,
         max_retries: int = 3,
         min_website_age_years: float = 3.0,
-        check_parked: bool = True
+        check_parked: bool = True,
+        hedging: Optional[HedgingPolicy] = None,
+        concurrency: Optional[HostConcurrency] = None,
+        domain_health: Optional[DomainHealthRegistry] = None,
+        crawl_cache: Optional[CrawlCache] = None
     ):
         self.timeout = timeout
         self.max_retries = max_retries
         self.min_website_age_years = min_website_age_years
         self.check_parked = check_parked
+        self.hedging = hedging or get_hedging_policy()
+        self.concurrency = concurrency or get_host_concurrency()
+        self.domain_health = domain_health or get_domain_health()
+        self.crawl_cache = crawl_cache or get_crawl_cache()
         self._session: Optional[aiohttp.ClientSession] = None
         
     async def __aenter__(self):
@@ -123,6 +136,7 @@ class WebsiteValidationService:
         if self._session:
             await self._session.close()
             self._session = None
+        self.concurrency.save()
             
     async def _ensure_session(self):
         """Ensure HTTP session is created."""
@@ -131,7 +145,7 @@ class WebsiteValidationService:
             connector = aiohttp.TCPConnector(ssl=ssl_context)
             timeout = aiohttp.ClientTimeout(total=self.timeout)
             
-            self._session = aiohttp.ClientSession(
+            self._session = create_client_session(
                 connector=connector,
                 timeout=timeout,
                 headers={
@@ -163,38 +177,47 @@ class WebsiteValidationService:
         try:
             # Normalize URL
             normalized_url = self._normalize_url(url)
+
+            # Known-dead hosts (NXDOMAIN, refused, TLS, timeout, parked) are not fetched again
+            dead = self.domain_health.check(normalized_url)
+            if dead is not None:
+                return WebsiteValidationResult(
+                    url=normalized_url,
+                    is_parked=dead.kind == PARKED,
+                    error_message=f"Skipped: host known dead ({dead.kind})"
+                )
             
-            # Perform HTTP request with timing
+            # Unchanged pages reuse the last extraction for the same business details.
+            # The site is always contacted (never answered from the crawl cache
+            # alone): liveness is what is being validated, and a 304 proves it.
+            crawl_key = self._crawl_key(business_name, business_phone, business_address)
+
+            # Perform HTTP request with timing (conditional if this page was validated before)
             start_time = time.time()
-            response_data = await self._make_request(normalized_url)
+            response_data = await self._make_request(normalized_url, crawl_key=crawl_key)
             response_time = time.time() - start_time
-            
+
             if not response_data or len(response_data) != 3:
                 return WebsiteValidationResult(
                     url=normalized_url,
                     error_message="Failed to fetch website or invalid response"
                 )
-            
+
             status_code, content, final_url = response_data
-            
-            # Check SSL
-            has_ssl = final_url.startswith('https://')
-            
-            # Parse content for validation
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Business name matching
-            business_name_match = self._calculate_business_name_match(
-                soup, business_name
-            )
-            
-            # Contact info matching
-            contact_info_match = self._validate_contact_info(
-                soup, business_phone, business_address
-            )
-            
-            # Business content validation
-            has_business_content = self._validate_business_content(soup)
+            page_facts = self.crawl_cache.reuse(normalized_url, crawl_key)
+            if page_facts is None and status_code == 304:
+                # Nothing left to reuse: fetch the page in full
+                status_code, content, final_url = await self._make_request(normalized_url)
+
+            if page_facts is not None:
+                page_facts = {**page_facts, 'response_time': response_time}
+            else:
+                page_facts = await self._extract_page_facts(
+                    content, final_url, business_name, business_phone, business_address
+                )
+                page_facts.update(status_code=status_code, response_time=response_time)
+                if status_code == 200:
+                    self.crawl_cache.store_extraction(normalized_url, crawl_key, page_facts)
 
             # Website age gate (Task 3)
             age_gate_result = check_website_age_gate(
@@ -206,12 +229,12 @@ class WebsiteValidationService:
             return WebsiteValidationResult(
                 url=normalized_url,
                 is_accessible=True,
-                status_code=status_code,
-                response_time=response_time,
-                has_ssl=has_ssl,
-                business_name_match=business_name_match,
-                contact_info_match=contact_info_match,
-                has_business_content=has_business_content,
+                status_code=page_facts['status_code'],
+                response_time=page_facts['response_time'],
+                has_ssl=page_facts['has_ssl'],
+                business_name_match=page_facts['business_name_match'],
+                contact_info_match=page_facts['contact_info_match'],
+                has_business_content=page_facts['has_business_content'],
                 # Website age fields
                 website_age_years=age_gate_result['age_years'],
                 website_first_seen=age_gate_result.get('first_seen'),
@@ -227,46 +250,102 @@ class WebsiteValidationService:
                 error_message=str(e)
             )
     
+    async def _extract_page_facts(
+        self,
+        content: str,
+        final_url: str,
+        business_name: str,
+        business_phone: Optional[str],
+        business_address: Optional[str]
+    ) -> Dict:
+        """Page-derived validation fields (what a revisit of an unchanged page reuses)."""
+        # Parse content for validation
+        page = await extract_page_async(content, base_url=final_url)
+
+        return {
+            # Check SSL
+            'has_ssl': final_url.startswith('https://'),
+            # Business name matching
+            'business_name_match': self._calculate_business_name_match(page, business_name),
+            # Contact info matching
+            'contact_info_match': self._validate_contact_info(page, business_phone, business_address),
+            # Business content validation
+            'has_business_content': self._validate_business_content(page),
+        }
+
+    def _crawl_key(
+        self,
+        business_name: str,
+        business_phone: Optional[str],
+        business_address: Optional[str]
+    ) -> str:
+        """Crawl-metadata key: the extraction depends on the business details matched against."""
+        return 'validation:' + '|'.join(value or '' for value in (business_name, business_phone, business_address))
+
     def _normalize_url(self, url: str) -> str:
         """Normalize URL format."""
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         return url.lower().strip()
     
-    async def _make_request(self, url: str) -> Optional[Tuple[int, str, str]]:
-        """Make HTTP request with retries."""
+    async def _make_request(self, url: str, crawl_key: Optional[str] = None) -> Optional[Tuple[int, str, str]]:
+        """
+        Make HTTP request with retries (slow attempts are hedged).
+
+        With a crawl_key the request is conditional on the page's stored
+        validators (the status may be 304, with no content) and the response
+        is recorded in the crawl metadata.
+        """
         if not self._session:
             raise ValidationError("HTTP session not initialized")
             
         for attempt in range(self.max_retries):
             try:
-                async with self._session.get(url, allow_redirects=True) as response:
-                    content = await response.text()
-                    return response.status, content, str(response.url)
+                result = await self.hedging.run(url, lambda: self._fetch(url, crawl_key))
+                self.domain_health.record_ok(url)
+                return result
                     
-            except asyncio.TimeoutError:
+            except asyncio.TimeoutError as e:
                 if attempt == self.max_retries - 1:
+                    self.domain_health.record(url, TIMEOUT, str(e) or None)
                     raise ValidationError(f"Timeout after {self.max_retries} attempts")
-                await asyncio.sleep(1)
+                # The attempt (and its hedge) already waited out the full timeout
                 
             except asyncio.CancelledError:
                 raise ValidationError("Request was cancelled")
                 
             except Exception as e:
+                # NXDOMAIN, refused and TLS failures will not change on a retry
+                kind = classify_failure(e)
+                if kind is not None and kind != TIMEOUT:
+                    self.domain_health.record(url, kind, str(e))
+                    raise ValidationError(f"Request failed: {str(e)}")
                 if attempt == self.max_retries - 1:
+                    self.domain_health.record_failure(url, e)
                     raise ValidationError(f"Request failed: {str(e)}")
                 await asyncio.sleep(1)
         
         raise ValidationError("All retry attempts failed")
+
+    async def _fetch(self, url: str, crawl_key: Optional[str] = None) -> Tuple[int, str, str]:
+        """One complete GET (status, body, final URL), within the host's concurrency limit."""
+        headers = self.crawl_cache.request_headers(url, crawl_key) if crawl_key else {}
+        async with self.concurrency.slot(url) as slot:
+            async with self._session.get(url, allow_redirects=True, headers=headers) as response:
+                slot.observe(response.status, response.headers.get('Retry-After'))
+                content, _ = await read_body_capped(response)
+                if crawl_key:
+                    self.crawl_cache.observe(url, response.status, response.headers, content)
+                return response.status, content, str(response.url)
     
-    def _calculate_business_name_match(self, soup: BeautifulSoup, business_name: str) -> float:
+    def _calculate_business_name_match(self, page: ExtractedPage, business_name: str) -> float:
         """Calculate how well the business name matches website content."""
         if not business_name:
             return 0.0
             
         # Extract text content
-        text_content = soup.get_text().lower()
-        title_content = soup.title.string.lower() if soup.title else ""
+        text_content = page.text.lower()
+        title_content = page.title.lower()
         
         # Clean business name for matching
         clean_business_name = re.sub(r'[^\w\s]', '', business_name.lower())
@@ -293,12 +372,12 @@ class WebsiteValidationService:
     
     def _validate_contact_info(
         self, 
-        soup: BeautifulSoup, 
+        page: ExtractedPage, 
         phone: Optional[str], 
         address: Optional[str]
     ) -> bool:
         """Validate contact information consistency."""
-        text_content = soup.get_text().lower()
+        text_content = page.text.lower()
         
         # Check phone number if provided
         if phone:
@@ -318,7 +397,7 @@ class WebsiteValidationService:
         
         return True
     
-    def _validate_business_content(self, soup: BeautifulSoup) -> bool:
+    def _validate_business_content(self, page: ExtractedPage) -> bool:
         """Validate that website has legitimate business content."""
         # Check for essential business indicators
         business_indicators = [
@@ -326,14 +405,14 @@ class WebsiteValidationService:
             'location', 'phone', 'email', 'business', 'company'
         ]
         
-        text_content = soup.get_text().lower()
+        text_content = page.text.lower()
         
         # Count indicators
         indicator_count = sum(1 for indicator in business_indicators if indicator in text_content)
         
         # Check for multiple pages/sections
-        nav_links = soup.find_all(['nav', 'menu', 'a'])
-        has_navigation = len(nav_links) > 5
+        nav_links = sum(page.tag_counts[tag] for tag in ('nav', 'menu', 'a'))
+        has_navigation = nav_links > 5
         
         # Check for professional content
         has_enough_content = len(text_content.split()) > 100
@@ -355,6 +434,7 @@ class WebsiteValidationService:
             List of WebsiteValidationResult objects
         """
         await self._ensure_session()
+        await self.domain_health.preflight(self._normalize_url(data['url']) for data in website_data)
         
         tasks = []
         for data in website_data:
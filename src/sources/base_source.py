@@ -3,10 +3,13 @@ Base class for all business data sources.
 
 Provides common interface and tracking for source performance.
 """
+import json
+import marshal
+import sys
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -26,63 +29,183 @@ class SourceMetrics:
     total_fetch_time_seconds: float = 0.0
 
 
-@dataclass
 class BusinessData:
-    """Standardized business data structure from any source."""
-    name: str
-    source: str
-    source_url: str
-    confidence: float  # 0.0-1.0 confidence in data accuracy
-
-    # Optional fields
-    street: Optional[str] = None
-    city: Optional[str] = None
-    province: Optional[str] = None
-    postal_code: Optional[str] = None
-    phone: Optional[str] = None
-    website: Optional[str] = None
-    email: Optional[str] = None
-    latitude: Optional[float] = None
-    longitude: Optional[float] = None
-    industry: Optional[str] = None
-    naics_code: Optional[str] = None
-    employee_count: Optional[int] = None
-    revenue_range: Optional[str] = None
-    year_established: Optional[int] = None
-    review_count: Optional[int] = None  # Number of online reviews (Google, Yelp, etc.)
-    rating: Optional[float] = None  # Average rating (0.0-5.0)
-    description: Optional[str] = None
-
-    # Metadata
-    raw_data: Dict[str, Any] = field(default_factory=dict)
-    fetched_at: datetime = field(default_factory=datetime.utcnow)
+    """
+    Standardized business data structure from any source.
+
+    This is the record every discovery candidate travels in, so it is kept
+    compact: attributes live in __slots__ (no per-instance __dict__) and the
+    provider payload is held out of line as one compact marshal blob that is
+    only decoded when ``raw_data`` is read. Low-cardinality strings (source,
+    city, province, industry) are interned. Validated models (BusinessLead,
+    StandardLeadOutput) are built from it on demand at API, export and DB
+    boundaries via to_business_lead() / to_standard_output().
+
+    ``raw_data`` returns a fresh dict on each read; assign a new dict to
+    change it.
+    """
+
+    __slots__ = (
+        'name', 'source', 'source_url', 'confidence',
+        'street', 'city', 'province', 'postal_code',
+        'phone', 'website', 'email', 'latitude', 'longitude',
+        'industry', 'naics_code', 'employee_count', 'revenue_range',
+        'year_established', 'review_count', 'rating', 'description',
+        '_raw', 'fetched_at',
+    )
+
+    FIELDS = __slots__[:21]
+
+    def __init__(
+        self,
+        name: str,
+        source: str,
+        source_url: str,
+        confidence: float,  # 0.0-1.0 confidence in data accuracy
+        street: Optional[str] = None,
+        city: Optional[str] = None,
+        province: Optional[str] = None,
+        postal_code: Optional[str] = None,
+        phone: Optional[str] = None,
+        website: Optional[str] = None,
+        email: Optional[str] = None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        industry: Optional[str] = None,
+        naics_code: Optional[str] = None,
+        employee_count: Optional[int] = None,
+        revenue_range: Optional[str] = None,
+        year_established: Optional[int] = None,
+        review_count: Optional[int] = None,  # Number of online reviews (Google, Yelp, etc.)
+        rating: Optional[float] = None,  # Average rating (0.0-5.0)
+        description: Optional[str] = None,
+        raw_data: Optional[Dict[str, Any]] = None,
+        fetched_at: Optional[datetime] = None
+    ):
+        self.name = name
+        self.source = _intern(source)
+        self.source_url = source_url
+        self.confidence = confidence
+        self.street = street
+        self.city = _intern(city)
+        self.province = _intern(province)
+        self.postal_code = postal_code
+        self.phone = phone
+        self.website = website
+        self.email = email
+        self.latitude = latitude
+        self.longitude = longitude
+        self.industry = _intern(industry)
+        self.naics_code = naics_code
+        self.employee_count = employee_count
+        self.revenue_range = revenue_range
+        self.year_established = year_established
+        self.review_count = review_count
+        self.rating = rating
+        self.description = description
+        self._raw = _pack_payload(raw_data)
+        self.fetched_at = fetched_at or datetime.utcnow()
+
+    @property
+    def raw_data(self) -> Dict[str, Any]:
+        """Provider payload (decoded on access)."""
+        return marshal.loads(self._raw) if self._raw else {}
+
+    @raw_data.setter
+    def raw_data(self, payload: Optional[Dict[str, Any]]):
+        self._raw = _pack_payload(payload)
+
+    @property
+    def raw_size(self) -> int:
+        """Bytes held for the provider payload."""
+        return len(self._raw) if self._raw else 0
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BusinessData):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"BusinessData(name={self.name!r}, source={self.source!r}, city={self.city!r})"
+
+    def __getstate__(self):
+        return {f: getattr(self, f) for f in self.__slots__}
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database storage."""
-        return {
-            'name': self.name,
-            'source': self.source,
-            'source_url': self.source_url,
-            'confidence': self.confidence,
-            'street': self.street,
-            'city': self.city,
-            'province': self.province,
-            'postal_code': self.postal_code,
-            'phone': self.phone,
-            'website': self.website,
-            'email': self.email,
-            'latitude': self.latitude,
-            'longitude': self.longitude,
-            'industry': self.industry,
-            'naics_code': self.naics_code,
-            'employee_count': self.employee_count,
-            'revenue_range': self.revenue_range,
-            'year_established': self.year_established,
-            'review_count': self.review_count,
-            'rating': self.rating,
-            'description': self.description,
-            'fetched_at': self.fetched_at.isoformat()
-        }
+        record = {f: getattr(self, f) for f in self.FIELDS}
+        record['fetched_at'] = self.fetched_at.isoformat()
+        return record
+
+    def to_business_lead(self):
+        """
+        Build the validated BusinessLead for this record.
+
+        Runs the full Pydantic validation (phone, postal code, URL), so call it
+        at boundaries only, not per attribute on the hot path.
+
+        Raises:
+            pydantic.ValidationError: If the record fails lead validation
+        """
+        from ..core.models import BusinessLead, ContactInfo, DataSource, LocationInfo
+
+        years_in_business = None
+        if self.year_established:
+            years_in_business = max(0, datetime.utcnow().year - int(self.year_established))
+
+        try:
+            data_sources = [DataSource(self.source)]
+        except ValueError:
+            data_sources = []
+
+        return BusinessLead(
+            business_name=self.name,
+            location=LocationInfo(
+                address=self.street,
+                city=self.city,
+                province=self.province,
+                postal_code=self.postal_code
+            ),
+            contact=ContactInfo(phone=self.phone, email=self.email, website=self.website),
+            industry=self.industry,
+            years_in_business=years_in_business,
+            employee_count=self.employee_count,
+            business_description=self.description,
+            review_count=self.review_count,
+            data_sources=data_sources,
+            confidence_score=self.confidence
+        )
+
+    def to_standard_output(self):
+        """Build the StandardLeadOutput (CSV export format) for this record."""
+        return self.to_business_lead().to_standard_output()
+
+
+def _pack_payload(payload: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """
+    Compact encoding of a provider payload (None when empty).
+
+    marshal is several times faster than JSON for the dict/list/str/number
+    payloads sources produce; anything it cannot encode (datetimes, custom
+    objects) is first reduced to JSON types, with str() as the fallback.
+    """
+    if not payload:
+        return None
+    try:
+        return marshal.dumps(payload)
+    except ValueError:
+        return marshal.dumps(json.loads(json.dumps(payload, default=str)))
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one copy of short repeated strings (source, city, province)."""
+    return sys.intern(value) if type(value) is str else value
 
 
 class BaseBusinessSource(ABC):
@@ -13,6 +13,8 @@ import structlog
 from bs4 import BeautifulSoup
 import re
 
+from ..services.http_transport import create_client_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -67,7 +69,7 @@ class CanadianImportersSearcher:
         businesses = []
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 # CID search by city
                 search_url = f"{self.base_url}/importingCity.html"
 
@@ -9,6 +9,8 @@ from urllib.parse import quote_plus
 import structlog
 from bs4 import BeautifulSoup
 
+from ..services.http_transport import create_client_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -51,7 +53,7 @@ class FourElevenSearcher:
         logger.info("411ca_search_started", query=query, location=location)
 
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with create_client_session(timeout=self.timeout) as session:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
                     'Accept': 'text/html,application/xhtml+xml',
@@ -11,6 +11,7 @@ import structlog
 from .base_source import BaseBusinessSource, BusinessData
 from ..core.config import config
 from ..core.resilience import call_with_retry
+from ..services.http_transport import create_client_session
 
 logger = structlog.get_logger(__name__)
 
@@ -149,7 +150,7 @@ class GeoapifySource(BaseBusinessSource):
         businesses = []
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 url = self.base_url
 
                 # Build request parameters
@@ -12,6 +12,7 @@ import structlog
 from .base_source import BaseBusinessSource, BusinessData
 from ..core.config import config
 from ..core.resilience import call_with_retry, google_places_limiter
+from ..services.http_transport import create_client_session
 
 logger = structlog.get_logger(__name__)
 
@@ -159,7 +160,7 @@ class GooglePlacesSource(BaseBusinessSource):
             # Rate limiting
             await google_places_limiter.acquire('google_places')
 
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 # New API uses POST with JSON body
                 url = f"{self.base_url}/places:searchText"
 
@@ -436,7 +437,7 @@ class GooglePlacesSource(BaseBusinessSource):
             # Rate limiting
             await google_places_limiter.acquire('google_places')
 
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 url = f"{self.base_url}/details/json"
                 params = {
                     'place_id': place_id,
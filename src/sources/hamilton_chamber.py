@@ -13,6 +13,8 @@ import structlog
 from bs4 import BeautifulSoup
 import re
 
+from ..services.http_transport import create_client_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -50,7 +52,7 @@ class HamiltonChamberSearcher:
         businesses = []
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 # Hamilton Chamber member directory URL
                 # Note: Actual URL structure needs verification
                 search_url = f"{self.base_url}/members"
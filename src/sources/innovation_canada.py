@@ -19,6 +19,7 @@ from bs4 import BeautifulSoup
 import structlog
 
 from src.sources.base_source import BaseBusinessSource, BusinessData
+from src.services.http_transport import create_client_session
 
 logger = structlog.get_logger(__name__)
 
@@ -108,7 +109,7 @@ class InnovationCanadaSource(BaseBusinessSource):
         )
 
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with create_client_session(timeout=self.timeout) as session:
                 # Build search URL
                 # Note: Actual URL structure would need to be determined from IC site
                 search_params = {
@@ -12,11 +12,10 @@ from typing import List, Dict, Optional, Set
 from datetime import datetime
 import structlog
 
+from src.core.normalization import normalize_city, normalize_name
 from src.sources.base_source import BaseBusinessSource, BusinessData
 from src.sources.sources_config import SourceManager, SOURCES_CONFIG
-from src.sources.hamilton_seed_list import HamiltonSeedListSource
-from src.sources.cme_members import CMECSVImporter
-from src.sources.innovation_canada import InnovationCanadaCSVImporter
+from src.sources.registry import SourceRegistry
 
 logger = structlog.get_logger(__name__)
 
@@ -33,80 +32,16 @@ class MultiSourceAggregator:
     - Stops when target count reached
     """
 
-    def __init__(self):
+    def __init__(self, registry: Optional[SourceRegistry] = None):
         self.source_manager = SourceManager(SOURCES_CONFIG)
-        self.sources: Dict[str, BaseBusinessSource] = {}
+        # Sources are imported and constructed lazily, only once selected
+        self.registry = registry or SourceRegistry()
         self.logger = logger
 
-        # Initialize available sources
-        self._initialize_sources()
-
-    def _initialize_sources(self):
-        """Initialize all available source implementations."""
-
-        # Always available: Small business seed list (highest priority - for qualified leads)
-        from src.sources.small_business_seed import SmallBusinessSeedListSource
-        self.sources['small_business_seed'] = SmallBusinessSeedListSource()
-
-        # Always available: Main seed list
-        self.sources['manual_seed_list'] = HamiltonSeedListSource()
-
-        # CSV importers (available if files exist)
-        self.sources['cme_csv_import'] = CMECSVImporter()
-        self.sources['innovation_canada_csv'] = InnovationCanadaCSVImporter()
-
-        # Google Places API (requires API key)
-        try:
-            from src.sources.google_places import GooglePlacesSource
-            self.sources['google_places'] = GooglePlacesSource()
-            self.logger.info("google_places_source_initialized")
-        except Exception as e:
-            self.logger.warning("google_places_init_failed", error=str(e))
-
-        # YellowPages scraper (free, no API key)
-        try:
-            from src.sources.yellowpages_source import YellowPagesSource
-            self.sources['yellowpages'] = YellowPagesSource()
-            self.logger.info("yellowpages_source_initialized")
-        except Exception as e:
-            self.logger.warning("yellowpages_init_failed", error=str(e))
-
-        # OpenStreetMap (free, no API key)
-        try:
-            from src.sources.openstreetmap_source import OpenStreetMapSource
-            self.sources['openstreetmap'] = OpenStreetMapSource()
-            self.logger.info("openstreetmap_source_initialized")
-        except Exception as e:
-            self.logger.warning("openstreetmap_init_failed", error=str(e))
-
-        # Canada411 scraper (free, no API key)
-        try:
-            from src.sources.canada411_source import Canada411Source
-            self.sources['canada411'] = Canada411Source()
-            self.logger.info("canada411_source_initialized")
-        except Exception as e:
-            self.logger.warning("canada411_init_failed", error=str(e))
-
-        # Geoapify Places API (free tier: 3,000 credits/day)
-        try:
-            from src.sources.geoapify_source import GeoapifySource
-            self.sources['geoapify'] = GeoapifySource()
-            self.logger.info("geoapify_source_initialized")
-        except Exception as e:
-            self.logger.warning("geoapify_init_failed", error=str(e))
-
-        # DuckDuckGo search (free, no API key - supplementary)
-        try:
-            from src.sources.duckduckgo_source import DuckDuckGoSource
-            self.sources['duckduckgo'] = DuckDuckGoSource()
-            self.logger.info("duckduckgo_source_initialized")
-        except Exception as e:
-            self.logger.warning("duckduckgo_init_failed", error=str(e))
-
-        self.logger.info(
-            "sources_initialized",
-            available_sources=list(self.sources.keys())
-        )
+    @property
+    def sources(self) -> Dict[str, BaseBusinessSource]:
+        """Sources that have been loaded so far, keyed by name."""
+        return self.registry.loaded()
 
     def get_available_sources(self) -> List[BaseBusinessSource]:
         """
@@ -117,7 +52,7 @@ class MultiSourceAggregator:
         """
         available = []
 
-        for name, source in self.sources.items():
+        for name in self.registry.names():
             config = self.source_manager.get_source_by_name(name)
 
             if not config:
@@ -127,6 +62,15 @@ class MultiSourceAggregator:
                 self.logger.debug("source_disabled", source=name)
                 continue
 
+            # Check API keys before importing the source module
+            if not self.registry.has_credentials(name):
+                self.logger.debug("source_missing_api_key", source=name)
+                continue
+
+            source = self.registry.load(name)
+            if source is None:
+                continue
+
             if not source.is_available():
                 self.logger.debug("source_not_available", source=name)
                 continue
@@ -261,16 +205,7 @@ class MultiSourceAggregator:
 
         Uses normalized name + city to identify duplicates across sources.
         """
-        name = business.name.lower().strip()
-        # Remove common suffixes
-        for suffix in [' inc', ' inc.', ' ltd', ' ltd.', ' corp', ' corp.', ' llc']:
-            name = name.replace(suffix, '')
-        name = ''.join(c for c in name if c.isalnum() or c.isspace())
-        name = ' '.join(name.split())  # Normalize whitespace
-
-        city = (business.city or '').lower().strip()
-
-        return f"{name}|{city}"
+        return f"{normalize_name(business.name)}|{normalize_city(business.city)}"
 
     def get_source_metrics(self) -> List[Dict]:
         """Get performance metrics for all sources."""
@@ -7,6 +7,8 @@ import aiohttp
 from typing import List, Dict, Any, Optional
 import structlog
 
+from ..services.http_transport import create_client_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -83,7 +85,7 @@ class OpenStreetMapSearcher:
         logger.info("osm_search_started", lat=latitude, lon=longitude, radius=radius_meters)
 
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with create_client_session(timeout=self.timeout) as session:
                 async with session.post(
                     self.overpass_url,
                     data={"data": overpass_query},
@@ -105,28 +107,9 @@ class OpenStreetMapSearcher:
                     # Parse results
                     businesses = []
                     for element in elements:
-                        tags_data = element.get('tags', {})
-
-                        # Extract business info
-                        name = tags_data.get('name')
-                        if not name:
-                            continue  # Skip unnamed entities
-
-                        business = {
-                            'name': name,
-                            'street': self._build_address(tags_data),
-                            'city': tags_data.get('addr:city', 'Hamilton'),
-                            'postal_code': tags_data.get('addr:postcode'),
-                            'phone': tags_data.get('phone') or tags_data.get('contact:phone'),
-                            'website': tags_data.get('website') or tags_data.get('contact:website'),
-                            'latitude': element.get('lat'),
-                            'longitude': element.get('lon'),
-                            'osm_type': element.get('type'),
-                            'osm_id': element.get('id'),
-                            'tags': tags_data
-                        }
-
-                        businesses.append(business)
+                        business = self._element_to_business(element)
+                        if business:
+                            businesses.append(business)
 
                     logger.info("osm_search_complete", businesses_found=len(businesses))
                     return businesses
@@ -138,6 +121,29 @@ class OpenStreetMapSearcher:
             logger.error("osm_search_failed", error=str(e))
             return []
 
+    def _element_to_business(self, element: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert an OSM element (node/way with tags) to a business dict."""
+        tags_data = element.get('tags', {})
+
+        # Extract business info
+        name = tags_data.get('name')
+        if not name:
+            return None  # Skip unnamed entities
+
+        return {
+            'name': name,
+            'street': self._build_address(tags_data),
+            'city': tags_data.get('addr:city', 'Hamilton'),
+            'postal_code': tags_data.get('addr:postcode'),
+            'phone': tags_data.get('phone') or tags_data.get('contact:phone'),
+            'website': tags_data.get('website') or tags_data.get('contact:website'),
+            'latitude': element.get('lat'),
+            'longitude': element.get('lon'),
+            'osm_type': element.get('type'),
+            'osm_id': element.get('id'),
+            'tags': tags_data
+        }
+
     def _build_address(self, tags: Dict[str, str]) -> Optional[str]:
         """Build full street address from OSM tags."""
         parts = []
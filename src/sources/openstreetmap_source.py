@@ -1,11 +1,15 @@
 """
 OpenStreetMap Source - BaseBusinessSource wrapper for OpenStreetMapSearcher
 """
+import asyncio
+from pathlib import Path
 from typing import List, Optional
 import structlog
 
+from ..core.config import config
 from .base_source import BaseBusinessSource, BusinessData
 from .openstreetmap import OpenStreetMapSearcher
+from .osm_extract import LocalOSMSearcher, OSMExtractIndex
 
 logger = structlog.get_logger(__name__)
 
@@ -15,11 +19,25 @@ class OpenStreetMapSource(BaseBusinessSource):
     OpenStreetMap business discovery source.
 
     Free, open data. Good for geographic-based discovery.
+
+    Backends:
+        overpass: public Overpass API (slow, rate-limited)
+        local: offline extract index (see osm_extract.py), refreshed from diffs
+        auto: local when the extract index exists, otherwise overpass
     """
 
-    def __init__(self):
+    def __init__(self, backend: Optional[str] = None):
         super().__init__(name='openstreetmap', priority=45)
-        self.searcher = OpenStreetMapSearcher()
+        self.backend = (backend or config.OSM_BACKEND).lower()
+        if self.backend == 'auto':
+            self.backend = 'local' if Path(config.OSM_EXTRACT_DB_PATH).exists() else 'overpass'
+
+        self.extract_index = None
+        if self.backend == 'local':
+            self.extract_index = OSMExtractIndex(config.OSM_EXTRACT_DB_PATH)
+            self.searcher = LocalOSMSearcher(self.extract_index)
+        else:
+            self.searcher = OpenStreetMapSearcher()
 
     def validate_config(self) -> bool:
         """OpenStreetMap is always available (no API key needed)."""
@@ -42,10 +60,11 @@ class OpenStreetMapSource(BaseBusinessSource):
         Returns:
             List of BusinessData objects
         """
-        import asyncio
         start_time = asyncio.get_event_loop().time()
 
         try:
+            await self._refresh_extract_if_stale()
+
             # Map industry to OSM types
             industry_types = self._get_osm_types(industry)
 
@@ -67,6 +86,7 @@ class OpenStreetMapSource(BaseBusinessSource):
 
             self.logger.info(
                 "openstreetmap_fetch_complete",
+                backend=self.backend,
                 businesses_found=len(businesses),
                 fetch_time=fetch_time
             )
@@ -79,6 +99,18 @@ class OpenStreetMapSource(BaseBusinessSource):
             self.logger.error("openstreetmap_fetch_failed", error=str(e))
             return []
 
+    async def _refresh_extract_if_stale(self):
+        """Apply pending replication diffs to the local extract (off the event loop)."""
+        if self.extract_index is None or not config.OSM_DIFF_DIR:
+            return
+        if not self.extract_index.is_stale(config.OSM_REFRESH_INTERVAL_HOURS):
+            return
+        try:
+            await asyncio.to_thread(self.extract_index.refresh_from_diffs, config.OSM_DIFF_DIR)
+        except Exception as e:
+            # A failed refresh leaves the previous extract in place
+            self.logger.warning("osm_extract_refresh_failed", error=str(e))
+
     def _get_osm_types(self, industry: Optional[str]) -> List[str]:
         """Map industry to OSM types."""
         if not industry:
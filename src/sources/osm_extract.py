@@ -0,0 +1,535 @@
+"""
+Offline OpenStreetMap extract index.
+
+Loads a local OSM extract (PBF or GeoJSON) for the Hamilton region into
+SQLite with an R*Tree spatial index and tag indexes on the business keys
+(industrial, craft, office, shop, man_made). LocalOSMSearcher answers the
+same tag + bbox queries as the Overpass-backed OpenStreetMapSearcher, from
+disk, in milliseconds.
+
+The index is kept current by applying OsmChange (.osc / .osc.gz) replication
+diffs in sequence order; the last applied sequence is stored in the index.
+
+PBF import requires pyosmium (optional dependency):
+    pip install osmium
+
+Usage:
+    python -m src.sources.osm_extract import ontario-latest.osm.pbf
+    python -m src.sources.osm_extract refresh data/osm_diffs
+    python -m src.sources.osm_extract stats
+"""
+import gzip
+import json
+import re
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import structlog
+
+from ..core.spatial import radius_to_bbox
+from .openstreetmap import OpenStreetMapSearcher
+
+try:
+    import osmium
+except ImportError:
+    osmium = None
+
+logger = structlog.get_logger(__name__)
+
+
+# Tag keys with an index; features without any of them are not imported
+INDEXED_TAG_KEYS = ('industrial', 'craft', 'office', 'shop', 'man_made')
+
+# (key, allowed values or None for any value) - same selection as the default
+# Overpass query in OpenStreetMapSearcher.search_businesses
+DEFAULT_BUSINESS_FILTERS: List[Tuple[str, Optional[List[str]]]] = [
+    ('industrial', None),
+    ('craft', None),
+    ('man_made', ['works']),
+    ('office', ['company', 'manufacturer', 'distributor']),
+    ('shop', ['wholesale']),
+]
+
+# Hamilton region: (south, west, north, east)
+HAMILTON_BBOX = (43.05, -80.25, 43.50, -79.55)
+
+# (min_lat, max_lat, min_lon, max_lon)
+Bounds = Tuple[float, float, float, float]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS osm_features (
+    id INTEGER PRIMARY KEY,
+    osm_type TEXT NOT NULL,
+    osm_id INTEGER NOT NULL,
+    name TEXT,
+    lat REAL,
+    lon REAL,
+    tags TEXT NOT NULL,
+    version INTEGER,
+    UNIQUE(osm_type, osm_id)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS osm_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon);
+CREATE TABLE IF NOT EXISTS osm_tags (
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    feature_id INTEGER NOT NULL,
+    PRIMARY KEY (key, value, feature_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_osm_tags_feature ON osm_tags(feature_id);
+CREATE TABLE IF NOT EXISTS osm_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _is_business(tags: Dict[str, str]) -> bool:
+    return any(key in tags for key in INDEXED_TAG_KEYS)
+
+
+def _bounds_from_points(points: Iterable[Tuple[float, float]]) -> Optional[Bounds]:
+    """Bounds from (lat, lon) pairs."""
+    points = list(points)
+    if not points:
+        return None
+    lats = [p[0] for p in points]
+    lons = [p[1] for p in points]
+    return (min(lats), max(lats), min(lons), max(lons))
+
+
+def _intersects(bounds: Bounds, bbox: Optional[Tuple[float, float, float, float]]) -> bool:
+    if bbox is None:
+        return True
+    south, west, north, east = bbox
+    return bounds[0] <= north and bounds[1] >= south and bounds[2] <= east and bounds[3] >= west
+
+
+def _diff_sequence(path: Path) -> int:
+    """Replication sequence from a diff path (e.g. 000/123/456.osc.gz -> 123456)."""
+    digits = re.findall(r'\d+', path.as_posix())
+    return int(''.join(digits[-3:])) if digits else 0
+
+
+class OSMExtractIndex:
+    """SQLite index of business-tagged OSM features."""
+
+    def __init__(self, db_path: str = "data/osm_extract.db"):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------ writes
+
+    def _feature_id(self, conn, osm_type: str, osm_id: int) -> Optional[int]:
+        row = conn.execute(
+            "SELECT id FROM osm_features WHERE osm_type = ? AND osm_id = ?", (osm_type, osm_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _delete(self, conn, osm_type: str, osm_id: int) -> bool:
+        feature_id = self._feature_id(conn, osm_type, osm_id)
+        if feature_id is None:
+            return False
+        conn.execute("DELETE FROM osm_features WHERE id = ?", (feature_id,))
+        conn.execute("DELETE FROM osm_rtree WHERE id = ?", (feature_id,))
+        conn.execute("DELETE FROM osm_tags WHERE feature_id = ?", (feature_id,))
+        return True
+
+    def _upsert(
+        self,
+        conn,
+        osm_type: str,
+        osm_id: int,
+        tags: Dict[str, str],
+        bounds: Optional[Bounds],
+        version: Optional[int] = None
+    ) -> bool:
+        """Insert or update a feature; features that lost their business tags are removed."""
+        if not _is_business(tags):
+            self._delete(conn, osm_type, osm_id)
+            return False
+
+        feature_id = self._feature_id(conn, osm_type, osm_id)
+        if bounds is None:
+            if feature_id is None:
+                return False  # No geometry known for a new feature
+            row = conn.execute(
+                "SELECT min_lat, max_lat, min_lon, max_lon FROM osm_rtree WHERE id = ?", (feature_id,)
+            ).fetchone()
+            bounds = tuple(row)
+
+        lat = (bounds[0] + bounds[1]) / 2
+        lon = (bounds[2] + bounds[3]) / 2
+        values = (tags.get('name'), lat, lon, json.dumps(tags, sort_keys=True), version)
+
+        if feature_id is None:
+            cursor = conn.execute(
+                """INSERT INTO osm_features (osm_type, osm_id, name, lat, lon, tags, version)
+                VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (osm_type, osm_id) + values
+            )
+            feature_id = cursor.lastrowid
+        else:
+            conn.execute(
+                "UPDATE osm_features SET name = ?, lat = ?, lon = ?, tags = ?, version = ? WHERE id = ?",
+                values + (feature_id,)
+            )
+            conn.execute("DELETE FROM osm_tags WHERE feature_id = ?", (feature_id,))
+
+        conn.execute("INSERT OR REPLACE INTO osm_rtree VALUES (?, ?, ?, ?, ?)", (feature_id,) + tuple(bounds))
+        conn.executemany(
+            "INSERT OR IGNORE INTO osm_tags (key, value, feature_id) VALUES (?, ?, ?)",
+            [(key, tags[key], feature_id) for key in INDEXED_TAG_KEYS if key in tags]
+        )
+        return True
+
+    def _set_meta(self, conn, **values):
+        conn.executemany(
+            "INSERT OR REPLACE INTO osm_meta (key, value) VALUES (?, ?)",
+            [(key, str(value)) for key, value in values.items()]
+        )
+
+    def get_meta(self) -> Dict[str, str]:
+        with sqlite3.connect(self.db_path) as conn:
+            return dict(conn.execute("SELECT key, value FROM osm_meta").fetchall())
+
+    # ----------------------------------------------------------------- imports
+
+    def import_extract(
+        self,
+        path: Union[str, Path],
+        bbox: Optional[Tuple[float, float, float, float]] = HAMILTON_BBOX
+    ) -> Dict[str, Any]:
+        """
+        Import a PBF (.pbf/.osm.pbf) or GeoJSON (.geojson/.json) extract.
+
+        Args:
+            path: Extract file
+            bbox: Only keep features intersecting (south, west, north, east); None keeps all
+
+        Returns:
+            Import statistics
+        """
+        path = Path(path)
+        if path.suffix == '.pbf':
+            return self.import_pbf(path, bbox=bbox)
+        return self.import_geojson(path, bbox=bbox)
+
+    def import_geojson(
+        self,
+        path: Union[str, Path],
+        bbox: Optional[Tuple[float, float, float, float]] = HAMILTON_BBOX
+    ) -> Dict[str, Any]:
+        """
+        Import a GeoJSON FeatureCollection (osmtogeojson / ogr2ogr / Overpass turbo export).
+
+        Feature ids are read from ``id`` or ``properties['@id']`` ("node/123");
+        tags from ``properties['tags']`` or the flat properties.
+        """
+        start = time.perf_counter()
+        with open(path, 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+
+        stats = {'imported': 0, 'skipped': 0}
+        with sqlite3.connect(self.db_path) as conn:
+            for feature in collection.get('features', []):
+                parsed = self._parse_geojson_feature(feature)
+                if parsed is None or not _intersects(parsed[3], bbox):
+                    stats['skipped'] += 1
+                    continue
+                osm_type, osm_id, tags, bounds = parsed
+                if self._upsert(conn, osm_type, osm_id, tags, bounds):
+                    stats['imported'] += 1
+                else:
+                    stats['skipped'] += 1
+            self._set_meta(conn, source=str(path), imported_at=datetime.now().isoformat(),
+                           refreshed_at=datetime.now().isoformat())
+
+        stats['seconds'] = round(time.perf_counter() - start, 3)
+        logger.info("osm_extract_imported", path=str(path), **stats)
+        return stats
+
+    @staticmethod
+    def _parse_geojson_feature(feature: Dict[str, Any]):
+        properties = feature.get('properties') or {}
+        raw_id = feature.get('id') or properties.get('@id') or properties.get('id')
+        if isinstance(raw_id, str) and '/' in raw_id:
+            osm_type, _, osm_id = raw_id.partition('/')
+        else:
+            osm_type, osm_id = properties.get('osm_type', properties.get('type', 'node')), raw_id
+        try:
+            osm_id = int(osm_id)
+        except (TypeError, ValueError):
+            return None
+
+        tags = properties.get('tags')
+        if not isinstance(tags, dict):
+            tags = {k: str(v) for k, v in properties.items() if not k.startswith('@') and v is not None
+                    and k not in ('id', 'osm_type', 'type')}
+        if not _is_business(tags):
+            return None
+
+        geometry = feature.get('geometry') or {}
+
+        def points(coords):
+            if coords and isinstance(coords[0], (int, float)):
+                yield (coords[1], coords[0])
+            else:
+                for item in coords or []:
+                    yield from points(item)
+
+        bounds = _bounds_from_points(points(geometry.get('coordinates')))
+        if bounds is None:
+            return None
+        return osm_type, osm_id, tags, bounds
+
+    def import_pbf(
+        self,
+        path: Union[str, Path],
+        bbox: Optional[Tuple[float, float, float, float]] = HAMILTON_BBOX
+    ) -> Dict[str, Any]:
+        """Import nodes and ways with business tags from a PBF extract (requires pyosmium)."""
+        if osmium is None:
+            raise ImportError("pyosmium is required for PBF import: pip install osmium")
+
+        start = time.perf_counter()
+        index = self
+        stats = {'imported': 0, 'skipped': 0}
+
+        with sqlite3.connect(self.db_path) as conn:
+            class _BusinessHandler(osmium.SimpleHandler):
+                def _store(self, osm_type, obj, bounds):
+                    if bounds is None or not _intersects(bounds, bbox):
+                        stats['skipped'] += 1
+                        return
+                    tags = {tag.k: tag.v for tag in obj.tags}
+                    if index._upsert(conn, osm_type, obj.id, tags, bounds, obj.version):
+                        stats['imported'] += 1
+
+                def node(self, n):
+                    if any(key in n.tags for key in INDEXED_TAG_KEYS) and n.location.valid():
+                        lat, lon = n.location.lat, n.location.lon
+                        self._store('node', n, (lat, lat, lon, lon))
+
+                def way(self, w):
+                    if any(key in w.tags for key in INDEXED_TAG_KEYS):
+                        coords = [(nd.lat, nd.lon) for nd in w.nodes if nd.location.valid()]
+                        self._store('way', w, _bounds_from_points(coords))
+
+            _BusinessHandler().apply_file(str(path), locations=True)
+            self._set_meta(conn, source=str(path), imported_at=datetime.now().isoformat(),
+                           refreshed_at=datetime.now().isoformat())
+
+        stats['seconds'] = round(time.perf_counter() - start, 3)
+        logger.info("osm_extract_imported", path=str(path), **stats)
+        return stats
+
+    # ------------------------------------------------------------------- diffs
+
+    def apply_diff(self, path: Union[str, Path]) -> Dict[str, int]:
+        """
+        Apply an OsmChange diff (.osc or .osc.gz).
+
+        Node geometry comes from the diff itself. Way geometry is rebuilt only
+        when every node of the way is in the same diff; otherwise (tag-only
+        changes, or the usual diff carrying just the moved nodes) the stored
+        geometry is kept.
+        """
+        path = Path(path)
+        opener = gzip.open if path.suffix == '.gz' else open
+        with opener(path, 'rb') as f:
+            root = ET.parse(f).getroot()
+
+        stats = {'upserted': 0, 'deleted': 0, 'skipped': 0}
+        node_locations: Dict[int, Tuple[float, float]] = {}
+
+        # Collect node locations first so ways can be placed from them
+        for node in root.iter('node'):
+            if node.get('lat') is not None:
+                node_locations[int(node.get('id'))] = (float(node.get('lat')), float(node.get('lon')))
+
+        with sqlite3.connect(self.db_path) as conn:
+            for action in root:
+                for element in action:
+                    if element.tag not in ('node', 'way'):
+                        continue
+                    osm_id = int(element.get('id'))
+
+                    if action.tag == 'delete':
+                        if self._delete(conn, element.tag, osm_id):
+                            stats['deleted'] += 1
+                        continue
+
+                    tags = {tag.get('k'): tag.get('v') for tag in element.findall('tag')}
+                    if element.tag == 'node':
+                        lat, lon = node_locations.get(osm_id, (None, None))
+                        bounds = (lat, lat, lon, lon) if lat is not None else None
+                    else:
+                        refs = [int(nd.get('ref')) for nd in element.findall('nd')]
+                        bounds = None
+                        if refs and all(r in node_locations for r in refs):
+                            bounds = _bounds_from_points(node_locations[r] for r in refs)
+
+                    version = int(element.get('version')) if element.get('version') else None
+                    if self._upsert(conn, element.tag, osm_id, tags, bounds, version):
+                        stats['upserted'] += 1
+                    else:
+                        stats['skipped'] += 1
+
+        logger.info("osm_diff_applied", path=str(path), **stats)
+        return stats
+
+    def refresh_from_diffs(self, diff_dir: Union[str, Path]) -> Dict[str, int]:
+        """
+        Apply replication diffs newer than the last applied sequence, in order.
+
+        Returns:
+            Totals across applied diffs plus the new sequence number
+        """
+        diff_dir = Path(diff_dir)
+        last_sequence = int(self.get_meta().get('diff_sequence', 0))
+        diffs = sorted(
+            (_diff_sequence(p.relative_to(diff_dir)), p)
+            for p in list(diff_dir.rglob('*.osc')) + list(diff_dir.rglob('*.osc.gz'))
+        )
+
+        totals = {'diffs_applied': 0, 'upserted': 0, 'deleted': 0, 'skipped': 0, 'sequence': last_sequence}
+        for sequence, path in diffs:
+            if sequence <= last_sequence:
+                continue
+            stats = self.apply_diff(path)
+            for key in ('upserted', 'deleted', 'skipped'):
+                totals[key] += stats[key]
+            totals['diffs_applied'] += 1
+            totals['sequence'] = sequence
+            with sqlite3.connect(self.db_path) as conn:
+                self._set_meta(conn, diff_sequence=sequence)
+
+        with sqlite3.connect(self.db_path) as conn:
+            self._set_meta(conn, refreshed_at=datetime.now().isoformat())
+        logger.info("osm_extract_refreshed", **totals)
+        return totals
+
+    def is_stale(self, max_age_hours: float) -> bool:
+        """True if the index was never refreshed or the last refresh is older than max_age_hours."""
+        refreshed_at = self.get_meta().get('refreshed_at')
+        if not refreshed_at:
+            return True
+        return datetime.now() - datetime.fromisoformat(refreshed_at) > timedelta(hours=max_age_hours)
+
+    # ----------------------------------------------------------------- queries
+
+    def query(
+        self,
+        bbox: Tuple[float, float, float, float],
+        filters: Optional[Sequence[Tuple[str, Optional[List[str]]]]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Features inside bbox (south, west, north, east) matching any tag filter.
+
+        Returns Overpass-style elements: {'type', 'id', 'lat', 'lon', 'tags'}.
+        """
+        filters = DEFAULT_BUSINESS_FILTERS if filters is None else filters
+        south, west, north, east = bbox
+
+        clauses, params = [], []
+        for key, values in filters:
+            if values:
+                clauses.append(f"(t.key = ? AND t.value IN ({','.join('?' * len(values))}))")
+                params.extend([key, *values])
+            else:
+                clauses.append("t.key = ?")
+                params.append(key)
+
+        sql = f"""
+            SELECT DISTINCT f.id, f.osm_type, f.osm_id, f.lat, f.lon, f.tags
+            FROM osm_rtree r
+            JOIN osm_features f ON f.id = r.id
+            JOIN osm_tags t ON t.feature_id = f.id
+            WHERE r.min_lat <= ? AND r.max_lat >= ? AND r.min_lon <= ? AND r.max_lon >= ?
+              AND ({' OR '.join(clauses) or '1'})
+            ORDER BY f.id
+        """
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(sql, [north, south, east, west, *params]).fetchall()
+
+        return [
+            {'type': row[1], 'id': row[2], 'lat': row[3], 'lon': row[4], 'tags': json.loads(row[5])}
+            for row in rows
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with sqlite3.connect(self.db_path) as conn:
+            total = conn.execute("SELECT COUNT(*) FROM osm_features").fetchone()[0]
+            by_key = dict(conn.execute("SELECT key, COUNT(*) FROM osm_tags GROUP BY key").fetchall())
+        return {'features': total, 'by_tag_key': by_key, **self.get_meta()}
+
+
+class LocalOSMSearcher(OpenStreetMapSearcher):
+    """
+    Drop-in replacement for OpenStreetMapSearcher backed by an OSMExtractIndex.
+    """
+
+    def __init__(self, index: OSMExtractIndex):
+        super().__init__()
+        self.index = index
+
+    async def search_businesses(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_meters: int = 15000,
+        tags: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Search the local extract for businesses near a location."""
+        start = time.perf_counter()
+        filters = [(key, [value]) for key, value in tags.items()] if tags else None
+        elements = self.index.query(radius_to_bbox(latitude, longitude, radius_meters), filters)
+
+        businesses = []
+        for element in elements:
+            business = self._element_to_business(element)
+            if business:
+                businesses.append(business)
+
+        logger.info(
+            "osm_local_search_complete",
+            businesses_found=len(businesses),
+            query_ms=round((time.perf_counter() - start) * 1000, 2)
+        )
+        return businesses
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Offline OSM extract index")
+    parser.add_argument('--db', default='data/osm_extract.db', help="Index database path")
+    sub = parser.add_subparsers(dest='command', required=True)
+    import_cmd = sub.add_parser('import', help="Import a PBF or GeoJSON extract")
+    import_cmd.add_argument('path')
+    import_cmd.add_argument('--all', action='store_true', help="Keep features outside the Hamilton bbox")
+    refresh_cmd = sub.add_parser('refresh', help="Apply replication diffs from a directory")
+    refresh_cmd.add_argument('diff_dir')
+    sub.add_parser('stats', help="Show index statistics")
+    args = parser.parse_args()
+
+    extract_index = OSMExtractIndex(args.db)
+    if args.command == 'import':
+        print(extract_index.import_extract(args.path, bbox=None if args.all else HAMILTON_BBOX))
+    elif args.command == 'refresh':
+        print(extract_index.refresh_from_diffs(args.diff_dir))
+    else:
+        print(json.dumps(extract_index.get_stats(), indent=2))
@@ -3,11 +3,12 @@ Multi-source place type lookup with canonical mapping.
 PRIORITY: P0 - Critical for category validation.
 """
 
-import aiohttp
 import json
 from typing import List, Optional, Dict, Set
 import structlog
 
+from ..services.http_transport import create_client_session
+
 try:
     from ..core.resilience import call_with_retry, google_places_limiter
 except ImportError:
@@ -206,7 +207,7 @@ class PlacesService:
         try:
             await google_places_limiter.acquire('google_places')
 
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 # Use Place Search to find the business
                 search_url = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
                 params = {
@@ -240,7 +241,7 @@ class PlacesService:
             return []
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 search_url = "https://api.yelp.com/v3/businesses/search"
                 headers = {'Authorization': f'Bearer {self.yelp_api_key}'}
                 params = {
@@ -270,7 +271,7 @@ class PlacesService:
     async def get_osm_tags(self, name: str, address: str) -> List[str]:
         """Query OpenStreetMap for tags."""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 search_url = "https://nominatim.openstreetmap.org/search"
                 params = {
                     'q': f"{name} {address}",
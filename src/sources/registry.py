@@ -0,0 +1,181 @@
+"""
+Lazy source registry.
+
+Sources are declared by name and import path and are only imported and
+constructed when the aggregator actually selects them. A source that is
+disabled in SOURCES_CONFIG, or whose API key is not configured, is never
+imported, so CLI tools that never touch discovery don't pay for BeautifulSoup,
+aiohttp or provider config validation at startup.
+
+Usage:
+    registry = SourceRegistry()
+    source = registry.load('openstreetmap')   # imported + constructed here
+    registry.get_timings()                    # per-source import/init cost
+
+Run as a script to print import cost for every registered source:
+    python -m src.sources.registry
+"""
+import importlib
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """Declaration of a source implementation."""
+    name: str
+    target: str  # "package.module:ClassName"
+    api_key_service: Optional[str] = None  # Service name for config.has_api_key()
+
+    @property
+    def module_path(self) -> str:
+        return self.target.split(':', 1)[0]
+
+    @property
+    def class_name(self) -> str:
+        return self.target.split(':', 1)[1]
+
+
+# Registration order is the fallback order for equal priorities
+SOURCE_SPECS: List[SourceSpec] = [
+    SourceSpec('small_business_seed', 'src.sources.small_business_seed:SmallBusinessSeedListSource'),
+    SourceSpec('manual_seed_list', 'src.sources.hamilton_seed_list:HamiltonSeedListSource'),
+    SourceSpec('cme_csv_import', 'src.sources.cme_members:CMECSVImporter'),
+    SourceSpec('innovation_canada_csv', 'src.sources.innovation_canada:InnovationCanadaCSVImporter'),
+    SourceSpec('google_places', 'src.sources.google_places:GooglePlacesSource', api_key_service='google_places'),
+    SourceSpec('yellowpages', 'src.sources.yellowpages_source:YellowPagesSource'),
+    SourceSpec('openstreetmap', 'src.sources.openstreetmap_source:OpenStreetMapSource'),
+    SourceSpec('canada411', 'src.sources.canada411_source:Canada411Source'),
+    SourceSpec('geoapify', 'src.sources.geoapify_source:GeoapifySource', api_key_service='geoapify'),
+    SourceSpec('duckduckgo', 'src.sources.duckduckgo_source:DuckDuckGoSource'),
+]
+
+
+class SourceRegistry:
+    """
+    Registry that imports and constructs sources on first use.
+
+    Failed imports/constructions are remembered so a broken source is only
+    attempted once per registry.
+    """
+
+    def __init__(self, specs: Optional[List[SourceSpec]] = None):
+        self.specs: Dict[str, SourceSpec] = {}
+        self._instances: Dict[str, object] = {}
+        self._failed: Dict[str, str] = {}
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self.logger = logger
+
+        for spec in (SOURCE_SPECS if specs is None else specs):
+            self.register(spec)
+
+    def register(self, spec: SourceSpec):
+        """Register (or replace) a source declaration."""
+        self.specs[spec.name] = spec
+        self._instances.pop(spec.name, None)
+        self._failed.pop(spec.name, None)
+
+    def names(self) -> List[str]:
+        """Names of all registered sources, in registration order."""
+        return list(self.specs.keys())
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def has_credentials(self, name: str) -> bool:
+        """Check the source's API key without importing the source module."""
+        spec = self.specs.get(name)
+        if spec is None:
+            return False
+        if not spec.api_key_service:
+            return True
+
+        from src.core.config import config
+        return config.has_api_key(spec.api_key_service)
+
+    def load(self, name: str):
+        """
+        Import and construct a source (cached).
+
+        Returns:
+            Source instance, or None if unknown or failed to load
+        """
+        if name in self._instances:
+            return self._instances[name]
+        if name in self._failed or name not in self.specs:
+            return None
+
+        spec = self.specs[name]
+        already_imported = spec.module_path in sys.modules
+
+        try:
+            start = time.perf_counter()
+            module = importlib.import_module(spec.module_path)
+            imported = time.perf_counter()
+            source = getattr(module, spec.class_name)()
+            constructed = time.perf_counter()
+        except Exception as e:
+            self._failed[name] = str(e)
+            self.logger.warning("source_load_failed", source=name, error=str(e))
+            return None
+
+        self._instances[name] = source
+        self._timings[name] = {
+            'import_ms': (imported - start) * 1000,
+            'init_ms': (constructed - imported) * 1000,
+            'cached_import': already_imported
+        }
+        self.logger.info(
+            "source_loaded",
+            source=name,
+            import_ms=round(self._timings[name]['import_ms'], 2),
+            init_ms=round(self._timings[name]['init_ms'], 2)
+        )
+        return source
+
+    def loaded(self) -> Dict[str, object]:
+        """Sources constructed so far, keyed by name."""
+        return dict(self._instances)
+
+    def get_failures(self) -> Dict[str, str]:
+        """Sources that failed to load, with the error."""
+        return dict(self._failed)
+
+    def get_timings(self) -> Dict[str, Dict[str, float]]:
+        """Import and construction cost per loaded source."""
+        return {name: dict(t) for name, t in self._timings.items()}
+
+
+def measure_import_times(specs: Optional[List[SourceSpec]] = None) -> Dict[str, float]:
+    """
+    Measure the import cost of each source module in milliseconds.
+
+    Modules are imported in registration order, so shared dependencies are
+    attributed to the first source that pulls them in.
+    """
+    timings = {}
+    for spec in (SOURCE_SPECS if specs is None else specs):
+        start = time.perf_counter()
+        try:
+            importlib.import_module(spec.module_path)
+        except Exception as e:
+            logger.warning("source_import_failed", source=spec.name, error=str(e))
+            continue
+        timings[spec.name] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+if __name__ == '__main__':
+    timings = measure_import_times()
+    print(f"\n{'Source':<25} {'Import (ms)':>12}")
+    print("-" * 38)
+    for name, ms in timings.items():
+        print(f"{name:<25} {ms:>12.1f}")
+    print("-" * 38)
+    print(f"{'total':<25} {sum(timings.values()):>12.1f}")
@@ -12,6 +12,8 @@ import structlog
 from bs4 import BeautifulSoup
 import re
 
+from ..services.http_transport import create_client_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -49,7 +51,7 @@ class YellowPagesSearcher:
         businesses = []
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with create_client_session() as session:
                 # Yellow Pages search URL format
                 search_url = f"{self.base_url}/search/si/1/{query}/{location}"
 
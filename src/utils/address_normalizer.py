@@ -10,6 +10,8 @@ import re
 from typing import Dict, Optional, Tuple
 import structlog
 
+from ..core.normalization import memoized
+
 logger = structlog.get_logger(__name__)
 
 # Canada Post standard abbreviations
@@ -55,6 +57,21 @@ CANADA_POST_ABBREV = {
     "Rm": "Room",
 }
 
+_POSTAL_CODE = re.compile(r'\b([A-Z]\d[A-Z]\s?\d[A-Z]\d)\b', re.IGNORECASE)
+_PROVINCE = re.compile(r'\b(ON|Ontario|QC|Quebec|BC|British Columbia)\b', re.IGNORECASE)
+_UNIT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'#\s*(\d+[A-Z]?)',
+    r'\b(Unit|Apt|Ste|Suite|Apartment)\s+(\d+[A-Z]?)\b',
+    r'\bUnit\s*(\d+[A-Z]?)\b',
+))
+_STREET_NUMBER = re.compile(r'^(\d+[A-Z]?)\b', re.IGNORECASE)
+_DIRECTION = re.compile(
+    r'\b(E|W|N|S|NE|NW|SE|SW|East|West|North|South|Northeast|Northwest|Southeast|Southwest)\b',
+    re.IGNORECASE
+)
+_STREET_TYPE = re.compile(r'\b(' + '|'.join(CANADA_POST_ABBREV.keys()) + r')\b\.?', re.IGNORECASE)
+_PARSE_STREET_NUMBER = re.compile(r'^(\d+[A-Z]?(?:-[A-Z])?)\b', re.IGNORECASE)
+
 
 def normalize_address(address_string: str) -> Dict[str, str]:
     """
@@ -82,6 +99,12 @@ def normalize_address(address_string: str) -> Dict[str, str]:
         >>> normalize_address("123 Main St E, Unit 7, Hamilton ON L8P 4R5")
         {'street_number': '123', 'street_name': 'Main', 'street_type': 'Street', ...}
     """
+    # Parsed once per distinct address; callers get their own copy
+    return dict(_parse_address(address_string))
+
+
+@memoized
+def _parse_address(address_string: str) -> Dict[str, str]:
     if not address_string:
         return {
             'street_number': '',
@@ -113,13 +136,13 @@ def normalize_address(address_string: str) -> Dict[str, str]:
     addr = address_string.strip()
 
     # Extract postal code (Canadian format: A1A 1A1 or A1A1A1)
-    postal_match = re.search(r'\b([A-Z]\d[A-Z]\s?\d[A-Z]\d)\b', addr, re.IGNORECASE)
+    postal_match = _POSTAL_CODE.search(addr)
     if postal_match:
         result['postal_code'] = postal_match.group(1).upper().replace(' ', '')
         addr = addr[:postal_match.start()] + addr[postal_match.end():]
 
     # Extract province (ON, Ontario, etc.)
-    province_match = re.search(r'\b(ON|Ontario|QC|Quebec|BC|British Columbia)\b', addr, re.IGNORECASE)
+    province_match = _PROVINCE.search(addr)
     if province_match:
         province = province_match.group(1)
         result['province'] = 'ON' if province.upper() in ['ON', 'ONTARIO'] else province
@@ -137,13 +160,8 @@ def normalize_address(address_string: str) -> Dict[str, str]:
         street_part = addr
 
     # Extract unit number (Unit 5, Apt 3, #7, Suite 10, etc.)
-    unit_patterns = [
-        r'#\s*(\d+[A-Z]?)',
-        r'\b(Unit|Apt|Ste|Suite|Apartment)\s+(\d+[A-Z]?)\b',
-        r'\bUnit\s*(\d+[A-Z]?)\b',
-    ]
-    for pattern in unit_patterns:
-        unit_match = re.search(pattern, street_part, re.IGNORECASE)
+    for pattern in _UNIT_PATTERNS:
+        unit_match = pattern.search(street_part)
         if unit_match:
             if len(unit_match.groups()) == 2:
                 result['unit'] = f"{unit_match.group(1)} {unit_match.group(2)}"
@@ -156,22 +174,20 @@ def normalize_address(address_string: str) -> Dict[str, str]:
     street_part = street_part.strip().strip(',').strip()
 
     # Extract street number (leading digits, may include letters like 123A)
-    number_match = re.match(r'^(\d+[A-Z]?)\b', street_part, re.IGNORECASE)
+    number_match = _STREET_NUMBER.match(street_part)
     if number_match:
         result['street_number'] = number_match.group(1)
         street_part = street_part[number_match.end():].strip()
 
     # Extract street direction (E, W, N, S, etc.) - usually at end
-    direction_pattern = r'\b(E|W|N|S|NE|NW|SE|SW|East|West|North|South|Northeast|Northwest|Southeast|Southwest)\b'
-    direction_match = re.search(direction_pattern, street_part, re.IGNORECASE)
+    direction_match = _DIRECTION.search(street_part)
     if direction_match:
         direction_abbrev = direction_match.group(1)
         result['street_direction'] = CANADA_POST_ABBREV.get(direction_abbrev, direction_abbrev)
         street_part = street_part[:direction_match.start()] + street_part[direction_match.end():]
 
     # Extract street type (St, Ave, Rd, etc.) - usually at end of remaining street
-    type_pattern = r'\b(' + '|'.join(CANADA_POST_ABBREV.keys()) + r')\b\.?'
-    type_match = re.search(type_pattern, street_part, re.IGNORECASE)
+    type_match = _STREET_TYPE.search(street_part)
     if type_match:
         type_abbrev = type_match.group(1)
         result['street_type'] = CANADA_POST_ABBREV.get(type_abbrev, type_abbrev)
@@ -369,5 +385,5 @@ def parse_street_number(address: str) -> Optional[str]:
     if not address:
         return None
 
-    match = re.match(r'^(\d+[A-Z]?(?:-[A-Z])?)\b', address.strip(), re.IGNORECASE)
+    match = _PARSE_STREET_NUMBER.match(address.strip())
     return match.group(1) if match else None
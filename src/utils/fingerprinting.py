@@ -3,14 +3,23 @@ Business entity fingerprinting for deduplication across data sources.
 PRIORITY: P0 - Critical for preventing duplicate leads from multiple sources.
 
 This module provides fingerprinting specifically for businesses discovered from
-Yellow Pages, Hamilton Chamber, and Canadian Importers sources.
+Yellow Pages, Hamilton Chamber, and Canadian Importers sources. Field
+normalization comes from the shared kernel in src.core.normalization.
 """
 
 import hashlib
-import re
 from typing import Dict, Optional
 import structlog
 
+from ..core.normalization import (
+    extract_street_number as _extract_street_number,
+    normalize_city,
+    normalize_entity_name as _normalize_name,
+    normalize_phone,
+    normalize_street_name as _normalize_street,
+    normalize_website as _normalize_website,
+)
+
 logger = structlog.get_logger(__name__)
 
 
@@ -69,11 +78,7 @@ def compute_business_fingerprint(
         components.extend(["", ""])
 
     # 3. Normalize city
-    if city:
-        norm_city = city.lower().strip()
-        components.append(norm_city)
-    else:
-        components.append("")
+    components.append(normalize_city(city))
 
     # 4. Normalize postal code (first 3 chars)
     if postal:
@@ -83,12 +88,7 @@ def compute_business_fingerprint(
         components.append("")
 
     # 5. Normalize phone (last 10 digits)
-    if phone:
-        phone_digits = re.sub(r'\D', '', phone)
-        norm_phone = phone_digits[-10:] if len(phone_digits) >= 10 else phone_digits
-        components.append(norm_phone)
-    else:
-        components.append("")
+    components.append(normalize_phone(phone))
 
     # 6. Normalize website domain
     if website:
@@ -110,157 +110,6 @@ def compute_business_fingerprint(
     return fingerprint
 
 
-def _normalize_name(name: str) -> str:
-    """
-    Normalize business name for comparison.
-
-    Removes:
-    - Common suffixes (Inc, Ltd, Corp, LLC, Co)
-    - Punctuation
-    - Extra whitespace
-
-    Examples:
-        >>> _normalize_name("ABC Manufacturing Inc.")
-        'abc manufacturing'
-        >>> _normalize_name("ABC Mfg. Ltd")
-        'abc mfg'
-    """
-    if not name:
-        return ""
-
-    name = name.lower()
-
-    # Remove common legal suffixes (more comprehensive list)
-    suffixes = [
-        'inc', 'ltd', 'limited', 'corp', 'corporation', 'llc',
-        'incorporated', 'co', 'company', 'enterprises', 'ent',
-        'group', 'holding', 'holdings', 'international', 'intl'
-    ]
-    for suffix in suffixes:
-        # Match whole words with optional period and 's' for plural
-        pattern = r'\b' + suffix + r's?\.?\b'
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-
-    # Remove '&' and 'and'
-    name = name.replace(' and ', ' ').replace(' & ', ' ')
-
-    # Remove punctuation
-    name = re.sub(r'[^\w\s]', '', name)
-
-    # Normalize whitespace
-    name = ' '.join(name.split())
-
-    return name.strip()
-
-
-def _normalize_street(street: str) -> str:
-    """
-    Normalize street name for comparison.
-
-    Removes:
-    - Street type abbreviations (St, Ave, Rd, etc.)
-    - Directional indicators (E, W, N, S)
-    - Punctuation
-    - Unit/suite numbers
-
-    Examples:
-        >>> _normalize_street("123 Main St E")
-        'main'
-        >>> _normalize_street("123 Main Street East Unit 5")
-        'main'
-    """
-    if not street:
-        return ""
-
-    street = street.lower()
-
-    # Remove street type abbreviations
-    street_types = [
-        'street', 'st', 'avenue', 'ave', 'road', 'rd', 'drive', 'dr',
-        'boulevard', 'blvd', 'lane', 'ln', 'court', 'ct', 'crt',
-        'place', 'pl', 'terrace', 'terr', 'parkway', 'pkwy', 'way'
-    ]
-    for street_type in street_types:
-        pattern = r'\b' + street_type + r'\.?\b'
-        street = re.sub(pattern, '', street, flags=re.IGNORECASE)
-
-    # Remove directional indicators
-    directions = ['east', 'west', 'north', 'south', 'e', 'w', 'n', 's']
-    for direction in directions:
-        pattern = r'\b' + direction + r'\.?\b'
-        street = re.sub(pattern, '', street, flags=re.IGNORECASE)
-
-    # Remove unit/suite indicators
-    unit_indicators = ['unit', 'suite', 'ste', 'apt', 'apartment', '#']
-    for indicator in unit_indicators:
-        pattern = r'\b' + indicator + r'\.?\s*\d*'
-        street = re.sub(pattern, '', street, flags=re.IGNORECASE)
-
-    # Remove punctuation and numbers (except street number which is extracted separately)
-    street = re.sub(r'[^\w\s]', '', street)
-    street = re.sub(r'\d+', '', street)
-
-    # Normalize whitespace
-    street = ' '.join(street.split())
-
-    return street.strip()
-
-
-def _extract_street_number(address: str) -> Optional[str]:
-    """
-    Extract street number from address.
-
-    Examples:
-        >>> _extract_street_number("123 Main St")
-        '123'
-        >>> _extract_street_number("456-B Oak Avenue")
-        '456'
-    """
-    if not address:
-        return None
-
-    # Match leading digits
-    match = re.match(r'^(\d+)', address.strip())
-    return match.group(1) if match else None
-
-
-def _normalize_website(url: str) -> str:
-    """
-    Normalize website URL to domain only.
-
-    Removes:
-    - Protocol (http://, https://)
-    - www prefix
-    - Trailing slash
-    - Path components
-
-    Examples:
-        >>> _normalize_website("https://www.example.com/")
-        'example.com'
-        >>> _normalize_website("http://example.com/page")
-        'example.com'
-    """
-    if not url:
-        return ""
-
-    url = url.lower().strip()
-
-    # Remove protocol
-    url = re.sub(r'^https?://', '', url)
-
-    # Remove www prefix
-    url = re.sub(r'^www\.', '', url)
-
-    # Remove trailing slash
-    url = url.rstrip('/')
-
-    # Extract domain only (remove path)
-    domain_match = re.match(r'^([^/]+)', url)
-    domain = domain_match.group(1) if domain_match else url
-
-    return domain
-
-
 def businesses_are_duplicates(
     business1: Dict,
     business2: Dict,
@@ -316,8 +165,8 @@ def businesses_are_duplicates(
         if not name1 or not name2 or name1 != name2:
             return False
 
-        city1 = (business1.get('city', '') or '').lower().strip()
-        city2 = (business2.get('city', '') or '').lower().strip()
+        city1 = normalize_city(business1.get('city', ''))
+        city2 = normalize_city(business2.get('city', ''))
 
         if city1 != city2:
             return False
@@ -330,8 +179,8 @@ def businesses_are_duplicates(
             return True
 
         # Check phone
-        phone1 = re.sub(r'\D', '', business1.get('phone', '') or '')[-10:]
-        phone2 = re.sub(r'\D', '', business2.get('phone', '') or '')[-10:]
+        phone1 = normalize_phone(business1.get('phone', ''))
+        phone2 = normalize_phone(business2.get('phone', ''))
 
         if phone1 and phone2 and phone1 == phone2:
             return True
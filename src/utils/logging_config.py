@@ -1,85 +1,275 @@
 """
 Production logging configuration with structured logging.
+
+Log output is written by a background thread: callers only render the event
+and enqueue the record, so file and console I/O stay off the pipeline's hot
+path. The queue is bounded; when it is full records are dropped and counted,
+and the drop count is reported once the writer catches up.
+
+Hot-path events (fingerprint_computed, rate_limit_acquired, ...) are rate
+limited per event name before any rendering happens, and log calls below the
+configured level return immediately without running the processor chain.
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import structlog
 
+# Max events per second per event name; events over the limit are dropped
+DEFAULT_EVENT_SAMPLE_RATES: Dict[str, float] = {
+    "fingerprint_computed": 5.0,
+    "rate_limit_acquired": 5.0,
+    "duplicate_blocked": 20.0,
+    "franchise_brand_excluded": 20.0,
+    "metric_recorded": 5.0,
+}
+
+DEFAULT_QUEUE_SIZE = 10000
+
+_sink: Optional["QueuedLogSink"] = None
+
+
+class EventSampler:
+    """
+    structlog processor that rate-limits events per event name.
+
+    Each configured event may be logged at most ``rate`` times per second;
+    the rest are dropped. The next event that gets through carries
+    ``sampled_out=<n>`` with the number suppressed since the last one.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None):
+        self.rates = dict(DEFAULT_EVENT_SAMPLE_RATES if rates is None else rates)
+        self._windows: Dict[str, list] = {}  # event -> [window_start, emitted, suppressed]
+        self._lock = threading.Lock()
+        self.suppressed_total: Dict[str, int] = {}
+
+    def __call__(self, logger, method_name, event_dict):
+        event = event_dict.get("event")
+        rate = self.rates.get(event)
+        if rate is None:
+            return event_dict
+
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(event)
+            if window is None or now - window[0] >= 1.0:
+                suppressed = window[2] if window else 0
+                window = [now, 0, suppressed]
+                self._windows[event] = window
+
+            if window[1] >= rate:
+                window[2] += 1
+                self.suppressed_total[event] = self.suppressed_total.get(event, 0) + 1
+                raise structlog.DropEvent
+
+            window[1] += 1
+            if window[2]:
+                event_dict["sampled_out"] = window[2]
+                window[2] = 0
+
+        return event_dict
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks: records are dropped when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported = 0
+        self._lock = threading.Lock()
+
+    def enqueue(self, record):
+        with self._lock:
+            if self._unreported:
+                notice = logging.LogRecord(
+                    record.name, logging.WARNING, __file__, 0,
+                    f"log_records_dropped count={self._unreported} total={self.dropped}",
+                    None, None
+                )
+                try:
+                    self.queue.put_nowait(notice)
+                    self._unreported = 0
+                except queue.Full:
+                    pass
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self._unreported += 1
+
+    def prepare(self, record):
+        # The message is already rendered by structlog; skip re-formatting and
+        # drop exc_info/args so the record is cheap to hand to the writer thread
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+
+class QueuedLogSink:
+    """Bounded queue plus background writer thread for the real handlers."""
+
+    def __init__(self, handlers, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.handler = DroppingQueueHandler(self.queue)
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self._stopped = False
+
+    def stop(self):
+        """Flush buffered records and stop the writer thread."""
+        if self._stopped:
+            return
+        self._stopped = True
+        self.listener.stop()
+        if self.handler.dropped:
+            for handler in self.listener.handlers:
+                handler.handle(logging.makeLogRecord({
+                    "msg": f"log_records_dropped total={self.handler.dropped}",
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                }))
+        for handler in self.listener.handlers:
+            handler.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "dropped": self.handler.dropped,
+        }
+
+
+def _logging_settings(config) -> Dict[str, Any]:
+    """Read logging settings from AppConfig or a config with a ``logging`` section."""
+    section = getattr(config, "logging", None)
+    if section is not None:
+        return {
+            "level": section.level,
+            "file_path": section.file_path,
+            "format": section.format,
+            "queue_size": getattr(section, "queue_size", DEFAULT_QUEUE_SIZE),
+            "sample_rates": getattr(section, "event_sample_rates", None),
+        }
+    return {
+        "level": config.LOG_LEVEL,
+        "file_path": config.LOG_FILE_PATH,
+        "format": config.LOG_FORMAT,
+        "queue_size": config.LOG_QUEUE_SIZE,
+        "sample_rates": config.LOG_EVENT_SAMPLE_RATES,
+    }
+
 
 def configure_logging(config) -> None:
     """Configure structured logging for the application."""
-    
+    global _sink
+
+    settings = _logging_settings(config)
+    level = getattr(logging, settings["level"].upper())
+
     # Ensure log directory exists
-    log_path = Path(config.logging.file_path)
+    log_path = Path(settings["file_path"])
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
+    formatter = logging.Formatter("%(message)s")
+    handlers = [logging.StreamHandler(sys.stdout), logging.FileHandler(settings["file_path"])]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Replace any previous writer so reconfiguring doesn't leak threads
+    if _sink is not None:
+        _sink.stop()
+    _sink = QueuedLogSink(handlers, queue_size=settings["queue_size"])
+
     # Configure standard library logging
     logging.basicConfig(
-        level=getattr(logging, config.logging.level.upper()),
+        level=level,
         format="%(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(config.logging.file_path)
-        ]
+        handlers=[_sink.handler],
+        force=True
     )
-    
+
+    sampler = EventSampler(settings["sample_rates"])
+
     # Configure structlog
-    if config.logging.format == "json":
+    if settings["format"] == "json":
         # JSON formatting for production
-        structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.TimeStamper(fmt="iso"),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer()
-            ],
-            context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
+        renderers = [
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            structlog.processors.JSONRenderer()
+        ]
     else:
         # Human-readable formatting for development
-        structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
-                structlog.dev.ConsoleRenderer(colors=True)
-            ],
-            context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
+        renderers = [
+            structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S"),
+            structlog.dev.ConsoleRenderer(colors=True)
+        ]
+
+    structlog.configure(
+        processors=[
+            sampler,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            *renderers
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        # Calls below `level` are no-ops: no event dict, no processors
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        cache_logger_on_first_use=True,
+    )
+
+
+def get_log_sink_stats() -> Dict[str, Any]:
+    """Queue depth and drop count of the background log writer."""
+    if _sink is None:
+        return {"queued": 0, "capacity": 0, "dropped": 0}
+    return _sink.get_stats()
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background log writer."""
+    global _sink
+    if _sink is not None:
+        _sink.stop()
+        _sink = None
+
+
+atexit.register(shutdown_logging)
 
 
 def setup_logging(environment: str = "development") -> None:
     """Simple logging setup for automation scripts."""
     level = logging.INFO if environment == "production" else logging.DEBUG
-    
+
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[logging.StreamHandler(sys.stdout)]
     )
-    
+
     # Basic structlog setup
     structlog.configure(
         processors=[
             structlog.stdlib.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(colors=True) if environment != "production" 
+            structlog.dev.ConsoleRenderer(colors=True) if environment != "production"
             else structlog.processors.JSONRenderer()
         ],
         context_class=dict,
@@ -91,4 +281,4 @@ def setup_logging(environment: str = "development") -> None:
 
 def get_logger(name: str = None):
     """Get a structured logger instance."""
-    return structlog.get_logger(name)
\ No newline at end of file
+    return structlog.get_logger(name)
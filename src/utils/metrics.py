@@ -4,13 +4,20 @@ PRIORITY: P2 - Observability for production monitoring.
 
 Task 11: Observability Dashboard
 Tracks gate performance, API health, and pipeline metrics.
+
+Each recorded metric also updates per-minute, per-hour and per-day rollups
+keyed by (name, normalized tags). Queries read the coarsest rollups that fit
+inside the requested window (finer ones only at the edges), so dashboard
+queries stay fast however much raw history exists. Raw rows are kept for a
+shorter time than rollups.
 """
 
 import sqlite3
 import json
+import time
 import structlog
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from threading import Lock
@@ -18,6 +25,39 @@ from threading import Lock
 
 logger = structlog.get_logger(__name__)
 
+# Rollup resolutions, coarsest first: (name, bucket size in seconds)
+ROLLUP_LEVELS: List[Tuple[str, int]] = [
+    ("day", 86400),
+    ("hour", 3600),
+    ("minute", 60),
+]
+
+# Days to keep raw rows and each rollup resolution
+DEFAULT_RETENTION_DAYS: Dict[str, int] = {
+    "raw": 7,
+    "minute": 14,
+    "hour": 400,
+    "day": 3650,
+}
+
+# Retention is applied from the write path at most this often
+RETENTION_INTERVAL_SECONDS = 3600
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch_seconds(dt: datetime) -> int:
+    return int((dt - _EPOCH).total_seconds())
+
+
+def normalize_tags(tags: Optional[Dict[str, Any]]) -> str:
+    """Canonical JSON for a tag set (sorted keys, string values) used as the rollup key."""
+    return json.dumps(
+        {str(k): str(v) for k, v in (tags or {}).items()},
+        sort_keys=True,
+        separators=(",", ":")
+    )
+
 
 @dataclass
 class MetricEvent:
@@ -50,9 +90,12 @@ class MetricsCollector:
     _instance: Optional['MetricsCollector'] = None
     _lock = Lock()
 
-    def __init__(self, db_path: str = "data/metrics.db"):
+    def __init__(self, db_path: str = "data/metrics.db",
+                 retention_days: Optional[Dict[str, int]] = None):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.retention_days = {**DEFAULT_RETENTION_DAYS, **(retention_days or {})}
+        self._last_retention = 0.0
         self._init_database()
 
     @classmethod
@@ -85,8 +128,114 @@ class MetricsCollector:
                 ON metrics (name, timestamp DESC)
             """)
 
+            # Rollup tables (one per resolution), bucket = epoch seconds of bucket start
+            for level, _ in ROLLUP_LEVELS:
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS metrics_rollup_{level} (
+                        name TEXT NOT NULL,
+                        tags TEXT NOT NULL,
+                        bucket INTEGER NOT NULL,
+                        count INTEGER NOT NULL,
+                        sum REAL NOT NULL,
+                        min REAL NOT NULL,
+                        max REAL NOT NULL,
+                        last_value REAL,
+                        last_timestamp TEXT,
+                        PRIMARY KEY (name, tags, bucket)
+                    ) WITHOUT ROWID
+                """)
+                conn.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_metrics_rollup_{level}_bucket
+                    ON metrics_rollup_{level} (bucket)
+                """)
+
+            # Databases created before rollups existed: build them from raw rows
+            has_raw = conn.execute("SELECT 1 FROM metrics LIMIT 1").fetchone()
+            has_rollups = conn.execute("SELECT 1 FROM metrics_rollup_minute LIMIT 1").fetchone()
+            if has_raw and not has_rollups:
+                self._rebuild_rollups(conn)
+
             logger.info("metrics_database_initialized", path=str(self.db_path))
 
+    def _rebuild_rollups(self, conn: sqlite3.Connection):
+        """Recompute all rollups from the raw metrics table."""
+        rows = conn.execute("SELECT timestamp, name, value, tags FROM metrics ORDER BY timestamp").fetchall()
+        for level, _ in ROLLUP_LEVELS:
+            conn.execute(f"DELETE FROM metrics_rollup_{level}")
+        for timestamp, name, value, tags_json in rows:
+            try:
+                tags = json.loads(tags_json) if tags_json else {}
+            except (TypeError, ValueError):
+                tags = {}
+            self._update_rollups(conn, timestamp, name, value, normalize_tags(tags))
+        logger.info("metrics_rollups_rebuilt", raw_rows=len(rows))
+
+    def _update_rollups(self, conn: sqlite3.Connection, timestamp: str, name: str,
+                        value: float, tags_key: str):
+        """Fold one raw metric into each rollup resolution."""
+        epoch = _epoch_seconds(datetime.fromisoformat(timestamp))
+        for level, size in ROLLUP_LEVELS:
+            conn.execute(f"""
+                INSERT INTO metrics_rollup_{level}
+                    (name, tags, bucket, count, sum, min, max, last_value, last_timestamp)
+                VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?)
+                ON CONFLICT (name, tags, bucket) DO UPDATE SET
+                    count = count + 1,
+                    sum = sum + excluded.sum,
+                    min = MIN(min, excluded.min),
+                    max = MAX(max, excluded.max),
+                    last_value = CASE WHEN excluded.last_timestamp >= last_timestamp
+                                      THEN excluded.last_value ELSE last_value END,
+                    last_timestamp = MAX(last_timestamp, excluded.last_timestamp)
+            """, (name, tags_key, epoch - epoch % size, value, value, value, value, timestamp))
+
+    def _rollup_plan(self, start: datetime, end: datetime) -> List[Tuple[str, int, int]]:
+        """
+        Cover [start, end) with rollup buckets, coarsest first.
+
+        Returns (level, first_bucket, end_epoch) segments: whole days inside the
+        window, then whole hours, then minutes at the edges. Edges older than a
+        resolution's retention fall back to the next coarser resolution.
+        """
+        start_epoch, end_epoch = _epoch_seconds(start), _epoch_seconds(end)
+        age_days = (datetime.utcnow() - start).total_seconds() / 86400
+
+        # Finest resolution still retained at the start of the window
+        finest = 0
+        for index, (level, _) in enumerate(ROLLUP_LEVELS):
+            if age_days <= self.retention_days[level]:
+                finest = index
+
+        def cover(lo: int, hi: int, index: int) -> List[Tuple[str, int, int]]:
+            if lo >= hi:
+                return []
+            level, size = ROLLUP_LEVELS[index]
+            if index == finest:
+                return [(level, lo - lo % size, hi)]
+            first = -(-lo // size) * size  # first whole bucket at or after lo
+            last = hi - hi % size  # end of last whole bucket before hi
+            if first >= last:
+                return cover(lo, hi, index + 1)
+            return cover(lo, first, index + 1) + [(level, first, last)] + cover(last, hi, index + 1)
+
+        return cover(start_epoch, end_epoch, 0)
+
+    def _query_rollups(self, conn: sqlite3.Connection, hours: float, select: str,
+                       where: str = "", params: Optional[List[Any]] = None) -> List[tuple]:
+        """
+        Run ``SELECT <select> FROM <rollup> WHERE bucket in segment [AND where]``
+        over every segment of the window and return all rows.
+        """
+        end = datetime.utcnow() + timedelta(seconds=1)
+        start = end - timedelta(hours=hours, seconds=1)
+        rows = []
+        for level, first_bucket, end_epoch in self._rollup_plan(start, end):
+            query = f"SELECT {select} FROM metrics_rollup_{level} WHERE bucket >= ? AND bucket < ?"
+            if where:
+                query += f" AND {where}"
+            rows.extend(conn.execute(query, [first_bucket, end_epoch, *(params or [])]).fetchall())
+        return rows
+
     def increment(self, metric_name: str, value: float = 1.0, tags: Optional[Dict[str, str]] = None):
         """
         Increment a counter metric.
@@ -144,9 +293,13 @@ class MetricsCollector:
                     "INSERT INTO metrics (timestamp, name, value, tags) VALUES (?, ?, ?, ?)",
                     (event.timestamp, event.name, event.value, json.dumps(event.tags))
                 )
+                self._update_rollups(conn, event.timestamp, name, value, normalize_tags(tags))
 
             logger.debug("metric_recorded", name=name, value=value, tags=tags)
 
+            if time.monotonic() - self._last_retention >= RETENTION_INTERVAL_SECONDS:
+                self.apply_retention()
+
         except Exception as e:
             logger.error("metric_recording_failed", name=name, error=str(e))
 
@@ -168,47 +321,39 @@ class MetricsCollector:
             Dict with count, sum, mean, min, max, latest
         """
         try:
-            cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+            where = "name = ?"
+            params: List[Any] = [metric_name]
+
+            # Add tag filters if provided
+            if tags:
+                for key, val in tags.items():
+                    where += " AND json_extract(tags, ?) = ?"
+                    params.extend([f"$.{key}", str(val)])
 
             with sqlite3.connect(self.db_path) as conn:
-                query = """
-                    SELECT COUNT(*) as count, SUM(value) as sum,
-                           AVG(value) as mean, MIN(value) as min,
-                           MAX(value) as max
-                    FROM metrics
-                    WHERE name = ? AND timestamp >= ?
-                """
-                params = [metric_name, cutoff]
-
-                # Add tag filters if provided
-                if tags:
-                    for key, val in tags.items():
-                        query += " AND json_extract(tags, ?) = ?"
-                        params.extend([f"$.{key}", val])
-
-                cursor = conn.execute(query, params)
-                row = cursor.fetchone()
-
-                # Get latest value
-                cursor = conn.execute(
-                    """SELECT value FROM metrics
-                       WHERE name = ? AND timestamp >= ?
-                       ORDER BY timestamp DESC LIMIT 1""",
-                    [metric_name, cutoff]
+                rows = self._query_rollups(
+                    conn, hours, "count, sum, min, max", where, params
                 )
-                latest_row = cursor.fetchone()
-
-                return {
-                    "metric": metric_name,
-                    "period_hours": hours,
-                    "count": row[0] or 0,
-                    "sum": row[1] or 0.0,
-                    "mean": row[2] or 0.0,
-                    "min": row[3] or 0.0,
-                    "max": row[4] or 0.0,
-                    "latest": latest_row[0] if latest_row else None,
-                    "tags": tags
-                }
+                # Latest value of the metric (any tags)
+                latest_rows = self._query_rollups(
+                    conn, hours, "last_timestamp, last_value", "name = ?", [metric_name]
+                )
+
+            count = sum(row[0] for row in rows)
+            total = sum(row[1] for row in rows)
+            latest = max(latest_rows)[1] if latest_rows else None
+
+            return {
+                "metric": metric_name,
+                "period_hours": hours,
+                "count": count,
+                "sum": total or 0.0,
+                "mean": total / count if count else 0.0,
+                "min": min(row[2] for row in rows) if rows else 0.0,
+                "max": max(row[3] for row in rows) if rows else 0.0,
+                "latest": latest,
+                "tags": tags
+            }
 
         except Exception as e:
             logger.error("get_metric_stats_failed", metric=metric_name, error=str(e))
@@ -225,44 +370,36 @@ class MetricsCollector:
             Dict mapping gate names to performance stats
         """
         try:
-            cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
-
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT name, tags, SUM(value) as total
-                    FROM metrics
-                    WHERE name LIKE 'gate.%.%' AND timestamp >= ?
-                    GROUP BY name, tags
-                """, [cutoff])
-
-                # Organize by gate
-                gates: Dict[str, Dict[str, float]] = {}
-                for row in cursor.fetchall():
-                    metric_name, tags_json, total = row
-                    parts = metric_name.split('.')
-                    if len(parts) >= 3:
-                        gate_name = parts[1]  # gate.GATENAME.result
-                        result = parts[2]  # pass or fail
-
-                        if gate_name not in gates:
-                            gates[gate_name] = {"pass": 0, "fail": 0}
-
-                        gates[gate_name][result] = gates[gate_name].get(result, 0) + total
-
-                # Calculate rates
-                performance = {}
-                for gate_name, counts in gates.items():
-                    total = counts.get("pass", 0) + counts.get("fail", 0)
-                    pass_rate = counts.get("pass", 0) / total if total > 0 else 0.0
-
-                    performance[gate_name] = {
-                        "total": int(total),
-                        "passed": int(counts.get("pass", 0)),
-                        "failed": int(counts.get("fail", 0)),
-                        "pass_rate": pass_rate
-                    }
-
-                return performance
+                rows = self._query_rollups(conn, hours, "name, sum", "name LIKE 'gate.%.%'")
+
+            # Organize by gate
+            gates: Dict[str, Dict[str, float]] = {}
+            for metric_name, total in rows:
+                parts = metric_name.split('.')
+                if len(parts) >= 3:
+                    gate_name = parts[1]  # gate.GATENAME.result
+                    result = parts[2]  # pass or fail
+
+                    if gate_name not in gates:
+                        gates[gate_name] = {"pass": 0, "fail": 0}
+
+                    gates[gate_name][result] = gates[gate_name].get(result, 0) + total
+
+            # Calculate rates
+            performance = {}
+            for gate_name, counts in gates.items():
+                total = counts.get("pass", 0) + counts.get("fail", 0)
+                pass_rate = counts.get("pass", 0) / total if total > 0 else 0.0
+
+                performance[gate_name] = {
+                    "total": int(total),
+                    "passed": int(counts.get("pass", 0)),
+                    "failed": int(counts.get("fail", 0)),
+                    "pass_rate": pass_rate
+                }
+
+            return performance
 
         except Exception as e:
             logger.error("get_gate_performance_failed", error=str(e))
@@ -279,48 +416,45 @@ class MetricsCollector:
             Dict mapping API names to health stats
         """
         try:
-            cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
-
             with sqlite3.connect(self.db_path) as conn:
                 # Get API call metrics
-                cursor = conn.execute("""
-                    SELECT name, AVG(value) as avg_latency, COUNT(*) as count
-                    FROM metrics
-                    WHERE name LIKE 'api.%.latency_ms' AND timestamp >= ?
-                    GROUP BY name
-                """, [cutoff])
-
-                apis: Dict[str, Dict[str, Any]] = {}
-                for row in cursor.fetchall():
-                    metric_name, avg_latency, count = row
-                    api_name = metric_name.split('.')[1]  # api.APINAME.latency_ms
-
-                    apis[api_name] = {
-                        "avg_latency_ms": round(avg_latency, 2),
-                        "total_calls": count,
-                        "errors": 0,  # Default to 0
-                        "success_rate": 1.0  # Default to 100% success
-                    }
-
+                latency_rows = self._query_rollups(
+                    conn, hours, "name, count, sum", "name LIKE 'api.%.latency_ms'"
+                )
                 # Get error counts
-                cursor = conn.execute("""
-                    SELECT name, SUM(value) as errors
-                    FROM metrics
-                    WHERE name LIKE 'api.%.error' AND timestamp >= ?
-                    GROUP BY name
-                """, [cutoff])
+                error_rows = self._query_rollups(
+                    conn, hours, "name, sum", "name LIKE 'api.%.error'"
+                )
+
+            calls: Dict[str, List[float]] = {}
+            for metric_name, count, total in latency_rows:
+                api_name = metric_name.split('.')[1]  # api.APINAME.latency_ms
+                api_calls = calls.setdefault(api_name, [0, 0.0])
+                api_calls[0] += count
+                api_calls[1] += total
+
+            apis: Dict[str, Dict[str, Any]] = {}
+            for api_name, (count, total) in calls.items():
+                apis[api_name] = {
+                    "avg_latency_ms": round(total / count, 2),
+                    "total_calls": count,
+                    "errors": 0,  # Default to 0
+                    "success_rate": 1.0  # Default to 100% success
+                }
 
-                for row in cursor.fetchall():
-                    metric_name, errors = row
-                    api_name = metric_name.split('.')[1]
+            errors_by_api: Dict[str, float] = {}
+            for metric_name, errors in error_rows:
+                api_name = metric_name.split('.')[1]
+                errors_by_api[api_name] = errors_by_api.get(api_name, 0) + errors
 
-                    if api_name in apis:
-                        apis[api_name]["errors"] = int(errors)
-                        total = apis[api_name]["total_calls"]
-                        success_rate = (total - errors) / total if total > 0 else 0.0
-                        apis[api_name]["success_rate"] = success_rate
+            for api_name, errors in errors_by_api.items():
+                if api_name in apis:
+                    apis[api_name]["errors"] = int(errors)
+                    total = apis[api_name]["total_calls"]
+                    success_rate = (total - errors) / total if total > 0 else 0.0
+                    apis[api_name]["success_rate"] = success_rate
 
-                return apis
+            return apis
 
         except Exception as e:
             logger.error("get_api_health_failed", error=str(e))
@@ -328,26 +462,56 @@ class MetricsCollector:
 
     def cleanup_old_metrics(self, days: int = 90):
         """
-        Remove metrics older than specified days.
+        Remove metrics (raw rows and rollups) older than specified days.
 
         Args:
             days: Number of days to retain
         """
         try:
-            cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+            cutoff = datetime.utcnow() - timedelta(days=days)
 
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.execute(
                     "DELETE FROM metrics WHERE timestamp < ?",
-                    [cutoff]
+                    [cutoff.isoformat()]
                 )
                 deleted = cursor.rowcount
+                for level, _ in ROLLUP_LEVELS:
+                    conn.execute(
+                        f"DELETE FROM metrics_rollup_{level} WHERE bucket < ?",
+                        [_epoch_seconds(cutoff)]
+                    )
 
             logger.info("metrics_cleaned_up", deleted=deleted, retention_days=days)
 
         except Exception as e:
             logger.error("cleanup_failed", error=str(e))
 
+    def apply_retention(self):
+        """Drop raw rows and rollups past their tier's retention (see DEFAULT_RETENTION_DAYS)."""
+        self._last_retention = time.monotonic()
+        try:
+            now = datetime.utcnow()
+            deleted = {}
+
+            with sqlite3.connect(self.db_path) as conn:
+                cutoff = now - timedelta(days=self.retention_days["raw"])
+                deleted["raw"] = conn.execute(
+                    "DELETE FROM metrics WHERE timestamp < ?", [cutoff.isoformat()]
+                ).rowcount
+                for level, size in ROLLUP_LEVELS:
+                    cutoff = now - timedelta(days=self.retention_days[level])
+                    # Only drop buckets that ended before the cutoff
+                    deleted[level] = conn.execute(
+                        f"DELETE FROM metrics_rollup_{level} WHERE bucket + ? <= ?",
+                        [size, _epoch_seconds(cutoff)]
+                    ).rowcount
+
+            logger.info("metrics_retention_applied", deleted=deleted)
+
+        except Exception as e:
+            logger.error("metrics_retention_failed", error=str(e))
+
 
 # Global metrics instance
 _metrics_collector: Optional[MetricsCollector] = None
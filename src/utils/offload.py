@@ -0,0 +1,246 @@
+"""
+Process-pool offload for CPU-bound work in async pipelines.
+
+HTML parsing and record normalization are pure CPU work; run on the event
+loop, one large page stalls every in-flight request. Functions registered with
+``@cpu_task`` can be awaited through ``run_cpu_task()``, which sends them to a
+shared ``ProcessPoolExecutor`` sized to the host.
+
+Payloads should stay compact and picklable: raw bytes or plain tuples in, small
+dicts out. Calls whose payload is below the task's ``min_offload_size`` run
+inline, because pickling and IPC would cost more than the work itself.
+
+Per-task timing (worker seconds vs inline seconds) is kept so the amount of
+work moved off the loop is visible in ``get_offload_stats()``.
+
+Example:
+    >>> @cpu_task("parse_page", min_offload_size=16_384)
+    ... def parse_page(body: bytes) -> dict: ...
+    >>> result = await run_cpu_task("parse_page", body)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class CpuTask:
+    """A registered CPU-bound function."""
+    name: str
+    func: Callable
+    min_offload_size: int = 0
+
+
+_registry: Dict[str, CpuTask] = {}
+
+
+def cpu_task(name: str, min_offload_size: int = 0):
+    """
+    Register a module-level function for process-pool offload.
+
+    Args:
+        name: Task name used with run_cpu_task()
+        min_offload_size: Payload size (bytes/chars/items) below which calls run inline
+    """
+    def decorator(func: Callable) -> Callable:
+        _registry[name] = CpuTask(name=name, func=func, min_offload_size=min_offload_size)
+        return func
+    return decorator
+
+
+def get_cpu_task(name: str) -> CpuTask:
+    """Look up a registered task."""
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(f"Unknown CPU task: {name}") from None
+
+
+def payload_size(args) -> int:
+    """Rough payload size: length of bytes/str/list arguments."""
+    return sum(len(arg) for arg in args if isinstance(arg, (bytes, bytearray, str, list, tuple)))
+
+
+def _timed_call(func: Callable, args: tuple, kwargs: dict):
+    """Runs in the worker: call func and report the CPU time it took."""
+    start = time.process_time()
+    result = func(*args, **kwargs)
+    return result, time.process_time() - start
+
+
+def default_worker_count() -> int:
+    """One worker per core, leaving one core for the event loop."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+class OffloadExecutor:
+    """
+    Shared process pool for registered CPU tasks.
+
+    Args:
+        max_workers: Worker processes (0 = one per core, minus one for the loop)
+        enabled: When False every task runs inline (debugging, constrained hosts)
+        start_method: multiprocessing start method for the workers
+    """
+
+    def __init__(self, max_workers: int = 0, enabled: bool = True, start_method: str = "spawn"):
+        self.max_workers = max_workers or default_worker_count()
+        self.enabled = enabled
+        self.start_method = start_method
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method)
+                )
+                logger.info("offload_pool_started", workers=self.max_workers, start_method=self.start_method)
+            return self._pool
+
+    def _task_stats(self, name: str) -> Dict[str, float]:
+        if name not in self.stats:
+            self.stats[name] = {
+                'offloaded': 0,
+                'inline': 0,
+                'failures': 0,
+                'worker_seconds': 0.0,
+                'inline_seconds': 0.0,
+                'wait_seconds': 0.0,
+            }
+        return self.stats[name]
+
+    async def run(self, name: str, *args, **kwargs) -> Any:
+        """
+        Run a registered task, in the pool when the payload is large enough.
+
+        Raises whatever the task raises.
+        """
+        task = get_cpu_task(name)
+        stats = self._task_stats(name)
+
+        if not self.enabled or payload_size(args) < task.min_offload_size:
+            return self._run_inline(task, stats, args, kwargs)
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            result, worker_seconds = await loop.run_in_executor(
+                self._get_pool(), _timed_call, task.func, args, kwargs
+            )
+        except BrokenProcessPool:
+            logger.warning("offload_pool_broken", task=name)
+            self._reset_pool()
+            return self._run_inline(task, stats, args, kwargs)
+        except Exception:
+            stats['failures'] += 1
+            raise
+
+        stats['offloaded'] += 1
+        stats['worker_seconds'] += worker_seconds
+        stats['wait_seconds'] += time.perf_counter() - start
+        return result
+
+    def _run_inline(self, task: CpuTask, stats: Dict[str, float], args: tuple, kwargs: dict) -> Any:
+        start = time.process_time()
+        try:
+            return task.func(*args, **kwargs)
+        except Exception:
+            stats['failures'] += 1
+            raise
+        finally:
+            stats['inline'] += 1
+            stats['inline_seconds'] += time.process_time() - start
+
+    def _reset_pool(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-task counters plus the share of CPU time moved off the loop."""
+        worker = sum(s['worker_seconds'] for s in self.stats.values())
+        inline = sum(s['inline_seconds'] for s in self.stats.values())
+        return {
+            'workers': self.max_workers,
+            'enabled': self.enabled,
+            'tasks': {name: dict(s) for name, s in self.stats.items()},
+            'offloaded_seconds': round(worker, 4),
+            'inline_seconds': round(inline, 4),
+            'offloaded_share': round(worker / (worker + inline), 3) if worker + inline else 0.0,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+            logger.info("offload_pool_stopped", stats=self.get_stats())
+
+
+_executor: Optional[OffloadExecutor] = None
+
+
+def get_offload_executor() -> OffloadExecutor:
+    """Get the shared executor (configured from OFFLOAD_* settings on first use)."""
+    global _executor
+    if _executor is None:
+        try:
+            from ..core.config import config
+            _executor = OffloadExecutor(
+                max_workers=config.OFFLOAD_MAX_WORKERS,
+                enabled=config.OFFLOAD_ENABLED,
+                start_method=config.OFFLOAD_START_METHOD
+            )
+        except Exception:
+            _executor = OffloadExecutor()
+    return _executor
+
+
+def configure_offload(**settings) -> OffloadExecutor:
+    """
+    Replace the shared executor (stops the previous pool).
+
+    Example:
+        >>> configure_offload(max_workers=4)
+        >>> configure_offload(enabled=False)  # everything inline
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+    _executor = OffloadExecutor(**settings)
+    return _executor
+
+
+def reset_offload():
+    """Stop the shared pool; the executor reloads from config on next use."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+    _executor = None
+
+
+async def run_cpu_task(name: str, *args, **kwargs) -> Any:
+    """Run a registered CPU task on the shared executor."""
+    return await get_offload_executor().run(name, *args, **kwargs)
+
+
+def get_offload_stats() -> Dict[str, Any]:
+    """Stats of the shared executor."""
+    return get_offload_executor().get_stats()
@@ -303,6 +303,9 @@ def initialize_default_limiters():
     # Wayback Machine: 1 request/second (be nice to Archive.org)
     registry.register("wayback", rate_per_second=1, burst_size=2)
 
+    # LinkedIn company pages: 1 lookup every 2 seconds
+    registry.register("linkedin", rate_per_second=0.5, burst_size=1)
+
     logger.info("default_rate_limiters_initialized",
                limiters=registry.list_limiters())
 
@@ -0,0 +1,88 @@
+"""
+Tests for the slotted discovery candidate record.
+Validates slots, out-of-line payloads, serialization and lazy model conversion.
+"""
+
+import copy
+import pickle
+from datetime import datetime
+
+from src.core.models import BusinessLead, DataSource
+from src.sources.base_source import BusinessData
+
+
+def make_record(**overrides):
+    fields = dict(
+        name="Stolk Machine Shop",
+        source="openstreetmap",
+        source_url="https://maps.google.com/?cid=1",
+        confidence=0.9,
+        street="100 Barton St E",
+        city="Hamilton",
+        province="ON",
+        postal_code="L8L 2W6",
+        phone="(905) 555-0100",
+        website="https://stolkmachine.ca",
+        industry="manufacturing",
+        year_established=2001,
+        review_count=12,
+        raw_data={'place_id': 'ChIJabc', 'types': ['store'], 'geometry': {'lat': 43.25}},
+    )
+    fields.update(overrides)
+    return BusinessData(**fields)
+
+
+class TestBusinessDataRecord:
+    """Test the compact record layout."""
+
+    def test_slotted(self):
+        record = make_record()
+
+        assert not hasattr(record, '__dict__')
+        assert record.raw_size > 0
+
+    def test_raw_data_round_trip(self):
+        record = make_record()
+
+        payload = record.raw_data
+        assert payload['geometry'] == {'lat': 43.25}
+        payload['place_id'] = 'changed'
+        assert record.raw_data['place_id'] == 'ChIJabc'
+
+        record.raw_data = {'fetched_at': datetime(2024, 1, 2)}
+        assert record.raw_data == {'fetched_at': '2024-01-02 00:00:00'}
+        assert make_record(raw_data=None).raw_data == {}
+
+    def test_to_dict(self):
+        record = make_record()
+        data = record.to_dict()
+
+        assert list(data)[:4] == ['name', 'source', 'source_url', 'confidence']
+        assert 'raw_data' not in data
+        assert data['fetched_at'] == record.fetched_at.isoformat()
+
+    def test_equality_copy_and_pickle(self):
+        record = make_record()
+
+        assert pickle.loads(pickle.dumps(record)) == record
+        assert copy.copy(record) == record
+        assert make_record(phone=None) != record
+
+
+class TestLazyConversion:
+    """Test conversion to validated models at boundaries."""
+
+    def test_to_business_lead(self):
+        lead = make_record().to_business_lead()
+
+        assert isinstance(lead, BusinessLead)
+        assert lead.business_name == "Stolk Machine Shop"
+        assert lead.location.city == "Hamilton"
+        assert lead.data_sources == [DataSource.OPENSTREETMAP]
+        assert lead.years_in_business == datetime.utcnow().year - 2001
+
+    def test_unknown_source_and_standard_output(self):
+        record = make_record(source="chamber_directory")
+
+        assert record.to_business_lead().data_sources == []
+        assert record.to_standard_output().business_name == "Stolk Machine Shop"
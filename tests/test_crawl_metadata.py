@@ -0,0 +1,253 @@
+"""
+Tests for crawl metadata and conditional re-crawls.
+Validates change detection, adaptive re-crawl intervals, persistence and 304 reuse in the website scrapers.
+"""
+
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+
+from src.enrichment.contact_enrichment import ContactEnricher
+from src.enrichment.website_scraper_enrichment import WebsiteScraperEnricher
+from src.services.crawl_metadata import (
+    CrawlCache,
+    CrawlMetadataStore,
+    configure_crawl_cache,
+    reset_crawl_cache,
+)
+from src.services.domain_health import configure_domain_health, reset_domain_health
+from src.services.hedging import HedgingPolicy, HedgingSettings
+from src.services.host_concurrency import HostConcurrency, HostLimitStore
+from src.services.website_validation_service import WebsiteValidationService
+
+URL = "https://stolkmachine.ca/"
+HOUR = 3600
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def cache(tmpdir_path):
+    return CrawlCache(store=CrawlMetadataStore(str(tmpdir_path / "crawl_metadata.db")),
+                      initial_interval_seconds=24 * HOUR, min_interval_seconds=6 * HOUR,
+                      max_interval_seconds=96 * HOUR)
+
+
+class TestCrawlCache:
+    """Test validators, change detection and the re-crawl schedule."""
+
+    def test_first_fetch_then_conditional_headers(self, cache):
+        assert cache.request_headers(URL) == {}
+
+        assert not cache.observe(URL, 200, {'ETag': '"v1"', 'Last-Modified': 'Mon, 05 Oct 2026 10:00:00 GMT'},
+                                 "<html>v1</html>")
+
+        # Only consumers with something to fall back on ask for a 304
+        assert cache.request_headers(URL, 'contacts') == {}
+        cache.store_extraction(URL, 'contacts', {'emails': ['info@stolkmachine.ca']})
+        assert cache.request_headers(URL, 'contacts') == {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 05 Oct 2026 10:00:00 GMT',
+        }
+
+    def test_not_modified_reuses_extraction(self, cache):
+        cache.observe(URL, 200, {'ETag': '"v1"'}, "<html>v1</html>")
+        cache.store_extraction(URL, 'contacts', {'emails': ['info@stolkmachine.ca']})
+
+        assert cache.revisit(URL, 'contacts', 304, {}) == {'emails': ['info@stolkmachine.ca']}
+        assert cache.reuse(URL, 'other') is None
+        assert cache.get_stats()['not_modified'] == 1
+
+    def test_same_body_without_validators_reuses_extraction(self, cache):
+        cache.observe(URL, 200, {}, "<html>v1</html>")
+        cache.store_extraction(URL, 'contacts', {'phones': ['9055551234']})
+
+        assert cache.revisit(URL, 'contacts', 200, {}, b"<html>v1</html>") == {'phones': ['9055551234']}
+        assert cache.get_stats()['unchanged_by_hash'] == 1
+
+    def test_changed_page_drops_extraction(self, cache):
+        cache.observe(URL, 200, {'ETag': '"v1"'}, "<html>v1</html>")
+        cache.store_extraction(URL, 'contacts', {'emails': ['old@stolkmachine.ca']})
+
+        assert cache.revisit(URL, 'contacts', 200, {'ETag': '"v2"'}, "<html>v2</html>") is None
+        assert cache.request_headers(URL, 'contacts') == {}
+        assert cache.get_stats()['changed'] == 1
+
+    def test_interval_adapts_to_change_rate(self, cache):
+        def revisit(body):
+            # As if the last fetch happened one full interval ago
+            record = cache._record(URL)
+            record.fetched_at -= record.interval_seconds
+            cache.observe(URL, 200, {}, body)
+            return cache.store.get(URL)
+
+        cache.observe(URL, 200, {}, "same")
+        intervals = [revisit("same").interval_seconds / HOUR for _ in range(4)]
+        assert intervals == [48, 96, 96, 96]
+
+        for version in range(5):
+            record = revisit(f"v{version}")
+        assert record.interval_seconds == 6 * HOUR
+        assert record.changes == 5
+        assert record.next_crawl_at == pytest.approx(time.time() + 6 * HOUR, abs=5)
+
+    def test_quick_refetch_keeps_interval(self, cache):
+        cache.observe(URL, 200, {'ETag': '"v1"'}, "same")
+        cache.observe(URL, 304, {'ETag': '"v1"'})
+        cache.observe(URL, 200, {'ETag': '"v1"'}, "same")
+        assert cache.store.get(URL).interval_seconds == 24 * HOUR
+
+        cache.observe(URL, 200, {'ETag': '"v2"'}, "changed")
+        record = cache.store.get(URL)
+        assert record.interval_seconds == 24 * HOUR
+        assert record.etag == '"v2"'
+        assert record.changes == 1
+        assert record.checks == 4
+
+    def test_lookup_within_interval(self, cache):
+        cache.observe(URL, 200, {}, "<html>v1</html>")
+        cache.store_extraction(URL, 'contacts', {'emails': []})
+
+        assert cache.lookup(URL, 'contacts') == {'emails': []}
+        assert cache.lookup(URL, 'firmographics') is None
+        assert cache.get_stats()['fresh_skips'] == 1
+
+        due = CrawlCache(store=cache.store, initial_interval_seconds=0, min_interval_seconds=0)
+        due.observe("https://other.ca/", 200, {}, "x")
+        due.store_extraction("https://other.ca/", 'contacts', {'emails': []})
+        assert due.lookup("https://other.ca/", 'contacts') is None
+
+    def test_persisted_between_runs(self, cache):
+        cache.observe(URL, 200, {'ETag': '"v1"'}, "<html>v1</html>")
+        cache.store_extraction(URL, 'contacts', {'emails': ['info@stolkmachine.ca']})
+
+        second = CrawlCache(store=cache.store)
+        assert second.request_headers(URL, 'contacts') == {'If-None-Match': '"v1"'}
+        assert second.revisit(URL, 'contacts', 304, {}) == {'emails': ['info@stolkmachine.ca']}
+
+    def test_errors_and_disabled_not_recorded(self, cache):
+        assert not cache.observe(URL, 500, {}, "oops")
+        assert not cache.observe(URL, 304, {})
+        assert not cache.store.db_path.exists()
+
+        cache.enabled = False
+        cache.observe(URL, 200, {}, "<html>v1</html>")
+        assert not cache.store.db_path.exists()
+
+
+CONTACT_HOME = """<html><head><title>Stolk Machine Shop</title></head><body>
+<a href="/contact">Contact</a> Call (905) 555-1234</body></html>"""
+CONTACT_PAGE = """<html><body>Email <a href="mailto:sales@stolkmachine.ca">sales@stolkmachine.ca</a></body></html>"""
+
+
+@pytest.fixture
+async def site():
+    """Local site that honours If-None-Match; counts full (200) and 304 responses."""
+    pages = {'/': CONTACT_HOME, '/contact': CONTACT_PAGE}
+    seen = {'full': 0, 'not_modified': 0}
+
+    async def handler(request):
+        body = pages[request.path]
+        etag = '"%s"' % hashlib.md5(body.encode()).hexdigest()
+        if request.headers.get('If-None-Match') == etag:
+            seen['not_modified'] += 1
+            return web.Response(status=304, headers={'ETag': etag})
+        seen['full'] += 1
+        return web.Response(text=body, content_type='text/html', headers={'ETag': etag})
+
+    app = web.Application()
+    app.router.add_get("/{path:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    server = web.TCPSite(runner, "127.0.0.1", 0)
+    await server.start()
+    port = server._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/", pages, seen
+
+    await runner.cleanup()
+
+
+@pytest.fixture
+def shared_caches(tmpdir_path):
+    """Shared crawl cache that always revisits (no fresh window), and a clean domain-health registry."""
+    configure_domain_health(db_path=str(tmpdir_path / "domain_health.db"))
+    cache = configure_crawl_cache(db_path=str(tmpdir_path / "crawl_metadata.db"),
+                                  initial_interval_seconds=0, min_interval_seconds=0, max_interval_seconds=0)
+    yield cache
+    reset_crawl_cache()
+    reset_domain_health()
+
+
+class TestConditionalRecrawl:
+    """Test the scrapers revisit with conditional GETs and reuse extractions."""
+
+    async def test_contact_enricher_reuses_unchanged_pages(self, site, shared_caches):
+        base_url, pages, seen = site
+        enricher = ContactEnricher()
+
+        first = await enricher.enrich_business("Stolk Machine Shop", website=base_url)
+        second = await enricher.enrich_business("Stolk Machine Shop", website=base_url)
+
+        assert 'sales@stolkmachine.ca' in first['emails']
+        assert second['emails'] == first['emails']
+        assert second['phones'] == first['phones']
+        assert seen == {'full': 2, 'not_modified': 2}
+
+        # Only the changed page is downloaded and re-extracted
+        pages['/contact'] = CONTACT_PAGE.replace('sales@', 'owner@')
+        third = await enricher.enrich_business("Stolk Machine Shop", website=base_url)
+        assert 'owner@stolkmachine.ca' in third['emails']
+        assert seen == {'full': 3, 'not_modified': 3}
+
+    async def test_scraper_skips_fresh_pages(self, site, tmpdir_path):
+        base_url, pages, seen = site
+        pages['/'] = "<html><body>Family owned since 1987. <a href='/about'>About</a></body></html>"
+        pages['/about'] = "<html><body>We are 10-30 employees strong</body></html>"
+        configure_crawl_cache(db_path=str(tmpdir_path / "crawl_metadata.db"))
+        try:
+            enricher = WebsiteScraperEnricher()
+            first = await enricher.scrape_website(base_url)
+            second = await enricher.scrape_website(base_url)
+        finally:
+            reset_crawl_cache()
+
+        assert first['year_founded'] == second['year_founded'] == 1987
+        assert first['employee_range'] == second['employee_range'] == '10-30'
+        # Within the re-crawl interval nothing is requested again
+        assert seen == {'full': 2, 'not_modified': 0}
+
+    @patch('src.services.website_validation_service.check_website_age_gate')
+    async def test_revalidation_costs_a_304(self, mock_age_gate, site, tmpdir_path):
+        base_url, _, seen = site
+        # Default (long) re-crawl interval: the validator still contacts the site every time
+        configure_domain_health(db_path=str(tmpdir_path / "domain_health.db"))
+        crawl_cache = configure_crawl_cache(db_path=str(tmpdir_path / "crawl_metadata.db"))
+        mock_age_gate.return_value = {'age_years': 10.0, 'is_parked': False, 'passes_gate': True}
+        concurrency = HostConcurrency(store=HostLimitStore(str(tmpdir_path / "host_limits.db")))
+        hedging = HedgingPolicy(HedgingSettings(enabled=False))
+
+        try:
+            async with WebsiteValidationService(hedging=hedging, concurrency=concurrency) as service:
+                first = await service.validate_website(base_url, "Stolk Machine Shop")
+                second = await service.validate_website(base_url, "Stolk Machine Shop")
+                other_name = await service.validate_website(base_url, "Hamilton Fabrication")
+        finally:
+            reset_crawl_cache()
+            reset_domain_health()
+
+        assert second.status_code == 200
+        assert second.business_name_match == first.business_name_match
+        assert other_name.business_name_match < first.business_name_match
+        # A different business name needs the page itself
+        assert seen == {'full': 2, 'not_modified': 1}
+        assert crawl_cache.get_stats()['reused'] == 1
@@ -0,0 +1,152 @@
+"""
+Tests for the streaming CSV enrichment runner.
+Validates ordered output under concurrency, checkpoint/resume, row failures and rate limiting.
+"""
+
+import asyncio
+import csv
+import random
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.enrichment.csv_runner import CHECKPOINT_SUFFIX, CsvEnrichmentRunner
+from src.enrichment.domain_age_checker import DomainAgeChecker
+from src.services.domain_registration import DomainRecord
+from src.utils.rate_limiter import TokenBucketLimiter
+
+
+class Crash(BaseException):
+    """Simulates the process dying mid-run."""
+
+
+@pytest.fixture
+def paths():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = Path(tmpdir) / "in.csv"
+        with open(input_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Business Name', 'Website'])
+            for i in range(60):
+                writer.writerow([f"Business {i}", f"https://business{i}.ca"])
+        yield str(input_path), str(Path(tmpdir) / "out" / "enriched.csv")
+
+
+def read_rows(path):
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+class TestCsvEnrichmentRunner:
+    """Test streaming, ordering and resume."""
+
+    async def test_output_in_input_order_with_concurrency(self, paths):
+        input_path, output_path = paths
+        in_flight = {'now': 0, 'max': 0}
+
+        async def enrich(row):
+            in_flight['now'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            await asyncio.sleep(random.uniform(0, 0.01))
+            in_flight['now'] -= 1
+            row['Length'] = len(row['Business Name'])
+
+        result = await CsvEnrichmentRunner(enrich, output_columns=['Length'], concurrency=8).run(input_path, output_path)
+
+        rows = read_rows(output_path)
+        assert [r['Business Name'] for r in rows] == [f"Business {i}" for i in range(60)]
+        assert rows[10]['Length'] == '11'
+        assert list(rows[0].keys()) == ['Business Name', 'Website', 'Length']
+        assert in_flight['max'] > 1
+        assert result.rows_written == result.rows_enriched == 60
+        assert not Path(output_path + CHECKPOINT_SUFFIX).exists()
+
+    async def test_resume_after_crash(self, paths):
+        input_path, output_path = paths
+        calls = []
+
+        async def crashing(row):
+            index = int(row['Business Name'].split()[1])
+            if index == 37:
+                raise Crash()
+            calls.append(index)
+            row['Done'] = 'yes'
+
+        with pytest.raises(Crash):
+            await CsvEnrichmentRunner(crashing, ['Done'], concurrency=4, checkpoint_every=10).run(input_path, output_path)
+        assert Path(output_path + CHECKPOINT_SUFFIX).exists()
+
+        calls.clear()
+
+        async def enrich(row):
+            calls.append(int(row['Business Name'].split()[1]))
+            row['Done'] = 'yes'
+
+        result = await CsvEnrichmentRunner(enrich, ['Done'], concurrency=4, checkpoint_every=10).run(input_path, output_path)
+
+        rows = read_rows(output_path)
+        assert [r['Business Name'] for r in rows] == [f"Business {i}" for i in range(60)]
+        assert all(r['Done'] == 'yes' for r in rows)
+        assert 30 <= result.resumed_from <= 37
+        assert sorted(calls) == list(range(result.resumed_from, 60))
+
+    async def test_failed_row_written_unchanged(self, paths):
+        input_path, output_path = paths
+
+        def enrich(row):
+            if row['Business Name'] == 'Business 3':
+                raise ValueError("bad row")
+            row['Upper'] = row['Business Name'].upper()
+
+        result = await CsvEnrichmentRunner(enrich, ['Upper']).run(input_path, output_path)
+
+        rows = read_rows(output_path)
+        assert rows[3]['Upper'] == ''
+        assert rows[4]['Upper'] == 'BUSINESS 4'
+        assert result.rows_failed == 1
+        assert len(rows) == 60
+
+    async def test_provider_rate_limit(self, paths):
+        input_path, output_path = paths
+        limiter = TokenBucketLimiter(rate_per_second=50, burst_size=1)
+
+        started = time.monotonic()
+        await CsvEnrichmentRunner(lambda row: row, concurrency=8, rate_limiter=limiter).run(input_path, output_path)
+
+        # 60 rows at 50/s with no burst take at least ~1.2s regardless of concurrency
+        assert time.monotonic() - started >= 1.0
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.lookups = []
+
+    async def lookup(self, website):
+        self.lookups.append(website)
+        if website.endswith('1.ca'):
+            return DomainRecord(domain=website, error='no registration data')
+        return DomainRecord(domain=website, creation_date=datetime(2001, 6, 15), source='rdap')
+
+    async def close(self):
+        self.closed = True
+
+
+class TestEnricherIntegration:
+    """Test an enricher running on the shared runner."""
+
+    async def test_domain_age_csv(self, paths):
+        input_path, output_path = paths
+        registry = FakeRegistry()
+
+        result = await DomainAgeChecker(registry=registry).enrich_csv_with_domain_age(input_path, output_path, concurrency=4)
+
+        rows = read_rows(output_path)
+        assert result.rows_written == 60
+        assert len(registry.lookups) == 60
+        assert registry.closed
+        assert rows[0]['Founded Year'] == '2001'
+        assert rows[0]['Age Source'] == 'rdap'
+        assert rows[1]['Age Source'] == 'whois_failed'
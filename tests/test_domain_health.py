@@ -0,0 +1,237 @@
+"""
+Tests for the domain-health registry.
+Validates failure classification, TTLs per kind, persistence, DNS pre-flight and consumer skips.
+"""
+
+import asyncio
+import csv
+import socket
+import ssl
+import tempfile
+import time
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+from src.enrichment.csv_runner import CsvEnrichmentRunner
+from src.services.domain_health import (
+    NXDOMAIN,
+    PARKED,
+    REFUSED,
+    TIMEOUT,
+    TLS_ERROR,
+    DomainHealthRegistry,
+    DomainHealthStore,
+    classify_failure,
+    configure_domain_health,
+    host_of,
+    reset_domain_health,
+)
+from src.services.hedging import HedgingPolicy, HedgingSettings
+from src.services.host_concurrency import HostConcurrency, HostLimitStore
+from src.services.website_validation_service import WebsiteValidationService
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def registry(tmpdir_path):
+    return DomainHealthRegistry(store=DomainHealthStore(str(tmpdir_path / "domain_health.db")),
+                                ttl_seconds=3600, transient_ttl_seconds=60)
+
+
+def nxdomain_error():
+    return socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+
+class TestClassifyFailure:
+    """Test fetch errors map to failure kinds."""
+
+    def test_wrapped_errors(self):
+        try:
+            try:
+                raise nxdomain_error()
+            except socket.gaierror as e:
+                raise ConnectionError("Cannot connect to host") from e
+        except ConnectionError as wrapped:
+            assert classify_failure(wrapped) == NXDOMAIN
+
+        assert classify_failure(socket.gaierror(socket.EAI_AGAIN, "Temporary failure")) is None
+        assert classify_failure(asyncio.TimeoutError()) == TIMEOUT
+        assert classify_failure(ValueError("bad content")) is None
+
+    async def test_refused_connection(self):
+        # Nothing listens on the discard port locally
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(aiohttp.ClientError) as excinfo:
+                await session.get("http://127.0.0.1:9/", timeout=aiohttp.ClientTimeout(total=5))
+
+        assert classify_failure(excinfo.value) == REFUSED
+
+    def test_host_of(self):
+        assert host_of("https://WWW.StolkMachine.ca:443/about") == "www.stolkmachine.ca"
+        assert host_of("stolkmachine.ca.") == "stolkmachine.ca"
+        assert host_of("") is None
+        assert host_of("UNKNOWN") is None
+
+
+class TestRegistry:
+    """Test recording, skipping and expiry."""
+
+    def test_record_and_skip(self, registry):
+        registry.record("https://gone.ca/", NXDOMAIN, "Name or service not known")
+
+        assert registry.is_dead("http://GONE.ca/contact")
+        assert not registry.is_dead("https://alive.ca/")
+        stats = registry.get_stats()
+        assert stats['skipped'] == 1
+        assert stats['skipped_by_kind'] == {NXDOMAIN: 1}
+
+    def test_record_metrics_does_not_double_count(self, registry, tmpdir_path, monkeypatch):
+        from src.utils import metrics as metrics_module
+        collector = metrics_module.MetricsCollector(str(tmpdir_path / "metrics.db"))
+        monkeypatch.setattr(metrics_module, "_metrics_collector", collector)
+        registry.record("gone.ca", NXDOMAIN)
+        registry.record("refused.ca", REFUSED)
+        registry.is_dead("gone.ca")
+        registry.is_dead("refused.ca")
+
+        registry.record_metrics()
+
+        assert collector.get_metric_stats("pipeline.domain_health_skipped")['sum'] == 2
+        by_kind = collector.get_metric_stats("pipeline.domain_health_skipped_by_kind", tags={'kind': NXDOMAIN})
+        assert by_kind['sum'] == 1
+
+    def test_transient_kinds_get_short_ttl(self, registry):
+        now = time.time()
+        refused = registry.record("refused.ca", REFUSED)
+        parked = registry.record("parked.ca", PARKED)
+
+        assert refused.expires_at - now == pytest.approx(60, abs=1)
+        assert parked.expires_at - now == pytest.approx(3600, abs=1)
+
+    def test_expired_record_is_retried(self, tmpdir_path):
+        store = DomainHealthStore(str(tmpdir_path / "domain_health.db"))
+        registry = DomainHealthRegistry(store=store, transient_ttl_seconds=0)
+        registry.record("slow.ca", TIMEOUT)
+
+        assert not registry.is_dead("slow.ca")
+
+    def test_record_failure_ignores_other_errors(self, registry):
+        assert registry.record_failure("tls.ca", ssl.SSLCertVerificationError("certificate verify failed")) == TLS_ERROR
+        assert registry.record_failure("busy.ca", ValueError("HTTP 500")) is None
+        assert registry.is_dead("tls.ca")
+        assert not registry.is_dead("busy.ca")
+
+    def test_recovery_clears_record(self, registry):
+        registry.record("flaky.ca", TIMEOUT)
+        registry.record_ok("https://flaky.ca/")
+
+        assert not registry.is_dead("flaky.ca")
+        assert registry.store.get("flaky.ca") is None
+        assert registry.get_stats()['recovered'] == 1
+
+    def test_persisted_between_runs(self, registry):
+        registry.record("gone.ca", NXDOMAIN)
+
+        second = DomainHealthRegistry(store=registry.store)
+        assert second.check("gone.ca").kind == NXDOMAIN
+
+    def test_disabled(self, registry):
+        registry.enabled = False
+        registry.record("gone.ca", NXDOMAIN)
+
+        assert not registry.is_dead("gone.ca")
+        assert not registry.store.db_path.exists()
+
+
+class TestPreflight:
+    """Test the concurrent DNS pre-flight."""
+
+    async def test_records_only_nxdomain(self, registry, monkeypatch):
+        loop = asyncio.get_running_loop()
+        resolved = []
+
+        async def fake_getaddrinfo(host, *args, **kwargs):
+            resolved.append(host)
+            if host.startswith("gone"):
+                raise nxdomain_error()
+            if host == "flaky.ca":
+                raise socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+            if host == "slow.ca":
+                await asyncio.sleep(1)
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('203.0.113.5', 0))]
+
+        monkeypatch.setattr(loop, "getaddrinfo", fake_getaddrinfo)
+        websites = ["https://gone1.ca/", "gone2.ca", "https://alive.ca/", "https://alive.ca/about",
+                    "flaky.ca", "slow.ca", "", "UNKNOWN"]
+
+        dead = await registry.preflight(websites, timeout=0.1)
+
+        assert set(dead) == {"gone1.ca", "gone2.ca"}
+        assert sorted(resolved) == ["alive.ca", "flaky.ca", "gone1.ca", "gone2.ca", "slow.ca"]
+        assert registry.get_stats()['preflight_dead'] == 2
+        assert not registry.is_dead("flaky.ca")
+        assert not registry.is_dead("slow.ca")
+
+        # Known-dead hosts are not resolved again
+        resolved.clear()
+        assert set(await registry.preflight(websites, timeout=0.1)) == {"gone1.ca", "gone2.ca"}
+        assert "gone1.ca" not in resolved
+
+    async def test_csv_runner_preflights_website_column(self, tmpdir_path, monkeypatch):
+        health = configure_domain_health(db_path=str(tmpdir_path / "domain_health.db"))
+        loop = asyncio.get_running_loop()
+
+        async def fake_getaddrinfo(host, *args, **kwargs):
+            if host == "gone.ca":
+                raise nxdomain_error()
+            return []
+
+        monkeypatch.setattr(loop, "getaddrinfo", fake_getaddrinfo)
+        input_path = tmpdir_path / "in.csv"
+        with open(input_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["Name", "Website"])
+            writer.writerow(["Gone Ltd", "https://gone.ca"])
+            writer.writerow(["Alive Inc", "https://alive.ca"])
+
+        fetched = []
+
+        def enrich(row):
+            if not health.is_dead(row['Website']):
+                fetched.append(row['Name'])
+            return {}
+
+        try:
+            runner = CsvEnrichmentRunner(enrich, preflight_column='Website')
+            await runner.run(str(input_path), str(tmpdir_path / "out.csv"), resume=False)
+        finally:
+            reset_domain_health()
+
+        assert fetched == ["Alive Inc"]
+
+
+class TestWebsiteService:
+    """Test the website validation service skips and records dead hosts."""
+
+    async def test_dead_host_not_fetched_again(self, registry, tmpdir_path):
+        concurrency = HostConcurrency(store=HostLimitStore(str(tmpdir_path / "host_limits.db")))
+        hedging = HedgingPolicy(HedgingSettings(enabled=False))
+
+        async with WebsiteValidationService(timeout=5.0, hedging=hedging, concurrency=concurrency,
+                                            domain_health=registry) as service:
+            first = await service.validate_website("http://127.0.0.1:9/", "Stolk Machine Shop")
+            started = time.monotonic()
+            second = await service.validate_website("http://127.0.0.1:9/", "Stolk Machine Shop")
+
+        assert not first.is_valid
+        assert registry.store.get("127.0.0.1").kind == REFUSED
+        assert second.error_message == f"Skipped: host known dead ({REFUSED})"
+        assert time.monotonic() - started < 0.5
+        assert registry.get_stats()['skipped'] == 1
@@ -0,0 +1,207 @@
+"""
+Tests for the shared domain registration service.
+Validates RDAP parsing, the one-lookup-per-domain cache and sharing between enrichers.
+"""
+
+import asyncio
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.enrichment.domain_age_checker import DomainAgeChecker
+from src.enrichment.owner_lookup import OwnerLookupService
+from src.services import domain_registration
+from src.services.domain_registration import (
+    DomainRecordStore,
+    DomainRegistrationService,
+    parse_rdap,
+    registrable_domain,
+    reset_domain_registration_service,
+)
+
+RDAP_RESPONSE = {
+    'ldhName': 'stolkmachine.ca',
+    'events': [
+        {'eventAction': 'last changed', 'eventDate': '2023-04-01T00:00:00Z'},
+        {'eventAction': 'registration', 'eventDate': '2001-06-15T14:30:00Z'},
+    ],
+    'entities': [
+        {
+            'roles': ['registrar'],
+            'vcardArray': ['vcard', [['version', {}, 'text', '4.0'], ['fn', {}, 'text', 'Example Registrar Inc.']]],
+            'entities': [
+                {'roles': ['abuse'], 'vcardArray': ['vcard', [['fn', {}, 'text', 'Abuse Desk']]]},
+            ],
+        },
+        {
+            'roles': ['registrant'],
+            'vcardArray': ['vcard', [['fn', {}, 'text', 'John Stolk']]],
+        },
+    ],
+}
+
+
+class TestParsing:
+    """Test domain normalization and RDAP parsing."""
+
+    def test_registrable_domain(self):
+        assert registrable_domain("https://www.stolkmachine.ca/about") == "stolkmachine.ca"
+        assert registrable_domain("shop.example.on.ca") == "example.on.ca"
+        assert registrable_domain("http://Example.COM:8080") == "example.com"
+        assert registrable_domain("UNKNOWN") is None
+        assert registrable_domain("localhost") is None
+
+    def test_parse_rdap(self):
+        creation_date, registrant, registrar = parse_rdap(RDAP_RESPONSE)
+
+        assert creation_date == datetime(2001, 6, 15, 14, 30)
+        assert registrant == 'John Stolk'
+        assert registrar == 'Example Registrar Inc.'
+
+
+@pytest.fixture
+async def rdap_server():
+    hits = []
+
+    async def domain(request):
+        name = request.match_info['name']
+        hits.append(name)
+        await asyncio.sleep(0.05)
+        if name == 'missing.ca':
+            return web.Response(status=404)
+        if name == 'flaky.ca' and hits.count(name) == 1:
+            return web.Response(status=503)
+        return web.json_response(RDAP_RESPONSE)
+
+    app = web.Application()
+    app.router.add_get("/domain/{name}", domain)
+    server = TestServer(app)
+    await server.start_server()
+    server.hits = hits
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+def store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield DomainRecordStore(str(Path(tmpdir) / "domains.db"))
+
+
+def make_service(server, store) -> DomainRegistrationService:
+    service = DomainRegistrationService(store=store, rate_per_registry=10.0, use_whois=False)
+    service.RDAP_BOOTSTRAP_URL = str(server.make_url("/domain/"))
+    return service
+
+
+class TestDomainRegistrationService:
+    """Test lookup sharing and caching."""
+
+    async def test_concurrent_lookups_share_one_request(self, rdap_server, store):
+        service = make_service(rdap_server, store)
+
+        records = await service.lookup_batch([
+            "https://stolkmachine.ca",
+            "www.stolkmachine.ca/contact",
+            "http://stolkmachine.ca/about",
+        ])
+        await service.close()
+
+        assert rdap_server.hits == ['stolkmachine.ca']
+        assert all(r.creation_date == datetime(2001, 6, 15, 14, 30) for r in records)
+        assert records[0].source == 'rdap'
+
+    async def test_disk_cache_survives_new_service(self, rdap_server, store):
+        first = make_service(rdap_server, store)
+        await first.lookup("stolkmachine.ca")
+        await first.close()
+
+        second = make_service(rdap_server, store)
+        record = await second.lookup("https://www.stolkmachine.ca")
+        await second.close()
+
+        assert record.registrant == 'John Stolk'
+        assert len(rdap_server.hits) == 1
+        assert second.get_stats()['disk_hits'] == 1
+
+    async def test_not_found_cached_with_short_ttl(self, rdap_server, store):
+        service = make_service(rdap_server, store)
+
+        record = await service.lookup("missing.ca")
+        await service.lookup("missing.ca")
+        await service.close()
+
+        assert not record.found
+        assert record.error == 'no registration data'
+        assert record.expires_at - record.looked_up_at <= 86400
+        assert rdap_server.hits == ['missing.ca']
+
+    async def test_domain_age_and_owner_lookup_share_record(self, rdap_server, store):
+        service = make_service(rdap_server, store)
+
+        age = await DomainAgeChecker(registry=service).get_domain_age("https://stolkmachine.ca")
+        owner = await OwnerLookupService(registry=service)._lookup_from_whois("https://stolkmachine.ca")
+        await service.close()
+
+        assert age['year_founded'] == 2001
+        assert age['source'] == 'rdap'
+        assert owner['name'] == 'John Stolk'
+        assert len(rdap_server.hits) == 1
+
+    async def test_transport_errors_not_cached(self, rdap_server, store):
+        service = make_service(rdap_server, store)
+
+        failed = await service.lookup("flaky.ca")
+        retried = await service.lookup("flaky.ca")
+        await service.close()
+
+        assert failed.error == 'rdap: RDAP returned status 503'
+        assert retried.registrant == 'John Stolk'
+        assert rdap_server.hits == ['flaky.ca', 'flaky.ca']
+        assert service.get_stats()['errors'] == 1
+
+
+class TestSessionLifecycle:
+    """Test the shared HTTP session is closed, not leaked."""
+
+    def test_session_from_old_loop_closed_before_replacing(self, store):
+        service = DomainRegistrationService(store=store, use_whois=False)
+
+        async def open_session():
+            return service._get_session()
+
+        old_loop = asyncio.new_event_loop()
+        try:
+            first = old_loop.run_until_complete(open_session())
+            second = asyncio.run(open_session())
+            old_loop.run_until_complete(asyncio.sleep(0))
+        finally:
+            old_loop.close()
+
+        assert second is not first
+        assert first.closed
+
+    async def test_reset_closes_shared_session(self, store, monkeypatch):
+        service = DomainRegistrationService(store=store, use_whois=False)
+        session = service._get_session()
+        monkeypatch.setattr(domain_registration, "_service", service)
+
+        reset_domain_registration_service()
+        await asyncio.sleep(0)
+
+        assert session.closed
+        assert domain_registration._service is None
+
+    async def test_enricher_close_releases_session(self, store):
+        service = DomainRegistrationService(store=store, use_whois=False)
+        session = service._get_session()
+
+        await DomainAgeChecker(registry=service).close()
+
+        assert session.closed
+        assert service._get_session() is not session
+        await service.close()
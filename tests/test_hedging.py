@@ -0,0 +1,200 @@
+"""
+Tests for hedged requests.
+Validates hedge timing, first-success-wins, the global hedge budget and website fetch integration.
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+from src.services.hedging import HedgeBudget, HedgingPolicy, HedgingSettings, LatencyTracker
+from src.services.host_concurrency import HostConcurrency, HostLimitStore
+from src.services.website_validation_service import WebsiteValidationService
+
+URL = "https://slow.example.ca/"
+
+
+def warmed_policy(latency=0.02, **settings):
+    """Policy that has seen a few fast responses from the test host."""
+    policy = HedgingPolicy(HedgingSettings(min_delay_seconds=0.0, **settings))
+    for _ in range(10):
+        policy.latency.record("slow.example.ca", latency)
+    policy.budget.tokens = policy.budget.max_banked
+    return policy
+
+
+class Attempts:
+    """Attempt factory: the nth attempt sleeps delays[n] then returns n (or raises)."""
+
+    def __init__(self, *delays, fail=()):
+        self.delays = delays
+        self.fail = fail
+        self.started = 0
+        self.cancelled = []
+
+    async def __call__(self):
+        n = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delays[n])
+        except asyncio.CancelledError:
+            self.cancelled.append(n)
+            raise
+        if n in self.fail:
+            raise ConnectionError(f"attempt {n} failed")
+        return n
+
+
+class TestLatencyTracker:
+    """Test percentile lookup."""
+
+    def test_host_percentile_with_global_fallback(self):
+        tracker = LatencyTracker()
+        for i in range(1, 11):
+            tracker.record("a.ca", i / 10)
+        tracker.record("b.ca", 5.0)
+
+        assert tracker.percentile("a.ca", 0.9) == 0.9
+        # b.ca has one sample; the all-hosts window stands in
+        assert tracker.percentile("b.ca", 0.5) == 0.6
+        assert tracker.percentile("c.ca", 0.9, min_samples=20) is None
+
+
+class TestHedgeBudget:
+    """Test token queueing."""
+
+    async def test_oldest_waiter_gets_next_token(self):
+        budget = HedgeBudget(ratio=0.5)
+        first = asyncio.ensure_future(budget.acquire())
+        second = asyncio.ensure_future(budget.acquire())
+        gone = asyncio.ensure_future(budget.acquire())
+        await asyncio.sleep(0)
+
+        # A request that finished on its own leaves the queue
+        gone.cancel()
+        budget.earn()
+        budget.earn()
+        await asyncio.sleep(0)
+
+        assert first.done() and not second.done()
+        budget.earn()
+        budget.earn()
+        await asyncio.sleep(0)
+        assert second.done()
+        assert budget.tokens == 0.0
+
+
+class TestHedgingPolicy:
+    """Test hedge decisions and outcomes."""
+
+    async def test_no_hedge_without_history(self):
+        policy = HedgingPolicy()
+        attempts = Attempts(0.05)
+
+        assert await policy.run(URL, attempts) == 0
+        assert attempts.started == 1
+        assert policy.get_stats()['hedges_sent'] == 0
+
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        policy = warmed_policy()
+        attempts = Attempts(1.0, 0.01)
+
+        started = time.monotonic()
+        result = await policy.run(URL, attempts)
+        await asyncio.sleep(0)
+
+        assert result == 1
+        assert time.monotonic() - started < 0.5
+        assert attempts.cancelled == [0]
+        stats = policy.get_stats()
+        assert stats['hedges_sent'] == stats['hedge_wins'] == 1
+        assert stats['hedge_win_rate'] == 1.0
+
+    async def test_primary_can_still_win(self):
+        policy = warmed_policy()
+        attempts = Attempts(0.06, 0.5)
+
+        assert await policy.run(URL, attempts) == 0
+        await asyncio.sleep(0)
+
+        assert attempts.cancelled == [1]
+        assert policy.get_stats()['primary_wins'] == 1
+
+    async def test_failed_attempt_waits_for_the_other(self):
+        policy = warmed_policy()
+
+        assert await policy.run(URL, Attempts(0.1, 0.01, fail={1})) == 0
+        with pytest.raises(ConnectionError):
+            await policy.run(URL, Attempts(0.05, 0.01, fail={0, 1}))
+
+    async def test_budget_caps_extra_requests(self):
+        policy = HedgingPolicy(HedgingSettings(min_delay_seconds=0.0, budget_ratio=0.05))
+        for _ in range(10):
+            policy.latency.record("slow.example.ca", 0.001)
+
+        results = await asyncio.gather(*[policy.run(URL, Attempts(0.02, 0.001)) for _ in range(100)])
+
+        stats = policy.get_stats()
+        assert stats['hedges_sent'] == 5
+        assert stats['budget_denied'] == 95
+        assert stats['hedge_rate'] == 0.05
+        assert results.count(1) == 5
+
+    async def test_disabled(self):
+        policy = warmed_policy(enabled=False)
+        attempts = Attempts(0.1, 0.01)
+
+        assert await policy.run(URL, attempts) == 0
+        assert attempts.started == 1
+
+
+@pytest.fixture
+async def tail_server():
+    """Local server whose first response for each path stalls."""
+    seen = {}
+
+    async def handler(request):
+        seen[request.path] = seen.get(request.path, 0) + 1
+        if seen[request.path] == 1 and request.path == '/stall':
+            await asyncio.sleep(2)
+        return web.Response(text="<html><title>Stolk Machine Shop</title></html>", content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get("/{path}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}", seen
+
+    await runner.cleanup()
+
+
+class TestWebsiteFetchHedging:
+    """Test hedging on the website validation fetch path."""
+
+    async def test_stalled_fetch_answered_by_hedge(self, tail_server):
+        base_url, seen = tail_server
+        policy = HedgingPolicy(HedgingSettings(min_delay_seconds=0.0))
+        policy.budget.tokens = 1.0
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            concurrency = HostConcurrency(store=HostLimitStore(str(Path(tmpdir) / "host_limits.db")))
+            async with WebsiteValidationService(timeout=5.0, hedging=policy, concurrency=concurrency) as service:
+                for _ in range(5):
+                    await service._make_request(f"{base_url}/fast")
+
+                started = time.monotonic()
+                status, content, _ = await service._make_request(f"{base_url}/stall")
+
+        assert status == 200
+        assert "Stolk" in content
+        assert time.monotonic() - started < 1.5
+        assert seen['/stall'] == 2
+        assert policy.get_stats()['hedge_wins'] == 1
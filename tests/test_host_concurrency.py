@@ -0,0 +1,197 @@
+"""
+Tests for adaptive per-host concurrency.
+Validates AIMD growth and backoff, Retry-After handling, persisted limits and website fetch integration.
+"""
+
+import asyncio
+import tempfile
+import time
+from email.utils import formatdate
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+from src.services.hedging import HedgingPolicy, HedgingSettings
+from src.services.host_concurrency import (
+    ConcurrencySettings,
+    HostConcurrency,
+    HostLimitStore,
+    parse_retry_after,
+)
+from src.services.website_validation_service import WebsiteValidationService
+
+
+@pytest.fixture
+def store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield HostLimitStore(str(Path(tmpdir) / "host_limits.db"))
+
+
+async def request(concurrency, url, status=200, seconds=0.0, retry_after=None):
+    async with concurrency.slot(url) as slot:
+        await asyncio.sleep(seconds)
+        slot.observe(status, retry_after)
+
+
+class TestHostLimit:
+    """Test limit growth, backoff and queueing."""
+
+    async def test_grows_while_healthy_and_in_use(self, store):
+        concurrency = HostConcurrency(store=store)
+        url = "https://places.googleapis.com/v1/places:searchText"
+
+        for _ in range(10):
+            await asyncio.gather(*[request(concurrency, url, seconds=0.01) for _ in range(4)])
+
+        host_limit = concurrency.host_limit("places.googleapis.com")
+        assert host_limit.limit > 4
+        assert host_limit.max_limit == 32.0
+        assert concurrency.get_stats()['increases'] > 0
+
+    async def test_idle_limit_does_not_grow(self, store):
+        concurrency = HostConcurrency(store=store)
+
+        for _ in range(20):
+            await request(concurrency, "https://stolkmachine.ca/")
+
+        assert concurrency.host_limit("stolkmachine.ca").limit == 2.0
+
+    async def test_degraded_latency_holds_limit(self, store):
+        concurrency = HostConcurrency(store=store)
+        host_limit = concurrency.host_limit("stolkmachine.ca")
+        host_limit.baseline_latency = 0.05
+        host_limit.in_flight = 2
+
+        host_limit.on_success(0.5)
+
+        assert host_limit.limit == 2.0
+
+    async def test_overload_halves_once_per_burst(self, store):
+        concurrency = HostConcurrency(store=store)
+        host_limit = concurrency.host_limit("stolkmachine.ca")
+        host_limit.limit = 8.0
+
+        await asyncio.gather(*[request(concurrency, "https://stolkmachine.ca/", status=503, seconds=0.01)
+                               for _ in range(8)])
+        assert host_limit.limit == 4.0
+
+        await request(concurrency, "https://stolkmachine.ca/", status=429)
+        assert host_limit.limit == 2.0
+        assert concurrency.get_stats()['decreases'] == 2
+
+    async def test_timeout_counts_as_overload(self, store):
+        concurrency = HostConcurrency(store=store)
+
+        with pytest.raises(asyncio.TimeoutError):
+            async with concurrency.slot("https://stolkmachine.ca/"):
+                raise asyncio.TimeoutError()
+
+        host_limit = concurrency.host_limit("stolkmachine.ca")
+        assert host_limit.limit == 1.0
+        assert host_limit.in_flight == 0
+
+    async def test_limit_bounds_in_flight(self, store):
+        concurrency = HostConcurrency(ConcurrencySettings(enabled=False), store=store)
+        peak = {'now': 0, 'max': 0}
+
+        async def tracked():
+            async with concurrency.slot("https://stolkmachine.ca/"):
+                peak['now'] += 1
+                peak['max'] = max(peak['max'], peak['now'])
+                await asyncio.sleep(0.01)
+                peak['now'] -= 1
+
+        await asyncio.gather(*[tracked() for _ in range(10)])
+
+        assert peak['max'] == 2
+
+    async def test_retry_after_pauses_host(self, store):
+        concurrency = HostConcurrency(store=store)
+        api = "https://api.geoapify.com/v1/geocode"
+
+        await request(concurrency, api, status=429, retry_after="1")
+        started = time.monotonic()
+        await request(concurrency, api)
+
+        assert time.monotonic() - started >= 0.9
+        assert concurrency.get_stats()['retry_after_pauses'] == 1
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("30") == 30.0
+        assert 55 < parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestPersistence:
+    """Test learned limits carry over between runs."""
+
+    async def test_limits_saved_and_restored(self, store):
+        first = HostConcurrency(store=store)
+        first.host_limit("stolkmachine.ca").limit = 5.5
+        first.host_limit("stolkmachine.ca").dirty = True
+        first.host_limit("quiet.ca")
+
+        assert first.save() == 1
+
+        second = HostConcurrency(store=store)
+        assert second.host_limit("stolkmachine.ca").limit == 5.5
+        assert second.host_limit("quiet.ca").limit == 2.0
+        assert second.get_stats()['restored_hosts'] == 1
+
+    async def test_restored_limit_clamped_and_stale_ignored(self, store):
+        store.put_many({"stolkmachine.ca": (50.0, 0.1)})
+
+        assert HostConcurrency(store=store).host_limit("stolkmachine.ca").limit == 8.0
+        stale = HostConcurrency(ConcurrencySettings(store_ttl_seconds=0), store=store)
+        assert stale.host_limit("stolkmachine.ca").limit == 2.0
+
+    def test_no_file_until_saved(self, store):
+        HostConcurrency(store=store).host_limit("stolkmachine.ca")
+
+        assert not store.db_path.exists()
+
+
+@pytest.fixture
+async def busy_server():
+    """Local server that answers 503 + Retry-After once, then 200."""
+    seen = {'count': 0}
+
+    async def handler(request):
+        seen['count'] += 1
+        if seen['count'] == 1:
+            return web.Response(status=503, headers={'Retry-After': '1'})
+        return web.Response(text="<html><title>Stolk Machine Shop</title></html>", content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/"
+
+    await runner.cleanup()
+
+
+class TestWebsiteFetch:
+    """Test the website validation fetch path reports to the controller."""
+
+    async def test_busy_site_backs_off(self, busy_server, store):
+        concurrency = HostConcurrency(store=store)
+        hedging = HedgingPolicy(HedgingSettings(enabled=False))
+
+        async with WebsiteValidationService(timeout=5.0, hedging=hedging, concurrency=concurrency) as service:
+            status, _, _ = await service._make_request(busy_server)
+            started = time.monotonic()
+            status_after, _, _ = await service._make_request(busy_server)
+
+        assert status == 503
+        assert status_after == 200
+        assert time.monotonic() - started >= 0.9
+        assert concurrency.get_stats()['decreases'] == 1
+        # Saved on exit
+        assert store.get(busy_server.split('/')[2], 3600) is not None
@@ -0,0 +1,165 @@
+"""
+Tests for the bounded HTML extraction engine.
+Validates single-pass extraction on both parser backends and capped body reads.
+"""
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.services.html_extraction import (
+    PARSER_BACKENDS,
+    etree,
+    extract_page,
+    read_body_bytes_capped,
+    read_body_capped,
+)
+
+PAGE = """
+<html>
+<head>
+    <title>Hamilton Caster &amp; Manufacturing</title>
+    <meta name="Description" content="Industrial casters since 1907">
+    <meta property="og:site_name" content="Hamilton Caster">
+    <script>var tracking = "noreply@tracker.com 905-000-0000";</script>
+    <style>.phone { color: red; }</style>
+</head>
+<body>
+    <nav><a href="/about">About</a><a href="/contact-us">Contact <b>us</b></a></nav>
+    <p>Call (905) 544-4122 or 905.662.3143, fax 9055550199.</p>
+    <p>Email info@hamiltoncaster.com for quotes. Ref 12345.</p>
+    <a href="mailto:sales@hamiltoncaster.com?subject=Quote">Sales</a>
+    <a href="tel:+1-905-555-0100">Call now</a>
+    <footer>Owner: Jane Smith</footer>
+</body>
+</html>
+"""
+
+BACKENDS = [
+    pytest.param(backend, marks=pytest.mark.skipif(backend == "lxml" and etree is None, reason="lxml not installed"))
+    for backend in PARSER_BACKENDS
+]
+
+
+class TestExtractPage:
+    """Test single-pass extraction."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_text_title_and_meta(self, backend):
+        page = extract_page(PAGE, backend=backend)
+
+        assert page.title == "Hamilton Caster & Manufacturing"
+        assert page.meta == {
+            'description': 'Industrial casters since 1907',
+            'og:site_name': 'Hamilton Caster',
+        }
+        assert "Call (905) 544-4122" in page.text
+        assert "tracking" not in page.text
+        assert "color" not in page.text
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_contacts_from_text_and_hrefs(self, backend):
+        page = extract_page(PAGE, backend=backend)
+
+        assert page.emails == {'info@hamiltoncaster.com', 'sales@hamiltoncaster.com'}
+        assert page.phones == {'(905) 544-4122', '905.662.3143', '9055550199', '9055550100'}
+
+    def test_tel_href_matching_visible_number_not_duplicated(self):
+        page = extract_page('<p>Call (905) 544-4122</p><a href="tel:+1%20905%20544%204122">Call</a>'
+                            '<a href="tel:905-544-4122">Call</a>')
+
+        assert page.phones == {'(905) 544-4122'}
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_links_resolved_against_base_url(self, backend):
+        import re
+
+        page = extract_page(PAGE, base_url="https://hamiltoncaster.com/", backend=backend)
+
+        contact = page.find_links(re.compile('/contact', re.IGNORECASE))
+        assert [(link.url, link.text) for link in contact] == [
+            ('https://hamiltoncaster.com/contact-us', 'Contact us')
+        ]
+        assert page.tag_counts['a'] == 4
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_inline_tags_do_not_split_words(self, backend):
+        page = extract_page('<p><b>Ham</b>ilton Wel<span>ding</span></p><p>Call <b>us</b><br>today</p>'
+                            '<ul><li>Steel</li><li>Aluminum</li></ul>', backend=backend)
+
+        assert page.text == "Hamilton Welding Call us today Steel Aluminum"
+
+    def test_skip_tags(self):
+        page = extract_page(PAGE, skip_tags=("nav", "footer"))
+
+        assert "Jane Smith" not in page.text
+        assert "About" not in page.text
+        assert "Call (905) 544-4122" in page.text
+
+    def test_empty_and_malformed_html(self):
+        assert extract_page("").text == ""
+        page = extract_page("<p>Unclosed <b>tags <a href='/x'>link")
+        assert page.text == "Unclosed tags link"
+        assert page.links[0].href == "/x"
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            extract_page(PAGE, backend="regex")
+
+
+class _BufferedResponse:
+    """Stands in for a replayed response whose body is already in memory."""
+
+    def __init__(self, body: str):
+        self.body = body
+
+    async def text(self):
+        return self.body
+
+
+@pytest.fixture
+async def server():
+    async def big(request):
+        return web.Response(text="<p>" + "x" * 500_000 + "</p>", content_type="text/html")
+
+    async def small(request):
+        return web.Response(text="<p>café</p>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/big", big)
+    app.router.add_get("/small", small)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    yield test_server
+    await test_server.close()
+
+
+class TestReadBodyCapped:
+    """Test bounded body reads."""
+
+    async def test_stream_stops_at_cap(self, server):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(server.make_url("/big")) as response:
+                html, truncated = await read_body_capped(response, max_bytes=100_000)
+
+        assert truncated is True
+        assert len(html) == 100_000
+
+    async def test_small_body_read_whole(self, server):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(server.make_url("/small")) as response:
+                html, truncated = await read_body_capped(response, max_bytes=100_000)
+
+        assert (html, truncated) == ("<p>café</p>", False)
+
+    async def test_buffered_response_cut_to_cap(self):
+        html, truncated = await read_body_capped(_BufferedResponse("abcdef"), max_bytes=4)
+
+        assert (html, truncated) == ("abcd", True)
+
+    async def test_buffered_response_cut_in_bytes(self):
+        body, encoding, truncated = await read_body_bytes_capped(_BufferedResponse("café au lait"), max_bytes=5)
+
+        assert (body, encoding, truncated) == (b"caf\xc3\xa9", "utf-8", True)
+        assert (await read_body_bytes_capped(_BufferedResponse("café"), max_bytes=5))[2] is False
@@ -0,0 +1,228 @@
+"""
+Tests for the record/replay HTTP transport.
+Validates request normalization, cassette storage, and record/replay sessions.
+"""
+
+import os
+import tempfile
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from src.services.http_transport import (
+    CassetteMissError,
+    CassetteSession,
+    CassetteStore,
+    RecordedResponse,
+    TransportSettings,
+    cassette_key,
+    configure_transport,
+    create_client_session,
+    normalize_request,
+    reset_transport,
+)
+
+
+@pytest.fixture
+async def local_server():
+    """Local aiohttp server counting the requests it receives."""
+    hits = {"count": 0}
+
+    async def handler(request):
+        hits["count"] += 1
+        return web.json_response({"name": "Stolk Machine Shop", "q": request.query.get("q")})
+
+    app = web.Application()
+    app.router.add_get("/search", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}", hits
+
+    await runner.cleanup()
+
+
+class TestRequestNormalization:
+    """Test cassette key normalization."""
+
+    def test_query_order_and_host_case_ignored(self):
+        a = normalize_request("get", "HTTPS://Example.com/search?b=2&a=1")
+        b = normalize_request("GET", "https://example.com/search?a=1&b=2")
+
+        assert a == b
+
+    def test_params_merged_into_query(self):
+        a = normalize_request("GET", "https://example.com/search", params={"q": "machine", "n": 5})
+        b = normalize_request("GET", "https://example.com/search?n=5&q=machine")
+
+        assert a == b
+
+    def test_api_keys_stripped(self):
+        canonical = normalize_request(
+            "GET", "https://api.geoapify.com/v2/places?apiKey=secret", params={"key": "secret2"}
+        )
+
+        assert "secret" not in canonical
+
+    def test_json_body_is_part_of_key(self):
+        a = normalize_request("POST", "https://example.com/", json_body={"textQuery": "printer"})
+        b = normalize_request("POST", "https://example.com/", json_body={"textQuery": "factory"})
+
+        assert cassette_key(a) != cassette_key(b)
+
+    def test_field_mask_header_is_part_of_key(self):
+        a = normalize_request("POST", "https://example.com/", headers={"X-Goog-FieldMask": "places.id"})
+        b = normalize_request("POST", "https://example.com/", headers={"X-Goog-FieldMask": "places.name"})
+        c = normalize_request("POST", "https://example.com/", headers={"User-Agent": "bot"})
+
+        assert a != b
+        assert c == normalize_request("POST", "https://example.com/")
+
+
+class TestCassetteStore:
+    """Test cassette persistence."""
+
+    def test_roundtrip_compresses_body(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CassetteStore(os.path.join(tmpdir, "cassettes.db"))
+            body = b"<html>" + b"Hamilton manufacturing " * 500 + b"</html>"
+
+            store.put("k1", "GET https://example.com/", RecordedResponse(
+                status=200, reason="OK", url="https://example.com/",
+                headers={"Content-Type": "text/html"}, body=body, elapsed_ms=120.0
+            ))
+            recorded = store.get("k1")
+
+            assert recorded.body == body
+            assert recorded.status == 200
+            assert store.get_stats()["compression_ratio"] < 0.1
+
+    def test_missing_key_returns_none(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CassetteStore(os.path.join(tmpdir, "cassettes.db"))
+
+            assert store.get("missing") is None
+            assert store.stats["misses"] == 1
+
+
+class TestCassetteSession:
+    """Test record and replay sessions against a local server."""
+
+    async def test_record_then_replay_offline(self, local_server):
+        base_url, hits = local_server
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CassetteStore(os.path.join(tmpdir, "cassettes.db"))
+
+            async with CassetteSession(TransportSettings(mode="record"), store=store) as session:
+                async with session.get(f"{base_url}/search", params={"q": "printing"}) as response:
+                    recorded = await response.json()
+
+            async with CassetteSession(TransportSettings(mode="replay"), store=store) as session:
+                async with session.get(f"{base_url}/search?q=printing") as response:
+                    replayed = await response.json()
+                    assert response.status == 200
+
+            assert replayed == recorded
+            assert hits["count"] == 1
+
+    async def test_awaiting_request_returns_response(self, local_server):
+        base_url, _ = local_server
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CassetteStore(os.path.join(tmpdir, "cassettes.db"))
+
+            async with CassetteSession(TransportSettings(mode="record"), store=store) as session:
+                response = await session.get(f"{base_url}/search")
+
+            assert response.status == 200
+            assert "Stolk" in await response.text()
+
+    async def test_replay_miss_fails(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CassetteStore(os.path.join(tmpdir, "cassettes.db"))
+
+            async with CassetteSession(TransportSettings(mode="replay"), store=store) as session:
+                with pytest.raises(CassetteMissError):
+                    async with session.get("https://example.invalid/search"):
+                        pass
+
+    async def test_replay_miss_passthrough_records(self, local_server):
+        base_url, hits = local_server
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CassetteStore(os.path.join(tmpdir, "cassettes.db"))
+            settings = TransportSettings(mode="replay", on_miss="passthrough")
+
+            async with CassetteSession(settings, store=store) as session:
+                await session.get(f"{base_url}/search")
+                await session.get(f"{base_url}/search")
+
+            assert hits["count"] == 1
+            assert store.count() == 1
+
+    async def test_simulated_latency(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CassetteStore(os.path.join(tmpdir, "cassettes.db"))
+            canonical = normalize_request("GET", "https://example.com/")
+            store.put(cassette_key(canonical), canonical, RecordedResponse(
+                status=200, reason="OK", url="https://example.com/",
+                headers={}, body=b"ok", elapsed_ms=100.0
+            ))
+            settings = TransportSettings(mode="replay", latency_ms=20, latency_scale=0.5)
+
+            async with CassetteSession(settings, store=store) as session:
+                start = time.perf_counter()
+                await session.get("https://example.com/")
+                elapsed = time.perf_counter() - start
+
+            assert elapsed >= 0.065
+
+    async def test_replayed_error_raises_client_response_error(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CassetteStore(os.path.join(tmpdir, "cassettes.db"))
+            canonical = normalize_request("GET", "https://example.com/missing")
+            store.put(cassette_key(canonical), canonical, RecordedResponse(
+                status=404, reason="Not Found", url="https://example.com/missing",
+                headers={}, body=b"", elapsed_ms=0.0
+            ))
+
+            async with CassetteSession(TransportSettings(mode="replay"), store=store) as session:
+                response = await session.get("https://example.com/missing")
+                with pytest.raises(aiohttp.ClientResponseError) as excinfo:
+                    response.raise_for_status()
+
+            assert excinfo.value.status == 404
+            assert excinfo.value.request_info.method == "GET"
+            assert "https://example.com/missing" in str(excinfo.value)
+
+
+class TestTransportConfiguration:
+    """Test session factory and settings."""
+
+    def teardown_method(self):
+        reset_transport()
+
+    async def test_live_mode_returns_aiohttp_session(self):
+        configure_transport(mode="live")
+
+        session = create_client_session()
+        try:
+            assert isinstance(session, aiohttp.ClientSession)
+        finally:
+            await session.close()
+
+    async def test_replay_mode_returns_cassette_session(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            configure_transport(mode="replay", store_path=os.path.join(tmpdir, "c.db"))
+
+            session = create_client_session(timeout=aiohttp.ClientTimeout(total=5))
+
+            assert isinstance(session, CassetteSession)
+            await session.close()
+
+    def test_invalid_mode_rejected(self):
+        with pytest.raises(ValueError):
+            TransportSettings(mode="offline")
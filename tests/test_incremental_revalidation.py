@@ -0,0 +1,150 @@
+"""
+Tests for incremental revalidation.
+Validates dirty-set detection, reuse of stored gate results, and parity with full validation.
+"""
+
+import dataclasses
+import os
+import tempfile
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.services.incremental_revalidation import (
+    DIRTY_INPUTS,
+    DIRTY_NEW,
+    DIRTY_RULE,
+    GATE_SPECS,
+    IncrementalRevalidator,
+)
+from src.services.new_validation_service import ValidationService
+
+MIGRATION = Path(__file__).parent.parent / 'migrations' / '001_evidence_schema.sql'
+
+BUSINESSES = [
+    # (name, place_types, employee_count)
+    ('Valid Manufacturing Co', 'manufacturing', 12),
+    ('Main Street Restaurant', 'restaurant', 12),
+    ('Unknown Size Fabrication', 'fabrication', None),
+]
+
+
+async def seed_db(db_path: str):
+    """Create the evidence schema and seed three businesses with observations."""
+    db = await aiosqlite.connect(db_path)
+    db.row_factory = aiosqlite.Row
+    await db.executescript(MIGRATION.read_text())
+    for column in ('name TEXT', 'industry TEXT', 'employee_count INTEGER',
+                   'website_ok BOOLEAN', 'website_age_years REAL'):
+        await db.execute(f"ALTER TABLE businesses ADD COLUMN {column}")
+
+    for index, (name, place_types, employees) in enumerate(BUSINESSES, 1):
+        await db.execute(
+            """INSERT INTO businesses
+            (id, fingerprint, normalized_name, original_name, name, city, latitude, longitude,
+             employee_count, website_ok, website_age_years, status)
+            VALUES (?, ?, ?, ?, ?, 'Hamilton', 43.2557, -79.9537, ?, 1, 20, 'DISCOVERED')""",
+            (index, f"fp{index}", name.lower(), name, name, employees)
+        )
+        observations = [('place_types', place_types, 1.0), ('revenue_midpoint', '1200000', 0.8)]
+        for obs_field, value in (('address', '100 King St'), ('phone', '9055550100'), ('postal_code', 'L8P1A1')):
+            observations += [(obs_field, value, 0.9), (obs_field, value, 0.9)]
+        for obs_field, value, confidence in observations:
+            await db.execute(
+                "INSERT INTO observations (business_id, source_url, field, value, confidence) VALUES (?, ?, ?, ?, ?)",
+                (index, 'https://example.com', obs_field, value, confidence)
+            )
+    await db.commit()
+    return db
+
+
+@pytest.fixture
+async def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        connection = await seed_db(os.path.join(tmpdir, 'leads.db'))
+        await connection.execute("UPDATE businesses SET status = 'REVIEW_REQUIRED'")
+        await connection.commit()
+        yield connection
+        await connection.close()
+
+
+async def statuses(db):
+    cursor = await db.execute("SELECT id, status FROM businesses ORDER BY id")
+    return {row[0]: row[1] for row in await cursor.fetchall()}
+
+
+class TestIncrementalRevalidation:
+    """Test dirty-set detection and gate reuse."""
+
+    async def test_first_run_matches_full_validation(self, db):
+        service = ValidationService()
+        expected = {}
+        for business_id in range(1, len(BUSINESSES) + 1):
+            cursor = await db.execute(
+                "SELECT value FROM observations WHERE business_id = ? AND field = 'place_types'", (business_id,)
+            )
+            place_types = (await cursor.fetchone())[0].split(',')
+            expected[business_id], _ = await service.validate_business(db, business_id, place_types)
+
+        report = await IncrementalRevalidator(service).revalidate(db)
+
+        assert await statuses(db) == expected
+        assert expected == {1: 'QUALIFIED', 2: 'EXCLUDED', 3: 'REVIEW_REQUIRED'}
+        assert report.gates_reused == 0
+        assert all(set(reasons) == {DIRTY_NEW} for reasons in report.dirty_by_rule.values())
+
+    async def test_unchanged_rerun_skips_all_gates(self, db):
+        revalidator = IncrementalRevalidator()
+        await revalidator.revalidate(db)
+
+        report = await revalidator.revalidate(db)
+
+        assert report.gates_rerun == 0
+        assert report.businesses_dirty == 0
+        assert report.work_skipped_pct == 100.0
+
+    async def test_new_observation_reruns_only_dependent_gate(self, db):
+        revalidator = IncrementalRevalidator()
+        await revalidator.revalidate(db)
+        await db.execute(
+            "INSERT INTO observations (business_id, source_url, field, value, confidence) VALUES (1, 'x', 'revenue_midpoint', '5000000', 0.95)"
+        )
+        await db.commit()
+
+        report = await revalidator.revalidate(db)
+
+        assert report.gates_rerun == 1
+        assert dict(report.dirty_by_rule) == {'revenue_gate': {DIRTY_INPUTS: 1}}
+        assert report.status_changes == [(1, 'QUALIFIED', 'EXCLUDED')]
+        assert (await statuses(db))[1] == 'EXCLUDED'
+
+    async def test_rule_change_dirties_only_that_gate_and_bumps_version(self, db):
+        first = await IncrementalRevalidator().revalidate(db)
+        specs = [
+            dataclasses.replace(spec, rule_config={**spec.rule_config, 'max_radius_km': 25})
+            if spec.rule_id == 'geo_gate' else spec
+            for spec in GATE_SPECS
+        ]
+
+        report = await IncrementalRevalidator(specs=specs).revalidate(db)
+
+        assert dict(report.dirty_by_rule) == {'geo_gate': {DIRTY_RULE: 2}}
+        assert report.validation_version == first.validation_version + 1
+
+    async def test_dry_run_writes_nothing(self, db):
+        report = await IncrementalRevalidator().revalidate(db, dry_run=True)
+
+        cursor = await db.execute("SELECT COUNT(*) FROM validation_inputs")
+        assert (await cursor.fetchone())[0] == 0
+        assert report.businesses_dirty == len(BUSINESSES)
+        assert set((await statuses(db)).values()) == {'REVIEW_REQUIRED'}
+
+    async def test_manual_override_skipped(self, db):
+        await db.execute("UPDATE businesses SET manual_override = 1 WHERE id = 2")
+        await db.commit()
+
+        report = await IncrementalRevalidator().revalidate(db)
+
+        assert report.businesses_skipped_override == 1
+        assert (await statuses(db))[2] == 'REVIEW_REQUIRED'
@@ -0,0 +1,99 @@
+"""
+Tests for intent detection batch API.
+Validates parity with detect_intent, once-per-batch shared signals, and bulk persistence.
+"""
+
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+pytest.importorskip("requests_cache")
+
+from tools.intent_detector import IntentDetector
+
+
+def make_businesses(n=12):
+    return [
+        {
+            'name': f'Business {i}',
+            'industry': 'retail' if i % 3 == 0 else 'Manufacturing',
+            'location': 'Hamilton, ON',
+            'years_in_business': 5 + i * 2,
+            'historical_revenue': [1400000, 1350000, 1200000 - i * 10000, 1150000],
+            'contacts': [{'name': 'Pat Lee', 'title': 'Owner', 'age': 50 + i}],
+            'address': f'{i} Industrial Way, Hamilton, ON',
+            'description': 'struggling with rent increase' if i % 2 else '',
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.chdir(tmpdir)
+        yield IntentDetector(db_path=os.path.join(tmpdir, "intent.db"))
+
+
+def stored_rows(detector):
+    with sqlite3.connect(detector.db_path) as conn:
+        return conn.execute("SELECT business_name FROM intent_analysis ORDER BY id").fetchall()
+
+
+class TestDetectIntentBatch:
+    """Test the concurrent batch API."""
+
+    async def test_matches_single_detection(self, detector):
+        businesses = make_businesses()
+
+        batch = await detector.detect_intent_batch(businesses, store=False)
+        single = [detector.detect_intent(b) for b in businesses]
+
+        assert [a.business_name for a in batch] == [b['name'] for b in businesses]
+        for actual, expected in zip(batch, single):
+            assert actual.overall_intent_score == pytest.approx(expected.overall_intent_score)
+            assert actual.buying_probability == pytest.approx(expected.buying_probability)
+            assert actual.urgency_level == expected.urgency_level
+            assert actual.recommended_approach == expected.recommended_approach
+
+    async def test_shared_signals_computed_once_per_key(self, detector, monkeypatch):
+        calls = []
+        original = detector._search_consolidation_news
+
+        def counting(industry, location):
+            calls.append((industry, location))
+            return original(industry, location)
+
+        monkeypatch.setattr(detector, "_search_consolidation_news", counting)
+
+        await detector.detect_intent_batch(make_businesses(), max_concurrency=4)
+
+        assert sorted(calls) == [('Manufacturing', 'Hamilton, ON'), ('retail', 'Hamilton, ON')]
+
+    async def test_bulk_persisted_and_failures_isolated(self, detector, monkeypatch):
+        businesses = make_businesses(5)
+        original = detector.check_owner_age
+
+        def failing(business):
+            if business['name'] == 'Business 2':
+                raise RuntimeError("lookup failed")
+            return original(business)
+
+        monkeypatch.setattr(detector, "check_owner_age", failing)
+
+        analyses = await detector.detect_intent_batch(businesses)
+
+        assert len(analyses) == 4
+        assert [row[0] for row in stored_rows(detector)] == [a.business_name for a in analyses]
+
+    def test_single_detection_not_memoized(self, detector, monkeypatch):
+        calls = []
+        monkeypatch.setattr(detector, "_check_regulatory_changes",
+                            lambda industry: calls.append(industry) or None)
+
+        detector.detect_intent(make_businesses(1)[0])
+        detector.detect_intent(make_businesses(1)[0])
+
+        assert len(calls) == 2
@@ -0,0 +1,203 @@
+"""
+Tests for the lead monitoring engine.
+Validates due-time ordering, bounded concurrency, batched write-back,
+adaptive check intervals and per-source rate limits.
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("requests_cache")
+
+from tools.lead_monitor import LeadMonitor, MonitoringAlert, SourceRateLimiter
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.chdir(tmpdir)
+        lead_monitor = LeadMonitor(db_path=os.path.join(tmpdir, "monitoring.db"))
+        lead_monitor.source_rate_limits = {}
+        lead_monitor.min_site_delay = 0
+        yield lead_monitor
+
+
+def add_businesses(monitor, count, priority='medium', due_in_minutes=-1):
+    due_at = (datetime.now() + timedelta(minutes=due_in_minutes)).isoformat()
+    for i in range(count):
+        name = f'{priority} business {i}'
+        monitor.add_business_to_monitoring({'name': name, 'industry': 'manufacturing'}, priority=priority)
+        with sqlite3.connect(monitor.db_path) as conn:
+            conn.execute("UPDATE monitored_businesses SET next_check_at = ? WHERE business_name = ?",
+                         (due_at, name))
+
+
+def business_rows(monitor):
+    with sqlite3.connect(monitor.db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        return {
+            row['business_name']: dict(row)
+            for row in conn.execute("SELECT * FROM monitored_businesses")
+        }
+
+
+async def run_until(monitor, condition, timeout=5.0, **kwargs):
+    stop = asyncio.Event()
+    engine = asyncio.create_task(monitor.run_monitoring(stop_event=stop, **kwargs))
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    stop.set()
+    await engine
+
+
+class TestMonitoringEngine:
+    """Test the heap-scheduled async engine."""
+
+    async def test_due_businesses_checked_with_bounded_concurrency(self, monitor, monkeypatch):
+        add_businesses(monitor, 12)
+        add_businesses(monitor, 3, priority='low', due_in_minutes=60)
+        active, peak, checked = 0, 0, []
+
+        def slow_check(business_name, keywords, site_delay=1.0):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            time.sleep(0.02)
+            active -= 1
+            checked.append(business_name)
+            return []
+
+        monkeypatch.setattr(monitor, "monitor_business_listings", slow_check)
+
+        await run_until(monitor, lambda: len(checked) >= 12, max_concurrency=4)
+
+        assert sorted(checked) == sorted(f'medium business {i}' for i in range(12))
+        assert peak <= 4
+
+    async def test_results_written_back_in_batches(self, monitor, monkeypatch):
+        add_businesses(monitor, 6)
+        alert = MonitoringAlert(
+            business_name='medium business 0', alert_type='news_mention', severity='high',
+            message='Owner retiring', evidence=[], detected_at=datetime.now(),
+            source='news', requires_action=True
+        )
+        monkeypatch.setattr(monitor, "monitor_news_mentions",
+                            lambda name, keywords: [alert] if name == alert.business_name else [])
+        notified = []
+        monitor.add_alert_callback(notified.append)
+
+        await run_until(monitor, lambda: monitor.engine_stats['checks_completed'] >= 6,
+                        batch_size=100, flush_interval=60)
+
+        rows = business_rows(monitor)
+        assert all(row['last_checked'] for row in rows.values())
+        assert monitor.engine_stats['batches_written'] == 1
+        assert rows['medium business 0']['total_alerts'] == 1
+        assert rows['medium business 0']['consecutive_quiet_checks'] == 0
+        assert rows['medium business 1']['consecutive_quiet_checks'] == 1
+        assert notified == [alert]
+        with sqlite3.connect(monitor.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM monitoring_alerts").fetchone()[0] == 1
+
+    async def test_failed_check_does_not_stop_engine(self, monitor, monkeypatch):
+        add_businesses(monitor, 3)
+        original = monitor._get_business_state
+
+        def flaky_state(business_name):
+            if business_name == 'medium business 1':
+                raise sqlite3.OperationalError("database is locked")
+            return original(business_name)
+
+        monkeypatch.setattr(monitor, "_get_business_state", flaky_state)
+
+        await run_until(monitor, lambda: monitor.engine_stats['checks_completed'] >= 2)
+
+        assert monitor.engine_stats['checks_failed'] == 1
+        assert business_rows(monitor)['medium business 2']['last_checked']
+
+    async def test_failing_business_backs_off(self, monitor, monkeypatch):
+        add_businesses(monitor, 1)
+        attempts = []
+
+        def locked_state(business_name):
+            attempts.append(time.monotonic())
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(monitor, "_get_business_state", locked_state)
+        monkeypatch.setattr("tools.lead_monitor.MIN_INTERVAL_MINUTES", 0.001)  # 60 ms first retry
+
+        await run_until(monitor, lambda: len(attempts) >= 3)
+
+        first_gap, second_gap = attempts[1] - attempts[0], attempts[2] - attempts[1]
+        assert first_gap >= 0.05
+        assert second_gap >= 0.11
+        assert monitor.engine_stats['checks_failed'] == 3
+
+    async def test_removed_business_is_unscheduled(self, monitor, monkeypatch):
+        add_businesses(monitor, 2)
+        with sqlite3.connect(monitor.db_path) as conn:
+            conn.execute("DELETE FROM monitored_businesses WHERE business_name = 'medium business 0'")
+        checked = []
+        monkeypatch.setattr(monitor, "monitor_business_listings",
+                            lambda name, keywords, site_delay=1.0: checked.append(name) or [])
+
+        await run_until(monitor, lambda: monitor.engine_stats['checks_completed'] >= 1)
+
+        assert checked == ['medium business 1']
+        assert monitor.engine_stats['checks_failed'] == 0
+
+
+class TestListingChecks:
+    """Test listing-site pacing."""
+
+    def test_minimum_delay_between_sites(self, monitor, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("tools.lead_monitor.time.sleep", sleeps.append)
+        monitor.min_site_delay = 1.0
+
+        monitor.monitor_business_listings('Stolk Machine Shop', [], site_delay=0)
+        assert sleeps == [1.0, 1.0, 1.0]
+
+        sleeps.clear()
+        monitor.monitor_business_listings('Stolk Machine Shop', [], site_delay=2.5)
+        assert sleeps == [2.5, 2.5, 2.5]
+
+
+class TestAdaptiveInterval:
+    """Test check interval adaptation."""
+
+    def test_priority_base_interval(self, monitor):
+        assert monitor._adaptive_interval('high', None, 0) == timedelta(minutes=60)
+        assert monitor._adaptive_interval('low', None, 0) == timedelta(minutes=1440)
+
+    def test_recent_alert_shortens_interval(self, monitor):
+        interval = monitor._adaptive_interval('medium', datetime.now() - timedelta(hours=1), 0)
+
+        assert interval == timedelta(minutes=120)
+
+    def test_quiet_businesses_back_off_to_cap(self, monitor):
+        assert monitor._adaptive_interval('high', None, 3) == timedelta(minutes=60)
+        assert monitor._adaptive_interval('high', None, 5) == timedelta(minutes=90)
+        assert monitor._adaptive_interval('high', None, 50) == timedelta(minutes=120)
+
+
+class TestSourceRateLimiter:
+    """Test per-source request spacing."""
+
+    async def test_spacing_per_source(self):
+        limiter = SourceRateLimiter({'listings': 20.0})
+        start = time.monotonic()
+
+        await asyncio.gather(*(limiter.acquire('listings') for _ in range(5)))
+        elapsed = time.monotonic() - start
+        await limiter.acquire('unlimited')
+
+        assert elapsed >= 0.19
+        assert time.monotonic() - start - elapsed < 0.05
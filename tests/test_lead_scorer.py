@@ -0,0 +1,109 @@
+"""
+Tests for the lead scorer batch path.
+Validates parity between batch_score_leads and per-lead score_lead, and batched history writes.
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+
+import pytest
+
+from tools.lead_scorer import LeadScorer
+
+
+def make_businesses(n=60, seed=7):
+    rng = random.Random(seed)
+    titles = ['President', 'Owner', 'Sales Manager', 'Founder & CEO', 'Engineer']
+    businesses = []
+    for i in range(n):
+        business = {
+            'name': f'Business {i}',
+            'revenue': rng.choice([0, -5, 500000, 1000000, 1200000, 1400000, 1900000, 5000000]),
+            'years_in_business': rng.choice([0, 2, 3, 7.5, 10, 25]),
+            'employee_count': rng.randint(1, 60),
+            'credit_score': rng.choice([0, 59, 60, 75, 80, 95]),
+            'website_quality': rng.uniform(0, 100),
+            'social_media_presence': rng.uniform(0, 100),
+            'reviews_score': rng.uniform(0, 100),
+            'market_share': rng.uniform(0, 100),
+            'owner_age': rng.randint(35, 75),
+            'financial_stability': rng.uniform(0, 100),
+            'contacts': [{'title': rng.choice(titles)}] if rng.random() > 0.3 else [],
+        }
+        # Exercise missing keys and their defaults
+        if i % 7 == 0:
+            del business['credit_score']
+        businesses.append(business)
+    return businesses
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield LeadScorer(db_path=os.path.join(tmpdir, "scoring.db"),
+                         model_path=os.path.join(tmpdir, "models"))
+
+
+def history_count(scorer):
+    with sqlite3.connect(scorer.db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM scoring_history").fetchone()[0]
+
+
+class TestBatchScoring:
+    """Test the vectorized batch scoring engine."""
+
+    def test_matches_per_lead_scoring(self, scorer):
+        businesses = make_businesses()
+        validations = [{'contact_validated': i % 2 == 0} for i in range(len(businesses))]
+
+        batch = {s.business_name: s for s in scorer.batch_score_leads(businesses, validations)}
+        single = {
+            b['name']: scorer.score_lead(b, v) for b, v in zip(businesses, validations)
+        }
+
+        assert batch.keys() == single.keys()
+        for name, expected in single.items():
+            actual = batch[name]
+            assert actual.total_score == pytest.approx(expected.total_score)
+            assert actual.factor_scores == pytest.approx(expected.factor_scores)
+            assert ({k: type(v) for k, v in actual.factor_scores.items()}
+                    == {k: type(v) for k, v in expected.factor_scores.items()})
+            assert actual.prediction_confidence == pytest.approx(expected.prediction_confidence)
+            assert actual.priority_level == expected.priority_level
+            assert actual.risk_assessment == expected.risk_assessment
+            assert actual.recommended_action == expected.recommended_action
+
+    def test_sorted_and_history_written(self, scorer):
+        before = history_count(scorer)
+
+        scores = scorer.batch_score_leads(make_businesses(25, seed=3))
+
+        totals = [s.total_score for s in scores]
+        assert totals == sorted(totals, reverse=True)
+        assert history_count(scorer) == before + 25
+
+    def test_non_numeric_rows_skipped(self, scorer):
+        businesses = make_businesses(3)
+        businesses[1]['revenue'] = None
+
+        scores = scorer.batch_score_leads(businesses, store_history=False)
+
+        assert sorted(s.business_name for s in scores) == ['Business 0', 'Business 2']
+
+    def test_non_numeric_ml_inputs_still_scored(self, scorer):
+        businesses = make_businesses(4, seed=11)
+        businesses[1]['employee_count'] = '10-20'
+        businesses[2]['owner_age'] = None
+
+        batch = {s.business_name: s for s in scorer.batch_score_leads(businesses, store_history=False)}
+
+        assert len(batch) == 4
+        for business in businesses:
+            expected = scorer.score_lead(business)
+            assert batch[business['name']].total_score == pytest.approx(expected.total_score)
+            assert batch[business['name']].prediction_confidence == pytest.approx(expected.prediction_confidence)
+
+    def test_empty_batch(self, scorer):
+        assert scorer.batch_score_leads([]) == []
@@ -0,0 +1,149 @@
+"""
+Tests for columnar lead snapshots.
+Validates the explicit schema, round-trips, projection/pushdown and the CSV fallback.
+"""
+
+import csv
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+
+from src.core.output_schema import STANDARD_CSV_HEADERS, StandardLeadOutput
+from src.exports.lead_snapshot import (
+    csv_to_snapshot,
+    lead_snapshot_schema,
+    load_lead_records,
+    load_leads,
+    read_lead_snapshot,
+    write_lead_snapshot,
+)
+
+pytest.importorskip("pyarrow")
+
+
+def make_lead(name: str, status: str = "QUALIFIED", city: str = "Hamilton") -> StandardLeadOutput:
+    return StandardLeadOutput(
+        business_name=name,
+        address="100 King St W",
+        city=city,
+        province="ON",
+        postal_code="L8P 1A1",
+        phone_number="905-555-0100",
+        website="https://example.com",
+        industry="Manufacturing",
+        estimated_employees_range="10-20",
+        estimated_sde_cad="$250,000",
+        estimated_revenue_cad="$1,200,000",
+        confidence_score="83%",
+        status=status,
+        data_sources="Google Business, Web Scraping"
+    )
+
+
+class TestSnapshotSchema:
+    """Test the schema derived from the locked output format."""
+
+    def test_schema_matches_standard_headers(self):
+        schema = lead_snapshot_schema()
+
+        assert schema.names == STANDARD_CSV_HEADERS
+
+    def test_schema_follows_to_dict(self):
+        lead = make_lead("Stolk Machine Shop")
+
+        assert list(lead.to_dict().keys()) == lead_snapshot_schema().names
+
+    def test_low_cardinality_columns_dictionary_encoded(self):
+        import pyarrow as pa
+
+        schema = lead_snapshot_schema()
+
+        assert pa.types.is_dictionary(schema.field("Status").type)
+        assert pa.types.is_string(schema.field("Business Name").type)
+
+
+class TestSnapshotReadWrite:
+    """Test snapshot round-trips and selective reads."""
+
+    @pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+    def test_roundtrip(self, suffix):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, f"leads{suffix}")
+            rows = [make_lead("A Corp"), make_lead("B Corp", status="EXCLUDED")]
+
+            assert write_lead_snapshot(rows, path) == 2
+            df = read_lead_snapshot(path)
+
+            assert list(df.columns) == STANDARD_CSV_HEADERS
+            assert df["Business Name"].tolist() == ["A Corp", "B Corp"]
+
+    def test_projection_and_filter(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "leads.parquet")
+            write_lead_snapshot(
+                [make_lead("A Corp"), make_lead("B Corp", status="EXCLUDED"), make_lead("C Corp")],
+                path
+            )
+
+            df = load_leads(path, columns=["Business Name"], filters=[("Status", "=", "QUALIFIED")])
+
+            assert list(df.columns) == ["Business Name"]
+            assert df["Business Name"].tolist() == ["A Corp", "C Corp"]
+
+    def test_non_standard_frame_keeps_numeric_columns(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "scored.parquet")
+            write_lead_snapshot(pd.DataFrame({"business_name": ["A", "B"], "score": [72, 55]}), path)
+
+            df = load_leads(path, filters=[("score", ">=", 60)])
+
+            assert df["business_name"].tolist() == ["A"]
+
+
+class TestCSVFallback:
+    """Test CSV loading through the same interface."""
+
+    def write_csv(self, path, rows):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=STANDARD_CSV_HEADERS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row.to_dict())
+
+    def test_csv_projection_and_filter(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "leads.csv")
+            self.write_csv(path, [make_lead("A Corp"), make_lead("B Corp", status="EXCLUDED")])
+
+            df = load_leads(path, columns=["Business Name"], filters=[("Status", "=", "EXCLUDED")])
+
+            assert df["Business Name"].tolist() == ["B Corp"]
+
+    def test_csv_and_snapshot_records_match(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "leads.csv")
+            self.write_csv(path, [make_lead("A Corp"), make_lead("B Corp", city="Burlington")])
+
+            snapshot = csv_to_snapshot(path)
+
+            assert load_lead_records(snapshot) == load_lead_records(path)
+
+    def test_nonstandard_csv_keeps_string_values(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "consolidated.csv")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["business_name", "phone", "employees", "website"])
+                writer.writerow(["A Corp", "9055551234", "12", ""])
+                writer.writerow(["B Corp", "", "", "https://bcorp.ca"])
+
+            with open(path, newline="", encoding="utf-8") as f:
+                expected = list(csv.DictReader(f))
+
+            records = load_lead_records(path)
+
+            assert records == expected
+            assert records[0]["phone"] == "9055551234"
+            assert load_lead_records(csv_to_snapshot(path)) == expected
@@ -0,0 +1,190 @@
+"""
+Tests for the local business-type classifier tier.
+Validates training from evidence history, calibrated predictions and LLM escalation.
+"""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.core.models import BusinessLead, ContactInfo, LocationInfo
+from src.services.business_type_classifier import BusinessTypeClassifier
+from src.services.local_classifier import (
+    LABEL_EXCLUDED,
+    LABEL_QUALIFIED,
+    LabelledBusiness,
+    LocalBusinessClassifier,
+    load_labelled_history,
+)
+
+PLACES = ['Hamilton', 'Dundas', 'Ancaster', 'Stoney Creek', 'Waterdown', 'Binbrook']
+QUALIFIED_KINDS = ['Metal Fabrication', 'Machine Shop', 'Precision Machining', 'Printing', 'Tool & Die', 'Plastics']
+EXCLUDED_KINDS = ['Convenience', 'Esso', 'Pharmacy', 'Variety Store', 'Gas Bar', 'Grocery']
+
+
+def history():
+    examples = []
+    for place in PLACES:
+        for suffix in ('Inc', 'Ltd', ''):
+            for kind in QUALIFIED_KINDS:
+                examples.append(LabelledBusiness(f"{place} {kind} {suffix}".strip(), LABEL_QUALIFIED))
+            for kind in EXCLUDED_KINDS:
+                examples.append(LabelledBusiness(f"{place} {kind} {suffix}".strip(), LABEL_EXCLUDED))
+    return examples
+
+
+@pytest.fixture(scope="module")
+def model():
+    classifier = LocalBusinessClassifier(n_buckets=2 ** 16)
+    classifier.fit(history())
+    return classifier
+
+
+class TestLocalBusinessClassifier:
+    """Test training and prediction."""
+
+    def test_training_report(self, model):
+        info = model.training_info
+
+        assert info['examples'] == len(history())
+        assert info['folds'] == 3
+        assert info['held_out_accuracy'] >= 0.9
+
+    def test_clear_cases_are_confident(self, model):
+        qualified = model.predict("Mount Hope Precision Machining")
+        excluded = model.predict("Mount Hope Variety Store")
+
+        assert (qualified.label, excluded.label) == (LABEL_QUALIFIED, LABEL_EXCLUDED)
+        assert qualified.confidence > 0.85
+        assert excluded.confidence > 0.85
+        assert 0.0 < excluded.probability_excluded < 1.0
+        assert qualified.latency_us > 0
+
+    def test_known_business_answered_from_neighbour(self, model):
+        prediction = model.predict("Binbrook Gas Bar Ltd.")
+
+        assert prediction.method == 'neighbour'
+        assert prediction.neighbour == "Binbrook Gas Bar Ltd"
+        assert prediction.label == LABEL_EXCLUDED
+
+    def test_unseen_vocabulary_is_not_confident(self, model):
+        assert model.predict("Zephyr Quantum Widgets").confidence < 0.85
+
+    def test_save_and_load(self, model):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "model.json")
+            model.save(path)
+            loaded = LocalBusinessClassifier.load(path)
+
+        for name in ("Dundas Tool & Die", "Hamilton Esso", "Binbrook Gas Bar Ltd"):
+            expected = model.predict(name)
+            actual = loaded.predict(name)
+            assert actual.label == expected.label
+            assert actual.confidence == pytest.approx(expected.confidence, abs=1e-4)
+
+    def test_needs_both_labels(self):
+        with pytest.raises(ValueError):
+            LocalBusinessClassifier().fit([LabelledBusiness("Hamilton Printing", LABEL_QUALIFIED)])
+
+    def test_load_labelled_history(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "leads.db")
+            with sqlite3.connect(db_path) as conn:
+                conn.executescript(Path("migrations/001_evidence_schema.sql").read_text())
+                conn.execute("ALTER TABLE businesses ADD COLUMN industry TEXT")
+                conn.executemany(
+                    "INSERT INTO businesses (fingerprint, normalized_name, original_name, status, industry) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        ('a', 'stolk machine', 'Stolk Machine Shop', 'QUALIFIED', 'manufacturing'),
+                        ('b', 'esso dundas', 'Esso Dundas', 'EXCLUDED', None),
+                        ('c', 'new lead', 'New Lead', 'DISCOVERED', None),
+                        ('d', 'hamilton printing', 'Hamilton Printing', 'EXPORTED', None),
+                        ('e', 'far away tool', 'Far Away Tool', 'EXCLUDED', 'manufacturing'),
+                    ]
+                )
+                conn.executemany(
+                    "INSERT INTO exclusions (business_id, rule_id, reason) VALUES (?, ?, ?)",
+                    [(2, 'category_gate', 'Blacklisted type: gas_station'), (5, 'geo_gate', 'Outside radius')]
+                )
+                conn.execute(
+                    "INSERT INTO observations (business_id, source_url, field, value) VALUES (2, 'places', 'place_types', 'gas_station,store')"
+                )
+
+            examples = load_labelled_history(db_path)
+
+        # Place types are not features (live leads don't have them); geo exclusions are not negatives
+        assert sorted((e.name, e.label, tuple(e.categories)) for e in examples) == [
+            ('Esso Dundas', LABEL_EXCLUDED, ()),
+            ('Hamilton Printing', LABEL_QUALIFIED, ()),
+            ('Stolk Machine Shop', LABEL_QUALIFIED, ('manufacturing',)),
+        ]
+
+
+def make_lead(name: str) -> BusinessLead:
+    return BusinessLead(
+        business_name=name,
+        contact=ContactInfo(phone="(905) 555-1234"),
+        location=LocationInfo(city="Hamilton", province="ON")
+    )
+
+
+@pytest.fixture
+def classifier(model, monkeypatch):
+    service = BusinessTypeClassifier(local_classifier=model, local_confidence_threshold=0.85)
+    llm_calls = []
+
+    async def no_signal(lead):
+        return {'is_suitable': True, 'categories': []}
+
+    async def llm(lead, evidence):
+        llm_calls.append(lead.business_name)
+        return {'is_suitable': True, 'confidence': 0.7}
+
+    for probe in ('_check_yellowpages_category', '_check_google_business', '_check_linkedin', '_check_hamilton_chamber'):
+        monkeypatch.setattr(service, probe, no_signal)
+    monkeypatch.setattr(service, '_llm_classify_business', llm)
+    service.llm_calls = llm_calls
+    return service
+
+
+class TestEscalation:
+    """Test that only ambiguous leads reach the LLM."""
+
+    async def test_confident_leads_skip_llm(self, classifier):
+        approved, _, evidence = await classifier.classify_business_type(make_lead("Mount Hope Precision Machining"))
+        rejected, reason, _ = await classifier.classify_business_type(make_lead("Binbrook Gas Bar Ltd"))
+
+        assert approved is True
+        assert evidence['local_classification']['label'] == LABEL_QUALIFIED
+        assert rejected is False
+        assert "Binbrook Gas Bar Ltd" in reason
+        assert classifier.llm_calls == []
+
+    async def test_ambiguous_lead_escalated(self, classifier):
+        await classifier.classify_business_type(make_lead("Mount Hope Precision Machining"))
+        await classifier.classify_business_type(make_lead("Zephyr Quantum Widgets"))
+
+        stats = classifier.get_classification_stats()
+        assert classifier.llm_calls == ["Zephyr Quantum Widgets"]
+        assert stats['decided_locally'] == 1
+        assert stats['escalated_to_llm'] == 1
+        assert stats['escalation_rate'] == 0.5
+        assert stats['local_latency_us_p95'] > 0
+
+    async def test_without_model_everything_escalates(self, monkeypatch):
+        service = BusinessTypeClassifier(local_classifier=None)
+        service.local_classifier = None
+
+        async def llm(lead, evidence):
+            return {'is_suitable': True, 'confidence': 0.7}
+
+        for probe in ('_check_yellowpages_category', '_check_google_business', '_check_linkedin', '_check_hamilton_chamber'):
+            monkeypatch.setattr(service, probe, lambda lead: llm(lead, None))
+        monkeypatch.setattr(service, '_llm_classify_business', llm)
+
+        await service.classify_business_type(make_lead("Mount Hope Precision Machining"))
+
+        assert service.get_classification_stats()['escalation_rate'] == 1.0
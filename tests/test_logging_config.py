@@ -0,0 +1,137 @@
+"""
+Tests for logging configuration.
+Validates per-event sampling, the bounded background log queue, and level short-circuiting.
+"""
+
+import logging
+import os
+import queue
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+import structlog
+
+from src.utils.logging_config import (
+    DroppingQueueHandler,
+    EventSampler,
+    configure_logging,
+    get_log_sink_stats,
+    shutdown_logging,
+)
+
+
+class TestEventSampler:
+    """Test per-event rate limiting."""
+
+    def test_events_over_rate_dropped(self):
+        sampler = EventSampler({"fingerprint_computed": 3})
+        emitted = 0
+
+        for _ in range(10):
+            try:
+                sampler(None, "debug", {"event": "fingerprint_computed"})
+                emitted += 1
+            except structlog.DropEvent:
+                pass
+
+        assert emitted == 3
+        assert sampler.suppressed_total["fingerprint_computed"] == 7
+
+    def test_unlisted_events_pass_through(self):
+        sampler = EventSampler({"fingerprint_computed": 1})
+
+        for _ in range(5):
+            assert sampler(None, "info", {"event": "lead_qualified"}) == {"event": "lead_qualified"}
+
+    def test_suppressed_count_reported_in_next_window(self, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr("src.utils.logging_config.time.monotonic", lambda: clock[0])
+        sampler = EventSampler({"metric_recorded": 1})
+
+        sampler(None, "debug", {"event": "metric_recorded"})
+        for _ in range(4):
+            with pytest.raises(structlog.DropEvent):
+                sampler(None, "debug", {"event": "metric_recorded"})
+        clock[0] += 1.5
+        event_dict = sampler(None, "debug", {"event": "metric_recorded"})
+
+        assert event_dict["sampled_out"] == 4
+
+    def test_zero_rate_disables_event(self):
+        sampler = EventSampler({"rate_limit_acquired": 0})
+
+        with pytest.raises(structlog.DropEvent):
+            sampler(None, "debug", {"event": "rate_limit_acquired"})
+
+
+class TestDroppingQueueHandler:
+    """Test the non-blocking queue handler."""
+
+    def make_record(self, msg):
+        return logging.makeLogRecord({"msg": msg, "levelno": logging.INFO, "levelname": "INFO"})
+
+    def test_full_queue_drops_without_blocking(self):
+        handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+
+        for i in range(5):
+            handler.handle(self.make_record(f"event {i}"))
+
+        assert handler.dropped == 3
+        assert handler.queue.qsize() == 2
+
+    def test_drops_reported_when_space_frees(self):
+        handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+        handler.handle(self.make_record("first"))
+        handler.handle(self.make_record("dropped"))
+
+        handler.queue.get_nowait()
+        handler.handle(self.make_record("after"))
+
+        notice = handler.queue.get_nowait()
+        assert "log_records_dropped count=1" in notice.getMessage()
+
+
+class TestConfigureLogging:
+    """Test end-to-end configuration with the background writer."""
+
+    def teardown_method(self):
+        shutdown_logging()
+        logging.basicConfig(handlers=[logging.NullHandler()], force=True)
+        structlog.reset_defaults()
+
+    def make_config(self, tmpdir, level="INFO"):
+        return SimpleNamespace(
+            LOG_LEVEL=level,
+            LOG_FILE_PATH=os.path.join(tmpdir, "logs", "app.log"),
+            LOG_FORMAT="json",
+            LOG_QUEUE_SIZE=1000,
+            LOG_EVENT_SAMPLE_RATES={"fingerprint_computed": 2},
+        )
+
+    def test_events_written_by_background_writer(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = self.make_config(tmpdir)
+            configure_logging(config)
+            log = structlog.get_logger("test")
+
+            log.info("lead_qualified", business="Stolk Machine Shop")
+            for _ in range(50):
+                log.info("fingerprint_computed")
+            shutdown_logging()
+
+            with open(config.LOG_FILE_PATH) as f:
+                lines = f.read().splitlines()
+
+            assert any("lead_qualified" in line for line in lines)
+            assert sum("fingerprint_computed" in line for line in lines) == 2
+
+    def test_below_level_calls_skip_processors(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            configure_logging(self.make_config(tmpdir, level="WARNING"))
+            log = structlog.get_logger("test")
+
+            log.debug("fingerprint_computed")
+            log.info("lead_qualified")
+
+            assert get_log_sink_stats()["queued"] == 0
@@ -3,16 +3,20 @@ Tests for metrics collection and dashboard.
 Validates observability system for production monitoring.
 """
 
+import json
 import pytest
 import tempfile
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import sqlite3
+
 from src.utils.metrics import (
     MetricsCollector,
     MetricEvent,
     get_metrics,
+    normalize_tags,
     track_gate_result,
     track_api_call,
     track_pipeline_metric
@@ -306,5 +310,93 @@ class TestMetricsIntegration:
         assert health["openai"]["avg_latency_ms"] == 1200.0
 
 
+class TestMetricRollups:
+    """Test pre-aggregated rollups and retention tiers."""
+
+    @pytest.fixture
+    def temp_metrics(self):
+        """Create temporary metrics collector."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+            db_path = f.name
+
+        collector = MetricsCollector(db_path)
+        yield collector
+
+        # Cleanup
+        Path(db_path).unlink(missing_ok=True)
+
+    def insert_raw(self, db_path, age, name, value, tags=None):
+        """Insert a raw metric row with a backdated timestamp (no rollup update)."""
+        timestamp = (datetime.utcnow() - age).isoformat()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO metrics (timestamp, name, value, tags) VALUES (?, ?, ?, ?)",
+                (timestamp, name, value, json.dumps(tags or {}))
+            )
+
+    def test_rollups_updated_on_record(self, temp_metrics):
+        temp_metrics.histogram("api.places.latency_ms", 100, tags={"status": "ok"})
+        temp_metrics.histogram("api.places.latency_ms", 300, tags={"status": "ok"})
+
+        with sqlite3.connect(temp_metrics.db_path) as conn:
+            for level in ("minute", "hour", "day"):
+                row = conn.execute(
+                    f"SELECT count, sum, min, max, last_value FROM metrics_rollup_{level}"
+                ).fetchone()
+                assert row == (2, 400.0, 100.0, 300.0, 300.0)
+
+    def test_tag_sets_normalized(self):
+        assert normalize_tags({"b": 1, "a": "x"}) == normalize_tags({"a": "x", "b": "1"})
+
+    def test_stats_survive_raw_retention(self, temp_metrics):
+        temp_metrics.increment("test.retained", 2)
+        temp_metrics.increment("test.retained", 3)
+
+        temp_metrics.retention_days["raw"] = 0
+        temp_metrics.apply_retention()
+
+        with sqlite3.connect(temp_metrics.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0] == 0
+        stats = temp_metrics.get_metric_stats("test.retained", hours=1)
+        assert stats["count"] == 2
+        assert stats["sum"] == 5.0
+        assert stats["latest"] == 3.0
+
+    def test_existing_raw_data_backfilled(self, temp_metrics):
+        db_path = str(temp_metrics.db_path)
+        with sqlite3.connect(db_path) as conn:
+            for level in ("minute", "hour", "day"):
+                conn.execute(f"DELETE FROM metrics_rollup_{level}")
+        self.insert_raw(db_path, timedelta(hours=3), "gate.geo.pass", 1)
+        self.insert_raw(db_path, timedelta(hours=30), "gate.geo.fail", 1)
+
+        collector = MetricsCollector(db_path)
+
+        assert collector.get_gate_performance(hours=6)["geo"]["total"] == 1
+        assert collector.get_gate_performance(hours=48)["geo"]["total"] == 2
+
+    def test_plan_uses_coarsest_buckets_inside_window(self, temp_metrics):
+        end = datetime.utcnow().replace(minute=37, second=20) - timedelta(hours=1)
+        start = end - timedelta(days=3)
+
+        plan = temp_metrics._rollup_plan(start, end)
+
+        levels = [level for level, _, _ in plan]
+        assert levels.count("day") == 1
+        assert set(levels) == {"day", "hour", "minute"}
+        # Segments are contiguous and ordered
+        for (_, _, seg_end), (_, next_start, _) in zip(plan, plan[1:]):
+            assert seg_end == next_start
+
+    def test_old_window_edges_fall_back_to_hours(self, temp_metrics):
+        end = datetime.utcnow()
+        start = end - timedelta(days=60)
+
+        plan = temp_metrics._rollup_plan(start, end)
+
+        assert plan[0][0] == "hour"
+        assert plan[0][1] % 3600 == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -6,6 +6,7 @@ import asyncio
 from src.sources.hamilton_seed_list import HamiltonSeedListSource
 from src.sources.multi_source_aggregator import MultiSourceAggregator
 from src.sources.sources_config import SourceManager
+from src.sources.registry import SourceRegistry, SourceSpec
 from src.enrichment.contact_enrichment import ContactEnricher
 
 
@@ -206,6 +207,52 @@ class TestMultiSourceAggregator:
         assert seed_metrics['run_count'] > 0
 
 
+class TestSourceRegistry:
+    """Test lazy source loading."""
+
+    def test_aggregator_loads_nothing_on_init(self):
+        """Test that creating the aggregator imports no sources."""
+        aggregator = MultiSourceAggregator()
+
+        assert aggregator.sources == {}
+
+    def test_only_selected_sources_are_loaded(self):
+        """Test that disabled and unconfigured sources are never constructed."""
+        registry = SourceRegistry([
+            SourceSpec('manual_seed_list', 'src.sources.hamilton_seed_list:HamiltonSeedListSource'),
+            SourceSpec('linkedin_company_search', 'src.sources.does_not_exist:Missing'),
+        ])
+        aggregator = MultiSourceAggregator(registry=registry)
+
+        available = aggregator.get_available_sources()
+
+        assert [s.name for s in available] == ['manual_seed_list']
+        assert registry.is_loaded('manual_seed_list')
+        assert not registry.is_loaded('linkedin_company_search')
+        assert registry.get_failures() == {}
+
+    def test_load_records_timings(self):
+        """Test that import and construction cost are recorded."""
+        registry = SourceRegistry()
+
+        source = registry.load('manual_seed_list')
+
+        assert source is not None
+        assert registry.load('manual_seed_list') is source
+        timings = registry.get_timings()['manual_seed_list']
+        assert timings['import_ms'] >= 0
+        assert timings['init_ms'] >= 0
+
+    def test_failed_load_is_remembered(self):
+        """Test that a broken source returns None and is not retried."""
+        registry = SourceRegistry([SourceSpec('broken', 'src.sources.does_not_exist:Missing')])
+
+        assert registry.load('broken') is None
+        assert registry.load('broken') is None
+        assert 'broken' in registry.get_failures()
+        assert registry.load('unknown') is None
+
+
 class TestContactEnrichment:
     """Test contact enrichment functionality."""
 
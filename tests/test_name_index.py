@@ -0,0 +1,198 @@
+"""
+Tests for the trigram business-name index.
+Validates name keys, in-memory and FTS5 top-k lookup, trigger sync and cross-source grouping.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.core.name_index import (
+    TrigramNameIndex,
+    ensure_name_index,
+    name_key,
+    name_similarity,
+    similar_names,
+)
+from src.integrations.business_data_aggregator import BusinessDataAggregator
+from src.services.source_validator import SourceCrossValidator
+
+MIGRATIONS = Path(__file__).parent.parent / 'migrations'
+
+BUSINESSES = [
+    # (normalized name, city, postal code, status)
+    ('abc mfg', 'Hamilton', 'L8N 1A1', 'QUALIFIED'),
+    ('abc manufacturing', 'Dundas', 'L9H 2B2', 'DISCOVERED'),
+    ('stolk machine shop', 'Hamilton', 'L8H 3C3', 'QUALIFIED'),
+    ('bay area distributors', 'Hamilton', 'L8N 4D4', 'EXCLUDED'),
+]
+
+
+async def insert_business(db, name, city, postal_code, status='DISCOVERED'):
+    cursor = await db.execute(
+        """INSERT INTO businesses (fingerprint, normalized_name, original_name, city, postal_code, status)
+        VALUES (?, ?, ?, ?, ?, ?)""",
+        (f"fp-{name}-{city}", name, name.title(), city, postal_code, status)
+    )
+    return cursor.lastrowid
+
+
+@pytest.fixture
+async def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        connection = await aiosqlite.connect(os.path.join(tmpdir, 'leads.db'))
+        await connection.executescript((MIGRATIONS / '001_evidence_schema.sql').read_text())
+        # One business predates the index and must be backfilled
+        await insert_business(connection, *BUSINESSES[0])
+        await ensure_name_index(connection)
+        for business in BUSINESSES[1:]:
+            await insert_business(connection, *business)
+        await connection.commit()
+        yield connection
+        await connection.close()
+
+
+class TestNameKey:
+    """Test matching keys and similarity."""
+
+    def test_name_key(self):
+        assert name_key("ABC Mfg. Inc.") == "abc manufacturing"
+        assert name_key("A.B.C. Manufacturing Ltd") == "abc manufacturing"
+        assert name_key("Smith & Sons Co.") == "smith and sons"
+        assert name_key("Inc") == "inc"
+        assert name_key(None) == ''
+
+    def test_similarity(self):
+        assert name_similarity("ABC Mfg Ltd", "ABC Manufacturing Inc.") == 1.0
+        assert name_similarity("Stolk Machine Shop", "Stolk Machine") > 0.8
+        assert name_similarity("ABC Plastics", "XYZ Printing") < 0.3
+        assert name_similarity("", "ABC") == 0.0
+
+
+class TestTrigramNameIndex:
+    """Test the in-memory index."""
+
+    def test_top_k_with_locality_filters(self):
+        index = TrigramNameIndex()
+        index.add(1, "ABC Manufacturing", city="Hamilton", postal_code="L8N 1A1")
+        index.add(2, "ABC Mfg Ltd", city="Dundas", postal_code="L9H 2B2")
+        index.add(3, "Stolk Machine Shop", city="Hamilton", postal_code="L8H 3C3")
+
+        everywhere = index.search("ABC Mfg Inc", k=2)
+        assert sorted(m.ref for m in everywhere) == [1, 2]
+        assert all(m.score == 1.0 for m in everywhere)
+
+        assert [m.ref for m in index.search("ABC Mfg", city="hamilton", min_score=0.5)] == [1]
+        assert [m.ref for m in index.search("ABC Mfg", fsa="l9h", min_score=0.5)] == [2]
+        assert index.search("Stolk Machine", min_score=0.8)[0].ref == 3
+        assert index.search("Zephyr", min_score=0.5) == []
+
+
+class TestFtsNameIndex:
+    """Test the FTS5 index over businesses."""
+
+    async def test_fuzzy_lookup_includes_backfilled_rows(self, db):
+        rows = await similar_names(db, "ABC Manufacturing Inc.", k=5, min_score=0.8)
+
+        assert {r['city'] for r in rows} == {'Hamilton', 'Dundas'}
+        assert all(r['name_similarity'] == 1.0 for r in rows)
+
+    async def test_city_and_fsa_filters(self, db):
+        in_dundas = await similar_names(db, "ABC Mfg", city="dundas")
+        in_l8n = await similar_names(db, "ABC Mfg", fsa="L8N 9Z9")
+
+        assert [r['normalized_name'] for r in in_dundas] == ['abc manufacturing']
+        assert [r['normalized_name'] for r in in_l8n] == ['abc mfg']
+
+    async def test_status_filter_and_exclude(self, db):
+        qualified = await similar_names(db, "ABC Mfg", statuses=['QUALIFIED'])
+        others = await similar_names(db, "ABC Mfg", exclude_id=qualified[0]['id'], min_score=0.8)
+
+        assert [r['normalized_name'] for r in qualified] == ['abc mfg']
+        assert [r['normalized_name'] for r in others] == ['abc manufacturing']
+
+    async def test_triggers_follow_updates_and_deletes(self, db):
+        business_id = await insert_business(db, 'stolk machine works', 'Ancaster', 'L9G 1A1')
+        await db.execute("UPDATE businesses SET normalized_name = 'nova plastics' WHERE id = ?", (business_id,))
+        await db.execute("DELETE FROM businesses WHERE normalized_name = 'stolk machine shop'")
+        await db.commit()
+
+        assert await similar_names(db, "Stolk Machine", min_score=0.5) == []
+        renamed = await similar_names(db, "Nova Plastics Inc")
+        assert renamed[0]['id'] == business_id
+        assert renamed[0]['city'] == 'Ancaster'
+
+    async def test_city_filter_applied_before_candidate_cap(self, db, monkeypatch):
+        monkeypatch.setattr("src.core.name_index.FTS_CANDIDATE_LIMIT", 3)
+        for i in range(10):
+            await insert_business(db, f'smith welding {i}', 'Toronto', 'M5V 1A1')
+        await insert_business(db, 'smith welding supply', 'Dundas', 'L9H 1A1')
+        await db.commit()
+
+        rows = await similar_names(db, "Smith Welding", city="Dundas", min_score=0.5)
+
+        assert [r['normalized_name'] for r in rows] == ['smith welding supply']
+
+    async def test_migration_matches_ensure(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            async with aiosqlite.connect(os.path.join(tmpdir, 'leads.db')) as connection:
+                await connection.executescript((MIGRATIONS / '001_evidence_schema.sql').read_text())
+                await insert_business(connection, 'abc mfg', 'Hamilton', 'L8N 1A1')
+                await connection.executescript((MIGRATIONS / '004_name_index.sql').read_text())
+                await ensure_name_index(connection)
+
+                rows = await similar_names(connection, "ABC Manufacturing")
+
+        assert len(rows) == 1
+
+
+class TestCrossSourceGrouping:
+    """Test fuzzy grouping in the aggregator and validator."""
+
+    def test_validator_accepts_abbreviated_names(self):
+        validator = SourceCrossValidator()
+        businesses = [
+            {'business_name': 'ABC Mfg Ltd'},
+            {'business_name': 'ABC Manufacturing Inc.'},
+        ]
+
+        assert validator._validate_name_consistency(businesses, 'ABC Manufacturing') == []
+        issues = validator._validate_name_consistency(businesses + [{'business_name': 'XYZ Printing'}], 'ABC Manufacturing')
+        assert len(issues) == 1
+        assert 'XYZ Printing' in issues[0]
+
+    async def test_abbreviated_listings_grouped(self):
+        aggregator = BusinessDataAggregator(session=object())
+        businesses = [
+            {'business_name': 'ABC Mfg Ltd', 'city': 'Hamilton', 'data_source': 'osm', 'phone': '905-555-0100'},
+            {'business_name': 'ABC Manufacturing Inc.', 'city': 'Hamilton', 'data_source': 'yellowpages', 'phone': '905-555-0100'},
+            {'business_name': 'ABC Manufacturing', 'city': 'Burlington', 'data_source': 'chamber'},
+            {'business_name': 'Stolk Machine Shop', 'data_source': 'osm'},
+        ]
+
+        validated = await aggregator._cross_validate_businesses(businesses, SourceCrossValidator())
+
+        assert sorted(b['source_count'] for b in validated) == [1, 1, 2]
+        merged = next(b for b in validated if b['source_count'] == 2)
+        assert merged['data_sources'] == 'osm,yellowpages'
+
+    async def test_fuzzy_names_need_corroboration(self):
+        aggregator = BusinessDataAggregator(session=object())
+        businesses = [
+            {'business_name': 'Joe Smith Welding', 'city': 'Hamilton', 'data_source': 'osm', 'phone': '905-555-0100'},
+            {'business_name': 'John Smith Welding', 'city': 'Hamilton', 'data_source': 'yellowpages', 'phone': '905-555-0199'},
+            {'business_name': 'Smith Welding Ltd', 'city': 'Hamilton', 'data_source': 'osm',
+             'website': 'https://www.smithwelding.ca/'},
+            {'business_name': 'Smith Welding Inc', 'city': 'Hamilton', 'data_source': 'chamber',
+             'website': 'http://smithwelding.ca/contact'},
+            {'business_name': 'Smith Weldings', 'city': 'Hamilton', 'data_source': 'yellowpages',
+             'website': 'http://smithwelding.ca'},
+        ]
+
+        validated = await aggregator._cross_validate_businesses(businesses, SourceCrossValidator())
+
+        # Joe and John stay apart; the website ties the misspelled listing to its group
+        assert sorted(b['source_count'] for b in validated) == [1, 1, 3]
@@ -0,0 +1,128 @@
+"""
+Tests for the shared normalization kernel.
+Validates golden fingerprints, memoization, batch/column APIs and the call sites that use the kernel.
+"""
+
+import pandas as pd
+import pyarrow as pa
+
+from src.core.normalization import (
+    clear_normalization_caches,
+    compute_fingerprint,
+    normalization_cache_info,
+    normalize_batch,
+    normalize_column,
+    normalize_entity_name,
+    normalize_name,
+    normalize_street_name,
+    normalize_website,
+)
+from src.services.source_validator import SourceCrossValidator
+from src.sources.base_source import BusinessData
+from src.sources.multi_source_aggregator import MultiSourceAggregator
+from src.utils.address_normalizer import normalize_address
+from src.utils.fingerprinting import compute_business_fingerprint
+
+# Fingerprints produced before the kernel existed; stored fingerprints must not change
+GOLDEN_FINGERPRINTS = [
+    ({'name': 'ABC Manufacturing Inc.', 'street': '123 Main St', 'city': 'Hamilton',
+      'postal_code': 'L8H 3R2', 'phone': '905-555-1234'}, '9fa88613dc043b2b'),
+    ({'name': 'ABC Manufacturing', 'street': '123 Main Street', 'city': 'Hamilton',
+      'postal_code': 'L8H 3R2', 'phone': '(905) 555-1234'}, '9fa88613dc043b2b'),
+    ({'name': 'XYZ Manufacturing', 'street': '123 Main St', 'city': 'Hamilton',
+      'postal_code': 'L8H 3R2'}, 'f6b0c3d18c7b6659'),
+    ({'name': 'Stolk Machine Shop Ltd.', 'street': '45 Barton St. E, Unit 5', 'city': 'Stoney Creek ',
+      'postal_code': None, 'phone': '+1 905 555 0100'}, 'bd7e9984b909d26b'),
+]
+
+
+class TestGoldenFingerprints:
+    """Test the kernel reproduces existing fingerprints exactly."""
+
+    def test_compute_fingerprint(self):
+        for business, expected in GOLDEN_FINGERPRINTS:
+            assert compute_fingerprint(business) == expected
+
+    def test_compute_business_fingerprint(self):
+        fingerprint = compute_business_fingerprint(
+            'ABC Mfg. Holdings Inc.', '123 Main Street East Unit 5', 'Hamilton',
+            'L8H 3R2', '905.555.1234', 'https://www.abcmfg.ca/about'
+        )
+
+        assert fingerprint == 'c3cbc0302ebf4365'
+
+
+class TestNormalizers:
+    """Test field normalizers and memoization."""
+
+    def test_field_normalizers(self):
+        assert normalize_name("ABC Mfg. Co.") == "abc mfg"
+        assert normalize_entity_name("ABC Holdings Group Inc.") == "abc"
+        assert normalize_street_name("123 Main Street East Unit 5") == "main"
+        assert normalize_website("HTTPS://www.Example.com/about/") == "example.com"
+
+    def test_memoized(self):
+        clear_normalization_caches()
+        normalize_name("Stolk Machine Shop Ltd")
+        normalize_name("Stolk Machine Shop Ltd")
+
+        info = normalization_cache_info()['src.core.normalization.normalize_name']
+        assert info['hits'] == 1
+        assert info['misses'] == 1
+
+    def test_parsed_address_copies_not_shared(self):
+        first = normalize_address("123 Main St E, Hamilton ON L8P 4R5")
+        first['street_name'] = 'Changed'
+
+        assert normalize_address("123 Main St E, Hamilton ON L8P 4R5")['street_name'] == 'Main'
+
+
+class TestBatchApi:
+    """Test batch and column normalization."""
+
+    def test_normalize_batch(self):
+        values = ["ABC Inc.", None, "ABC Inc.", float('nan'), "XYZ Ltd"]
+
+        assert normalize_batch(values, 'name') == ['abc', '', 'abc', '', 'xyz']
+
+    def test_pandas_column(self):
+        column = pd.Series(["(905) 555-1234", None, "905.555.1234"], index=[10, 11, 12], name='phone')
+
+        normalized = normalize_column(column, 'phone')
+
+        assert list(normalized) == ['9055551234', '', '9055551234']
+        assert list(normalized.index) == [10, 11, 12]
+        assert normalized.name == 'phone'
+
+    def test_arrow_column(self):
+        column = pa.chunked_array([["https://www.a.ca/", None], ["a.ca/contact", "http://b.ca"]])
+
+        normalized = normalize_column(column, 'website')
+
+        assert normalized.to_pylist() == ['a.ca', '', 'a.ca', 'b.ca']
+
+
+class TestCallSites:
+    """Test modules that normalize through the kernel."""
+
+    def test_dedup_key(self):
+        aggregator = MultiSourceAggregator.__new__(MultiSourceAggregator)
+
+        def key(name, city):
+            return aggregator._create_dedup_key(BusinessData(name=name, source='osm', source_url='', confidence=0.5, city=city))
+
+        assert key("ABC Manufacturing Inc.", "Hamilton ") == key("abc manufacturing", "hamilton")
+        # Suffixes are whole words, not substrings
+        assert key("Lincoln Incubator", "Hamilton") == "lincoln incubator|hamilton"
+
+    def test_validator_compares_website_domains(self):
+        validator = SourceCrossValidator()
+        businesses = [
+            {'website': 'https://www.abcmfg.ca/'},
+            {'website': 'http://abcmfg.ca/contact'},
+            {'phone': '+1 (905) 555-0100'},
+            {'phone': '905-555-0100'},
+        ]
+
+        assert validator._validate_website_consistency(businesses) == ([], 'abcmfg.ca')
+        assert validator._validate_phone_consistency(businesses) == ([], '9055550100')
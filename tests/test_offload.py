@@ -0,0 +1,107 @@
+"""
+Tests for the CPU offload layer.
+Validates inline vs pool dispatch, per-task timing and the registered parsing/fingerprint tasks.
+"""
+
+import pytest
+
+from src.core.normalization import compute_fingerprint, compute_fingerprints
+from src.services.html_extraction import MIN_OFFLOAD_BYTES, extract_page, extract_page_async
+from src.utils.offload import (
+    configure_offload,
+    cpu_task,
+    get_offload_stats,
+    reset_offload,
+    run_cpu_task,
+)
+
+
+@cpu_task("test_word_count", min_offload_size=100)
+def word_count(text: str) -> dict:
+    if not text:
+        raise ValueError("empty text")
+    return {'words': len(text.split())}
+
+
+def large_page() -> bytes:
+    rows = ''.join(
+        f'<tr><td>Supplier {i}</td><td>(905) 555-{i:04d}</td><td><a href="/s/{i}">info</a></td></tr>'
+        for i in range(600)
+    )
+    html = f'<html><head><title>Suppliers</title></head><body><table>{rows}</table>' \
+           '<a href="mailto:sales@example.ca">Sales</a></body></html>'
+    return html.encode('utf-8')
+
+
+@pytest.fixture
+def executor():
+    executor = configure_offload(max_workers=1)
+    yield executor
+    reset_offload()
+
+
+class TestOffloadExecutor:
+    """Test dispatch between the pool and the event loop."""
+
+    async def test_small_payload_runs_inline(self, executor):
+        assert await run_cpu_task("test_word_count", "two words") == {'words': 2}
+
+        stats = get_offload_stats()['tasks']['test_word_count']
+        assert (stats['inline'], stats['offloaded']) == (1, 0)
+
+    async def test_large_payload_runs_in_pool(self, executor):
+        text = "word " * 1000
+
+        assert await run_cpu_task("test_word_count", text) == {'words': 1000}
+
+        stats = get_offload_stats()
+        assert stats['tasks']['test_word_count']['offloaded'] == 1
+        assert stats['offloaded_seconds'] >= 0.0
+        assert stats['workers'] == 1
+
+    async def test_disabled_runs_everything_inline(self):
+        executor = configure_offload(enabled=False)
+
+        await run_cpu_task("test_word_count", "word " * 1000)
+
+        assert executor.stats['test_word_count']['inline'] == 1
+        reset_offload()
+
+    async def test_task_errors_propagate_and_are_counted(self, executor):
+        with pytest.raises(ValueError):
+            await run_cpu_task("test_word_count", "")
+
+        assert get_offload_stats()['tasks']['test_word_count']['failures'] == 1
+
+    async def test_unknown_task(self, executor):
+        with pytest.raises(KeyError):
+            await run_cpu_task("no_such_task", b"")
+
+
+class TestRegisteredTasks:
+    """Test the parsing and fingerprint tasks."""
+
+    async def test_extract_page_async_matches_inline_parse(self, executor):
+        body = large_page()
+        assert len(body) > MIN_OFFLOAD_BYTES
+
+        page = await extract_page_async(body, 'utf-8', base_url='https://example.ca/')
+        expected = extract_page(body.decode('utf-8'), base_url='https://example.ca/')
+
+        assert executor.stats['extract_page']['offloaded'] == 1
+        assert page.text == expected.text
+        assert page.links == expected.links
+        assert page.emails == expected.emails == {'sales@example.ca'}
+        assert page.phones == expected.phones
+        assert page.tag_counts == expected.tag_counts
+
+    async def test_fingerprint_batch(self, executor):
+        businesses = [
+            {'name': 'Stolk Machine Shop Inc', 'street': '10 Bay St', 'city': 'Hamilton'},
+            {'name': 'Broken Record', 'street': None, 'city': 'Hamilton'},
+        ]
+
+        fingerprints = await run_cpu_task("compute_fingerprints", businesses)
+
+        assert fingerprints == [compute_fingerprint(businesses[0]), None]
+        assert compute_fingerprints(businesses) == fingerprints
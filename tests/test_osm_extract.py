@@ -0,0 +1,186 @@
+"""
+Tests for the offline OSM extract index.
+Validates GeoJSON import, bbox + tag queries, diff refresh and the local searcher backend.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+
+import pytest
+
+from src.sources.osm_extract import (
+    LocalOSMSearcher,
+    OSMExtractIndex,
+    radius_to_bbox,
+)
+
+FEATURES = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature", "id": "node/1",
+            "geometry": {"type": "Point", "coordinates": [-79.87, 43.25]},
+            "properties": {"name": "Stolk Machine Shop", "craft": "metal_construction",
+                           "addr:housenumber": "12", "addr:street": "Nebo Road"}
+        },
+        {
+            "type": "Feature", "id": "way/2",
+            "geometry": {"type": "Polygon", "coordinates": [[
+                [-79.80, 43.24], [-79.79, 43.24], [-79.79, 43.25], [-79.80, 43.25], [-79.80, 43.24]
+            ]]},
+            "properties": {"tags": {"name": "Bay Area Distributors", "office": "distributor"}}
+        },
+        {
+            "type": "Feature", "id": "node/3",
+            "geometry": {"type": "Point", "coordinates": [-79.86, 43.26]},
+            "properties": {"name": "Corner Cafe", "amenity": "cafe"}
+        },
+        {
+            "type": "Feature", "id": "node/4",
+            "geometry": {"type": "Point", "coordinates": [-79.38, 43.65]},
+            "properties": {"name": "Toronto Works", "man_made": "works"}
+        },
+    ]
+}
+
+DIFF = """<?xml version="1.0" encoding="UTF-8"?>
+<osmChange version="0.6">
+  <create>
+    <node id="10" version="1" lat="43.25" lon="-79.85">
+      <tag k="name" v="Hamilton Printing"/><tag k="craft" v="printer"/>
+    </node>
+  </create>
+  <modify>
+    <node id="1" version="2" lat="43.25" lon="-79.87">
+      <tag k="name" v="Stolk Machine Shop Ltd"/><tag k="craft" v="metal_construction"/>
+    </node>
+  </modify>
+  <delete>
+    <way id="2" version="3"/>
+  </delete>
+</osmChange>
+"""
+
+
+@pytest.fixture
+def index():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "extract.geojson")
+        with open(path, "w") as f:
+            json.dump(FEATURES, f)
+        extract_index = OSMExtractIndex(os.path.join(tmpdir, "osm.db"))
+        extract_index.import_extract(path)
+        yield extract_index, tmpdir
+
+
+def names(elements):
+    return sorted(e["tags"]["name"] for e in elements)
+
+
+class TestExtractImport:
+    """Test importing and querying an extract."""
+
+    def test_import_keeps_business_features_in_region(self, index):
+        extract_index, _ = index
+
+        stats = extract_index.get_stats()
+
+        # Cafe has no business tag, Toronto is outside the Hamilton bbox
+        assert stats["features"] == 2
+        assert stats["by_tag_key"] == {"craft": 1, "office": 1}
+
+    def test_default_query_matches_overpass_selection(self, index):
+        extract_index, _ = index
+
+        elements = extract_index.query(radius_to_bbox(43.2557, -79.8711, 15000))
+
+        assert names(elements) == ["Bay Area Distributors", "Stolk Machine Shop"]
+
+    def test_tag_filter_and_bbox(self, index):
+        extract_index, _ = index
+
+        by_tag = extract_index.query(radius_to_bbox(43.2557, -79.8711, 15000), [("office", ["distributor"])])
+        far_away = extract_index.query(radius_to_bbox(45.42, -75.69, 5000))
+
+        assert names(by_tag) == ["Bay Area Distributors"]
+        assert far_away == []
+
+    def test_way_located_at_centroid(self, index):
+        extract_index, _ = index
+
+        way = [e for e in extract_index.query(radius_to_bbox(43.2557, -79.8711, 15000)) if e["type"] == "way"][0]
+
+        assert way["lat"] == pytest.approx(43.245)
+        assert way["lon"] == pytest.approx(-79.795)
+
+
+class TestDiffRefresh:
+    """Test applying replication diffs."""
+
+    def test_apply_diff_create_modify_delete(self, index):
+        extract_index, tmpdir = index
+        path = os.path.join(tmpdir, "change.osc")
+        with open(path, "w") as f:
+            f.write(DIFF)
+
+        stats = extract_index.apply_diff(path)
+
+        assert stats == {"upserted": 2, "deleted": 1, "skipped": 0}
+        assert names(extract_index.query(radius_to_bbox(43.2557, -79.8711, 15000))) == [
+            "Hamilton Printing", "Stolk Machine Shop Ltd"
+        ]
+
+    def test_way_with_partial_nodes_keeps_stored_geometry(self, index):
+        extract_index, tmpdir = index
+        path = os.path.join(tmpdir, "partial.osc")
+        with open(path, "w") as f:
+            f.write("""<?xml version="1.0" encoding="UTF-8"?>
+<osmChange version="0.6">
+  <modify>
+    <node id="21" version="2" lat="43.2401" lon="-79.7999"/>
+    <way id="2" version="4">
+      <nd ref="21"/><nd ref="22"/><nd ref="23"/><nd ref="24"/><nd ref="21"/>
+      <tag k="name" v="Bay Area Distributors Inc"/><tag k="office" v="distributor"/>
+    </way>
+  </modify>
+</osmChange>
+""")
+
+        extract_index.apply_diff(path)
+
+        way = [e for e in extract_index.query(radius_to_bbox(43.2557, -79.8711, 15000)) if e["type"] == "way"][0]
+        assert way["tags"]["name"] == "Bay Area Distributors Inc"
+        assert way["lat"] == pytest.approx(43.245)
+        assert way["lon"] == pytest.approx(-79.795)
+
+    def test_refresh_applies_new_sequences_once(self, index):
+        extract_index, tmpdir = index
+        diff_dir = os.path.join(tmpdir, "diffs", "000", "001")
+        os.makedirs(diff_dir)
+        with gzip.open(os.path.join(diff_dir, "042.osc.gz"), "wt") as f:
+            f.write(DIFF)
+
+        first = extract_index.refresh_from_diffs(os.path.join(tmpdir, "diffs"))
+        second = extract_index.refresh_from_diffs(os.path.join(tmpdir, "diffs"))
+
+        assert first["diffs_applied"] == 1
+        assert first["sequence"] == 1042
+        assert second["diffs_applied"] == 0
+        assert not extract_index.is_stale(max_age_hours=1)
+
+
+class TestLocalSearcher:
+    """Test the drop-in searcher backend."""
+
+    async def test_search_hamilton_area_returns_business_dicts(self, index):
+        extract_index, _ = index
+        searcher = LocalOSMSearcher(extract_index)
+
+        results = await searcher.search_hamilton_area(max_results=10)
+
+        stolk = [r for r in results if r["name"] == "Stolk Machine Shop"][0]
+        assert stolk["street"] == "12 Nebo Road"
+        assert stolk["osm_type"] == "node"
+        assert stolk["latitude"] == pytest.approx(43.25)
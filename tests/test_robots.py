@@ -0,0 +1,148 @@
+"""
+Tests for the robots.txt rule cache.
+Validates parsing, compiled longest-match decisions and the fetch-once disk cache.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.services.robots import (
+    RobotsCacheStore,
+    RobotsPolicy,
+    RobotsRecord,
+    parse_robots_txt,
+    select_group_rules,
+)
+
+USER_AGENT = "Hamilton Business Research Bot 2.0 (Ethical Crawler)"
+
+ROBOTS_TXT = """
+# Example site
+User-agent: *
+Disallow: /admin
+Allow: /admin/public
+Disallow: /*.pdf$
+Disallow: /search?
+Crawl-delay: 2
+
+User-agent: BadBot
+User-agent: OtherBot
+Disallow: /
+
+Sitemap: https://example.ca/sitemap.xml
+"""
+
+
+class TestRobotsRules:
+    """Test parsing and path decisions."""
+
+    def test_groups_parsed(self):
+        groups = parse_robots_txt(ROBOTS_TXT)
+
+        assert [g.agents for g in groups] == [['*'], ['badbot', 'otherbot']]
+        assert groups[0].crawl_delay == 2.0
+        assert (False, '/admin') in groups[0].rules
+
+    def test_longest_match_and_wildcards(self):
+        matcher = select_group_rules(parse_robots_txt(ROBOTS_TXT), USER_AGENT)
+
+        assert matcher.allowed('/') is True
+        assert matcher.allowed('/admin/users') is False
+        assert matcher.allowed('/admin/public/page') is True
+        assert matcher.allowed('/files/report.pdf') is False
+        assert matcher.allowed('/files/report.pdf?v=2') is True
+        assert matcher.allowed('/search?q=machining') is False
+        assert matcher.allowed('/robots.txt') is True
+        assert matcher.crawl_delay == 2.0
+
+    def test_specific_agent_group_wins(self):
+        content = "User-agent: *\nDisallow: /\n\nUser-agent: hamilton business research bot\nDisallow: /private\n"
+        matcher = select_group_rules(parse_robots_txt(content), USER_AGENT)
+
+        assert matcher.allowed('/about') is True
+        assert matcher.allowed('/private/x') is False
+
+    def test_empty_disallow_allows_everything(self):
+        matcher = select_group_rules(parse_robots_txt("User-agent: *\nDisallow:\n"), USER_AGENT)
+
+        assert matcher.allowed('/anything') is True
+        assert matcher.crawl_delay is None
+
+
+@pytest.fixture
+async def server():
+    hits = {'robots': 0}
+
+    async def robots(request):
+        hits['robots'] += 1
+        return web.Response(text=ROBOTS_TXT)
+
+    app = web.Application()
+    app.router.add_get("/robots.txt", robots)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    test_server.hits = hits
+    yield test_server
+    await test_server.close()
+
+
+@pytest.fixture
+def store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield RobotsCacheStore(str(Path(tmpdir) / "robots.db"))
+
+
+class TestRobotsPolicy:
+    """Test fetch-once behaviour of the memory and disk caches."""
+
+    async def test_fetched_once_for_many_paths(self, server, store):
+        policy = RobotsPolicy(USER_AGENT, store=store, ttl_seconds=3600)
+
+        async with aiohttp.ClientSession() as session:
+            assert await policy.can_fetch(session, str(server.make_url("/contact"))) is True
+            assert await policy.can_fetch(session, str(server.make_url("/admin/x"))) is False
+            assert await policy.crawl_delay(session, str(server.make_url("/"))) == 2.0
+
+        assert server.hits['robots'] == 1
+        assert policy.get_stats()['fetched'] == 1
+        assert policy.get_stats()['disallowed'] == 1
+
+    async def test_disk_cache_reused_by_new_policy(self, server, store):
+        async with aiohttp.ClientSession() as session:
+            await RobotsPolicy(USER_AGENT, store=store, ttl_seconds=3600).can_fetch(
+                session, str(server.make_url("/"))
+            )
+
+            policy = RobotsPolicy(USER_AGENT, store=store, ttl_seconds=3600)
+            assert await policy.can_fetch(session, str(server.make_url("/admin"))) is False
+
+        assert server.hits['robots'] == 1
+        assert policy.get_stats()['disk_hits'] == 1
+
+    async def test_expired_record_refetched(self, server, store):
+        origin = str(server.make_url("/")).rstrip('/').lower()
+        store.put(RobotsRecord(origin, 200, [], time.time() - 10, time.time() - 1))
+        policy = RobotsPolicy(USER_AGENT, store=store, ttl_seconds=3600)
+
+        async with aiohttp.ClientSession() as session:
+            assert await policy.can_fetch(session, str(server.make_url("/admin"))) is False
+
+        assert server.hits['robots'] == 1
+        assert store.purge_expired() == 0
+
+    async def test_unreachable_host_allowed(self, store):
+        policy = RobotsPolicy(USER_AGENT, store=store, ttl_seconds=3600)
+
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=2)) as session:
+            assert await policy.can_fetch(session, "http://127.0.0.1:1/page") is True
+
+        assert policy.get_stats()['fetch_errors'] == 1
+        record = store.get("http://127.0.0.1:1")
+        assert record.status == 0
+        assert record.expires_at - record.fetched_at <= 3600
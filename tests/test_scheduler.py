@@ -0,0 +1,207 @@
+"""
+Tests for scheduler dispatch.
+Validates worker slots, overlap policies, catch-up of missed runs and jitter.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.automation.config import AutomationConfig
+from src.automation.scheduler import (
+    AutomationScheduler,
+    CatchUpPolicy,
+    OverlapPolicy,
+    TaskStatus,
+)
+
+
+@pytest.fixture
+def scheduler():
+    config = AutomationConfig()
+    config.environment = "testing"
+    config.schedule.max_concurrent_runs = 2
+    config.schedule.timeout_minutes = 1
+    config.schedule.jitter_seconds = 0
+    config.schedule.misfire_grace_seconds = 60
+    config.schedule.max_catch_up_runs = 3
+    return AutomationScheduler(config)
+
+
+def make_due(scheduler, task, seconds_ago=1):
+    """Move a task's next run into the past."""
+    task.next_run = datetime.now() - timedelta(seconds=seconds_ago)
+    scheduler._push(task)
+
+
+class BlockingJob:
+    """Job that runs until released, counting starts."""
+
+    def __init__(self):
+        self.started = 0
+        self.finished = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.started += 1
+        await self.release.wait()
+        self.finished += 1
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestDispatch:
+    """Test non-blocking dispatch into worker slots."""
+
+    async def test_long_task_does_not_block_short_task(self, scheduler):
+        pipeline = BlockingJob()
+        monitor_runs = []
+
+        async def monitor():
+            monitor_runs.append(datetime.now())
+
+        scheduler.add_task("pipeline", "Pipeline", pipeline, "0 9 * * *")
+        scheduler.add_task("monitor", "Monitor", monitor, "*/5 * * * *")
+        make_due(scheduler, scheduler.tasks["pipeline"])
+        await scheduler._process_pending_tasks()
+        await settle()
+
+        make_due(scheduler, scheduler.tasks["monitor"])
+        await scheduler._process_pending_tasks()
+        await settle()
+
+        assert len(monitor_runs) == 1
+        assert scheduler.tasks["pipeline"].status == TaskStatus.RUNNING
+        pipeline.release.set()
+        await settle()
+        assert scheduler.tasks["pipeline"].status == TaskStatus.COMPLETED
+
+    async def test_waits_for_free_slot(self, scheduler):
+        scheduler.config.schedule.max_concurrent_runs = 1
+        first, second = BlockingJob(), BlockingJob()
+        scheduler.add_task("first", "First", first, "0 9 * * *")
+        scheduler.add_task("second", "Second", second, "0 9 * * *")
+        make_due(scheduler, scheduler.tasks["first"], seconds_ago=2)
+        make_due(scheduler, scheduler.tasks["second"], seconds_ago=1)
+
+        await scheduler._process_pending_tasks()
+        await settle()
+        assert (first.started, second.started) == (1, 0)
+        assert scheduler.get_stats()["waiting_tasks"] == 1
+
+        first.release.set()
+        await settle()
+        assert second.started == 1
+
+    async def test_next_run_rescheduled_at_dispatch(self, scheduler):
+        job = BlockingJob()
+        task = scheduler.add_task("job", "Job", job, "*/5 * * * *")
+        make_due(scheduler, task)
+
+        await scheduler._process_pending_tasks()
+
+        assert task.next_run > datetime.now()
+        assert scheduler._due_at["job"] == task.next_run
+
+
+class TestOverlapPolicy:
+    """Test behaviour when a task comes due while still running."""
+
+    async def run_twice(self, scheduler, policy):
+        job = BlockingJob()
+        task = scheduler.add_task("job", "Job", job, "* * * * *", overlap_policy=policy)
+        make_due(scheduler, task)
+        await scheduler._process_pending_tasks()
+        await settle()
+        make_due(scheduler, task)
+        await scheduler._process_pending_tasks()
+        await settle()
+        return job, task
+
+    async def test_skip(self, scheduler):
+        job, task = await self.run_twice(scheduler, OverlapPolicy.SKIP)
+
+        job.release.set()
+        await settle()
+
+        assert job.started == 1
+        assert task.skipped_runs == 1
+
+    async def test_queue(self, scheduler):
+        job, task = await self.run_twice(scheduler, OverlapPolicy.QUEUE)
+        assert job.started == 1
+
+        job.release.set()
+        await settle()
+
+        assert job.started == 2
+        assert job.finished == 2
+
+    async def test_cancel_previous(self, scheduler):
+        job, task = await self.run_twice(scheduler, OverlapPolicy.CANCEL_PREVIOUS)
+
+        assert job.started == 2
+        assert job.finished == 0
+        assert scheduler.get_stats()["cancelled_runs"] == 1
+        job.release.set()
+        await settle()
+        assert task.status == TaskStatus.COMPLETED
+
+
+class TestCatchUpPolicy:
+    """Test handling of runs missed beyond the grace period."""
+
+    @pytest.mark.parametrize("policy,expected_runs", [
+        (CatchUpPolicy.SKIP, 0),
+        (CatchUpPolicy.RUN_ONCE, 1),
+        (CatchUpPolicy.RUN_ALL, 3),
+    ])
+    async def test_missed_runs(self, scheduler, policy, expected_runs):
+        runs = []
+
+        async def job():
+            runs.append(1)
+
+        task = scheduler.add_task("job", "Job", job, "* * * * *",
+                                  catch_up_policy=policy)
+        make_due(scheduler, task, seconds_ago=10 * 60)
+
+        await scheduler._process_pending_tasks()
+        await settle()
+
+        assert len(runs) == expected_runs
+        assert task.missed_runs >= 10 - expected_runs
+
+    async def test_late_within_grace_runs_normally(self, scheduler):
+        task = scheduler.add_task("job", "Job", BlockingJob(), "* * * * *",
+                                  catch_up_policy=CatchUpPolicy.SKIP)
+        make_due(scheduler, task, seconds_ago=30)
+
+        await scheduler._process_pending_tasks()
+
+        assert task.missed_runs == 0
+        assert "job" in scheduler.running_tasks
+
+
+class TestJitter:
+    """Test jittered start times."""
+
+    def test_due_time_within_jitter_window(self, scheduler):
+        task = scheduler.add_task("job", "Job", BlockingJob(), "0 9 * * *", jitter_seconds=120)
+
+        due_at = scheduler._due_at["job"]
+
+        assert task.next_run <= due_at <= task.next_run + timedelta(seconds=120)
+
+    async def test_disabled_task_not_dispatched(self, scheduler):
+        job = BlockingJob()
+        task = scheduler.add_task("job", "Job", job, "* * * * *", enabled=False)
+        make_due(scheduler, task)
+
+        await scheduler._process_pending_tasks()
+        await settle()
+
+        assert job.started == 0
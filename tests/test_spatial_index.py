@@ -0,0 +1,130 @@
+"""
+Tests for the businesses spatial index.
+Validates trigger sync, radius/kNN/bbox queries, proximity dedup and catchment reports.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.core.spatial import (
+    businesses_in_bbox,
+    businesses_within_radius,
+    catchment_report,
+    ensure_spatial_index,
+    find_proximity_duplicate,
+    nearest_businesses,
+)
+
+MIGRATION = Path(__file__).parent.parent / 'migrations' / '001_evidence_schema.sql'
+
+HAMILTON = (43.2557, -79.8711)
+
+BUSINESSES = [
+    # (name, lat, lon, phone, website, status)
+    ('Stolk Machine Shop', 43.2557, -79.8711, '9055550100', 'https://stolk.ca', 'QUALIFIED'),
+    ('Bay Area Distributors', 43.2600, -79.8700, None, None, 'EXCLUDED'),
+    ('Dundas Fabrication', 43.2660, -79.9550, None, None, 'QUALIFIED'),
+    ('Grimsby Printing', 43.1930, -79.5610, None, None, 'REVIEW_REQUIRED'),
+]
+
+
+async def insert_business(db, name, lat, lon, phone=None, website=None, status='DISCOVERED'):
+    cursor = await db.execute(
+        """INSERT INTO businesses
+        (fingerprint, normalized_name, original_name, phone, website, latitude, longitude, status)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        (f"fp-{name}", name.lower(), name, phone, website, lat, lon, status)
+    )
+    return cursor.lastrowid
+
+
+@pytest.fixture
+async def db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        connection = await aiosqlite.connect(os.path.join(tmpdir, 'leads.db'))
+        connection.row_factory = aiosqlite.Row
+        await connection.executescript(MIGRATION.read_text())
+        # One business predates the index and must be backfilled
+        await insert_business(connection, *BUSINESSES[0])
+        await ensure_spatial_index(connection)
+        for business in BUSINESSES[1:]:
+            await insert_business(connection, *business)
+        await connection.commit()
+        yield connection
+        await connection.close()
+
+
+def names(rows):
+    return [row['original_name'] for row in rows]
+
+
+class TestSpatialQueries:
+    """Test radius, nearest-neighbour and bbox queries."""
+
+    async def test_radius_sorted_by_distance(self, db):
+        rows = await businesses_within_radius(db, *HAMILTON, radius_km=10)
+
+        assert names(rows) == ['Stolk Machine Shop', 'Bay Area Distributors', 'Dundas Fabrication']
+        assert rows[0]['distance_from_point_km'] == pytest.approx(0.0)
+
+    async def test_radius_status_filter(self, db):
+        rows = await businesses_within_radius(db, *HAMILTON, radius_km=50, statuses=['QUALIFIED'])
+
+        assert names(rows) == ['Stolk Machine Shop', 'Dundas Fabrication']
+
+    async def test_nearest_expands_search(self, db):
+        rows = await nearest_businesses(db, *HAMILTON, k=4)
+
+        assert names(rows)[-1] == 'Grimsby Printing'
+        assert len(rows) == 4
+
+    async def test_bbox(self, db):
+        rows = await businesses_in_bbox(db, (43.25, -79.90, 43.27, -79.85))
+
+        assert sorted(names(rows)) == ['Bay Area Distributors', 'Stolk Machine Shop']
+
+    async def test_triggers_follow_updates_and_deletes(self, db):
+        await db.execute("UPDATE businesses SET latitude = 43.1930, longitude = -79.5610 WHERE original_name = 'Stolk Machine Shop'")
+        await db.execute("DELETE FROM businesses WHERE original_name = 'Bay Area Distributors'")
+        await db.commit()
+
+        rows = await businesses_within_radius(db, *HAMILTON, radius_km=10)
+
+        assert names(rows) == ['Dundas Fabrication']
+
+
+class TestProximityDuplicate:
+    """Test same-location duplicate detection."""
+
+    async def test_renamed_business_at_same_location(self, db):
+        match = await find_proximity_duplicate(db, 43.25572, -79.87112, 'Stolk Machine Shop Ltd')
+
+        assert match['original_name'] == 'Stolk Machine Shop'
+        assert match['match_reason'] == 'name'
+
+    async def test_shared_phone_or_website(self, db):
+        by_phone = await find_proximity_duplicate(db, 43.2557, -79.8711, 'Precision Works', phone='(905) 555-0100')
+        by_site = await find_proximity_duplicate(db, 43.2557, -79.8711, 'Precision Works', website='www.stolk.ca/about')
+
+        assert by_phone['match_reason'] == 'phone'
+        assert by_site['match_reason'] == 'website'
+
+    async def test_unrelated_neighbour_not_duplicate(self, db):
+        assert await find_proximity_duplicate(db, 43.2557, -79.8711, 'Corner Cafe') is None
+        assert await find_proximity_duplicate(db, None, None, 'Stolk Machine Shop') is None
+
+
+class TestCatchmentReport:
+    """Test catchment rings."""
+
+    async def test_counts_by_status_per_ring(self, db):
+        report = await catchment_report(db, *HAMILTON, radii_km=(1, 10, 40))
+
+        rings = {ring['radius_km']: ring for ring in report['rings']}
+        assert rings[1]['by_status'] == {'QUALIFIED': 1, 'EXCLUDED': 1}
+        assert rings[10]['total'] == 3
+        assert rings[40]['by_status']['REVIEW_REQUIRED'] == 1
@@ -4,14 +4,25 @@ Ensures sign shops < 3 years are blocked and parked domains are detected.
 """
 
 import pytest
+import tempfile
 from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+from src.services.domain_health import configure_domain_health, reset_domain_health
 from src.services.wayback_service import (
     WaybackService,
     check_website_age_gate
 )
 
 
+@pytest.fixture(autouse=True)
+def domain_health():
+    """Parked-domain records must not leak between tests or into data/."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield configure_domain_health(db_path=str(Path(tmpdir) / "domain_health.db"))
+        reset_domain_health()
+
+
 class TestWaybackTimestampParsing:
     """Test Wayback timestamp parsing."""
 
@@ -3,17 +3,35 @@ Comprehensive tests for website validation service.
 """
 import pytest
 import asyncio
+import tempfile
+from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 
 import aiohttp
 
+from src.services.crawl_metadata import configure_crawl_cache, reset_crawl_cache
+from src.services.domain_health import configure_domain_health, reset_domain_health
+from src.services.host_concurrency import configure_host_concurrency, reset_host_concurrency
 from src.services.website_validation_service import (
     WebsiteValidationService, 
     WebsiteValidationResult
 )
 
 
+@pytest.fixture(autouse=True)
+def host_limits():
+    """Keep learned host limits, dead-host records and crawl metadata out of data/ (and out of other tests)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        configure_host_concurrency(store_path=str(Path(tmpdir) / "host_limits.db"))
+        configure_domain_health(db_path=str(Path(tmpdir) / "domain_health.db"))
+        configure_crawl_cache(db_path=str(Path(tmpdir) / "crawl_metadata.db"))
+        yield
+        reset_host_concurrency()
+        reset_domain_health()
+        reset_crawl_cache()
+
+
 class TestWebsiteValidationResult:
     """Test WebsiteValidationResult class."""
     
@@ -215,7 +233,7 @@ class TestWebsiteValidationService:
             
     def test_business_name_match_calculation(self, validator):
         """Test business name matching algorithm."""
-        from bs4 import BeautifulSoup
+        from src.services.html_extraction import extract_page
         
         # Test high match
         html_content = """
@@ -227,10 +245,10 @@ class TestWebsiteValidationService:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = extract_page(html_content)
         
         match = validator._calculate_business_name_match(
-            soup, "Hamilton Manufacturing Co"
+            page, "Hamilton Manufacturing Co"
         )
         assert match > 0.6
         
@@ -241,16 +259,16 @@ class TestWebsiteValidationService:
         <body><p>Nothing related here</p></body>
         </html>
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = extract_page(html_content)
         
         match = validator._calculate_business_name_match(
-            soup, "Hamilton Manufacturing Co"
+            page, "Hamilton Manufacturing Co"
         )
         assert match < 0.3
         
     def test_contact_info_validation(self, validator):
         """Test contact information validation."""
-        from bs4 import BeautifulSoup
+        from src.services.html_extraction import extract_page
         
         # Test matching contact info
         html_content = """
@@ -261,10 +279,10 @@ class TestWebsiteValidationService:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = extract_page(html_content)
         
         result = validator._validate_contact_info(
-            soup, "(905) 555-0123", "123 Business Street"
+            page, "(905) 555-0123", "123 Business Street"
         )
         assert result == True
         
@@ -277,16 +295,16 @@ class TestWebsiteValidationService:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = extract_page(html_content)
         
         result = validator._validate_contact_info(
-            soup, "(905) 555-0123", "123 Business Street"
+            page, "(905) 555-0123", "123 Business Street"
         )
         assert result == False
         
     def test_business_content_validation(self, validator):
         """Test business content validation."""
-        from bs4 import BeautifulSoup
+        from src.services.html_extraction import extract_page
         
         # Test legitimate business content
         html_content = """
@@ -306,9 +324,9 @@ class TestWebsiteValidationService:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = extract_page(html_content)
         
-        result = validator._validate_business_content(soup)
+        result = validator._validate_business_content(page)
         assert result == True
         
         # Test insufficient business content
@@ -319,9 +337,9 @@ class TestWebsiteValidationService:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = extract_page(html_content)
         
-        result = validator._validate_business_content(soup)
+        result = validator._validate_business_content(page)
         assert result == False
         
     @pytest.mark.asyncio
@@ -5,9 +5,12 @@ Identifies buying signals and acquisition intent for business owners.
 
 import os
 import re
+import asyncio
 import logging
+import threading
 import time
-from typing import Dict, List, Optional, Any, Tuple
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import requests
@@ -20,6 +23,46 @@ from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+class _SignalMemo:
+    """
+    Once-per-batch cache for industry- and location-level signals.
+
+    Shared by the worker threads of one batch; concurrent requests for the
+    same key wait for the first computation instead of repeating it.
+    """
+
+    def __init__(self):
+        self._values: Dict[Tuple, Any] = {}
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+            value = compute()
+            with self._lock:
+                self._values[key] = value
+                self.misses += 1
+        return value
+
+
+# Active memo for the current batch; asyncio.to_thread carries it into workers
+_batch_memo: ContextVar[Optional[_SignalMemo]] = ContextVar('intent_batch_memo', default=None)
+
 @dataclass
 class IntentSignal:
     signal_type: str
@@ -259,7 +302,7 @@ class IntentDetector:
             # Check market indicators
             industry = business.get('industry', '')
             if industry:
-                industry_health = self._check_industry_health(industry)
+                industry_health = self._shared_signal(self._check_industry_health, industry)
                 if industry_health and industry_health.get('declining'):
                     confidence += 0.3
                     evidence.append(f"Industry {industry} showing decline trends")
@@ -298,19 +341,19 @@ class IntentDetector:
             location = business.get('location', '')
 
             # Check for consolidation news
-            consolidation_data = self._search_consolidation_news(industry, location)
+            consolidation_data = self._shared_signal(self._search_consolidation_news, industry, location)
             if consolidation_data:
                 confidence = consolidation_data.get('confidence', 0.0)
                 evidence.extend(consolidation_data.get('evidence', []))
 
             # Check competitor activity
-            competitor_data = self._analyze_competitor_activity(industry, location)
+            competitor_data = self._shared_signal(self._analyze_competitor_activity, industry, location)
             if competitor_data:
                 confidence += competitor_data.get('confidence', 0.0) * 0.5
                 evidence.extend(competitor_data.get('evidence', []))
 
             # Check for regulatory changes
-            regulatory_data = self._check_regulatory_changes(industry)
+            regulatory_data = self._shared_signal(self._check_regulatory_changes, industry)
             if regulatory_data:
                 confidence += regulatory_data.get('confidence', 0.0) * 0.3
                 evidence.extend(regulatory_data.get('evidence', []))
@@ -379,6 +422,65 @@ class IntentDetector:
 
     def detect_intent(self, business: Dict[str, Any]) -> IntentAnalysis:
         """Main method to detect buying intent signals."""
+        analysis = self._analyze_business(business)
+
+        # Store analysis
+        self._store_intent_analyses([analysis])
+
+        return analysis
+
+    async def detect_intent_batch(self, businesses: List[Dict[str, Any]],
+                                  max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+                                  store: bool = True) -> List[IntentAnalysis]:
+        """
+        Detect intent for many businesses concurrently.
+
+        Each business is analyzed in a worker thread (at most max_concurrency
+        at a time). Industry- and location-level signals are computed once per
+        batch and shared, and all analyses are stored in one transaction.
+        Results keep input order; businesses whose analysis fails are logged
+        and omitted.
+        """
+        memo = _SignalMemo()
+        token = _batch_memo.set(memo)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze(business: Dict[str, Any]) -> IntentAnalysis:
+            async with semaphore:
+                return await asyncio.to_thread(self._analyze_business, business)
+
+        try:
+            results = await asyncio.gather(
+                *(analyze(business) for business in businesses),
+                return_exceptions=True
+            )
+        finally:
+            _batch_memo.reset(token)
+
+        analyses = []
+        for business, result in zip(businesses, results):
+            if isinstance(result, Exception):
+                logger.error(f"Intent detection failed for {business.get('name', 'Unknown')}: {result}")
+                continue
+            analyses.append(result)
+
+        if store and analyses:
+            await asyncio.to_thread(self._store_intent_analyses, analyses)
+
+        logger.info(f"Intent batch complete: {len(analyses)}/{len(businesses)} analyzed, "
+                    f"shared signals computed {memo.misses}x, reused {memo.hits}x")
+
+        return analyses
+
+    def _shared_signal(self, check: Callable, *args):
+        """Run an industry/location-level check, reusing the batch result when in a batch."""
+        memo = _batch_memo.get()
+        if memo is None:
+            return check(*args)
+        return memo.get((check.__name__, *args), lambda: check(*args))
+
+    def _analyze_business(self, business: Dict[str, Any]) -> IntentAnalysis:
+        """Run all signal checks for one business and combine them (no persistence)."""
         logger.info(f"Detecting intent for {business.get('name', 'Unknown')}")
 
         # Run all signal detection methods
@@ -413,10 +515,6 @@ class IntentDetector:
             overall_intent_score, urgency_level, detected_signals
         )
 
-        # Store analysis
-        self._store_intent_analysis(business, overall_intent_score, buying_probability,
-                                  urgency_level, detected_signals)
-
         return IntentAnalysis(
             business_name=business.get('name', 'Unknown'),
             overall_intent_score=overall_intent_score,
@@ -469,29 +567,27 @@ class IntentDetector:
         else:
             return "PASSIVE: Monitor for changes, no immediate outreach recommended."
 
-    def _store_intent_analysis(self, business: Dict[str, Any], intent_score: float,
-                             buying_probability: float, urgency_level: str,
-                             signals: List[IntentSignal]):
-        """Store intent analysis in database."""
+    def _store_intent_analyses(self, analyses: List[IntentAnalysis]):
+        """Store intent analyses in one transaction."""
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+                conn.executemany("""
                     INSERT INTO intent_analysis
                     (business_name, overall_intent_score, buying_probability,
                      urgency_level, detected_signals)
                     VALUES (?, ?, ?, ?, ?)
-                """, (
-                    business.get('name', 'Unknown'),
-                    intent_score,
-                    buying_probability,
-                    urgency_level,
+                """, [(
+                    analysis.business_name,
+                    analysis.overall_intent_score,
+                    analysis.buying_probability,
+                    analysis.urgency_level,
                     json.dumps([{
                         'type': s.signal_type,
                         'confidence': s.confidence,
                         'evidence': s.evidence,
                         'source': s.source
-                    } for s in signals])
-                ))
+                    } for s in analysis.detected_signals])
+                ) for analysis in analyses])
         except Exception as e:
             logger.error(f"Failed to store intent analysis: {e}")
 
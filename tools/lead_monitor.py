@@ -1,14 +1,21 @@
 """
 Real-Time Lead Monitoring System
 Continuous monitoring for acquisition signals and market changes.
+
+The monitoring loop is an asyncio engine: every monitored business has a due
+time in a heap, due checks run with bounded concurrency and per-source rate
+limits, and last_checked / alert state is written back in batches. Check
+intervals follow priority and shrink after alerts, grow while quiet.
 """
 
 import os
+import heapq
+import itertools
 import logging
+import random
 import time
 import asyncio
-import schedule
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import sqlite3
@@ -22,6 +29,59 @@ from requests_cache import CachedSession
 
 logger = logging.getLogger(__name__)
 
+# Checks per second allowed against each monitoring source
+DEFAULT_SOURCE_RATE_LIMITS = {
+    'listings': 1.0,
+    'news': 5.0,
+    'financial': 2.0,
+}
+
+# Adaptive interval bounds, as multiples of the priority's base interval
+RECENT_ALERT_FACTOR = 0.5   # Check twice as often after an alert
+MAX_QUIET_FACTOR = 2.0      # Back off to at most 2x while nothing is found
+QUIET_CHECKS_BEFORE_BACKOFF = 3
+MIN_INTERVAL_MINUTES = 15
+
+# Pause between listing sites within one check, whatever the caller asks for
+MIN_SITE_DELAY_SECONDS = 1.0
+
+# Failed checks retry after MIN_INTERVAL_MINUTES, doubling up to this cap
+MAX_FAILURE_BACKOFF_MINUTES = 1440
+
+
+class BusinessNotMonitored(KeyError):
+    """The business was removed from monitored_businesses."""
+
+
+class SourceRateLimiter:
+    """Async per-source rate limiter (minimum spacing between calls)."""
+
+    def __init__(self, rates: Dict[str, float]):
+        self.rates = dict(rates)
+        self._next_slot: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, source: str):
+        rate = self.rates.get(source)
+        if not rate:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(source, now))
+            self._next_slot[source] = slot + 1.0 / rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+@dataclass
+class _CheckResult:
+    """Outcome of one business check, waiting to be written back."""
+    business_name: str
+    checked_at: datetime
+    next_check_at: datetime
+    alerts: List['MonitoringAlert']
+    quiet_checks: int
+
 @dataclass
 class MonitoringAlert:
     business_name: str
@@ -113,6 +173,17 @@ class LeadMonitor:
         self.monitoring_thread = None
         self.executor = ThreadPoolExecutor(max_workers=5)
 
+        # Async engine settings
+        self.source_rate_limits = dict(DEFAULT_SOURCE_RATE_LIMITS)
+        self.min_site_delay = MIN_SITE_DELAY_SECONDS
+        self.engine_stats = {
+            'checks_completed': 0,
+            'checks_failed': 0,
+            'alerts_found': 0,
+            'batches_written': 0,
+            'max_lag_seconds': 0.0,
+        }
+
         # Callback functions for alerts
         self.alert_callbacks: List[Callable[[MonitoringAlert], None]] = []
 
@@ -144,10 +215,23 @@ class LeadMonitor:
                     monitoring_keywords TEXT,
                     last_checked TIMESTAMP,
                     total_alerts INTEGER DEFAULT 0,
+                    next_check_at TIMESTAMP,
+                    last_alert_at TIMESTAMP,
+                    consecutive_quiet_checks INTEGER DEFAULT 0,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
 
+            # Older databases: add the scheduling columns
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(monitored_businesses)")}
+            for column, ddl in (
+                ('next_check_at', 'TIMESTAMP'),
+                ('last_alert_at', 'TIMESTAMP'),
+                ('consecutive_quiet_checks', 'INTEGER DEFAULT 0'),
+            ):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE monitored_businesses ADD COLUMN {column} {ddl}")
+
     def add_business_to_monitoring(self, business: Dict[str, Any], priority: str = 'medium'):
         """Add a business to the monitoring system."""
         try:
@@ -205,9 +289,11 @@ class LeadMonitor:
 
         return list(set(keywords))  # Remove duplicates
 
-    def monitor_business_listings(self, business_name: str, keywords: List[str]) -> List[MonitoringAlert]:
-        """Monitor for business for sale listings."""
+    def monitor_business_listings(self, business_name: str, keywords: List[str],
+                                  site_delay: float = 1.0) -> List[MonitoringAlert]:
+        """Monitor for business for sale listings (site_delay seconds between sites, at least min_site_delay)."""
         alerts = []
+        site_delay = max(site_delay or 0, self.min_site_delay)
 
         try:
             # Search business for sale websites
@@ -218,10 +304,11 @@ class LeadMonitor:
                 'sunbeltnetwork.com'
             ]
 
-            for site in listing_sites:
+            for i, site in enumerate(listing_sites):
+                if i and site_delay:
+                    time.sleep(site_delay)  # Rate limiting
                 try:
                     alerts.extend(self._search_business_listings(site, business_name, keywords))
-                    time.sleep(1)  # Rate limiting
                 except Exception as e:
                     logger.warning(f"Failed to search {site}: {e}")
 
@@ -327,40 +414,292 @@ class LeadMonitor:
         return alerts
 
     def continuous_monitoring(self):
-        """Main continuous monitoring loop."""
+        """Main continuous monitoring loop (runs the async engine until stopped)."""
         logger.info("Starting continuous monitoring")
         self.monitoring_active = True
+        try:
+            asyncio.run(self.run_monitoring())
+        except KeyboardInterrupt:
+            logger.info("Monitoring interrupted by user")
+        logger.info("Continuous monitoring stopped")
 
-        # Schedule different monitoring tasks
-        schedule.every(self.monitoring_intervals['high_priority_businesses']).minutes.do(
-            self._monitor_high_priority_businesses
-        )
-        schedule.every(self.monitoring_intervals['medium_priority_businesses']).minutes.do(
-            self._monitor_medium_priority_businesses
-        )
-        schedule.every(self.monitoring_intervals['low_priority_businesses']).minutes.do(
-            self._monitor_low_priority_businesses
+    async def run_monitoring(self, max_concurrency: int = 20, batch_size: int = 200,
+                             flush_interval: float = 5.0, reload_interval: float = 300.0,
+                             stop_event: Optional[asyncio.Event] = None):
+        """
+        Async monitoring engine.
+
+        Args:
+            max_concurrency: Business checks in flight at once
+            batch_size: Write back after this many completed checks...
+            flush_interval: ...or after this many seconds
+            reload_interval: Seconds between scans for newly added businesses
+            stop_event: Optional event that stops the engine (as does stop_monitoring)
+        """
+        self.monitoring_active = True
+        stop_event = stop_event or asyncio.Event()
+        limiter = SourceRateLimiter(self.source_rate_limits)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        wakeup = asyncio.Event()
+
+        heap: List[Tuple[float, int, str, str]] = []  # (due_ts, seq, kind, key)
+        seq = itertools.count()
+        scheduled: set = set()
+        pending: List[_CheckResult] = []
+        in_flight: set = set()
+        failures: Dict[str, int] = {}
+
+        def push(due: datetime, kind: str, key: str):
+            heapq.heappush(heap, (due.timestamp(), next(seq), kind, key))
+
+        def load_new_businesses():
+            for business in self._get_businesses_due_state(exclude=scheduled):
+                scheduled.add(business['business_name'])
+                push(business['due_at'], 'business', business['business_name'])
+
+        load_new_businesses()
+        now = datetime.now()
+        for task_name in ('market_trends', 'news_alerts'):
+            push(now + timedelta(minutes=self.monitoring_intervals[task_name]), 'task', task_name)
+        push(now + timedelta(seconds=reload_interval), 'reload', '')
+
+        async def check_business(name: str, due_ts: float):
+            try:
+                result = await self._check_business_async(name, limiter)
+                failures.pop(name, None)
+                pending.append(result)
+                push(result.next_check_at, 'business', name)
+            except BusinessNotMonitored:
+                # Removed from monitoring: drop it (a later reload picks it up if re-added)
+                failures.pop(name, None)
+                scheduled.discard(name)
+                logger.info(f"{name} is no longer monitored; unscheduled")
+            except Exception as e:
+                self.engine_stats['checks_failed'] += 1
+                failures[name] = failures.get(name, 0) + 1
+                backoff = min(MAX_FAILURE_BACKOFF_MINUTES, MIN_INTERVAL_MINUTES * 2 ** (failures[name] - 1))
+                logger.error(f"Failed to monitor {name} ({failures[name]} in a row, retry in {backoff} min): {e}")
+                push(datetime.now() + timedelta(minutes=backoff), 'business', name)
+            finally:
+                semaphore.release()
+                wakeup.set()
+
+        async def run_task(task_name: str):
+            try:
+                await asyncio.to_thread(getattr(self, f'_monitor_{task_name}'))
+            except Exception as e:
+                logger.error(f"Monitoring task {task_name} failed: {e}")
+            push(datetime.now() + timedelta(minutes=self.monitoring_intervals[task_name]), 'task', task_name)
+
+        last_flush = time.monotonic()
+        logger.info(f"Monitoring engine started: {len(scheduled)} businesses, concurrency {max_concurrency}")
+
+        try:
+            while self.monitoring_active and not stop_event.is_set():
+                # Dispatch everything due, bounded by the semaphore
+                while heap and heap[0][0] <= time.time():
+                    due_ts, _, kind, key = heap[0]
+                    if kind == 'business':
+                        if semaphore.locked():
+                            break
+                        heapq.heappop(heap)
+                        await semaphore.acquire()
+                        lag = time.time() - due_ts
+                        self.engine_stats['max_lag_seconds'] = max(self.engine_stats['max_lag_seconds'], lag)
+                        task = asyncio.create_task(check_business(key, due_ts))
+                    elif kind == 'task':
+                        heapq.heappop(heap)
+                        task = asyncio.create_task(run_task(key))
+                    else:
+                        heapq.heappop(heap)
+                        load_new_businesses()
+                        push(datetime.now() + timedelta(seconds=reload_interval), 'reload', '')
+                        continue
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+                # Batched write-back
+                if pending and (len(pending) >= batch_size or time.monotonic() - last_flush >= flush_interval):
+                    batch, pending[:] = list(pending), []
+                    await asyncio.to_thread(self._write_check_results, batch)
+                    last_flush = time.monotonic()
+
+                # Sleep until the next due item, a finished check, or the flush deadline
+                timeout = flush_interval
+                if heap and not (heap[0][2] == 'business' and semaphore.locked()):
+                    timeout = min(timeout, max(0.0, heap[0][0] - time.time()))
+                # (capped so stop requests are noticed promptly)
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=min(timeout, 1.0))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            if pending:
+                await asyncio.to_thread(self._write_check_results, list(pending))
+            self.monitoring_active = False
+            logger.info(f"Monitoring engine stopped: {self.engine_stats}")
+
+    async def _check_business_async(self, business_name: str, limiter: SourceRateLimiter) -> _CheckResult:
+        """Run all checks for one business, each behind its source's rate limit."""
+        state = self._get_business_state(business_name)
+        keywords = json.loads(state.get('monitoring_keywords') or '[]')
+
+        async def limited(source: str, check: Callable, *args):
+            await limiter.acquire(source)
+            return await asyncio.to_thread(check, *args)
+
+        results = await asyncio.gather(
+            limited('listings', self.monitor_business_listings, business_name, keywords, 0),  # min_site_delay applies
+            limited('news', self.monitor_news_mentions, business_name, keywords),
+            limited('financial', self.monitor_financial_signals, business_name),
+            return_exceptions=True
         )
-        schedule.every(self.monitoring_intervals['market_trends']).minutes.do(
-            self._monitor_market_trends
+
+        alerts: List[MonitoringAlert] = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Monitoring task failed for {business_name}: {result}")
+                continue
+            alerts.extend(result)
+
+        # High severity alerts notify immediately; storage happens in the next batch
+        for alert in alerts:
+            if alert.severity == 'high':
+                self._notify_callbacks(alert)
+
+        checked_at = datetime.now()
+        quiet_checks = 0 if alerts else (state.get('consecutive_quiet_checks') or 0) + 1
+        last_alert_at = checked_at if alerts else self._parse_timestamp(state.get('last_alert_at'))
+        interval = self._adaptive_interval(state.get('priority_level', 'medium'), last_alert_at, quiet_checks)
+
+        self.engine_stats['checks_completed'] += 1
+        self.engine_stats['alerts_found'] += len(alerts)
+
+        return _CheckResult(
+            business_name=business_name,
+            checked_at=checked_at,
+            next_check_at=checked_at + interval,
+            alerts=alerts,
+            quiet_checks=quiet_checks
         )
-        schedule.every(self.monitoring_intervals['news_alerts']).minutes.do(
-            self._monitor_news_alerts
+
+    def _adaptive_interval(self, priority: str, last_alert_at: Optional[datetime],
+                           quiet_checks: int) -> timedelta:
+        """Check interval for a business from its priority and alert history."""
+        base = self.monitoring_intervals.get(
+            f'{priority}_priority_businesses',
+            self.monitoring_intervals['medium_priority_businesses']
         )
 
-        # Main monitoring loop
-        while self.monitoring_active:
+        if last_alert_at and datetime.now() - last_alert_at < timedelta(minutes=base * 4):
+            factor = RECENT_ALERT_FACTOR
+        elif quiet_checks > QUIET_CHECKS_BEFORE_BACKOFF:
+            factor = min(MAX_QUIET_FACTOR, 1 + 0.25 * (quiet_checks - QUIET_CHECKS_BEFORE_BACKOFF))
+        else:
+            factor = 1.0
+
+        return timedelta(minutes=max(MIN_INTERVAL_MINUTES, base * factor))
+
+    def _get_businesses_due_state(self, exclude: set) -> List[Dict[str, Any]]:
+        """Monitored businesses not yet scheduled, with their next due time."""
+        now = datetime.now()
+        rows = []
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    SELECT business_name, priority_level, last_checked, next_check_at,
+                           last_alert_at, consecutive_quiet_checks
+                    FROM monitored_businesses
+                """)
+                for name, priority, last_checked, next_check_at, last_alert_at, quiet in cursor:
+                    if name in exclude:
+                        continue
+                    due_at = self._parse_timestamp(next_check_at)
+                    if due_at is None:
+                        checked = self._parse_timestamp(last_checked)
+                        interval = self._adaptive_interval(
+                            priority or 'medium', self._parse_timestamp(last_alert_at), quiet or 0
+                        )
+                        # Never-checked businesses are spread over their first interval
+                        due_at = (checked + interval) if checked else (
+                            now + timedelta(seconds=random.uniform(0, interval.total_seconds()))
+                        )
+                    rows.append({'business_name': name, 'due_at': due_at})
+        except Exception as e:
+            logger.error(f"Failed to load monitored businesses: {e}")
+        return rows
+
+    def _get_business_state(self, business_name: str) -> Dict[str, Any]:
+        """Current monitoring state of one business."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("""
+                SELECT business_name, priority_level, monitoring_keywords, last_checked,
+                       last_alert_at, consecutive_quiet_checks
+                FROM monitored_businesses WHERE business_name = ?
+            """, (business_name,)).fetchone()
+        if row is None:
+            raise BusinessNotMonitored(f"{business_name} is no longer monitored")
+        return dict(row)
+
+    def _write_check_results(self, results: List[_CheckResult]):
+        """Write a batch of check results (alerts, timestamps, counters) in one transaction."""
+        alerts = [alert for result in results for alert in result.alerts]
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany("""
+                    INSERT INTO monitoring_alerts
+                    (business_name, alert_type, severity, message, evidence,
+                     source, requires_action)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, [(
+                    alert.business_name, alert.alert_type, alert.severity, alert.message,
+                    json.dumps(alert.evidence), alert.source, alert.requires_action
+                ) for alert in alerts])
+
+                conn.executemany("""
+                    UPDATE monitored_businesses
+                    SET last_checked = ?,
+                        next_check_at = ?,
+                        consecutive_quiet_checks = ?,
+                        total_alerts = total_alerts + ?,
+                        last_alert_at = CASE WHEN ? > 0 THEN ? ELSE last_alert_at END
+                    WHERE business_name = ?
+                """, [(
+                    result.checked_at.isoformat(),
+                    result.next_check_at.isoformat(),
+                    result.quiet_checks,
+                    len(result.alerts),
+                    len(result.alerts),
+                    result.checked_at.isoformat(),
+                    result.business_name
+                ) for result in results])
+
+            self.engine_stats['batches_written'] += 1
+            for alert in alerts:
+                logger.info(f"Alert processed: {alert.alert_type} for {alert.business_name}")
+
+        except Exception as e:
+            logger.error(f"Failed to write monitoring batch: {e}")
+
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    def _notify_callbacks(self, alert: MonitoringAlert):
+        for callback in self.alert_callbacks:
             try:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-            except KeyboardInterrupt:
-                logger.info("Monitoring interrupted by user")
-                break
+                callback(alert)
             except Exception as e:
-                logger.error(f"Monitoring error: {e}")
-                time.sleep(300)  # Wait 5 minutes before retrying
-
-        logger.info("Continuous monitoring stopped")
+                logger.error(f"Alert callback failed: {e}")
 
     def start_monitoring(self):
         """Start monitoring in a separate thread."""
@@ -461,20 +800,16 @@ class LeadMonitor:
                     alert.requires_action
                 ))
 
-            # Update business alert count
-            conn.execute("""
-                UPDATE monitored_businesses
-                SET total_alerts = total_alerts + 1
-                WHERE business_name = ?
-            """, (alert.business_name,))
+                # Update business alert count
+                conn.execute("""
+                    UPDATE monitored_businesses
+                    SET total_alerts = total_alerts + 1, last_alert_at = ?
+                    WHERE business_name = ?
+                """, (datetime.now().isoformat(), alert.business_name))
 
             # Trigger callbacks for high priority alerts
             if alert.severity == 'high':
-                for callback in self.alert_callbacks:
-                    try:
-                        callback(alert)
-                    except Exception as e:
-                        logger.error(f"Alert callback failed: {e}")
+                self._notify_callbacks(alert)
 
             logger.info(f"Alert processed: {alert.alert_type} for {alert.business_name}")
 
@@ -5,6 +5,7 @@ Multi-factor scoring algorithm for business acquisition lead prioritization.
 
 import os
 import logging
+import numbers
 import pickle
 import numpy as np
 import pandas as pd
@@ -26,6 +27,52 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# (business key, default) for each ML model input column, in model order
+ML_FEATURES = [
+    ('revenue', 0),
+    ('years_in_business', 0),
+    ('employee_count', 0),
+    ('credit_score', 0),
+    ('website_quality', 0),
+    ('owner_age', 55),
+    ('industry_growth', 0.05),
+    ('local_competition', 5),
+    ('social_media_presence', 0),
+    ('financial_stability', 0),
+]
+
+# Numeric inputs of the rule-based factors (all default to 0)
+RULE_FEATURES = [
+    'revenue', 'years_in_business', 'credit_score', 'website_quality',
+    'social_media_presence', 'reviews_score', 'market_share',
+]
+
+DECISION_MAKER_ROLES = ['owner', 'president', 'ceo', 'founder']
+
+
+def _select_scores(conditions: List[np.ndarray], choices: List[Any],
+                   clamped=()) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    np.select for factor scores.
+
+    Returns float scores and a mask of rows whose score is a scaled (float)
+    value rather than a constant; choices in ``clamped`` go through max(0, x)
+    like the per-lead code. The mask lets callers hand back
+    calculate_rule_based_score's int/float types.
+    """
+    # max(0, x) hands back the int 0 whenever it clamps
+    scaled = np.select(
+        conditions,
+        [(choice > 0) if i in clamped else isinstance(choice, np.ndarray) for i, choice in enumerate(choices)],
+        default=False
+    )
+    scores = np.select(
+        conditions,
+        [np.maximum(0, choice) if i in clamped else choice for i, choice in enumerate(choices)],
+        default=0
+    ).astype(float)
+    return scores, scaled
+
 @dataclass
 class LeadScore:
     business_name: str
@@ -279,7 +326,7 @@ class LeadScorer:
         decision_makers = [
             contact for contact in contacts
             if any(role in contact.get('title', '').lower()
-                  for role in ['owner', 'president', 'ceo', 'founder'])
+                  for role in DECISION_MAKER_ROLES)
         ]
 
         if decision_makers:
@@ -333,18 +380,7 @@ class LeadScorer:
 
         try:
             # Prepare features for ML model
-            features = np.array([[
-                business.get('revenue', 0),
-                business.get('years_in_business', 0),
-                business.get('employee_count', 0),
-                business.get('credit_score', 0),
-                business.get('website_quality', 0),
-                business.get('owner_age', 55),
-                business.get('industry_growth', 0.05),
-                business.get('local_competition', 5),
-                business.get('social_media_presence', 0),
-                business.get('financial_stability', 0)
-            ]])
+            features = np.array([[business.get(key, default) for key, default in ML_FEATURES]])
 
             # Scale features
             features_scaled = self.scaler.transform(features)
@@ -480,22 +516,203 @@ class LeadScorer:
         except Exception as e:
             logger.error(f"Failed to store scoring history: {e}")
 
-    def batch_score_leads(self, businesses: List[Dict[str, Any]]) -> List[LeadScore]:
-        """Score multiple leads and return sorted by priority."""
-        scored_leads = []
+    def batch_score_leads(self, businesses: List[Dict[str, Any]],
+                          validation_results: Optional[List[Optional[Dict[str, Any]]]] = None,
+                          store_history: bool = True) -> List[LeadScore]:
+        """
+        Score multiple leads and return sorted by priority.
+
+        Equivalent to calling score_lead on each business, but builds one
+        feature matrix, runs a single transform/predict_proba, computes the
+        rule-based factors column-wise and writes history in one transaction.
+        Businesses with non-numeric rule-based inputs are logged and skipped
+        (score_lead raises on them); non-numeric ML inputs only zero that
+        lead's ML score, as in calculate_ml_score.
+        """
+        if validation_results is None:
+            validation_results = [None] * len(businesses)
+
+        # Drop rows score_lead would fail on before building the matrix
+        rows, row_validations = [], []
+        for business, validation in zip(businesses, validation_results):
+            bad_fields = [
+                key for key in RULE_FEATURES
+                if not isinstance(business.get(key, 0), numbers.Real)
+            ]
+            if bad_fields:
+                logger.error(f"Failed to score {business.get('name', 'Unknown')}: "
+                             f"non-numeric {', '.join(sorted(set(bad_fields)))}")
+                continue
+            rows.append(business)
+            row_validations.append(validation)
 
-        for business in businesses:
-            try:
-                score = self.score_lead(business)
-                scored_leads.append(score)
-            except Exception as e:
-                logger.error(f"Failed to score {business.get('name', 'Unknown')}: {e}")
+        if not rows:
+            return []
+
+        logger.info(f"Batch scoring {len(rows)} leads")
+
+        factor_columns, scaled_columns = self.calculate_rule_based_scores(rows, row_validations)
+        rule_based_totals = sum(factor_columns.values())
+
+        if ML_AVAILABLE and self.ml_model:
+            ml_scores, ml_confidences = self.calculate_ml_scores(rows)
+            total_scores = (rule_based_totals * 0.7) + (ml_scores * 0.3)
+            confidences = ml_confidences
+        else:
+            total_scores = rule_based_totals
+            confidences = np.full(len(rows), 0.8)
+
+        factor_names = list(factor_columns)
+        factor_rows = np.column_stack([factor_columns[name] for name in factor_names]).tolist()
+        scaled_rows = np.column_stack([scaled_columns[name] for name in factor_names]).tolist()
+        scoring_timestamp = datetime.now()
+
+        scored_leads = []
+        for business, validation, factors, scaled, total_score, confidence in zip(
+                rows, row_validations, factor_rows, scaled_rows, total_scores.tolist(), confidences.tolist()):
+            # Constant branches are ints in calculate_rule_based_score, scaled ones floats
+            factor_scores = {
+                name: value if is_scaled else int(value)
+                for name, value, is_scaled in zip(factor_names, factors, scaled)
+            }
+            priority_level, risk_assessment = self._assess_priority_and_risk(
+                total_score, factor_scores, validation
+            )
+            scored_leads.append(LeadScore(
+                business_name=business.get('name', 'Unknown'),
+                total_score=total_score,
+                factor_scores=factor_scores,
+                prediction_confidence=confidence,
+                risk_assessment=risk_assessment,
+                priority_level=priority_level,
+                recommended_action=self._generate_recommendation(
+                    total_score, priority_level, factor_scores
+                ),
+                scoring_timestamp=scoring_timestamp
+            ))
+
+        if store_history:
+            self._store_scoring_history_batch(scored_leads)
 
         # Sort by total score (descending)
         scored_leads.sort(key=lambda x: x.total_score, reverse=True)
 
         return scored_leads
 
+    def calculate_rule_based_scores(self, businesses: List[Dict[str, Any]],
+                                    validation_results: Optional[List[Optional[Dict[str, Any]]]] = None
+                                    ) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """
+        Column-wise calculate_rule_based_score: one float array per factor.
+
+        Branches are chosen with array comparisons. Also returns, per factor, a
+        mask of rows whose score was scaled rather than a constant.
+        """
+        if validation_results is None:
+            validation_results = [None] * len(businesses)
+
+        def column(key: str) -> np.ndarray:
+            return np.array([business.get(key, 0) for business in businesses], dtype=float)
+
+        def max_score(factor: str) -> float:
+            return self.score_factors[factor]['max_score']
+
+        revenue = column('revenue')
+        years = column('years_in_business')
+        credit = column('credit_score')
+        engagement = (column('website_quality') + column('social_media_presence')) / 2
+        position = (column('reviews_score') + column('market_share')) / 2
+
+        has_decision_maker = np.array([
+            any(any(role in contact.get('title', '').lower() for role in DECISION_MAKER_ROLES)
+                for contact in business.get('contacts', []))
+            for business in businesses
+        ], dtype=bool)
+        contact_validated = np.array([
+            bool(validation and validation.get('contact_validated'))
+            for validation in validation_results
+        ], dtype=bool)
+
+        selected = {
+            'revenue_confirmed': _select_scores(
+                [(revenue >= 1000000) & (revenue <= 1400000),
+                 (revenue > 0) & (revenue < 1000000),
+                 revenue > 1400000],
+                [max_score('revenue_confirmed'),
+                 (revenue / 1000000) * 15,
+                 30 - ((revenue - 1400000) / 100000)],
+                clamped={1, 2}
+            ),
+            'years_in_business': _select_scores(
+                [years >= 10, years >= 3],
+                [max_score('years_in_business'), (years / 10) * 20]
+            ),
+            'owner_identified': _select_scores(
+                [has_decision_maker & contact_validated, has_decision_maker],
+                [max_score('owner_identified'), 10]
+            ),
+            'financial_health': _select_scores(
+                [credit >= 80, credit >= 60],
+                [max_score('financial_health'), (credit / 80) * 15]
+            ),
+            'engagement_signals': _select_scores(
+                [engagement >= 70, engagement >= 40],
+                [max_score('engagement_signals'), (engagement / 70) * 10]
+            ),
+            'market_position': _select_scores(
+                [position >= 70, position >= 40],
+                [max_score('market_position'), (position / 70) * 10]
+            ),
+        }
+        return ({factor: scores for factor, (scores, _) in selected.items()},
+                {factor: scaled for factor, (_, scaled) in selected.items()})
+
+    def calculate_ml_scores(self, businesses: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Batch calculate_ml_score: ML scores and confidences for all rows at once."""
+        zeros = np.zeros(len(businesses))
+        if not ML_AVAILABLE or not self.ml_model or not self.scaler:
+            return zeros, zeros
+
+        # Each row is converted like calculate_ml_score's one-row array (None -> NaN);
+        # rows that do not convert score 0 on their own
+        features, valid = [], []
+        for i, business in enumerate(businesses):
+            try:
+                features.append(np.array([business.get(key, default) for key, default in ML_FEATURES]).astype(float))
+                valid.append(i)
+            except (TypeError, ValueError) as e:
+                logger.error(f"ML scoring failed: {e}")
+        if not valid:
+            return zeros, zeros
+
+        try:
+            prediction_proba = self.ml_model.predict_proba(self.scaler.transform(np.array(features)))[:, 1]
+        except Exception as e:
+            logger.error(f"Batch ML scoring failed: {e}")
+            return zeros, zeros
+
+        ml_scores, confidences = zeros.copy(), zeros.copy()
+        ml_scores[valid] = prediction_proba * 100
+        confidences[valid] = np.abs(prediction_proba - 0.5) * 2
+        return ml_scores, confidences
+
+    def _store_scoring_history_batch(self, scores: List[LeadScore]):
+        """Store scoring results for many leads in one transaction."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany("""
+                    INSERT INTO scoring_history
+                    (business_name, total_score, factor_scores, prediction_confidence,
+                     priority_level)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [
+                    (score.business_name, score.total_score, str(score.factor_scores),
+                     score.prediction_confidence, score.priority_level)
+                    for score in scores
+                ])
+        except Exception as e:
+            logger.error(f"Failed to store scoring history: {e}")
+
     def retrain_model(self, feedback_data: pd.DataFrame):
         """Retrain ML model with new feedback data."""
         if not ML_AVAILABLE:
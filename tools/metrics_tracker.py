@@ -117,6 +117,11 @@ class LeadQualityMetrics:
                 )
             """)
 
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lead_performance_created_at
+                ON lead_performance (created_at)
+            """)
+
             # Source performance tracking
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS source_performance (
@@ -242,51 +247,45 @@ class LeadQualityMetrics:
 
         try:
             with sqlite3.connect(self.db_path) as conn:
-                # Get lead performance data
-                df = pd.read_sql_query("""
-                    SELECT * FROM lead_performance
+                # Aggregate in SQLite instead of loading the period into pandas
+                row = conn.execute("""
+                    SELECT
+                        COUNT(*),
+                        SUM(verification_successful = 1),
+                        SUM(marked_as_hot = 1),
+                        SUM(marked_as_hot = 1 AND (
+                            actual_outcome IN ('rejected', 'not_interested', 'invalid')
+                            OR meeting_scheduled = 0)),
+                        SUM(data_fields_total),
+                        SUM(data_fields_complete),
+                        SUM(meeting_scheduled = 1),
+                        AVG(ROUND((julianday(validation_end_time) - julianday(validation_start_time)) * 86400.0, 3)),
+                        SUM(contact_successful = 1)
+                    FROM lead_performance
                     WHERE created_at >= ?
-                """, conn, params=(cutoff_date.isoformat(),))
+                """, (cutoff_date.isoformat(),)).fetchone()
 
-                if len(df) == 0:
+                (total_leads, verified_leads, hot_leads_count, false_positives, total_fields,
+                 complete_fields, meetings_scheduled, avg_validation_time, successful_contacts) = row
+
+                if total_leads == 0:
                     return self._empty_metrics_summary(days)
 
                 # Calculate verification rate
-                verified_leads = len(df[df['verification_successful'] == True])
-                total_leads = len(df)
-                verification_rate = verified_leads / total_leads if total_leads > 0 else 0
+                verification_rate = verified_leads / total_leads
 
                 # Calculate false positive rate
-                hot_leads = df[df['marked_as_hot'] == True]
-                if len(hot_leads) > 0:
-                    false_positives = len(hot_leads[
-                        (hot_leads['actual_outcome'].isin(['rejected', 'not_interested', 'invalid'])) |
-                        (hot_leads['meeting_scheduled'] == False)
-                    ])
-                    false_positive_rate = false_positives / len(hot_leads)
-                else:
-                    false_positive_rate = 0
+                false_positive_rate = false_positives / hot_leads_count if hot_leads_count > 0 else 0
 
                 # Calculate data completeness
-                total_fields = df['data_fields_total'].sum()
-                complete_fields = df['data_fields_complete'].sum()
-                data_completeness = complete_fields / total_fields if total_fields > 0 else 0
+                data_completeness = complete_fields / total_fields if total_fields else 0
 
                 # Calculate source reliability
                 source_reliability = self._calculate_source_reliability()
 
                 # Calculate conversion to meeting
-                hot_leads_count = len(hot_leads)
-                meetings_scheduled = len(df[df['meeting_scheduled'] == True])
                 conversion_to_meeting = meetings_scheduled / hot_leads_count if hot_leads_count > 0 else 0
 
-                # Calculate average validation time
-                df['validation_duration'] = pd.to_datetime(df['validation_end_time']) - pd.to_datetime(df['validation_start_time'])
-                avg_validation_time = df['validation_duration'].dt.total_seconds().mean()
-
-                # Count successful contacts
-                successful_contacts = len(df[df['contact_successful'] == True])
-
                 return MetricsSummary(
                     period=f"Last {days} days",
                     verification_rate=verification_rate,
@@ -294,7 +293,7 @@ class LeadQualityMetrics:
                     data_completeness=data_completeness,
                     source_reliability=source_reliability,
                     conversion_to_meeting=conversion_to_meeting,
-                    time_to_validate=avg_validation_time,
+                    time_to_validate=avg_validation_time if avg_validation_time is not None else float('nan'),
                     total_leads_processed=total_leads,
                     hot_leads_generated=hot_leads_count,
                     successful_contacts=successful_contacts,